@@ -28,7 +28,7 @@ from PHX.PHPP.phpp_model import (
     version,
     windows_rows,
 )
-from PHX.xl import xl_app
+from PHX.xl import xl_app, xl_profile
 from PHX.xl.xl_typing import xl_Sheet_Protocol
 
 
@@ -44,10 +44,26 @@ class PHPPConnection:
         14: ("B", "Underground roof / ceiling"),
     }
 
-    def __init__(self, _xl: xl_app.XLConnection):
+    def __init__(self, _xl: xl_app.XLConnection, profile: bool | None = None):
+        """Interface for a PHPP Excel Document.
+
+        Arguments:
+        ----------
+            * _xl (xl_app.XLConnection): The Excel connection to use.
+            * profile (bool | None): Set True to record per-phase timing and round-trip
+                counts (see 'xl_profile'). Default=None reads the 'PHX_PHPP_PROFILE'
+                environment variable. When off, nothing is instrumented.
+        """
         # -- Setup the Excel connection and facade object.
         self.xl = _xl
 
+        if profile is None:
+            profile = xl_profile.profile_setting_from_env() is not None
+        self.profiler: xl_profile.XLProfiler | None = None
+        if profile:
+            self.profiler = self.xl.profiler or xl_profile.XLProfiler.attach(self.xl)
+            self.profiler.wrap_phases(self, self.profiled_phase_names())
+
         # -- Get the localized (units, language) PHPP Shape with worksheet names and column locations
         self.version = self.get_phpp_version()
         self.shape: PhppShape = phpp_localization.get_phpp_shape(self.xl, self.version)
@@ -79,6 +95,11 @@ class PHPPConnection:
         self.solar_dhw = sheet_io.SolarDHW(self.xl, self.shape.SOLAR_DHW)
         self.solar_pv = sheet_io.SolarPV(self.xl, self.shape.SOLAR_PV)
 
+    @classmethod
+    def profiled_phase_names(cls) -> list[str]:
+        """Return the names of the methods which are each profiled as their own export phase."""
+        return [name for name in dir(cls) if name.startswith(("write_", "activate_variant_")) or name == "calculate"]
+
     def get_data_worksheet(self) -> xl_Sheet_Protocol:
         """Return the 'Data' worksheet from the active PHPP file, support English, German, Spanish."""
         valid_data_worksheet_names = ["DATA", "DATEN", "DATOS"]
@@ -294,18 +315,24 @@ class PHPPConnection:
         return None
 
     def write_climate_data(self, phx_project: project.PhxProject) -> None:
-        """Write the variant's weather-station data to the PHPP 'Climate' worksheet."""
-        if self.easyPh:
+        """Write the variants' weather-station data to the PHPP 'Climate' worksheet.
+
+        Every variant is written to the first user-defined slot, so a later variant
+        overwrites an earlier one (with a warning, see 'Climate.write_climate_block').
+        PHPP has a single active climate: the last variant's.
+        """
+        if self.easyPh or not phx_project.variants:
             return None
 
-        for phx_variant in phx_project.variants:
+        for i, phx_variant in enumerate(phx_project.variants):
             # -- Write the actual weather station data
             weather_station_data = climate_entry.ClimateDataBlock(shape=self.shape.CLIMATE, phx_site=phx_variant.site)
-            self.climate.write_climate_block(weather_station_data)
+            self.climate.write_climate_block(weather_station_data, i)
 
-            # -- Set the active weather station
-            active_climate_data = climate_entry.ClimateSettings(shape=self.shape.CLIMATE, phx_site=phx_variant.site)
-            self.climate.write_active_climate(active_climate_data)
+        # -- Set the active weather station
+        active_site = phx_project.variants[-1].site
+        active_climate_data = climate_entry.ClimateSettings(shape=self.shape.CLIMATE, phx_site=active_site)
+        self.climate.write_active_climate(active_climate_data)
         return None
 
     def write_project_constructions(self, phx_project: project.PhxProject) -> None:
@@ -1,7 +1,11 @@
 # -*- Python Version: 3.10 -*-
 
-"""Functions for finding / loading the right PHPP-ShapeFile."""
+"""Functions for finding / loading the right PHPP-ShapeFile.
 
+Shape-files are validated once per process and memoized by version, so every
+PHPPConnection after the first one re-uses the same (shared, read-only)
+PhppShape instance.
+"""
 
 import os
 import pathlib
@@ -10,6 +14,10 @@ from PHX.PHPP.phpp_localization.shape_model import PhppShape
 from PHX.PHPP.phpp_model import version
 from PHX.xl import xl_app
 
+# -- {shape-file-path: PhppShape}. Validating a ~48 KB shape-file dominates the
+# -- cost of creating a PHPPConnection, and batch workflows create many of them.
+_PHPP_SHAPES: dict[pathlib.Path, PhppShape] = {}
+
 
 def phpp_version_as_file_name(version: version.PHPPVersion):
     """Return the version as a file-name."""
@@ -38,12 +46,38 @@ def get_shape_filepath(version: version.PHPPVersion, _shape_file_directory: path
     return shape_file_path
 
 
+def load_phpp_shape_file(_shape_file_path: pathlib.Path) -> PhppShape:
+    """Load and validate a single JSON shape-file.
+
+    Arguments:
+    ----------
+        * _shape_file_path (pathlib.Path): The path to the JSON shape-file.
+
+    Returns:
+    --------
+        * (PhppShape): A new PhppShape object (not memoized).
+    """
+    return PhppShape.model_validate_json(pathlib.Path(_shape_file_path).read_bytes())
+
+
+def clear_phpp_shape_cache() -> None:
+    """Drop all the memoized PhppShape objects (the next load re-reads the shape-files)."""
+    _PHPP_SHAPES.clear()
+
+
 def get_phpp_shape(_xl: xl_app.XLConnection, version: version.PHPPVersion) -> PhppShape:
-    """Return the PhppShape Object."""
+    """Return the PhppShape Object.
+
+    The shape is loaded and validated only once per process for each PHPP version.
+    The same PhppShape instance is returned to every caller, so treat it as read-only.
+    """
 
     shape_file_dir = pathlib.Path(__file__).parent
     phpp_shape_filepath = get_shape_filepath(version, shape_file_dir)
-    _xl.output(f"Loading PHPP Shapefile: {phpp_shape_filepath}")
-    phpp_shape = PhppShape.model_validate_json(pathlib.Path(phpp_shape_filepath).read_bytes())
 
-    return phpp_shape
+    if phpp_shape_filepath not in _PHPP_SHAPES:
+        _xl.output(f"Loading PHPP Shapefile: {phpp_shape_filepath}")
+        _PHPP_SHAPES[phpp_shape_filepath] = load_phpp_shape_file(phpp_shape_filepath)
+
+    return _PHPP_SHAPES[phpp_shape_filepath]
+
@@ -52,6 +52,30 @@ class ClimateSettings:
         return xl_item_list
 
 
+@dataclass
+class ActiveClimateSnapshot:
+    """The active climate selections and monthly data, as read back from the worksheet."""
+
+    __slots__ = (
+        "country",
+        "region",
+        "data_set",
+        "station_elevation",
+        "site_elevation",
+        "latitude",
+        "longitude",
+        "monthly_data",
+    )
+    country: str
+    region: str
+    data_set: str
+    station_elevation: str
+    site_elevation: str
+    latitude: float
+    longitude: float
+    monthly_data: list[list]
+
+
 @dataclass
 class ClimateDataBlock:
     """A single Climate / Weather-Station entry block."""
@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Collection, Sequence
+from collections.abc import Callable, Collection, Sequence
 from dataclasses import dataclass, field
 
 from ph_units.unit_type import Unit
@@ -15,15 +15,256 @@ from PHX.xl import xl_app, xl_data
 from PHX.xl.xl_data import col_offset, xl_writable
 
 
+def _is_entry_number(_value: xl_writable, _locator_string: str) -> bool:
+    """Return True if the cell value is the section's first entry-number ("1.0" from Excel is "1")."""
+    try:
+        return str(int(_value)) == _locator_string  # type: ignore
+    except Exception:
+        return False
+
+
+@dataclass
+class AddnlVentSectionRows:
+    """The header, first-entry and last-entry rows of one section on the 'Additional Vent' worksheet."""
+
+    header: int
+    first_entry: int
+    last_entry: int
+
+
+_LocatorData = dict[str, list[xl_data.xl_range_single_value]]
+
+
+class AddnlVentSectionLocator:
+    """Finds the shape of the Rooms, Vent-Units and Ducts sections from a single read.
+
+    The three section controllers used to each scan their locator columns with
+    several separate reads (header, first-entry, last-entry, and again after
+    any inserted rows). This reads all of the locator columns once, as one block,
+    and applies the same searches to it. If a section runs past the end of the
+    block (a project with many inserted room rows), the block is re-read once
+    at its full size.
+
+    Each section is located (and can fail) on its own, so a worksheet missing
+    one section can still be used for the others.
+    """
+
+    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.AddnlVent, _read_rows: int = 1_000) -> None:
+        self.xl = _xl
+        self.shape = _shape
+        self.read_rows = _read_rows
+        self.max_read_rows = 10_000
+        self._data: _LocatorData | None = None
+        self._data_rows = 0
+        self._rooms: AddnlVentSectionRows | None = None
+        self._units: AddnlVentSectionRows | None = None
+        self._ducts: AddnlVentSectionRows | None = None
+
+    @property
+    def rooms(self) -> AddnlVentSectionRows:
+        """The 'Rooms' section rows, located on first use. The last-entry row is the first empty row below."""
+        if not self._rooms:
+            self._rooms = self._locate(self._search_rooms)
+        return self._rooms
+
+    @property
+    def units(self) -> AddnlVentSectionRows:
+        """The 'Ventilation-Units' section rows, located on first use."""
+        if not self._units:
+            self._units = self._locate(self._search_units)
+        return self._units
+
+    @property
+    def ducts(self) -> AddnlVentSectionRows:
+        """The 'Vent-Ducts' section rows, located on first use."""
+        if not self._ducts:
+            self._ducts = self._locate(self._search_ducts)
+        return self._ducts
+
+    @property
+    def locator_columns(self) -> list[str]:
+        """The columns searched by any of the sections, in worksheet order."""
+        cols = {
+            self.shape.rooms.locator_col_header,
+            self.shape.rooms.locator_col_entry,
+            self.shape.units.locator_col_header,
+            self.shape.units.locator_col_entry,
+            self.shape.ducts.locator_col_header,
+            self.shape.ducts.locator_col_entry,
+        }
+        return sorted(cols, key=xl_data.xl_ord)
+
+    def read_locator_columns(self, _row_end: int) -> _LocatorData:
+        """Return the locator-column data for rows 1 to '_row_end', key'd by column letter."""
+        cols = self.locator_columns
+        if len(cols) == 1:
+            return {cols[0]: self.xl.get_single_column_data(self.shape.name, cols[0], 1, _row_end)}
+        return self.xl.get_data_with_column_letters(self.shape.name, f"{cols[0]}1:{cols[-1]}{_row_end}")
+
+    def _get_data(self, _row_end: int) -> _LocatorData:
+        if self._data is None or self._data_rows < _row_end:
+            self._data = self.read_locator_columns(_row_end)
+            self._data_rows = _row_end
+        return self._data
+
+    def _locate(self, _search: Callable[[_LocatorData], AddnlVentSectionRows]) -> AddnlVentSectionRows:
+        """Run the section search on the block, re-reading the block at its full size if the section runs past it."""
+        try:
+            return _search(self._get_data(self.read_rows))
+        except LookupError as e:
+            missing = e
+        if self._data_rows < self.max_read_rows:
+            try:
+                return _search(self._get_data(self.max_read_rows))
+            except LookupError as e:
+                missing = e
+
+        raise Exception(
+            f"\nError: Not able to find the {missing} of the '{self.shape.name}' worksheet "
+            f"in rows 1-{self._data_rows}?"
+        )
+
+    @staticmethod
+    def _find(
+        _data: _LocatorData,
+        _col: str,
+        _start: int,
+        _end: int | None,
+        _test: Callable[[xl_writable], bool],
+        _what: str,
+    ) -> int:
+        """Return the first row in the column, from '_start' to '_end', passing the test. Raises LookupError."""
+        col_data = _data[_col]
+        end = len(col_data) if _end is None else min(_end, len(col_data))
+        for i in range(max(_start, 1), end + 1):
+            if _test(col_data[i - 1]):
+                return i
+        raise LookupError(_what)
+
+    def _search_rooms(self, _data: _LocatorData) -> AddnlVentSectionRows:
+        rooms = self.shape.rooms
+        header = self._find(
+            _data,
+            rooms.locator_col_header,
+            1,
+            100,
+            lambda v: rooms.locator_string_header in str(v),
+            f'"Rooms" section header ("{rooms.locator_string_header}")',
+        )
+        first_entry = self._find(
+            _data,
+            rooms.locator_col_entry,
+            header,
+            header + 25,
+            lambda v: _is_entry_number(v, rooms.locator_string_entry),
+            '"Rooms" section first entry row',
+        )
+        last_entry = self._find(
+            _data, rooms.locator_col_header, first_entry, None, lambda v: v is None, '"Rooms" section last entry row'
+        )
+        return AddnlVentSectionRows(header, first_entry, last_entry)
+
+    def _search_units(self, _data: _LocatorData) -> AddnlVentSectionRows:
+        units = self.shape.units
+        what = f'"Ventilation-Units" section header ("{units.locator_string_header}")'
+        # -- Search from row 50, as the controller does, then from the top
+        try:
+            header = self._find(
+                _data, units.locator_col_header, 50, None, lambda v: units.locator_string_header in str(v), what
+            )
+        except LookupError:
+            header = self._find(
+                _data, units.locator_col_header, 1, 50, lambda v: units.locator_string_header in str(v), what
+            )
+        first_entry = self._find(
+            _data,
+            units.locator_col_entry,
+            header,
+            header + 25,
+            lambda v: _is_entry_number(v, units.locator_string_entry),
+            '"Ventilation-Units" section first entry row',
+        )
+        end = self._find(
+            _data,
+            units.locator_col_entry,
+            first_entry,
+            first_entry + 50,
+            lambda v: v is None,
+            '"Ventilation-Units" section last entry row',
+        )
+        return AddnlVentSectionRows(header, first_entry, end - 1)
+
+    def _search_ducts(self, _data: _LocatorData) -> AddnlVentSectionRows:
+        ducts = self.shape.ducts
+        header = self._find(
+            _data,
+            ducts.locator_col_header,
+            1,
+            None,
+            lambda v: ducts.locator_string_header in str(v),
+            f'"Vent-Ducts" section header ("{ducts.locator_string_header}")',
+        )
+        # -- There is no entry flag, so the first entry is a fixed offset from the header
+        first_entry = header + 9
+        end = self._find(
+            _data,
+            ducts.locator_col_entry,
+            first_entry,
+            first_entry + 100,
+            lambda v: ducts.locator_string_end in str(v),
+            '"Vent-Ducts" section last entry row',
+        )
+        return AddnlVentSectionRows(header, first_entry, end - 1)
+
+
 class Spaces:
     """Reads and writes ventilation space data in the PHPP 'Additional Vent' worksheet."""
 
-    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.AddnlVent) -> None:
+    def __init__(
+        self,
+        _xl: xl_app.XLConnection,
+        _shape: shape_model.AddnlVent,
+        _locator: AddnlVentSectionLocator | None = None,
+    ) -> None:
         self.xl = _xl
         self.shape = _shape
-        self.section_header_row: int | None = None
-        self.section_first_entry_row: int | None = None
-        self.section_last_entry_row: int | None = None
+        self.locator = _locator
+        self._section_header_row: int | None = None
+        self._section_first_entry_row: int | None = None
+        self._section_last_entry_row: int | None = None
+
+    @property
+    def section_header_row(self) -> int | None:
+        """The row number of the 'Rooms' section header, if known (from the shared locator, when there is one)."""
+        if not self._section_header_row and self.locator:
+            self._section_header_row = self.locator.rooms.header
+        return self._section_header_row
+
+    @section_header_row.setter
+    def section_header_row(self, _value: int | None) -> None:
+        self._section_header_row = _value
+
+    @property
+    def section_first_entry_row(self) -> int | None:
+        """The row number of the first 'Rooms' entry row, if known (from the shared locator, when there is one)."""
+        if not self._section_first_entry_row and self.locator:
+            self._section_first_entry_row = self.locator.rooms.first_entry
+        return self._section_first_entry_row
+
+    @section_first_entry_row.setter
+    def section_first_entry_row(self, _value: int | None) -> None:
+        self._section_first_entry_row = _value
+
+    @property
+    def section_last_entry_row(self) -> int | None:
+        """The row number just below the 'Rooms' entry rows, if known (from the shared locator, when there is one)."""
+        if not self._section_last_entry_row and self.locator:
+            self._section_last_entry_row = self.locator.rooms.last_entry
+        return self._section_last_entry_row
+
+    @section_last_entry_row.setter
+    def section_last_entry_row(self, _value: int | None) -> None:
+        self._section_last_entry_row = _value
 
     def find_section_header_row(self, _row_start: int = 1, _row_end: int = 100) -> int:
         """Return the row number of the 'Rooms' section header."""
@@ -152,32 +393,48 @@ class VentilatorDeviceUsage:
 class VentUnits:
     """Reads and writes ventilation unit data in the PHPP 'Additional Vent' worksheet."""
 
-    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.AddnlVent):
+    def __init__(
+        self,
+        _xl: xl_app.XLConnection,
+        _shape: shape_model.AddnlVent,
+        _locator: AddnlVentSectionLocator | None = None,
+    ):
         self.xl = _xl
         self.shape = _shape
+        self.locator = _locator
         self._section_header_row: int | None = None
         self._section_first_entry_row: int | None = None
         self._section_last_entry_row: int | None = None
+        self._unit_numbers_by_phpp_id: dict[str, xl_writable] | None = None
 
     @property
     def section_header_row(self) -> int:
         """Return the row number of the 'Area input' section header."""
         if not self._section_header_row:
-            self._section_header_row = self.find_section_header_row()
+            if self.locator:
+                self._section_header_row = self.locator.units.header
+            else:
+                self._section_header_row = self.find_section_header_row()
         return self._section_header_row
 
     @property
     def section_first_entry_row(self) -> int:
         """Return the row number of the very first user-input entry row in the 'Area input' section."""
         if not self._section_first_entry_row:
-            self._section_first_entry_row = self.find_section_first_entry_row()
+            if self.locator:
+                self._section_first_entry_row = self.locator.units.first_entry
+            else:
+                self._section_first_entry_row = self.find_section_first_entry_row()
         return self._section_first_entry_row
 
     @property
     def section_last_entry_row(self) -> int:
         """Return the row number of the last user-input entry row in the 'Area input' section."""
         if not self._section_last_entry_row:
-            self._section_last_entry_row = self.find_section_last_entry_row()
+            if self.locator:
+                self._section_last_entry_row = self.locator.units.last_entry
+            else:
+                self._section_last_entry_row = self.find_section_last_entry_row()
         return self._section_last_entry_row
 
     def find_section_header_row(self, _row_start: int = 50, _row_end: int = 200) -> int:
@@ -268,27 +525,45 @@ class VentUnits:
                 the Ventilation unit.
         """
 
-        search_column = str(self.shape.units.inputs.unit_selected.column)
-
-        xl_data = self.xl.get_single_column_data(
-            _sheet_name=self.shape.name,
-            _col=search_column,
-            _row_start=self.section_first_entry_row,
-            _row_end=self.section_first_entry_row + 25,
-        )
-
-        for i, val in enumerate(xl_data, start=self.section_first_entry_row):
-            if val == _phpp_id:
-                num_col = col_offset(str(search_column), -3)
-                return self.xl.get_data(self.shape.name, f"{num_col}{i}")
+        unit_numbers = self.get_vent_unit_numbers_by_phpp_id()
+        if _phpp_id in unit_numbers:
+            return unit_numbers[_phpp_id]
 
         raise Exception(
             f"Error: Cannot locate the Ventilation Unit: '{_phpp_id}' in"
-            f" the '{self.shape.name}' worksheet Units section, column {search_column}?"
+            f" the '{self.shape.name}' worksheet Units section, column {self.shape.units.inputs.unit_selected.column}?"
             f" Ensure that you enter the Ventilator-unit data into the '{self.shape.name}'"
             " worksheet before writing the spaces and ducts."
         )
 
+    def get_vent_unit_numbers_by_phpp_id(self) -> dict[str, xl_writable]:
+        """Return the PHPP ventilation-unit number of each selected ventilator, key'd by its phpp-id.
+
+        The map is read from the worksheet once, as a single block, and then
+        re-used for every lookup. Call 'clear_vent_unit_numbers' after writing
+        to the Vent-Units section.
+        """
+        if self._unit_numbers_by_phpp_id is None:
+            search_column = str(self.shape.units.inputs.unit_selected.column)
+            num_col = col_offset(search_column, -3)
+            row_start = self.section_first_entry_row
+            data = self.xl.get_data_with_column_letters(
+                self.shape.name, f"{num_col}{row_start}:{search_column}{row_start + 25}"
+            )
+
+            unit_numbers: dict[str, xl_writable] = {}
+            for phpp_id, unit_number in zip(data[search_column], data[num_col]):
+                # -- The first matching row wins, as with the original top-down search
+                if isinstance(phpp_id, str) and phpp_id not in unit_numbers:
+                    unit_numbers[phpp_id] = unit_number
+            self._unit_numbers_by_phpp_id = unit_numbers
+
+        return self._unit_numbers_by_phpp_id
+
+    def clear_vent_unit_numbers(self) -> None:
+        """Drop the cached phpp-id to unit-number map, so the next lookup re-reads the worksheet."""
+        self._unit_numbers_by_phpp_id = None
+
     def get_ventilation_units(self) -> tuple[VentilatorDeviceUsage, ...]:
         """Return a tuple of VentilatorDeviceUsage objects from the PHPP worksheet."""
         input_shape = self.shape.units.inputs
@@ -311,12 +586,51 @@ class VentUnits:
 class VentDucts:
     """Reads and writes ventilation duct data in the PHPP 'Additional Vent' worksheet."""
 
-    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.AddnlVent) -> None:
+    def __init__(
+        self,
+        _xl: xl_app.XLConnection,
+        _shape: shape_model.AddnlVent,
+        _locator: AddnlVentSectionLocator | None = None,
+    ) -> None:
         self.xl = _xl
         self.shape = _shape
-        self.section_header_row: int | None = None
-        self.section_first_entry_row: int | None = None
-        self.section_last_entry_row: int | None = None
+        self.locator = _locator
+        self._section_header_row: int | None = None
+        self._section_first_entry_row: int | None = None
+        self._section_last_entry_row: int | None = None
+
+    @property
+    def section_header_row(self) -> int | None:
+        """The row number of the 'Ducts' section header, if known (from the shared locator, when there is one)."""
+        if not self._section_header_row and self.locator:
+            self._section_header_row = self.locator.ducts.header
+        return self._section_header_row
+
+    @section_header_row.setter
+    def section_header_row(self, _value: int | None) -> None:
+        self._section_header_row = _value
+
+    @property
+    def section_first_entry_row(self) -> int | None:
+        """The row number of the first 'Ducts' entry row, if known (from the shared locator, when there is one)."""
+        if not self._section_first_entry_row and self.locator:
+            self._section_first_entry_row = self.locator.ducts.first_entry
+        return self._section_first_entry_row
+
+    @section_first_entry_row.setter
+    def section_first_entry_row(self, _value: int | None) -> None:
+        self._section_first_entry_row = _value
+
+    @property
+    def section_last_entry_row(self) -> int | None:
+        """The row number of the last 'Ducts' entry row, if known (from the shared locator, when there is one)."""
+        if not self._section_last_entry_row and self.locator:
+            self._section_last_entry_row = self.locator.ducts.last_entry
+        return self._section_last_entry_row
+
+    @section_last_entry_row.setter
+    def section_last_entry_row(self, _value: int | None) -> None:
+        self._section_last_entry_row = _value
 
     def find_section_header_row(self, _row_start: int = 1, _row_end: int = 300) -> int:
         """Return the row number of the ventilation-duct section header."""
@@ -392,9 +706,10 @@ class AddnlVent:
     def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.AddnlVent) -> None:
         self.xl = _xl
         self.shape = _shape
-        self.spaces = Spaces(self.xl, self.shape)
-        self.vent_units = VentUnits(self.xl, self.shape)
-        self.vent_ducts = VentDucts(self.xl, self.shape)
+        self.locator = AddnlVentSectionLocator(self.xl, self.shape)
+        self.spaces = Spaces(self.xl, self.shape, self.locator)
+        self.vent_units = VentUnits(self.xl, self.shape, self.locator)
+        self.vent_ducts = VentDucts(self.xl, self.shape, self.locator)
 
     def write_spaces(self, _spaces: list[vent_space.VentSpaceRow]) -> None:
         if not self.spaces.section_first_entry_row:
@@ -412,6 +727,7 @@ class AddnlVent:
         ]
         for item in xl_data.merge_xl_item_rows(row_items):
             self.xl.write_xl_item(item)
+        self.vent_units.clear_vent_unit_numbers()
 
     def write_vent_ducts(self, _vent_ducts: list[vent_ducts.VentDuctRow]) -> None:
         if not self.vent_ducts.section_first_entry_row:
@@ -428,16 +744,19 @@ class AddnlVent:
         """Link the Vent unit to the Variants worksheet."""
 
         # -- Ventilator Unit
-        start_row = self.vent_units.find_section_first_entry_row()
-        end_row = self.vent_units.find_section_last_entry_row()
-        for i in range(start_row, end_row + 1):
-            self.xl.write_xl_item(
-                xl_data.XlItem(
-                    self.shape.name,
-                    f"{self.shape.units.inputs.unit_selected.column}{i}",
-                    f"={variants_worksheet_name}!{vent_unit_range}",
-                )
+        # -- Every entry row gets the same formula: write them as one column block.
+        start_row = self.vent_units.section_first_entry_row
+        end_row = self.vent_units.section_last_entry_row
+        if end_row < start_row:
+            return None
+        self.xl.write_xl_item(
+            xl_data.XlItem(
+                self.shape.name,
+                f"{self.shape.units.inputs.unit_selected.column}{start_row}",
+                [[f"={variants_worksheet_name}!{vent_unit_range}"] for _ in range(start_row, end_row + 1)],
             )
+        )
+        self.vent_units.clear_vent_unit_numbers()
 
         return None
 
@@ -169,10 +169,11 @@ class Surfaces:
             except KeyError:
                 pass
 
+        # -- Search the whole entry block, which may have been grown past 500 rows.
         row = self.xl.get_row_num_of_value_in_column(
             sheet_name=self.shape.name,
             row_start=self.section_first_entry_row,
-            row_end=self.section_first_entry_row + 500,
+            row_end=max(self.section_last_entry_row, self.section_first_entry_row + 500),
             col=str(self.shape.surface_rows.inputs.description.column),
             find=_name,
         )
@@ -6,7 +6,10 @@ from __future__ import annotations
 
 from PHX.PHPP.phpp_localization import shape_model
 from PHX.PHPP.phpp_model import climate_entry
-from PHX.xl import xl_app
+from PHX.xl import xl_app, xl_data
+
+# -- The first row of the active climate-dataset selections.
+_ACTIVE_CLIMATE_START_ROW = 9
 
 
 class Climate:
@@ -21,20 +24,42 @@ class Climate:
         # TODO: make this find the right starting rows.
         return [self.shape.ud_block.start_row]
 
-    def write_climate_block(self, _climate_entry: climate_entry.ClimateDataBlock) -> None:
+    def write_climate_block(self, _climate_entry: climate_entry.ClimateDataBlock, _slot: int = 0) -> None:
+        """Write a weather-station's data to the user-defined slot on the worksheet.
+
+        The entry cells are merged into a few block writes (the header cells, the
+        monthly block and the peak-load block) instead of one write per cell.
+
+        Arguments:
+        ----------
+            * _climate_entry (climate_entry.ClimateDataBlock): The weather-station data to write.
+            * _slot (int): The slot the data is meant for (ie: the variant's index). Every variant
+                is written to the first slot for now, so any later one overwrites it, with a
+                warning. Default=0.
+
+        Returns:
+        --------
+            * None
+        """
         if not self.weather_data_start_rows:
             self.weather_data_start_rows = self.get_start_rows()
 
-        # Just use the first one for now....
-        # TODO: Write all variants to different slots
+        # -- Just use the first one for now....
+        # -- TODO: Write all variants to different slots
         start_row = self.weather_data_start_rows[0]
-
-        for item in _climate_entry.create_xl_items(self.shape.name, start_row):
+        if _slot >= len(self.weather_data_start_rows):
+            self.xl.output(
+                f"\nPHPPClimateWarning: the '{self.shape.name}' worksheet has "
+                f"{len(self.weather_data_start_rows)} user-defined climate slot(s); the climate "
+                f"'{_climate_entry.phx_site.display_name}' for slot {_slot + 1} overwrites slot 1.\n"
+            )
+
+        for item in xl_data.merge_xl_item_cells(_climate_entry.create_xl_items(self.shape.name, start_row)):
             self.xl.write_xl_item(item)
 
     def write_active_climate(self, _active_climate: climate_entry.ClimateSettings) -> None:
-        start_row = 9
-        for item in _active_climate.create_xl_items(self.shape.name, start_row):
+        items = _active_climate.create_xl_items(self.shape.name, _ACTIVE_CLIMATE_START_ROW)
+        for item in xl_data.merge_xl_item_cells(items):
             self.xl.write_xl_item(item)
 
     def read_active_country(self) -> str:
@@ -70,3 +95,48 @@ class Climate:
             _range_address=rng,
         )
         return data
+
+    def read_active_climate_snapshot(self) -> climate_entry.ActiveClimateSnapshot:
+        """Return the active climate selections and monthly data, with a few reads.
+
+        This is the same data as the individual 'read_*' methods return. The country,
+        region and data-set are read from their named ranges, as those methods do. The
+        defined ranges and the monthly results block are read as a single block, instead
+        of one round trip for each value.
+        """
+        defined = self.shape.defined_ranges
+        block = self.shape.active_block
+
+        addresses = {
+            "station_elevation": defined.weather_station_altitude,
+            "site_elevation": defined.site_altitude,
+            "latitude": defined.latitude,
+            "longitude": defined.longitude,
+        }
+        cells = {name: xl_data.split_cell_address(address) for name, address in addresses.items()}
+        all_cols = [col for col, _ in cells.values()] + [block.start_col, block.end_col]
+        all_rows = [row for _, row in cells.values()] + [block.start_row, block.end_row]
+        col_start = min(all_cols, key=xl_data.xl_ord)
+        col_end = max(all_cols, key=xl_data.xl_ord)
+        row_start = min(all_rows)
+        row_end = max(all_rows)
+
+        data = self.xl.get_data_with_column_letters(self.shape.name, f"{col_start}{row_start}:{col_end}{row_end}")
+        values = {name: data[col][row - row_start] for name, (col, row) in cells.items()}
+
+        first_col, last_col = xl_data.xl_ord(block.start_col), xl_data.xl_ord(block.end_col)
+        monthly_data = [
+            data[xl_data.xl_chr(col_num)][block.start_row - row_start : block.end_row - row_start + 1]
+            for col_num in range(first_col, last_col + 1)
+        ]
+
+        return climate_entry.ActiveClimateSnapshot(
+            country=self.read_active_country(),
+            region=self.read_active_region(),
+            data_set=self.read_active_data_set(),
+            station_elevation=str(values["station_elevation"]),
+            site_elevation=str(values["site_elevation"]),
+            latitude=float(values["latitude"] or 0.0),  # type: ignore
+            longitude=float(values["longitude"] or 0.0),  # type: ignore
+            monthly_data=monthly_data,
+        )
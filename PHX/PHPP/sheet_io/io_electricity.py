@@ -9,6 +9,15 @@ from PHX.PHPP.phpp_localization import shape_model
 from PHX.PHPP.phpp_model import electricity_item
 from PHX.xl import xl_app, xl_data
 
+# -- Some items cannot be turned off....
+_EXCLUDED_FROM_RESET = (
+    "clothes_drying",
+    "cooking",
+    "consumer_elec",
+    "lighting",
+    "small_appliances",
+)
+
 
 class Electricity:
     """IO Controller for PHPP "Electricity" worksheet."""
@@ -18,32 +27,90 @@ class Electricity:
         self.shape = shape
         self.device_map = elec_equip.get_device_type_map()
 
+    def _reset_xl_items(self) -> list[xl_data.XlItem]:
+        """Return the XlItems which set all the 'used' values to 0, to reset the sheet before writing new equipment."""
+        return [
+            xl_data.XlItem(self.shape.name, f"{self.shape.input_columns.used}{item[1].data}", 0)
+            for item in self.shape.input_rows
+            if item[0] not in _EXCLUDED_FROM_RESET
+        ]
+
     def _turn_off_all_equipment(self) -> None:
         """Sets all the 'used' values to 0 to reset the sheet before writing new equipment."""
-        for item in self.shape.input_rows:
-            # Some items cannot be turned off....
-            excluded = [
-                "clothes_drying",
-                "cooking",
-                "consumer_elec",
-                "lighting",
-                "small_appliances",
-            ]
-            if item[0] in excluded:
-                continue
-
-            self.xl.write_xl_item(xl_data.XlItem(self.shape.name, f"{self.shape.input_columns.used}{item[1].data}", 0))
+        for xl_item in xl_data.merge_xl_item_cells(self._reset_xl_items()):
+            self.xl.write_xl_item(xl_item)
 
     def write_equipment(self, _equipment_inputs: list[electricity_item.ElectricityItemXLWriter]) -> None:
-        """Write a list of equipment-input objects to the Worksheet."""
-        self._turn_off_all_equipment()
+        """Write a list of equipment-input objects to the Worksheet.
 
+        The 'used' reset and all the equipment values are merged in Python first,
+        and written out as a few rectangular blocks (see 'xl_data.merge_xl_item_cells').
+        """
+        xl_items = self._reset_xl_items()
         for equip_input in _equipment_inputs:
-            for item in equip_input.create_xl_items(self.shape):
-                self.xl.write_xl_item(item)
-
-    def build_phx_device_from_phpp(self, _reader: electricity_item.ReaderDataItem) -> elec_equip.PhxElectricalDevice:
-        """Build a PHX Electrical Device object from the PHPP worksheet data."""
+            xl_items.extend(equip_input.create_xl_items(self.shape))
+
+        for xl_item in xl_data.merge_xl_item_cells(xl_items):
+            self.xl.write_xl_item(xl_item)
+
+    def read_addresses(self, _addresses: list[str]) -> dict[str, xl_data.xl_range_single_value]:
+        """Return the values of a set of single-cell addresses, read from the worksheet as one block.
+
+        Arguments:
+        ----------
+            * _addresses (list[str]): The cell addresses to read. ie: ["E25", "F25", "AB25"]
+
+        Returns:
+        --------
+            * (dict[str, xl_range_single_value]): The value of each cell, by address.
+        """
+        if not _addresses:
+            return {}
+
+        cells = [xl_data.split_cell_address(address) for address in _addresses]
+        col_start = min((col for col, _ in cells), key=xl_data.xl_ord)
+        col_end = max((col for col, _ in cells), key=xl_data.xl_ord)
+        row_start = min(row for _, row in cells)
+        row_end = max(row for _, row in cells)
+
+        data = self.xl.get_data_by_columns(self.shape.name, f"{col_start}{row_start}:{col_end}{row_end}")
+
+        # -- Excel gives a one-row (or one-column) range back as a flat list, and a single cell as a scalar.
+        if row_start == row_end and col_start == col_end:
+            columns = [[data]]
+        elif row_start == row_end:
+            columns = [[value] for value in data]  # type: ignore
+        elif col_start == col_end:
+            columns = [list(data)]  # type: ignore
+        else:
+            columns = data
+
+        start_col_number = xl_data.xl_ord(col_start)
+        return {
+            address: columns[xl_data.xl_ord(col) - start_col_number][row - row_start]
+            for address, (col, row) in zip(_addresses, cells, strict=True)
+        }
+
+    def build_phx_device_from_phpp(
+        self,
+        _reader: electricity_item.ReaderDataItem,
+        _phpp_data: dict[str, xl_data.xl_range_single_value] | None = None,
+    ) -> elec_equip.PhxElectricalDevice:
+        """Build a PHX Electrical Device object from the PHPP worksheet data.
+
+        Arguments:
+        ----------
+            * _reader (electricity_item.ReaderDataItem): The device type and its read-addresses.
+            * _phpp_data (dict[str, xl_range_single_value] | None): Optional values already read
+                from the worksheet, by address (see 'read_addresses'). If None, the reader's
+                addresses are read from the worksheet.
+
+        Returns:
+        --------
+            * (elec_equip.PhxElectricalDevice): The new device.
+        """
+        if _phpp_data is None:
+            _phpp_data = self.read_addresses([_.phpp_address for _ in _reader.data])
 
         # -- Get the right device class based on the device-type
         cls = self.device_map[_reader.type]
@@ -51,8 +118,7 @@ class Electricity:
 
         # -- Build the new Device using the input data from the PHPP Reader
         for phpp_read_address in _reader.data:
-            phpp_data = self.xl.get_single_data_item(self.shape.name, phpp_read_address.phpp_address)
-            setattr(phx_elec_device, phpp_read_address.attr_name, phpp_data)
+            setattr(phx_elec_device, phpp_read_address.attr_name, _phpp_data[phpp_read_address.phpp_address])
         return phx_elec_device
 
     def get_phx_elec_devices(self) -> list[elec_equip.PhxElectricalDevice]:
@@ -60,17 +126,20 @@ class Electricity:
         # -- Setup the reader class
         reader = electricity_item.ElectricityItemXLReader(self.shape)
 
-        phx_elec_devices = [
-            self.build_phx_device_from_phpp(reader._dishwasher),
-            self.build_phx_device_from_phpp(reader._clothes_washer),
-            self.build_phx_device_from_phpp(reader._clothes_dryer),
-            self.build_phx_device_from_phpp(reader._refrigerator),
-            self.build_phx_device_from_phpp(reader._fridge_freezer),
-            self.build_phx_device_from_phpp(reader._freezer),
-            self.build_phx_device_from_phpp(reader._cooktop),
-            self.build_phx_device_from_phpp(reader._mel),
-            self.build_phx_device_from_phpp(reader._lighting_interior),
-            self.build_phx_device_from_phpp(reader._lighting_exterior),
+        device_readers = [
+            reader._dishwasher,
+            reader._clothes_washer,
+            reader._clothes_dryer,
+            reader._refrigerator,
+            reader._fridge_freezer,
+            reader._freezer,
+            reader._cooktop,
+            reader._mel,
+            reader._lighting_interior,
+            reader._lighting_exterior,
         ]
 
-        return phx_elec_devices
+        # -- Read every device's data in one go
+        phpp_data = self.read_addresses([_.phpp_address for r in device_readers for _ in r.data])
+
+        return [self.build_phx_device_from_phpp(device_reader, phpp_data) for device_reader in device_readers]
@@ -11,21 +11,114 @@ from ph_units.unit_type import Unit
 
 from PHX.PHPP.phpp_localization import shape_model
 from PHX.PHPP.phpp_model import hot_water_piping, hot_water_tank
-from PHX.xl import xl_app
+from PHX.xl import xl_app, xl_data
+
+
+class DhwSectionLocator:
+    """Finds the section anchors on the 'DHW+Distribution' worksheet from a single read.
+
+    The piping and tank controllers used to each scan their own (overlapping)
+    window of the same locator columns. This reads all of the locator columns
+    once, as one block, and resolves each section's anchor row from it when that
+    section is first asked for. Each section is still only searched for within
+    its own row window, and a missing anchor only fails the section which needs it.
+    """
+
+    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.Dhw):
+        self.xl = _xl
+        self.shape = _shape
+        self._data: dict[str, list] | None = None
+        self._rows: dict[str, int] = {}
+
+    @property
+    def searches(self) -> dict[str, tuple[str, str, int, int]]:
+        """The (column, locator-string, row-start, row-end) to search for, for each section."""
+        return {
+            "dhw_header": (
+                self.shape.branch_piping.locator_col_header,
+                self.shape.branch_piping.locator_string_header,
+                100,
+                200,
+            ),
+            "recirc_header": (
+                self.shape.recirc_piping.locator_col_entry,
+                self.shape.recirc_piping.locator_string_entry,
+                100,
+                200,
+            ),
+            "branch_header": (
+                self.shape.branch_piping.locator_col_entry,
+                self.shape.branch_piping.locator_string_entry,
+                100,
+                200,
+            ),
+            # -- The tank header is above its entry rows, which are further down on older PHPPs (ie: 9.x)
+            "tanks_header": (
+                self.shape.tanks.locator_col_header,
+                self.shape.tanks.locator_string_header,
+                150,
+                max(200, self.shape.tanks.entry_row_start),
+            ),
+        }
+
+    @property
+    def data(self) -> dict[str, list]:
+        """The values of every locator column, by column letter, read from the worksheet on first use."""
+        if self._data is None:
+            self._data = self.read_locator_columns()
+        return self._data
+
+    def read_locator_columns(self) -> dict[str, list]:
+        """Read all of the sections' locator columns, over all of their row windows, as one block."""
+        searches = self.searches
+        cols = [col for col, _, _, _ in searches.values()]
+        col_start = min(cols, key=xl_data.xl_ord)
+        col_end = max(cols, key=xl_data.xl_ord)
+        row_start = min(start for _, _, start, _ in searches.values())
+        row_end = max(end for _, _, _, end in searches.values())
+
+        if col_start == col_end:
+            return {
+                col_start: self.xl.get_single_column_data(
+                    _sheet_name=self.shape.name, _col=col_start, _row_start=row_start, _row_end=row_end
+                )
+            }
+        return self.xl.get_data_with_column_letters(self.shape.name, f"{col_start}{row_start}:{col_end}{row_end}")
+
+    def row(self, _section: str) -> int:
+        """Return the anchor row of one section ('dhw_header', 'recirc_header', 'branch_header' or 'tanks_header')."""
+        if _section not in self._rows:
+            self._rows[_section] = self.find_section_row(_section)
+        return self._rows[_section]
+
+    def find_section_row(self, _section: str) -> int:
+        """Return the anchor row of one section, searched for within its own row window of the locator data."""
+        searches = self.searches
+        col, locator_string, start, end = searches[_section]
+        data_start = min(start for _, _, start, _ in searches.values())
+
+        for i, val in enumerate(self.data[col][start - data_start : end - data_start + 1], start=start):
+            if locator_string == val:
+                return i
+
+        raise Exception(
+            f"Error: Cannot find the '{locator_string}' header on the '{self.shape.name}' sheet, column {col}?"
+        )
 
 
 class RecircPiping:
     """The Recirculation Piping Section Group"""
 
-    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.Dhw):
+    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.Dhw, _locator: DhwSectionLocator | None = None):
         self.xl = _xl
         self.shape = _shape
+        self.locator = _locator or DhwSectionLocator(_xl, _shape)
         self._header_row: int | None = None
 
     @property
     def header_row(self) -> int:
         if not self._header_row:
-            self._header_row = self.find_header_row()
+            self._header_row = self.locator.row("recirc_header")
         return self._header_row
 
     def find_header_row(self, _row_start: int = 100, _rows: int = 100) -> int:
@@ -49,15 +142,16 @@ class RecircPiping:
 class BranchPiping:
     """The Branch Piping Section Group"""
 
-    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.Dhw):
+    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.Dhw, _locator: DhwSectionLocator | None = None):
         self.xl = _xl
         self.shape = _shape
+        self.locator = _locator or DhwSectionLocator(_xl, _shape)
         self._header_row: int | None = None
 
     @property
     def header_row(self) -> int:
         if not self._header_row:
-            self._header_row = self.find_header_row()
+            self._header_row = self.locator.row("branch_header")
         return self._header_row
 
     def find_header_row(self, _row_start: int = 100, _rows: int = 100) -> int:
@@ -81,12 +175,13 @@ class BranchPiping:
 class DHWPiping:
     """The DHW Piping Section Group"""
 
-    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.Dhw):
+    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.Dhw, _locator: DhwSectionLocator | None = None):
         self.xl = _xl
         self.shape = _shape
+        self.locator = _locator or DhwSectionLocator(_xl, _shape)
         self._header_row: int | None = None
-        self.recirc_piping = RecircPiping(self.xl, self.shape)
-        self.branch_piping = BranchPiping(self.xl, self.shape)
+        self.recirc_piping = RecircPiping(self.xl, self.shape, self.locator)
+        self.branch_piping = BranchPiping(self.xl, self.shape, self.locator)
 
     def find_header_row(self, _row_start: int = 100, _row_end: int = 200) -> int:
         xl_data = self.xl.get_single_column_data(
@@ -108,7 +203,7 @@ class DHWPiping:
     @property
     def header_row(self) -> int:
         if not self._header_row:
-            self._header_row = self.find_header_row()
+            self._header_row = self.locator.row("dhw_header")
         return self._header_row
 
     def find_recirc_piping_start_row(self) -> int:
@@ -117,6 +212,110 @@ class DHWPiping:
     def find_branch_piping_start_row(self) -> int:
         return self.branch_piping.header_row
 
+    def _read_piping_block(
+        self, _col_start: str, _start_row: int, _row_offsets: list[int], _num_groups: int
+    ) -> dict[str, list]:
+        """Return the pipe-group columns of one piping section, read as a single block."""
+        col_end = xl_data.col_offset(_col_start, _num_groups - 1)
+        row_start = _start_row + min(_row_offsets)
+        row_end = _start_row + max(_row_offsets)
+        if _num_groups == 1:
+            return {
+                _col_start: self.xl.get_single_column_data(
+                    _sheet_name=self.shape.name, _col=_col_start, _row_start=row_start, _row_end=row_end
+                )
+            }
+        return self.xl.get_data_with_column_letters(self.shape.name, f"{_col_start}{row_start}:{col_end}{row_end}")
+
+    def get_recirc_piping_data(self, _num_groups: int = 5) -> list[RecircPipingData]:
+        """Get the data for each recirculation pipe-group, read from the worksheet in one go."""
+        offsets = self.shape.recirc_piping.input_rows_offset
+        fields = {name: item.row for name, item in offsets}
+        first_offset = min(fields.values())
+        data = self._read_piping_block(
+            self.shape.recirc_piping.input_col_start, self.recirc_piping.header_row, list(fields.values()), _num_groups
+        )
+
+        piping_data = []
+        for i in range(_num_groups):
+            col = xl_data.col_offset(self.shape.recirc_piping.input_col_start, i)
+            phpp_data: dict[str, Any] = {name: data[col][row - first_offset] for name, row in fields.items()}
+            phpp_data.update({f"{name}_unit": item.unit for name, item in offsets})
+            piping_data.append(RecircPipingData.from_phpp_data(phpp_data))
+        return piping_data
+
+    def get_branch_piping_data(self, _num_groups: int = 5) -> list[BranchPipingData]:
+        """Get the data for each branch pipe-group, read from the worksheet in one go."""
+        offsets = self.shape.branch_piping.input_rows_offset
+        fields = {
+            "water_temp": offsets.water_temp.row,
+            "diameter": offsets.diameter.row,
+            "total_length": offsets.total_length.row,
+            "num_taps": offsets.num_taps,
+        }
+        first_offset = min(fields.values())
+        data = self._read_piping_block(
+            self.shape.branch_piping.input_col_start, self.branch_piping.header_row, list(fields.values()), _num_groups
+        )
+
+        piping_data = []
+        for i in range(_num_groups):
+            col = xl_data.col_offset(self.shape.branch_piping.input_col_start, i)
+            phpp_data: dict[str, Any] = {name: data[col][row - first_offset] for name, row in fields.items()}
+            phpp_data.update(
+                {
+                    "water_temp_unit": offsets.water_temp.unit,
+                    "diameter_unit": offsets.diameter.unit,
+                    "total_length_unit": offsets.total_length.unit,
+                }
+            )
+            piping_data.append(BranchPipingData.from_phpp_data(phpp_data))
+        return piping_data
+
+
+@dataclass
+class RecircPipingData:
+    """Convenience Wrapper for a Recirculation pipe-group's data read in from the PHPP."""
+
+    total_length: Unit = field(default_factory=Unit)
+    diameter: Unit = field(default_factory=Unit)
+    insul_thickness: Unit = field(default_factory=Unit)
+    insul_reflective: bool = False
+    insul_conductivity: Unit = field(default_factory=Unit)
+    daily_period: float = 0.0
+    water_temp: Unit = field(default_factory=Unit)
+
+    @classmethod
+    def from_phpp_data(cls, _d: dict[str, Any]) -> RecircPipingData:
+        return cls(
+            total_length=Unit(_d["total_length"], _d["total_length_unit"]),
+            diameter=Unit(_d["diameter"], _d["diameter_unit"]),
+            insul_thickness=Unit(_d["insul_thickness"], _d["insul_thickness_unit"]),
+            insul_reflective=str(_d["insul_reflective"] or "").strip().lower() == "x",
+            insul_conductivity=Unit(_d["insul_conductivity"], _d["insul_conductivity_unit"]),
+            daily_period=float(_d["daily_period"] or 0.0),
+            water_temp=Unit(_d["water_temp"], _d["water_temp_unit"]),
+        )
+
+
+@dataclass
+class BranchPipingData:
+    """Convenience Wrapper for a Branch pipe-group's data read in from the PHPP."""
+
+    water_temp: Unit = field(default_factory=Unit)
+    diameter: Unit = field(default_factory=Unit)
+    total_length: Unit = field(default_factory=Unit)
+    num_taps: int = 0
+
+    @classmethod
+    def from_phpp_data(cls, _d: dict[str, Any]) -> BranchPipingData:
+        return cls(
+            water_temp=Unit(_d["water_temp"], _d["water_temp_unit"]),
+            diameter=Unit(_d["diameter"], _d["diameter_unit"]),
+            total_length=Unit(_d["total_length"], _d["total_length_unit"]),
+            num_taps=int(_d["num_taps"] or 0),
+        )
+
 
 @dataclass
 class TankData:
@@ -154,26 +353,37 @@ class Tank:
         """Find the row where the tank entry starts."""
         return self.shape.tanks.entry_row_start
 
-    def get_phpp_data(self, _tank_num: int) -> TankData:
-        """Get the PHPP data for the specified tank number."""
+    def get_phpp_data(self, _tank_num: int, _column_data: list | None = None) -> TankData:
+        """Get the PHPP data for the specified tank number.
+
+        Arguments:
+        ----------
+            * _tank_num (int): The tank number (1 or 2).
+            * _column_data (list | None): Optional values of the tank's column, already read
+                from the worksheet, starting at the entry-start row. If None, the tank's
+                column is read from the worksheet.
+
+        Returns:
+        --------
+            * (TankData): The tank's data.
+        """
         shape = self.shape.tanks
         rows = shape.input_rows
         col = getattr(shape.input_columns, f"tank_{_tank_num}")
 
+        if _column_data is None:
+            _column_data = self.xl.get_single_column_data(
+                _sheet_name=self.shape.name,
+                _col=col,
+                _row_start=self.entry_row_start,
+                _row_end=self.entry_row_start + max(item.row for _, item in rows),  # type: ignore
+            )
+
         phpp_data = {
-            "type": self.xl.get_data(
-                self.shape.name,
-                f"{col}{self.entry_row_start + rows.tank_type.row}",
-            ),
-            "heat_loss_rate": self.xl.get_data(
-                self.shape.name,
-                f"{col}{self.entry_row_start + rows.standby_losses.row}",
-            ),
+            "type": _column_data[rows.tank_type.row],  # type: ignore
+            "heat_loss_rate": _column_data[rows.standby_losses.row],  # type: ignore
             "heat_loss_rate_unit": rows.standby_losses.unit,
-            "volume": self.xl.get_data(
-                self.shape.name,
-                f"{col}{self.entry_row_start + rows.storage_capacity.row}",
-            ),
+            "volume": _column_data[rows.storage_capacity.row],  # type: ignore
             "volume_unit": rows.storage_capacity.unit,
         }
 
@@ -183,9 +393,12 @@ class Tank:
 class Tanks:
     """The Tanks (Storage Heat Loss) Section Group"""
 
-    def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.Dhw) -> None:
+    def __init__(
+        self, _xl: xl_app.XLConnection, _shape: shape_model.Dhw, _locator: DhwSectionLocator | None = None
+    ) -> None:
         self.xl = _xl
         self.shape = _shape
+        self.locator = _locator or DhwSectionLocator(_xl, _shape)
         self._header_row: int | None = None
 
         self.tank_1 = Tank(self.xl, self.shape)
@@ -195,7 +408,7 @@ class Tanks:
     def header_row(self) -> int:
         """The row where the tank header starts."""
         if not self._header_row:
-            self._header_row = self.find_header_row()
+            self._header_row = self.locator.row("tanks_header")
         return self._header_row
 
     def find_header_row(self, _row_start: int = 150, _row_end: int = 200) -> int:
@@ -217,10 +430,14 @@ class Tanks:
         )
 
     def get_all_tank_device_data(self) -> list[TankData]:
-        """Get all the tank data from the spreadsheet."""
+        """Get all the tank data from the spreadsheet, reading both tank columns as one block."""
+        cols = self.shape.tanks.input_columns
+        row_start = self.tank_1.entry_row_start
+        row_end = row_start + max(item.row for _, item in self.shape.tanks.input_rows)  # type: ignore
+        data = self.xl.get_data_with_column_letters(self.shape.name, f"{cols.tank_1}{row_start}:{cols.tank_2}{row_end}")
         return [
-            self.tank_1.get_phpp_data(1),
-            self.tank_2.get_phpp_data(2),
+            self.tank_1.get_phpp_data(1, data[cols.tank_1]),
+            self.tank_2.get_phpp_data(2, data[cols.tank_2]),
         ]
 
 
@@ -230,27 +447,46 @@ class HotWater:
     def __init__(self, _xl: xl_app.XLConnection, _shape: shape_model.Dhw):
         self.xl = _xl
         self.shape = _shape
-        self.tanks = Tanks(self.xl, self.shape)
-        self.dhw_piping = DHWPiping(self.xl, self.shape)
+        # -- One shared locator, so all the section anchors are found in a single pass.
+        self.locator = DhwSectionLocator(self.xl, self.shape)
+        self.tanks = Tanks(self.xl, self.shape, self.locator)
+        self.dhw_piping = DHWPiping(self.xl, self.shape, self.locator)
 
     def write_tanks(self, _phpp_hw_tanks: list[hot_water_tank.TankInput]) -> None:
         """Write the tank data to the spreadsheet."""
+        xl_items = []
         for phpp_Tank_input in _phpp_hw_tanks:
-            for item in phpp_Tank_input.create_xl_items(self.shape.name, self.tanks.tank_1.entry_row_start):
-                self.xl.write_xl_item(item)
+            xl_items.extend(phpp_Tank_input.create_xl_items(self.shape.name, self.tanks.tank_1.entry_row_start))
+
+        for item in xl_data.merge_xl_item_cells(xl_items):
+            self.xl.write_xl_item(item)
 
     def write_branch_piping(self, _phpp_branch_piping: list[hot_water_piping.BranchPipingInput]) -> None:
         """Write the branch piping data to the spreadsheet."""
+        xl_items = []
         for pipe_inputs in _phpp_branch_piping:
-            for item in pipe_inputs.create_xl_items(self.shape.name, self.dhw_piping.branch_piping.header_row):
-                self.xl.write_xl_item(item)
+            xl_items.extend(pipe_inputs.create_xl_items(self.shape.name, self.dhw_piping.branch_piping.header_row))
+
+        for item in xl_data.merge_xl_item_cells(xl_items):
+            self.xl.write_xl_item(item)
 
-    def write_recirc_piping(self, _phpp_recirc_piping: list[hot_water_piping.BranchPipingInput]) -> None:
+    def write_recirc_piping(self, _phpp_recirc_piping: list[hot_water_piping.RecircPipingInput]) -> None:
         """Write the recirc piping data to the spreadsheet."""
+        xl_items = []
         for pipe_inputs in _phpp_recirc_piping:
-            for item in pipe_inputs.create_xl_items(self.shape.name, self.dhw_piping.recirc_piping.header_row):
-                self.xl.write_xl_item(item)
+            xl_items.extend(pipe_inputs.create_xl_items(self.shape.name, self.dhw_piping.recirc_piping.header_row))
+
+        for item in xl_data.merge_xl_item_cells(xl_items):
+            self.xl.write_xl_item(item)
 
     def get_all_tank_device_data(self) -> list[TankData]:
         """Get all the tank data from the PHPP worksheet."""
         return self.tanks.get_all_tank_device_data()
+
+    def get_recirc_piping_data(self) -> list[RecircPipingData]:
+        """Get all the recirculation pipe-group data from the PHPP worksheet."""
+        return self.dhw_piping.get_recirc_piping_data()
+
+    def get_branch_piping_data(self) -> list[BranchPipingData]:
+        """Get all the branch pipe-group data from the PHPP worksheet."""
+        return self.dhw_piping.get_branch_piping_data()
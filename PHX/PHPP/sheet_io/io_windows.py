@@ -5,13 +5,35 @@
 from __future__ import annotations
 
 from collections.abc import Generator
+from itertools import groupby
 
 from ph_units.unit_type import Unit
 
 from PHX.PHPP.phpp_localization import shape_model
 from PHX.PHPP.phpp_model.windows_rows import WindowRow, get_name_from_glazing_id
 from PHX.xl import xl_app
-from PHX.xl.xl_data import XlItem, col_offset, merge_xl_item_rows
+from PHX.xl.xl_data import XlItem, col_offset, merge_xl_item_rows, xl_ord
+
+
+def _has_window_data(_item) -> bool:
+    """Return True if a 'description' cell value holds a user-entered window."""
+    return not (_item == "-" or _item == "<End of designPH import!>" or _item is None)
+
+
+def _scaled_window_dimensions(_width: float, _height: float, _scale_factor: float) -> tuple[float, float]:
+    """Return the (width, height) of a window, scaled so its area changes by the scale-factor."""
+    # -- Calculate current area
+    current_area = float(_height) * float(_width)
+    desired_area = current_area * _scale_factor
+
+    # -- Calculate scaling factor
+    # ** 0.5 is equivalent to taking the square root of the expression on the
+    # left-hand side. This is because raising a number to the power of 1/2 is
+    # the same as taking the square root of that number.
+    edge_scaling_factor = (desired_area / current_area) ** 0.5
+
+    # -- Scale the dimensions
+    return _width * edge_scaling_factor, _height * edge_scaling_factor
 
 
 class Windows:
@@ -65,16 +87,13 @@ class Windows:
 
     @property
     def used_window_row_numbers(self) -> Generator[int, None, None]:
-        def has_window_data(_item) -> bool:
-            return not (_item == "-" or _item == "<End of designPH import!>" or _item is None)
-
         data = self.xl.get_single_column_data(
             self.shape.name,
             str(self.shape.window_rows.inputs.description.column),
             self.first_entry_row,
             self.last_entry_row,
         )
-        return (i for i, val in enumerate(data, start=self.first_entry_row) if has_window_data(val))
+        return (i for i, val in enumerate(data, start=self.first_entry_row) if _has_window_data(val))
 
     def find_header_row(self, _row_start: int = 1, _read_length: int = 100) -> int:
         """Return the row number for the Window entry section 'Header'"""
@@ -302,19 +321,7 @@ class Windows:
             f"{self.shape.window_rows.inputs.height.column}{_row_num}",
         )
 
-        # -- Calculate current area
-        current_area = float(height) * float(width)  # type: ignore
-        desired_area = current_area * _scale_factor
-
-        # -- Calculate scaling factor
-        # ** 0.5 is equivalent to taking the square root of the expression on the
-        # left-hand side. This is because raising a number to the power of 1/2 is
-        # the same as taking the square root of that number.
-        edge_scaling_factor = (desired_area / current_area) ** 0.5
-
-        # -- Scale the dimensions
-        new_width = width * edge_scaling_factor
-        new_height = height * edge_scaling_factor
+        new_width, new_height = _scaled_window_dimensions(width, height, _scale_factor)  # type: ignore
 
         # -- Set the new dimensions
         self.xl.write_xl_item(
@@ -332,6 +339,101 @@ class Windows:
             )
         )
 
+    def scale_window_sizes(
+        self,
+        _scale_factor: float,
+        _windows: bool = True,
+        _skylights: bool = True,
+        _tolerance: float = 5.0,
+    ) -> list[int]:
+        """Scale the size of every used window row based on an overall scale-factor.
+
+        The bulk version of 'scale_window_size': the description, angle, width and
+        height of the whole entry block are read in one go, the new sizes are
+        computed in Python, and each run of consecutive scaled rows is written back
+        as a single width/height block. So a full sheet costs one read and (usually)
+        one write, instead of four round trips per window.
+
+        Rows without a description, or without a usable width/height, are skipped
+        and left untouched, as are the windows / skylights filtered out. The angle
+        is only read when one of the two is filtered out; a row without a usable
+        angle is then taken as a (vertical) window.
+
+        Arguments:
+        ----------
+            * _scale_factor: float
+                The factor to scale each window's area by.
+            * _windows: bool
+                Scale the vertical windows. Default=True.
+            * _skylights: bool
+                Scale the skylights (anything not within the tolerance of vertical). Default=True.
+            * _tolerance: float
+                The angle tolerance used to tell windows from skylights. Default=5.0.
+
+        Returns:
+        --------
+            * (list[int]): The row numbers of the windows which were scaled.
+        """
+        inputs = self.shape.window_rows.inputs
+        cols = {
+            "description": str(inputs.description.column),
+            "angle": str(inputs.vertical_angle.column),
+            "width": str(inputs.width.column),
+            "height": str(inputs.height.column),
+        }
+        col_start = min(cols.values(), key=xl_ord)
+        col_end = max(cols.values(), key=xl_ord)
+        data = self.xl.get_data_with_column_letters(
+            self.shape.name, f"{col_start}{self.first_entry_row}:{col_end}{self.last_entry_row}"
+        )
+
+        new_sizes: dict[int, tuple[float, float]] = {}
+        for i, row_num in enumerate(range(self.first_entry_row, self.last_entry_row + 1)):
+            if not _has_window_data(data[cols["description"]][i]):
+                continue
+            try:
+                width = float(data[cols["width"]][i])  # type: ignore
+                height = float(data[cols["height"]][i])  # type: ignore
+            except (TypeError, ValueError):
+                continue
+            if not width * height:
+                continue
+
+            if _windows != _skylights:
+                # -- Only one of them is scaled, so tell them apart. A row without
+                # -- a usable angle is taken as vertical (a window).
+                try:
+                    is_window = abs(90.0 - float(data[cols["angle"]][i])) < _tolerance  # type: ignore
+                except (TypeError, ValueError):
+                    is_window = True
+                if is_window != _windows:
+                    continue
+            elif not _windows:
+                continue
+
+            new_sizes[row_num] = _scaled_window_dimensions(width, height, _scale_factor)
+
+        # -- Write each run of consecutive rows as one block.
+        for _, group in groupby(enumerate(new_sizes), key=lambda item: item[1] - item[0]):
+            rows = [row_num for _, row_num in group]
+            self._write_window_sizes(rows[0], [new_sizes[row_num] for row_num in rows])
+
+        return list(new_sizes)
+
+    def _write_window_sizes(self, _start_row: int, _sizes: list[tuple[float, float]]) -> None:
+        """Write a block of (width, height) values to consecutive rows, starting at the row given."""
+        width_col = str(self.shape.window_rows.inputs.width.column)
+        height_col = str(self.shape.window_rows.inputs.height.column)
+
+        if xl_ord(height_col) == xl_ord(width_col) + 1:
+            self.xl.write_xl_item(XlItem(self.shape.name, f"{width_col}{_start_row}", [list(s) for s in _sizes]))
+            return None
+
+        # -- Non-adjacent columns: one column-write each.
+        for col, values in ((width_col, [s[0] for s in _sizes]), (height_col, [s[1] for s in _sizes])):
+            self.xl.write_xl_item(XlItem(self.shape.name, f"{col}{_start_row}", values), _transpose=True)
+        return None
+
     def row_is_window(self, _row_num: int, _tolerance: float = 5.0) -> bool:
         """Return True if the row is a window, False otherwise."""
         col = str(self.shape.window_rows.inputs.vertical_angle.column)
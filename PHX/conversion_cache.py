@@ -0,0 +1,217 @@
+# -*- Python Version: 3.10 -*-
+
+"""An opt-in local cache of HBJSON conversions for the 'hbjson_to_*' run scripts.
+
+Repeated exports of an unchanged model (the usual case when tuning an export
+from Grasshopper / Rhino) re-read the HBJSON and re-convert it every time. With
+the 'PHX_CONVERSION_CACHE' environment variable set to a directory, each run
+script keys the conversion by a hash of:
+
+    * the HBJSON file's bytes
+    * the conversion options (group-components, merge-faces, ...)
+    * the PHX, snapshot-format and honeybee package versions
+
+and keeps, under that key, the built project (as a 'PHX.snapshot') and, for the
+file writers whose output only depends on the project, the written output. A
+hit on the output skips reading and converting the model altogether; a hit on
+the project skips the conversion. The hits and misses of the run, and the
+running totals of the directory, are reported by 'ConversionCache.report'.
+
+Only the most recently used 'max_entries' keys are kept.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import shutil
+import tempfile
+from collections import Counter
+from importlib import metadata
+from typing import Any
+
+from PHX import snapshot
+from PHX.model.project import PhxProject
+
+CACHE_ENV_VAR = "PHX_CONVERSION_CACHE"
+
+# -- Part of every key: changing one of these packages can change the conversion.
+_KEYED_PACKAGES = ("honeybee-core", "honeybee-energy", "honeybee-ph", "ladybug-geometry")
+_PROJECT_SUFFIX = "project.phxsnap"
+_STATS_FILE = "stats.json"
+
+logger = logging.getLogger(__name__)
+
+
+def _package_version(_name: str) -> str:
+    try:
+        return metadata.version(_name)
+    except metadata.PackageNotFoundError:
+        return "not-installed"
+
+
+def _write_atomic(_path: pathlib.Path, _data: bytes) -> None:
+    """Write the file through a temporary file, so a concurrent run never reads a partial entry."""
+    with tempfile.NamedTemporaryFile(dir=_path.parent, prefix=f".{_path.name}.", delete=False) as tmp:
+        tmp.write(_data)
+    os.replace(tmp.name, _path)
+
+
+class ConversionCache:
+    """A directory of converted projects and written outputs, by a hash of the conversion inputs.
+
+    Arguments:
+    ----------
+        * cache_dir (pathlib.Path): The cache directory. Created if needed.
+        * max_entries (int): The number of keys (models / option sets) to keep. Default: 32.
+    """
+
+    def __init__(self, cache_dir: pathlib.Path, max_entries: int = 32) -> None:
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        # -- The hits and misses already added to the directory's totals.
+        self._reported: tuple[Counter[str], Counter[str]] = (Counter(), Counter())
+
+    @classmethod
+    def from_env(cls) -> ConversionCache | None:
+        """Return the cache in the 'PHX_CONVERSION_CACHE' directory, or None if it is not set."""
+        value = os.environ.get(CACHE_ENV_VAR, "").strip()
+        if not value:
+            return None
+        return cls(pathlib.Path(value).expanduser())
+
+    def key(self, _source_file: pathlib.Path, **_options: Any) -> str:
+        """Return the key of converting the HBJSON file with the options."""
+        versions = {
+            "phx": snapshot.phx_version(),
+            "snapshot_format": snapshot.SNAPSHOT_FORMAT_VERSION,
+            **{name: _package_version(name) for name in _KEYED_PACKAGES},
+        }
+        digest = hashlib.sha256()
+        digest.update(json.dumps({"versions": versions, "options": _options}, sort_keys=True).encode("utf-8"))
+        digest.update(pathlib.Path(_source_file).read_bytes())
+        return digest.hexdigest()
+
+    def _entry(self, _key: str, _suffix: str) -> pathlib.Path:
+        return self.cache_dir / f"{_key}.{_suffix}"
+
+    def _record(self, _kind: str, _hit: bool) -> bool:
+        (self.hits if _hit else self.misses)[_kind] += 1
+        return _hit
+
+    # -------------------------------------------------------------------------
+
+    def load_project(self, _key: str) -> PhxProject | None:
+        """Return the cached project, or None (a miss) if there is none or it cannot be loaded."""
+        path = self._entry(_key, _PROJECT_SUFFIX)
+        project = None
+        if path.exists():
+            try:
+                project = snapshot.read_project_snapshot(path)
+                path.touch()
+            except snapshot.SnapshotError as e:
+                logger.info(f"Ignoring the cached project {path.name}: {e}")
+        self._record("project", project is not None)
+        return project
+
+    def store_project(self, _key: str, _project: PhxProject) -> None:
+        """Save the converted project under the key."""
+        _write_atomic(self._entry(_key, _PROJECT_SUFFIX), snapshot.dump_project_snapshot(_project))
+        self._prune()
+
+    def restore_output(self, _key: str, _suffix: str, _target: pathlib.Path) -> bool:
+        """Copy the cached output (e.g. 'wufi.xml') to the target. Return False (a miss) if there is none."""
+        path = self._entry(_key, _suffix)
+        if not self._record("output", path.exists()):
+            return False
+        shutil.copyfile(path, _target)
+        path.touch()
+        return True
+
+    def store_output(self, _key: str, _suffix: str, _written: pathlib.Path) -> None:
+        """Save a copy of the written output file under the key."""
+        _write_atomic(self._entry(_key, _suffix), pathlib.Path(_written).read_bytes())
+        self._prune()
+
+    # -------------------------------------------------------------------------
+
+    def _prune(self) -> None:
+        """Remove the least recently used keys beyond 'max_entries'."""
+        last_used: dict[str, float] = {}
+        for path in self.cache_dir.glob("*.*"):
+            if path.name.startswith(".") or path.name == _STATS_FILE:
+                continue
+            key = path.name.split(".", 1)[0]
+            last_used[key] = max(last_used.get(key, 0.0), path.stat().st_mtime)
+        for key in sorted(last_used, key=last_used.__getitem__)[: max(len(last_used) - self.max_entries, 0)]:
+            for path in self.cache_dir.glob(f"{key}.*"):
+                path.unlink(missing_ok=True)
+
+    def _update_totals(self) -> dict[str, dict[str, int]]:
+        """Add this run's hits and misses to the directory's running totals, and return these."""
+        stats_path = self.cache_dir / _STATS_FILE
+        try:
+            totals = json.loads(stats_path.read_text())
+        except (OSError, ValueError):
+            totals = {}
+        reported_hits, reported_misses = self._reported
+        for kind in sorted(self.hits.keys() | self.misses.keys()):
+            kind_totals = totals.setdefault(kind, {"hits": 0, "misses": 0})
+            kind_totals["hits"] += self.hits[kind] - reported_hits[kind]
+            kind_totals["misses"] += self.misses[kind] - reported_misses[kind]
+        self._reported = (self.hits.copy(), self.misses.copy())
+        _write_atomic(stats_path, json.dumps(totals, indent=2, sort_keys=True).encode("utf-8"))
+        return totals
+
+    def report(self) -> str:
+        """Return this run's hits and misses and the directory's totals, and add the run to the totals."""
+        totals = self._update_totals()
+        run = ", ".join(
+            f"{kind} {self.hits[kind]} hits / {self.misses[kind]} misses" for kind in sorted(self.hits | self.misses)
+        )
+        total = ", ".join(f"{kind} {t['hits']} hits / {t['misses']} misses" for kind, t in sorted(totals.items()))
+        return f"Conversion cache ({self.cache_dir}): this run {run or 'not used'}. Totals: {total or 'none'}."
+
+
+def convert_hbjson_file(
+    _source_file: pathlib.Path, _cache: ConversionCache | None, _key: str | None = None, **_options: Any
+) -> PhxProject:
+    """Return the PHX project of the HBJSON file: from the cache if it holds it, otherwise read and converted.
+
+    Arguments:
+    ----------
+        * _source_file (pathlib.Path): The HBJSON file.
+        * _cache (ConversionCache | None): The cache, or None to always convert.
+        * _key (str | None): The key, if already computed (see 'ConversionCache.key').
+        * _options: The 'convert_hb_model_to_PhxProject' options, without the leading
+            underscore (group_components=..., merge_faces=..., ...).
+
+    Returns:
+    --------
+        * (PhxProject): The converted project.
+    """
+    # -- Imported here: a hit does not need the Honeybee libraries at all.
+    from PHX.from_HBJSON import create_project, read_HBJSON_file
+
+    if _cache is not None:
+        _key = _key or _cache.key(_source_file, **_options)
+        if (project := _cache.load_project(_key)) is not None:
+            logger.info(f"> Loaded the PHX-Project from the conversion cache: {_key[:12]}")
+            return project
+
+    logger.info(f"> Reading in the HBJSON file: ./{_source_file}")
+    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(read_HBJSON_file.read_hb_json_from_file(_source_file))
+    logger.info(f'> Generating the PHX-Project from the Honeybee-Model: "{hb_model}"')
+    project = create_project.convert_hb_model_to_PhxProject(
+        hb_model, **{f"_{name}": value for name, value in _options.items()}
+    )
+
+    if _cache is not None and _key is not None:
+        _cache.store_project(_key, project)
+    return project
@@ -0,0 +1,138 @@
+# -*- Python Version: 3.10 -*-
+
+"""Import only part of a WUFI-XML file: some of its Variants, or some of its top-level sections.
+
+A full import parses, validates and converts every Variant of the file, even when
+only the project data, the constructions or a single Variant is needed. A
+'WufiXmlSelection' names the Variants (by their position in the file) and the
+top-level sections to load; the rest is dropped from the tree as the file is
+parsed ('read_WUFI_XML_file.parse_WUFI_XML_file_selection'), so it is never
+converted, validated or built. The project's 'partial_import' then records what
+was left out.
+
+The project data (and the file's version information) is always loaded. The
+climate, certification and HVAC data belong to each Variant, and are loaded
+with it. A Variant refers to the project's constructions, shades and
+utilization patterns, so loading any Variant also loads all of these sections.
+"""
+
+from __future__ import annotations
+
+import pathlib
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import Any
+
+from PHX.from_WUFI_XML import read_WUFI_XML_file
+from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
+from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
+from PHX.model.project import PhxPartialImport, PhxProject
+
+# -- The top-level sections of a WUFI-XML file which can be left out (the 'Variants' are selected on their own).
+SELECTABLE_SECTIONS = (
+    "UtilizationPatternsPH",
+    "UtilisationPatternsVentilation",
+    "WindowTypes",
+    "Assemblies",
+    "SolarProtectionTypes",
+)
+
+
+@dataclass(frozen=True)
+class WufiXmlSelection:
+    """The parts of a WUFI-XML file to import.
+
+    Attributes:
+        variants (Collection[int] | None): The positions (0-based, in the file's order) of the
+            Variants to load. None for all of them, empty for none. Default: None.
+        sections (Collection[str] | None): The top-level sections to load, by their XML name
+            (see 'SELECTABLE_SECTIONS'). None for all of them. Default: None. Sections which
+            a loaded Variant refers to are always loaded.
+    """
+
+    variants: Collection[int] | None = None
+    sections: Collection[str] | None = None
+
+    def __post_init__(self) -> None:
+        unknown = sorted(set(self.sections or ()) - set(SELECTABLE_SECTIONS))
+        if unknown:
+            raise ValueError(
+                f"Error: Unknown WUFI-XML section(s): {unknown}. The sections which can be selected are: "
+                f"{list(SELECTABLE_SECTIONS)}."
+            )
+
+    @property
+    def skipped_sections(self) -> tuple[str, ...]:
+        """The top-level sections which are not loaded."""
+        if self.sections is None or self.variants is None or len(self.variants) > 0:
+            return ()
+        return tuple(section for section in SELECTABLE_SECTIONS if section not in self.sections)
+
+
+def get_WUFI_XML_file_selection_as_plain_dict(
+    _file_address: pathlib.Path, _selection: WufiXmlSelection
+) -> tuple[dict[str, Any], PhxPartialImport | None]:
+    """Read in the selected parts of a WUFI-XML file as a nested dictionary of plain values.
+
+    Arguments:
+    ----------
+        * _file_address (pathlib.Path): Path to the WUFI-XML file.
+        * _selection (WufiXmlSelection): The Variants and sections to read.
+
+    Returns:
+    --------
+        * (dict): Nested dictionary of the selected XML structure (as 'get_WUFI_XML_file_as_plain_dict').
+        * (PhxPartialImport | None): What was left out, or None if the whole file was read.
+
+    Raises:
+    -------
+        * ValueError: If a selected Variant position is not in the file.
+    """
+    skipped_sections = _selection.skipped_sections
+    root, variant_names = read_WUFI_XML_file.parse_WUFI_XML_file_selection(
+        _file_address, skipped_sections, _selection.variants
+    )
+
+    selected_variants = set(range(len(variant_names)) if _selection.variants is None else _selection.variants)
+    missing = sorted(i for i in selected_variants if not 0 <= i < len(variant_names))
+    if missing:
+        raise ValueError(
+            f"Error: Cannot import the WUFI-XML Variant(s) {missing} from '{_file_address}': "
+            f"the file has {len(variant_names)} Variant(s)."
+        )
+
+    skipped_variants = {i: name for i, name in enumerate(variant_names) if i not in selected_variants}
+    partial_import = None
+    if skipped_sections or skipped_variants:
+        partial_import = PhxPartialImport(skipped_sections=skipped_sections, skipped_variants=skipped_variants)
+
+    return read_WUFI_XML_file.xml_to_plain_dict(root, _release=True), partial_import
+
+
+def convert_WUFI_XML_file_selection_to_PHX_project(
+    _file_address: pathlib.Path,
+    _selection: WufiXmlSelection,
+    _max_workers: int | None = 1,
+) -> PhxProject:
+    """Import the selected parts of a WUFI-XML file as a PHX-Project model.
+
+    Arguments:
+    ----------
+        * _file_address (pathlib.Path): Path to the WUFI-XML file.
+        * _selection (WufiXmlSelection): The Variants and sections to import.
+        * _max_workers (int | None): The maximum number of worker processes used to build
+            the Variants' geometry (see 'convert_WUFI_XML_to_PHX_project'). Default: 1.
+
+    Returns:
+    --------
+        * (PhxProject): A new PHX project with the selected data. Its 'partial_import' records
+            the sections and Variants which were left out (None if none were).
+
+    Raises:
+    -------
+        * ValueError: If a selected Variant position is not in the file.
+    """
+    data, partial_import = get_WUFI_XML_file_selection_as_plain_dict(_file_address, _selection)
+    phx_project = convert_WUFI_XML_to_PHX_project(WUFIplusProject.model_validate(data), _max_workers)
+    phx_project.partial_import = partial_import
+    return phx_project
@@ -1,4 +1,5 @@
 from PHX.from_WUFI_XML.phx_schemas import _PhxProject
+from PHX.from_WUFI_XML.phx_variants import build_variant_geometries
 from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
 from PHX.model import project
 from PHX.model.identity import build_project_with_identities
@@ -6,15 +7,20 @@ from PHX.model.identity import build_project_with_identities
 
 def convert_WUFI_XML_to_PHX_project(
     _wufi_xml_project: WUFIplusProject,
+    _max_workers: int | None = 1,
 ) -> project.PhxProject:
     """Convert a WUFI-XML Pydantic project schema into a PHX-Project model.
 
     Arguments:
     ----------
         * _wufi_xml_project (WUFIplusProject): The parsed WUFI-XML project.
+        * _max_workers (int | None): The maximum number of worker processes used to build
+            the Variants' geometry. Default: 1 (all in this process). None for one per CPU.
+            The result is the same for any number of workers.
 
     Returns:
     --------
         * (project.PhxProject): A new PHX project with all data from the WUFI file.
     """
-    return build_project_with_identities(lambda: _PhxProject(_wufi_xml_project))
+    variant_geometry = build_variant_geometries(_wufi_xml_project, _max_workers)
+    return build_project_with_identities(lambda: _PhxProject(_wufi_xml_project, variant_geometry))
@@ -2,11 +2,13 @@
 
 """Classes for converting WUFI-Pydantic Entities to PHX Model Objects."""
 
+import inspect
 import logging
 import sys
 from collections import defaultdict, deque
+from collections.abc import Callable
 from functools import partial
-from typing import Any, Protocol
+from typing import Any, NamedTuple, Protocol
 
 from ph_units.converter import convert
 from rich import print
@@ -114,7 +116,14 @@ from PHX.model.hvac.ventilation import (
     PhxExhaustVentilatorUserDefined,
 )
 from PHX.model.hvac.water import PhxHotWaterTank
-from PHX.model.identity import IdentityNamespace, IdentityNamespaces, claim_identity, identity_owner_scope
+from PHX.model.identity import (
+    IdentityAllocator,
+    IdentityNamespace,
+    IdentityNamespaces,
+    claim_identity,
+    current_identity_allocator,
+    identity_owner_scope,
+)
 from PHX.model.phx_site import PhxClimate, PhxCO2Factor, PhxGround, PhxPEFactor, PhxSite, PhxSiteEnergyFactors
 from PHX.model.project import PhxProject, PhxProjectData, PhxProjectDate, PhxVariant, ProjectData_Agent, WufiPlugin
 from PHX.model.schedules.lighting import PhxScheduleLighting
@@ -127,6 +136,22 @@ from PHX.model.spaces import PhxSpace
 # -- Conversion Function
 
 
+class NoPhxBuilderFoundError(Exception):
+    """Raised when no PHX class-builder is found for a given schema name.
+
+    Attributes:
+        message (str): Detailed error describing the missing builder, input type, and module searched.
+    """
+
+    def __init__(self, _schema_module, _model, _schema_nm):
+        self.message = (
+            f'\n  Error: Cannot find a PHX class-builder for the object of type: "{type(_model)}"'
+            f'\n  using the schema name: "{_schema_nm}" (function "_{_schema_nm}")'
+            f'\n  in file: "{_schema_module.__file__}". Please check the schemas.'
+        )
+        super().__init__(self.message)
+
+
 def as_phx_obj(_model, _schema_name, **kwargs) -> Any:
     """Find the right class-builder from the module and pass along the data to it.
 
@@ -137,7 +162,10 @@ def as_phx_obj(_model, _schema_name, **kwargs) -> Any:
     Returns:
         A new PHX object built from the input data
     """
-    builder = getattr(sys.modules[__name__], f"_{_schema_name}")
+    try:
+        builder = _BUILDERS[_schema_name]
+    except KeyError:
+        raise NoPhxBuilderFoundError(sys.modules[__name__], _model, _schema_name) from None
     return builder(_model, **kwargs)
 
 
@@ -165,11 +193,22 @@ def _claim_object_identity(
         _obj.id_num = claimed
 
 
+class PhxVariantGeometry(NamedTuple):
+    """A Variant's vertices and polygons, by their WUFI IdentNr."""
+
+    vertices: dict[int, PhxVertix]
+    polygons: dict[int, PhxPolygon]
+    # -- The allocator they were built with, when built apart from the project.
+    identities: IdentityAllocator | None = None
+
+
 # -----------------------------------------------------------------------------
 # -- Project
 
 
-def _PhxProject(_model: wufi_xml.WUFIplusProject) -> PhxProject:
+def _PhxProject(
+    _model: wufi_xml.WUFIplusProject, _variant_geometry: list[PhxVariantGeometry] | None = None
+) -> PhxProject:
     phx_obj = PhxProject()
     phx_obj.data_version = _model.DataVersion
     phx_obj.unit_system = _model.UnitSystem
@@ -212,9 +251,15 @@ def _PhxProject(_model: wufi_xml.WUFIplusProject) -> PhxProject:
 
     # ----------------------------------------------------------------------
     # -- Build all the actual Variants
-    for variant_dict in _model.Variants or []:
+    # -- If their geometry was already built (in worker processes), it is used in place.
+    for i, variant_dict in enumerate(_model.Variants or []):
         with identity_owner_scope(variant_dict.IdentNr):
-            new_variant = as_phx_obj(variant_dict, "PhxVariant", _phx_project_host=phx_obj)
+            new_variant = as_phx_obj(
+                variant_dict,
+                "PhxVariant",
+                _phx_project_host=phx_obj,
+                _geometry=_variant_geometry[i] if _variant_geometry else None,
+            )
         phx_obj.add_new_variant(new_variant)
 
     return phx_obj
@@ -479,7 +524,11 @@ def _WufiPlugin(_model: wufi_xml.WufiPlugin) -> WufiPlugin:
     return phx_obj
 
 
-def _PhxVariant(_xml_variant_data: wufi_xml.WufiVariant, _phx_project_host: PhxProject) -> PhxVariant:
+def _PhxVariant(
+    _xml_variant_data: wufi_xml.WufiVariant,
+    _phx_project_host: PhxProject,
+    _geometry: PhxVariantGeometry | None = None,
+) -> PhxVariant:
     phx_obj = PhxVariant()
 
     _claim_object_identity(
@@ -493,6 +542,7 @@ def _PhxVariant(_xml_variant_data: wufi_xml.WufiVariant, _phx_project_host: PhxP
         (_xml_variant_data.Building, _xml_variant_data.Graphics_3D),
         "PhxBuilding",
         _phx_project_host=_phx_project_host,
+        _geometry=_geometry,
     )
     # Pass along the phx-building, so we can calculate the Airtightness n50
     phx_obj.phius_cert = as_phx_obj(
@@ -858,16 +908,19 @@ def _get_compo_data_by_type(
 def _PhxBuilding(
     _data: tuple[wufi_xml.WufiBuilding, wufi_xml.WufiGraphics_3D],
     _phx_project_host: PhxProject,
+    _geometry: PhxVariantGeometry | None = None,
 ) -> PhxBuilding:
     phx_obj = PhxBuilding()
 
     # ------------------------------------------------------------------
     # -- First, build all the vertices and polygons needed by the Components
+    # -- (unless they were built apart, in which case their identities join the project's)
     bldg_data, geom_data = _data
-    vertix_dict: dict[int, PhxVertix] = {v.IdentNr: as_phx_obj(v, "PhxVertix") for v in geom_data.Vertices}
-    polygon_dict: dict[int, PhxPolygon] = {
-        v.IdentNr: as_phx_obj(v, "PhxPolygon", _vertix_dict=vertix_dict) for v in geom_data.Polygons
-    }
+    if _geometry is None:
+        _geometry = as_phx_obj(geom_data, "PhxVariantGeometry")
+    elif _geometry.identities is not None and (allocator := current_identity_allocator()) is not None:
+        allocator.absorb(_geometry.identities)
+    polygon_dict = _geometry.polygons
 
     # ------------------------------------------------------------------
     # -- Build the Components
@@ -904,6 +957,14 @@ def _PhxBuilding(
     return phx_obj
 
 
+def _PhxVariantGeometry(_data: wufi_xml.WufiGraphics_3D) -> PhxVariantGeometry:
+    vertix_dict: dict[int, PhxVertix] = {v.IdentNr: as_phx_obj(v, "PhxVertix") for v in _data.Vertices}
+    polygon_dict: dict[int, PhxPolygon] = {
+        v.IdentNr: as_phx_obj(v, "PhxPolygon", _vertix_dict=vertix_dict) for v in _data.Polygons
+    }
+    return PhxVariantGeometry(vertix_dict, polygon_dict)
+
+
 def _PhxVertix(_data: wufi_xml.WufiVertix) -> PhxVertix:
     phx_obj = PhxVertix()
     _claim_object_identity(phx_obj, IdentityNamespaces.VERTICES, _data.IdentNr, f"Vertex[{_data.IdentNr}]")
@@ -1378,29 +1439,11 @@ def _PhxZone(_data: wufi_xml.WufiZone, _phx_project_host: PhxProject) -> PhxZone
     ventilation_spaces = [
         as_phx_obj(data, "PhxSpace", _phx_project_host=_phx_project_host) for data in _data.RoomsVentilation or []
     ]
-    ventilation_spaces_by_name: defaultdict[str, deque[PhxSpace]] = defaultdict(deque)
-    for space in ventilation_spaces:
-        ventilation_spaces_by_name[_space_list_join_key(space.display_name)].append(space)
+    space_lists = _join_space_lists(ventilation_spaces, _data.LoadsPersonsPH or [], _data.LoadsLightingsPH or [])
 
-    lighting_load_data: defaultdict[str, deque[wufi_xml.WufiLoadsLighting]] = defaultdict(deque)
-    for lighting_data in _data.LoadsLightingsPH or []:
-        lighting_load_data[_space_list_join_key(lighting_data.Name)].append(lighting_data)
-
-    used_ventilation_space_ids = set()
-    unpaired_person_load_names: list[str | None] = []
-
-    def _pop_lighting_data(_name: str | None) -> wufi_xml.WufiLoadsLighting | None:
-        """Consume the next unused lighting record matching a name, if there is one."""
-        matching_lighting_data = lighting_load_data[_space_list_join_key(_name)]
-        return matching_lighting_data.popleft() if matching_lighting_data else None
-
-    for occupancy_data in _data.LoadsPersonsPH or []:
-        matching_ventilation_spaces = ventilation_spaces_by_name[_space_list_join_key(occupancy_data.Name)]
-        if matching_ventilation_spaces:
-            space = matching_ventilation_spaces.popleft()
-            used_ventilation_space_ids.add(id(space))
-        else:
-            unpaired_person_load_names.append(occupancy_data.Name)
+    for space, occupancy_data, lighting_data in space_lists.rows:
+        if space is None:
+            # -- A person-load with no ventilation room.
             floor_area = occupancy_data.FloorAreaUtilizationZone or 0.0
             space = PhxSpace(
                 display_name=occupancy_data.Name,
@@ -1409,21 +1452,12 @@ def _PhxZone(_data: wufi_xml.WufiZone, _phx_project_host: PhxProject) -> PhxZone
             )
 
         space = _add_occupancy_data_to_space(space, _phx_project_host, occupancy_data)
-        space = _add_lighting_data_to_space(space, _phx_project_host, _pop_lighting_data(occupancy_data.Name))
-        phx_obj.spaces.append(space)
-
-    # -- Any ventilation room left over has no person-load record: every record in
-    # -- 'LoadsPersonsPH' was consumed by the loop above. Do NOT re-read one here.
-    unpaired_room_names: list[str | None] = []
-    for space in ventilation_spaces:
-        if id(space) in used_ventilation_space_ids:
-            continue
-        unpaired_room_names.append(space.display_name)
-        space = _add_occupancy_data_to_space(space, _phx_project_host, None)
-        space = _add_lighting_data_to_space(space, _phx_project_host, _pop_lighting_data(space.display_name))
+        space = _add_lighting_data_to_space(space, _phx_project_host, lighting_data)
         phx_obj.spaces.append(space)
 
-    _report_space_list_reconciliation(_data.Name, unpaired_room_names, unpaired_person_load_names, lighting_load_data)
+    _report_space_list_reconciliation(
+        _data.Name, space_lists.unpaired_rooms, space_lists.unpaired_persons, space_lists.unused_lighting
+    )
 
     # ----------------------------------------------------------------------
     # -- Add in any devices and thermal bridges as well.
@@ -1455,6 +1489,71 @@ def _space_list_join_key(_name: str | None) -> str:
     return " ".join((_name or "").split())
 
 
+class _SpaceListJoin(NamedTuple):
+    """A Zone's ventilation rooms, person-loads and lighting-loads, paired by name.
+
+    'rows' are the (Space, person-load, lighting-load) to build, in Space order: one per
+    person-load (with Space None where no ventilation room matched), then one per
+    left-over ventilation room (with person-load None).
+    """
+
+    rows: list[tuple[PhxSpace | None, wufi_xml.WufiLoadPerson | None, wufi_xml.WufiLoadsLighting | None]]
+    unpaired_rooms: list[str | None]
+    unpaired_persons: list[str | None]
+    unused_lighting: defaultdict[str, deque[wufi_xml.WufiLoadsLighting]]
+
+
+def _join_space_lists(
+    _ventilation_spaces: list[PhxSpace],
+    _person_loads: list[wufi_xml.WufiLoadPerson],
+    _lighting_loads: list[wufi_xml.WufiLoadsLighting],
+) -> _SpaceListJoin:
+    """Pair the Zone's three Space-shaped lists in one hash-join on '_space_list_join_key'.
+
+    Each name is normalized once. Records with the same key pair in list order, and
+    every record is consumed at most once; whatever is left is un-paired. Nothing is
+    built here, so the Spaces (and any patterns) are still created in Space order.
+    """
+    room_keys = [_space_list_join_key(space.display_name) for space in _ventilation_spaces]
+    rooms_by_key: defaultdict[str, deque[int]] = defaultdict(deque)
+    for i, key in enumerate(room_keys):
+        rooms_by_key[key].append(i)
+
+    lighting_by_key: defaultdict[str, deque[wufi_xml.WufiLoadsLighting]] = defaultdict(deque)
+    for lighting_data in _lighting_loads:
+        lighting_by_key[_space_list_join_key(lighting_data.Name)].append(lighting_data)
+
+    def _pop_lighting_data(_key: str) -> wufi_xml.WufiLoadsLighting | None:
+        matching_lighting_data = lighting_by_key.get(_key)
+        return matching_lighting_data.popleft() if matching_lighting_data else None
+
+    rows: list[tuple[PhxSpace | None, wufi_xml.WufiLoadPerson | None, wufi_xml.WufiLoadsLighting | None]] = []
+    unpaired_persons: list[str | None] = []
+    room_is_paired = [False] * len(_ventilation_spaces)
+    for occupancy_data in _person_loads:
+        key = _space_list_join_key(occupancy_data.Name)
+        matching_rooms = rooms_by_key.get(key)
+        if matching_rooms:
+            room_index = matching_rooms.popleft()
+            room_is_paired[room_index] = True
+            space = _ventilation_spaces[room_index]
+        else:
+            unpaired_persons.append(occupancy_data.Name)
+            space = None
+        rows.append((space, occupancy_data, _pop_lighting_data(key)))
+
+    # -- Any ventilation room left over has no person-load record: every record in
+    # -- the person-load list was consumed by the loop above. Do NOT re-read one here.
+    unpaired_rooms: list[str | None] = []
+    for space, key, is_paired in zip(_ventilation_spaces, room_keys, room_is_paired):
+        if is_paired:
+            continue
+        unpaired_rooms.append(space.display_name)
+        rows.append((space, None, _pop_lighting_data(key)))
+
+    return _SpaceListJoin(rows, unpaired_rooms, unpaired_persons, lighting_by_key)
+
+
 def _report_space_list_reconciliation(
     _zone_name: str | None,
     _unpaired_rooms: list[str | None],
@@ -2029,3 +2128,15 @@ def _PhxDeviceCustomMEL(_data: wufi_xml.WufiHomeDevice) -> PhxDeviceCustomMEL:
     phx_obj = PhxDeviceCustomMEL()
 
     return phx_obj
+
+
+# -----------------------------------------------------------------------------
+# -- Builder Registry
+
+# -- Every class-builder in the module ('_' + a capitalised name: '_PhxZone', '_Trunc', ...)
+# -- by its schema name, built once so 'as_phx_obj' does not look it up on each call.
+_BUILDERS: dict[str, Callable[..., Any]] = {
+    _name[1:]: _obj
+    for _name, _obj in globals().items()
+    if _name[:1] == "_" and _name[1:2].isupper() and inspect.isfunction(_obj) and _obj.__module__ == __name__
+}
@@ -0,0 +1,63 @@
+# -*- Python Version: 3.10 -*-
+
+"""Build the geometry of each WUFI-XML Variant in parallel processes."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from PHX.from_WUFI_XML import phx_schemas
+from PHX.from_WUFI_XML import wufi_file_schema as wufi_xml
+from PHX.model.identity import identity_owner_scope, identity_scope
+
+# -- Each Variant's identity-owner (its IdentNr) and geometry data, set once in each worker process.
+_WORKER_STATE: list[tuple[int, wufi_xml.WufiGraphics_3D]] | None = None
+
+
+def _init_worker(_variants: list[tuple[int, wufi_xml.WufiGraphics_3D]]) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = _variants
+
+
+def _build_variant_geometry(_variant_index: int) -> phx_schemas.PhxVariantGeometry:
+    """Build one Variant's vertices and polygons, with their identities in a fresh allocator."""
+    if _WORKER_STATE is None:
+        raise RuntimeError("The WUFI-XML variant worker was not initialised with the variants.")
+    owner, geom_data = _WORKER_STATE[_variant_index]
+    with identity_scope() as allocator, identity_owner_scope(owner):
+        geometry = phx_schemas.as_phx_obj(geom_data, "PhxVariantGeometry")
+    return geometry._replace(identities=allocator)
+
+
+def build_variant_geometries(
+    _model: wufi_xml.WUFIplusProject, _max_workers: int | None = None
+) -> list[phx_schemas.PhxVariantGeometry] | None:
+    """Build the vertices and polygons of every Variant in the project, in worker processes.
+
+    The geometry is most of the cost of converting a Variant, and is the part which
+    only depends on the Variant itself: the rest (components, zones, spaces, ...)
+    reads and adds to the project's shared types and patterns, so it is built in
+    order, in this process. Each worker claims the Variant's vertex and polygon
+    identities in a fresh allocator, under the Variant's owner-scope, so these are
+    the same as when built in-line and are simply taken over by the project.
+
+    Arguments:
+    ----------
+        * _model (WUFIplusProject): The parsed WUFI-XML project.
+        * _max_workers (int | None): The maximum number of worker processes. Default: None (one
+            per CPU).
+
+    Returns:
+    --------
+        * (list[PhxVariantGeometry] | None): The geometry of each Variant, in the Variant
+            order. Or None with a single worker (or Variant): the geometry is then built
+            in-line with each Variant.
+    """
+    variants = [(v.IdentNr, v.Graphics_3D) for v in _model.Variants or []]
+    num_workers = min(_max_workers or os.cpu_count() or 1, len(variants))
+    if num_workers <= 1:
+        return None
+
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker, initargs=(variants,)) as executor:
+        return list(executor.map(_build_variant_geometry, range(len(variants))))
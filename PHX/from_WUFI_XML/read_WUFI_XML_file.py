@@ -2,7 +2,9 @@
 
 """Functions for importing WUFI XML file data."""
 
+import mmap
 import pathlib
+from collections.abc import Collection
 from dataclasses import dataclass
 from typing import Any
 
@@ -76,34 +78,204 @@ def xml_to_dict(element: etree._Element, _level: int = 0) -> dict[list | str, An
     return d
 
 
-def get_WUFI_XML_file_as_dict(_file_address: pathlib.Path) -> dict[str | list, Any]:
-    """Read in a WUFI-XML file and return the data as a nested dictionary of Tag objects.
+def _plain_leaf(_text: str | None, _unit: str | None) -> dict[str, str | None] | str | None:
+    """Return the leaf value as 'wufi_file_schema.unpack_xml_tag' would unpack its Tag."""
+    if _unit:
+        return {"value": _text, "unit_type": _unit}
+    return None if _text == "None" else _text
+
+
+def xml_to_plain_dict(element: etree._Element, _release: bool = False) -> dict[str, Any]:
+    """Recursively convert an lxml Element tree into a nested dict of plain values and lists.
+
+    The same shape as 'xml_to_dict', but every leaf is already unpacked (its text, or
+    a {'value': ..., 'unit_type': ...} dict when it has a unit), so the result holds no
+    Tag objects and no references back into the lxml tree. With '_release', each child
+    element is cleared once converted, so the tree shrinks as the dict grows.
+    """
+    if len(element) == 0:
+        return {element.tag: _plain_leaf(element.text, element.get("unit"))}
+
+    d = {}
+    for child in element:  # type: ignore
+        if len(child) == 0:
+            # -- An empty container, or an actual data item
+            d[child.tag] = [] if "count" in child.attrib else _plain_leaf(child.text, child.get("unit"))
+        elif _is_list_element(child):
+            # -- Oy... WUFI... sometimes the unit data is up at the parent
+            parent_unit = child.get("unit")
+            items = []
+            for sub_child in child:
+                if parent_unit is not None and len(sub_child) == 0:
+                    items.append({sub_child.tag: _plain_leaf(sub_child.text, parent_unit)})
+                else:
+                    items.append(xml_to_plain_dict(sub_child, _release))
+            d[child.tag] = items
+        else:
+            d[child.tag] = xml_to_plain_dict(child, _release)
+
+        if _release:
+            child.clear()
+    return d
+
+
+# -- The file is fed to the parser in blocks of this many bytes.
+READ_BLOCK_SIZE = 1 << 20
+
+
+def parse_WUFI_XML_file(_file_address: pathlib.Path, _block_size: int = READ_BLOCK_SIZE) -> etree._Element:
+    """Parse a WUFI-XML file and return the root element.
+
+    The raw bytes are fed to the (recovering) parser in large blocks, so even a
+    very large file takes only a few hundred feed calls, and is never decoded in
+    Python. Malformed XML is recovered from, as before. Bytes which are not valid
+    UTF-8 come through as U+FFFD replacement characters.
 
     Arguments:
     ----------
         * _file_address (pathlib.Path): Path to the WUFI-XML file.
+        * _block_size (int): The number of bytes to read and feed at a time.
 
     Returns:
     --------
-        * (dict): Nested dictionary representing the XML structure.
+        * (etree._Element): The root element of the parsed XML.
     """
 
-    parser = etree.XMLPullParser(recover=True, encoding="utf-8")
-    with open(_file_address, encoding="utf-8") as xml_file:
-        # -- Read in chunks in case the file is large
+    parser = etree.XMLParser(recover=True, encoding="utf-8")
+    with open(_file_address, "rb") as xml_file:
         while True:
-            chunk = xml_file.read(1024)
-            if not chunk:
+            block = xml_file.read(_block_size)
+            if not block:
                 break
-            parser.feed(chunk)
+            parser.feed(block)
+
+    return parser.close()
+
+
+def _find_element(_data: mmap.mmap, _tag: bytes, _start: int, _end: int) -> tuple[int, int] | None:
+    """Return the byte span of the first '<tag>...</tag>' (or '<tag/>') element in the data[start:end], if any."""
+    pos = _start
+    while (pos := _data.find(b"<" + _tag, pos, _end)) != -1:
+        after_name = _data[pos + len(_tag) + 1 : pos + len(_tag) + 2]
+        if after_name in (b">", b"/") or after_name.isspace():
+            start_tag_end = _data.find(b">", pos, _end)
+            if start_tag_end == -1:
+                return None
+            if _data[start_tag_end - 1 : start_tag_end] == b"/":
+                return pos, start_tag_end + 1
+            end_tag = _data.find(b"</" + _tag + b">", start_tag_end, _end)
+            return None if end_tag == -1 else (pos, end_tag + len(_tag) + 3)
+        pos += 1
+    return None
+
+
+def _variant_name(_data: mmap.mmap, _variant_span: tuple[int, int]) -> str:
+    """Return the Name of the Variant, from its head (the Name comes before its geometry and building)."""
+    start, end = _variant_span
+    head_end = _data.find(b"<Graphics_3D", start, end)
+    name_span = _find_element(_data, b"Name", start + 1, end if head_end == -1 else head_end)
+    if name_span is None:
+        return ""
+    name = etree.fromstring(_data[slice(*name_span)], etree.XMLParser(recover=True, encoding="utf-8"))
+    return "" if name is None else (name.text or "")
+
+
+def parse_WUFI_XML_file_selection(
+    _file_address: pathlib.Path,
+    _skip_sections: Collection[str] = (),
+    _variants: Collection[int] | None = None,
+    _block_size: int = READ_BLOCK_SIZE,
+) -> tuple[etree._Element, list[str]]:
+    """Parse a WUFI-XML file without its unselected top-level sections and Variants.
+
+    The file is memory-mapped, and the byte spans of the skipped elements found with
+    a plain byte search. Only the bytes around them are fed to the (recovering)
+    parser, so a skipped section or Variant is never parsed, converted or validated.
+
+    Arguments:
+    ----------
+        * _file_address (pathlib.Path): Path to the WUFI-XML file.
+        * _skip_sections (Collection[str]): The top-level elements to leave out (e.g. "Assemblies").
+        * _variants (Collection[int] | None): The positions of the Variants to keep. Default: None (all).
+        * _block_size (int): The number of bytes to feed at a time.
+
+    Returns:
+    --------
+        * (etree._Element): The root element of the parsed XML, without the skipped elements.
+        * (list[str]): The name of every Variant in the file (kept or not), in the file's order.
+    """
+
+    parser = etree.XMLParser(recover=True, encoding="utf-8")
+    with open(_file_address, "rb") as xml_file, mmap.mmap(xml_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        skipped_spans: list[tuple[int, int]] = []
+
+        # -- The Variants, in the project's own 'Variants' list
+        variant_names: list[str] = []
+        variants_span = _find_element(data, b"Variants", 0, len(data)) or (len(data), len(data))
+        pos = variants_span[0] + 1
+        while (variant_span := _find_element(data, b"Variant", pos, variants_span[1])) is not None:
+            if _variants is not None and len(variant_names) not in _variants:
+                skipped_spans.append(variant_span)
+            variant_names.append(_variant_name(data, variant_span))
+            pos = variant_span[1]
+
+        # -- The top-level sections, before or after the Variants
+        for section in _skip_sections:
+            tag = section.encode("utf-8")
+            section_span = _find_element(data, tag, 0, variants_span[0]) or _find_element(
+                data, tag, variants_span[1], len(data)
+            )
+            if section_span is not None:
+                skipped_spans.append(section_span)
+
+        pos = 0
+        for start, end in sorted(skipped_spans) + [(len(data), len(data))]:
+            for block_start in range(pos, start, _block_size):
+                parser.feed(data[block_start : min(block_start + _block_size, start)])
+            pos = end
+
+    return parser.close(), variant_names
+
+
+def get_WUFI_XML_file_as_dict(_file_address: pathlib.Path) -> dict[str | list, Any]:
+    """Read in a WUFI-XML file and return the data as a nested dictionary of Tag objects.
+
+    Arguments:
+    ----------
+        * _file_address (pathlib.Path): Path to the WUFI-XML file.
+
+    Returns:
+    --------
+        * (dict): Nested dictionary representing the XML structure.
+    """
 
     # Get the root element of the parsed XML
-    root: etree._Element = parser.close()
+    root: etree._Element = parse_WUFI_XML_file(_file_address)
 
     # Convert the root element and all children to a Python Dictionary
     return xml_to_dict(root)
 
 
+def get_WUFI_XML_file_as_plain_dict(_file_address: pathlib.Path) -> dict[str, Any]:
+    """Read in a WUFI-XML file and return the data as a nested dictionary of plain values.
+
+    The leaf values are already unpacked (see 'xml_to_plain_dict'), and the parsed
+    tree is released as the dict is built, so only one representation of the file is
+    held at a time. 'WUFIplusProject.model_validate' gives the same models from this
+    dict as from 'get_WUFI_XML_file_as_dict'.
+
+    Arguments:
+    ----------
+        * _file_address (pathlib.Path): Path to the WUFI-XML file.
+
+    Returns:
+    --------
+        * (dict): Nested dictionary representing the XML structure.
+    """
+
+    return xml_to_plain_dict(parse_WUFI_XML_file(_file_address), _release=True)
+
+
 def get_WUFI_xml_file_as_str(_file_address: pathlib.Path) -> str:
     """Read in the WUFI-XML file and return it as a string.
 
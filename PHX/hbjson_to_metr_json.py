@@ -9,7 +9,7 @@ import pathlib
 import sys
 from datetime import datetime
 
-from PHX.from_HBJSON import create_project, read_HBJSON_file
+from PHX import conversion_cache
 from PHX.to_METr_JSON import metr_builder, metr_json_to_file
 
 
@@ -96,6 +96,14 @@ def log_level(_args: list[str]) -> int:
         return 0
 
 
+def compact_output(_args: list[str]) -> bool:
+    """Return the 'compact_output' boolean from sys.argv[9]."""
+    try:
+        return _args[9].lower() == "true"
+    except IndexError:
+        return False
+
+
 def remove_old_logs(directory: pathlib.Path, max_files: int = 10):
     """Remove old log files from the directory."""
     all_log_files = glob.glob(os.path.join(directory, "*.log"))
@@ -164,6 +172,7 @@ if __name__ == "__main__":
     MERGE_SPACES_BY_ERV = merge_spaces_by_erv(sys.argv)
     MERGE_EXHAUST_VENT_DEVICES = merge_exhaust_vent_devices(sys.argv)
     LOG_LEVEL = log_level(sys.argv)
+    COMPACT_OUTPUT = compact_output(sys.argv)
 
     # --- Setup logging
     logger = startup_logging(LOG_LEVEL)
@@ -172,26 +181,33 @@ if __name__ == "__main__":
     logger.info(f"Merging Faces: {MERGE_FACES}")
     logger.info(f"Merging Spaces by ERV: {MERGE_SPACES_BY_ERV}")
     logger.info(f"Merging Exhaust Ventilation Devices: {MERGE_EXHAUST_VENT_DEVICES}")
-
-    # --- Read in the existing HB_JSON and re-build the HB Objects
-    logger.info(f"> Reading in the HBJSON file: ./{SOURCE_FILE}")
-    hb_json_dict = read_HBJSON_file.read_hb_json_from_file(SOURCE_FILE)
-    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(hb_json_dict)
-
-    # --- Generate the PHX Project
-    logger.info(f'> Generating the PHX-Project from the Honeybee-Model: "{hb_model}"')
-    phx_project = create_project.convert_hb_model_to_PhxProject(
-        hb_model,
-        _group_components=GROUP_COMPONENTS,
-        _merge_faces=MERGE_FACES,
-        _merge_spaces_by_erv=MERGE_SPACES_BY_ERV,
-        _merge_exhaust_vent_devices=MERGE_EXHAUST_VENT_DEVICES,
-    )
-
-    # --- Output the METr JSON
+    logger.info(f"Compact Output: {COMPACT_OUTPUT}")
+
+    # --- With 'PHX_CONVERSION_CACHE' set: reuse the JSON (or the project) of an unchanged model
+    CACHE = conversion_cache.ConversionCache.from_env()
+    CONVERSION_OPTIONS = {
+        "group_components": GROUP_COMPONENTS,
+        "merge_faces": MERGE_FACES,
+        "merge_spaces_by_erv": MERGE_SPACES_BY_ERV,
+        "merge_exhaust_vent_devices": MERGE_EXHAUST_VENT_DEVICES,
+    }
+    CACHE_KEY = CACHE.key(SOURCE_FILE, **CONVERSION_OPTIONS) if CACHE else None
+    CACHE_OUTPUT = "metr.compact.json" if COMPACT_OUTPUT else "metr.json"
+    if CACHE and CACHE_KEY and CACHE.restore_output(CACHE_KEY, CACHE_OUTPUT, TARGET_FILE):
+        logger.info(f"> Restored the METr JSON file from the conversion cache to: ./{TARGET_FILE}")
+        logger.info(CACHE.report())
+        sys.exit(0)
+
+    # --- Read in the existing HB_JSON, re-build the HB Objects and generate the PHX Project
+    phx_project = conversion_cache.convert_hbjson_file(SOURCE_FILE, CACHE, CACHE_KEY, **CONVERSION_OPTIONS)
+
+    # --- Output the METr JSON, streamed to the file as it is generated
     logger.info(f'> Generating METr JSON for the PHX-Project: "{phx_project}"')
-    metr_json_text = metr_builder.generate_metr_json_text(phx_project)
-
     logger.info(f"> Saving the METr JSON file to: ./{TARGET_FILE}")
-    metr_json_to_file.write_metr_json_file(TARGET_FILE, metr_json_text)
+    metr_json_chunks = metr_builder.iter_metr_json_text(phx_project, _compact=COMPACT_OUTPUT)
+    metr_json_to_file.write_metr_json_chunks(TARGET_FILE, metr_json_chunks)
     logger.info("> Finished conversion of HBJSON to METr JSON.")
+
+    if CACHE and CACHE_KEY:
+        CACHE.store_output(CACHE_KEY, CACHE_OUTPUT, TARGET_FILE)
+        logger.info(CACHE.report())
@@ -5,9 +5,10 @@
 import pathlib
 import sys
 
-from PHX.from_HBJSON import create_project, read_HBJSON_file
+from PHX import conversion_cache
 from PHX.model.identity_validation import IdentityValidationTarget, validate_project_export_readiness
 from PHX.PHPP import phpp_app
+from PHX.xl import xl_profile
 
 
 def write_phx_project_to_phpp(
@@ -63,6 +64,23 @@ def write_phx_project_to_phpp(
         phpp_conn.activate_variant_ventilation()
         phpp_conn.activate_variant_additional_vent()
 
+    report_phpp_export_profile(phpp_conn)
+
+
+def report_phpp_export_profile(phpp_conn: "phpp_app.PHPPConnection") -> None:
+    """Output the export-phase profile, and write it to JSON if 'PHX_PHPP_PROFILE' is a file path."""
+    if phpp_conn.profiler is None:
+        return None
+
+    for line in phpp_conn.profiler.summary_lines():
+        phpp_conn.xl.output(line)
+
+    output_path = xl_profile.profile_output_path_from_env()
+    if output_path is not None:
+        phpp_conn.profiler.write_json(output_path)
+        phpp_conn.xl.output(f"Wrote PHPP export profile: {output_path}")
+    return None
+
 
 if __name__ == "__main__":
     import xlwings as xw
@@ -78,14 +96,18 @@ if __name__ == "__main__":
     # -- so the old '== "True"' check could never pass and variants never activated.)
     ACTIVATE_VARIANTS = any(str(arg).strip().lower() == "true" for arg in sys.argv[2:])
 
-    # --- Read in an existing HB_JSON and re-build the HB Objects
-    # -------------------------------------------------------------------------
-    hb_json_dict = read_HBJSON_file.read_hb_json_from_file(SOURCE_FILE)
-    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(hb_json_dict)
-
-    # --- Generate the PhxProject file.
+    # --- Read in an existing HB_JSON, re-build the HB Objects and generate the PhxProject.
+    # --- With 'PHX_CONVERSION_CACHE' set, the project of an unchanged model is reused.
     # -------------------------------------------------------------------------
-    phx_project = create_project.convert_hb_model_to_PhxProject(hb_model, _group_components=True)
+    CACHE = conversion_cache.ConversionCache.from_env()
+    phx_project = conversion_cache.convert_hbjson_file(
+        SOURCE_FILE,
+        CACHE,
+        group_components=True,
+        merge_faces=False,
+        merge_spaces_by_erv=False,
+        merge_exhaust_vent_devices=False,
+    )
 
     # --- Connect to open instance of XL, Load the correct PHPP Shape file
     # -------------------------------------------------------------------------
@@ -96,6 +118,8 @@ if __name__ == "__main__":
         xl.output(f"> connected to excel doc: {phpp_conn.xl.wb.name}")
     except xl_app.NoActiveExcelRunningError as e:
         raise e
+    if CACHE:
+        xl.output(CACHE.report())
 
     with phpp_conn.xl.in_silent_mode():
         phpp_conn.xl.unprotect_all_sheets()
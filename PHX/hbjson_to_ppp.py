@@ -7,8 +7,8 @@ import os
 import pathlib
 import sys
 
-from PHX.from_HBJSON import create_project, read_HBJSON_file
-from PHX.to_PPP import ppp_builder, ppp_txt_to_file
+from PHX import conversion_cache
+from PHX.to_PPP import ppp_builder, ppp_txt_to_file, ppp_variants
 
 
 class InputFileError(Exception):
@@ -47,6 +47,14 @@ def resolve_paths(_args: list[str]) -> tuple[pathlib.Path, pathlib.Path]:
     return src, target
 
 
+def all_variants(_args: list[str]) -> bool:
+    """Return the 'all_variants' boolean from sys.argv[4]: write one PPP file per variant."""
+    try:
+        return _args[4].lower() == "true"
+    except IndexError:
+        return False
+
+
 if __name__ == "__main__":
     # --- Input / Output file paths
     SOURCE_FILE, TARGET_FILE_PPP = resolve_paths(sys.argv)
@@ -62,20 +70,28 @@ if __name__ == "__main__":
     handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
     logger.addHandler(handler)
 
-    # --- Read in the HBJSON and build HB Objects
-    logger.info(f"> Reading HBJSON file: {SOURCE_FILE}")
-    hb_json_dict = read_HBJSON_file.read_hb_json_from_file(SOURCE_FILE)
-    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(hb_json_dict)
-
-    # --- Generate the PHX Project
-    logger.info(f'> Generating PHX-Project from Honeybee-Model: "{hb_model}"')
-    phx_project = create_project.convert_hb_model_to_PhxProject(
-        hb_model,
-        _group_components=GROUP_COMPONENTS,
-        _merge_faces=MERGE_FACES,
-        _merge_spaces_by_erv=MERGE_SPACES_BY_ERV,
-        _merge_exhaust_vent_devices=MERGE_EXHAUST_VENT_DEVICES,
+    # --- Read in the HBJSON, build HB Objects and generate the PHX Project. With 'PHX_CONVERSION_CACHE'
+    # --- set, the project of an unchanged model is reused. (The PPP files are always written again:
+    # --- they carry the time they were written.)
+    CACHE = conversion_cache.ConversionCache.from_env()
+    phx_project = conversion_cache.convert_hbjson_file(
+        SOURCE_FILE,
+        CACHE,
+        group_components=GROUP_COMPONENTS,
+        merge_faces=MERGE_FACES,
+        merge_spaces_by_erv=MERGE_SPACES_BY_ERV,
+        merge_exhaust_vent_devices=MERGE_EXHAUST_VENT_DEVICES,
     )
+    if CACHE:
+        logger.info(CACHE.report())
+
+    # --- Build and write one PPP file per variant
+    if all_variants(sys.argv):
+        logger.info(f"> Building and writing {len(phx_project.variants)} PPP files to: {TARGET_FILE_PPP.parent}")
+        for path in ppp_variants.write_variant_ppp_files(phx_project, TARGET_FILE_PPP.parent, TARGET_FILE_PPP.stem):
+            logger.info(f"> Wrote PPP file: {path}")
+        logger.info("> Done.")
+        sys.exit(0)
 
     # --- Build and write the PPP file
     logger.info("> Building PPP file...")
@@ -9,7 +9,7 @@ import pathlib
 import sys
 from datetime import datetime
 
-from PHX.from_HBJSON import create_project, read_HBJSON_file
+from PHX import conversion_cache
 from PHX.to_WUFI_XML import _bug_fixes, xml_builder, xml_txt_to_file
 
 
@@ -245,21 +245,24 @@ if __name__ == "__main__":
     logger.info(f"Merging Spaces by ERV: {MERGE_SPACES_BY_ERV}")
     logger.info(f"Merging Exhaust Ventilation Devices: {MERGE_EXHAUST_VENT_DEVICES}")
 
-    # --- Read in the existing HB_JSON and re-build the HB Objects
+    # --- With 'PHX_CONVERSION_CACHE' set: reuse the XML (or the project) of an unchanged model
     # -------------------------------------------------------------------------
-    logger.info(f"> Reading in the HBJSON file: ./{SOURCE_FILE}")
-    hb_json_dict = read_HBJSON_file.read_hb_json_from_file(SOURCE_FILE)
-    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(hb_json_dict)
-
-    # --- Generate the WUFI Project file.
-    logger.info(f'> Generating the PHX-Project from the Honeybee-Model: "{hb_model}"')
-    phx_project = create_project.convert_hb_model_to_PhxProject(
-        hb_model,
-        _group_components=GROUP_COMPONENTS,
-        _merge_faces=MERGE_FACES,
-        _merge_spaces_by_erv=MERGE_SPACES_BY_ERV,
-        _merge_exhaust_vent_devices=MERGE_EXHAUST_VENT_DEVICES,
-    )
+    CACHE = conversion_cache.ConversionCache.from_env()
+    CONVERSION_OPTIONS = {
+        "group_components": GROUP_COMPONENTS,
+        "merge_faces": MERGE_FACES,
+        "merge_spaces_by_erv": MERGE_SPACES_BY_ERV,
+        "merge_exhaust_vent_devices": MERGE_EXHAUST_VENT_DEVICES,
+    }
+    CACHE_KEY = CACHE.key(SOURCE_FILE, **CONVERSION_OPTIONS) if CACHE else None
+    if CACHE and CACHE_KEY and CACHE.restore_output(CACHE_KEY, "wufi.xml", TARGET_FILE_XML):
+        logger.info(f"> Restored the XML file from the conversion cache to: ./{TARGET_FILE_XML}")
+        logger.info(CACHE.report())
+        sys.exit(0)
+
+    # --- Read in the existing HB_JSON, re-build the HB Objects and generate the WUFI Project
+    # -------------------------------------------------------------------------
+    phx_project = conversion_cache.convert_hbjson_file(SOURCE_FILE, CACHE, CACHE_KEY, **CONVERSION_OPTIONS)
 
     # --- Apply the WUFI-Passive Cooling Bug fix (200 KW limit)
     phx_project = _bug_fixes.split_cooling_into_multiple_systems(phx_project)
@@ -271,3 +274,7 @@ if __name__ == "__main__":
 
     logger.info(f"> Saving the XML file to: ./{TARGET_FILE_XML}")
     xml_txt_to_file.write_XML_text_file(TARGET_FILE_XML, xml_txt)
+
+    if CACHE and CACHE_KEY:
+        CACHE.store_output(CACHE_KEY, "wufi.xml", TARGET_FILE_XML)
+        logger.info(CACHE.report())
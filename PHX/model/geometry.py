@@ -5,8 +5,10 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Collection
+from array import array
+from collections.abc import Collection, Iterator
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import ClassVar
 
 from PHX.model.identity import IdentityNamespaces, allocate_identity
@@ -647,6 +649,33 @@ class PhxPolygonRectangular(PhxPolygon):
         return (2 * self.width) + (2 * self.height)
 
 
+@dataclass(frozen=True)
+class PhxVertexTable:
+    """The unique vertices of a PhxGraphics3D, with each polygon's vertices, gathered together for the writers.
+
+    The polygon vertices are packed into one flat list, with each polygon's
+    slice of it given by 'polygon_offsets' (len(polygons) + 1 entries).
+
+    Attributes:
+        vertices (list[PhxVertix]): The unique vertices, sorted by id_num.
+        packed_vertices (list[PhxVertix]): The vertices of all the polygons, in the polygon order.
+        polygon_offsets (array): The start of each polygon's vertices in 'packed_vertices', plus the end.
+    """
+
+    vertices: list[PhxVertix]
+    packed_vertices: list[PhxVertix]
+    polygon_offsets: array
+
+    def polygon_vertices(self, _index: int) -> list[PhxVertix]:
+        """Return the vertices of the polygon at the index (of PhxGraphics3D.polygons)."""
+        return self.packed_vertices[self.polygon_offsets[_index] : self.polygon_offsets[_index + 1]]
+
+    def iter_polygon_vertices(self) -> Iterator[list[PhxVertix]]:
+        """Yield the vertices of each polygon, in the polygon order."""
+        for i in range(len(self.polygon_offsets) - 1):
+            yield self.polygon_vertices(i)
+
+
 @dataclass
 class PhxGraphics3D:
     """A collection of 3D polygons representing the geometry of a building component.
@@ -662,10 +691,40 @@ class PhxGraphics3D:
     @property
     def vertices(self) -> list[PhxVertix]:
         """Returns a sorted list with all of the unique vertix objects of all the polygons in the collection."""
-        return sorted(
-            {vertix for polygon in self.polygons for vertix in polygon.vertices},
-            key=lambda _: _.id_num,
-        )
+        return self.vertex_table().vertices
+
+    def vertex_table(self) -> PhxVertexTable:
+        """Return the unique vertices and each polygon's vertices, gathered in a single pass over the polygons.
+
+        The unique vertices are the same (and in the same order) as the set-based
+        de-duplication by 'PhxVertix.__hash__' / '__eq__': a vertex is only
+        formatted and hashed when a different vertex object has the same id_num.
+        """
+        packed_vertices: list[PhxVertix] = []
+        polygon_offsets = array("q", [0])
+        for polygon in self.polygons:
+            packed_vertices.extend(polygon.vertices)
+            polygon_offsets.append(len(packed_vertices))
+
+        # -- A stable sort keeps the first occurrence of each vertex first, as the set
+        # -- does. The repeats are then dropped in place.
+        unique_vertices = sorted(packed_vertices, key=attrgetter("id_num"))
+        num_unique = 0
+        for vertix in unique_vertices:
+            if num_unique:
+                existing = unique_vertices[num_unique - 1]
+                if existing.id_num == vertix.id_num:
+                    if existing is vertix or (hash(existing) == hash(vertix) and existing == vertix):
+                        continue
+                    # -- Two different vertices share an id_num: only the set gives their order.
+                    unique_vertices = sorted(set(packed_vertices), key=lambda _: _.id_num)
+                    num_unique = len(unique_vertices)
+                    break
+            unique_vertices[num_unique] = vertix
+            num_unique += 1
+        del unique_vertices[num_unique:]
+
+        return PhxVertexTable(unique_vertices, packed_vertices, polygon_offsets)
 
     def add_polygons(self, _polygons: Collection[PhxPolygon] | PhxPolygon) -> None:
         """Adds a new Polygon object to the collection"""
@@ -11,6 +11,7 @@ insulation properties.
 from __future__ import annotations
 
 import math
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import ClassVar, Union
 from uuid import uuid4
@@ -24,6 +25,29 @@ from PHX.model.enums.hvac import (
 from PHX.model.geometry import PhxLineSegment
 from PHX.model.identity import IdentityNamespaces, allocate_identity
 
+# -- Converged heat-loss coefficients (W/mk), by 'PhxPipeSegment.heat_loss_key'.
+# -- The solve depends only on the pipe's diameters, insulation and reflectivity,
+# -- and a model typically has only a handful of distinct pipe types.
+_PIPE_HEAT_LOSS_COEFFS: dict[tuple[float, float, float, float, bool], float] = {}
+
+
+def clear_pipe_heat_loss_cache() -> None:
+    """Forget all the memoized pipe heat-loss coefficients."""
+    _PIPE_HEAT_LOSS_COEFFS.clear()
+
+
+def solve_pipe_heat_loss_coefficients(_segments: Iterable[PhxPipeSegment]) -> list[float]:
+    """Return the heat-loss coefficient (W/mk) of each segment, in order.
+
+    Segments are grouped by 'heat_loss_key' so that each distinct pipe type is
+    solved only once, no matter how many segments share it.
+    """
+    segments = list(_segments)
+    for key, segment in {s.heat_loss_key: s for s in segments}.items():
+        if key not in _PIPE_HEAT_LOSS_COEFFS:
+            _PIPE_HEAT_LOSS_COEFFS[key] = segment._solve_for_pipe_heat_loss_coeff()
+    return [_PIPE_HEAT_LOSS_COEFFS[s.heat_loss_key] for s in segments]
+
 
 @dataclass
 class PhxRecirculationParameters:
@@ -121,10 +145,28 @@ class PhxPipeSegment:
         """Segment length derived from the line geometry (m)."""
         return self.geometry.length
 
+    @property
+    def heat_loss_key(self) -> tuple[float, float, float, float, bool]:
+        """The inputs which determine the heat-loss coefficient: (diameters, insulation, reflectivity)."""
+        return (
+            self.diameter_inner_m,
+            self.pipe_wall_thickness_m,
+            self.insulation_thickness_m,
+            self.insulation_conductivity,
+            self.insulation_reflective,
+        )
+
     @property
     def pipe_heat_loss_coefficient(self) -> float:
-        """Return the pipe's heat-loss-coefficient (W/mk) considering the diameter and insulation."""
-        return self._solve_for_pipe_heat_loss_coeff()
+        """Return the pipe's heat-loss-coefficient (W/mk) considering the diameter and insulation.
+
+        The converged result is memoized by 'heat_loss_key', so segments of the same
+        pipe type are only solved once.
+        """
+        try:
+            return _PIPE_HEAT_LOSS_COEFFS[self.heat_loss_key]
+        except KeyError:
+            return solve_pipe_heat_loss_coefficients([self])[0]
 
     @property
     def _starting_alpha(self) -> float:
@@ -187,14 +229,27 @@ class PhxPipeSegment:
             _k2 = self._calc_pipe_heat_loss_coeff(_alpha)
             _surface_temp = self._calc_pipe_surface_temp(DELTA_T, _k2)
 
-            # -- calc new alpha W/m2k value
+            # -- calc new alpha W/m2k value. Loop until the k result is < the tolerance
             _alpha = N * 4.8 + 1.62 * _surface_temp**0.333
 
-            # -- Run the solver until the k result is < the tolerance
-            self._solve_for_pipe_heat_loss_coeff(_alpha, _k1, _k2, _surface_temp)
-
         return _k2
 
+    def _reverse_solve_heat_loss_coeff(self, _conductivity: float) -> float:
+        """Return the heat-loss-coefficient (W/mk) used by the reverse solver for an insulation conductivity."""
+        TOLERANCE_A = 0.001
+        DELTA_T = 30  # K
+        N = 0.1 if self.insulation_reflective else 0.85
+
+        alpha = 5.0  # Assuming a known starting value for _alpha
+        k1 = 2.0  # Assuming a high initial value for _k1
+        k2 = 0.01  # Assuming a low initial value for _k2
+        while k1 - k2 > TOLERANCE_A:
+            k1 = k2
+            k2 = self._calc_pipe_heat_loss_coeff(alpha, _conductivity)
+            surface_temp = self._calc_pipe_surface_temp(DELTA_T, k2, _conductivity)
+            alpha = N * 4.8 + 1.62 * surface_temp**0.333
+        return k2
+
     def reverse_solve_for_insulation_conductivity(
         self,
         target_result: float,
@@ -203,34 +258,42 @@ class PhxPipeSegment:
         """Return an insulation conductivity (W/mk) when given a known heat-loss-coeff (W/MK).
 
         Be sure to set the known (or assumed) pipe-diameter and insulation-thickness of the Segment before trying to solve.
+
+        Searches the conductivities 'starting_conductivity', minus 0.001, minus 0.002 ...
+        for the first (highest) one whose heat-loss-coeff is within 0.01 of the target.
+        The heat-loss-coeff rises with the conductivity, so that step is found by
+        bisection between the starting conductivity and zero.
         """
-        TOLERANCE_A = 0.001
         TOLERANCE_B = 0.01
-        DELTA_T = 30  # K
-
-        N = 0.1 if self.insulation_reflective else 0.85
-
-        conductivity = starting_conductivity
-
-        while True:
-            alpha = 5.0  # Assuming a known starting value for _alpha
-            k1 = 2.0  # Assuming a high initial value for _k1
-            k2 = 0.01  # Assuming a low initial value for _k2
-            surface_temp = None  # Placeholder for surface temp
-
-            # -- Use the values and calc the heat-loss-coefficient...
-            while k1 - k2 > TOLERANCE_A:
-                k1 = k2
-                k2 = self._calc_pipe_heat_loss_coeff(alpha, conductivity)
-                surface_temp = self._calc_pipe_surface_temp(DELTA_T, k2, conductivity)
-                alpha = N * 4.8 + 1.62 * surface_temp**0.333
-
-            if abs(k2 - target_result) < TOLERANCE_B:
-                return conductivity
-
-            # Adjust conductivity for the next iteration
-            STEP = 0.001  # You can adjust the step size as needed
-            conductivity -= STEP
+        STEP = 0.001
+
+        def conductivity_at(_step_number: int) -> float:
+            # -- Step down one at a time, to land on exactly the same floats as a linear search.
+            conductivity = starting_conductivity
+            for _ in range(_step_number):
+                conductivity -= STEP
+            return conductivity
+
+        # -- Bracket: 'low' is above the target window, 'high' (a step number) is the last conductivity above zero.
+        low, high = -1, max(int(starting_conductivity / STEP), 0)
+        while high > 0 and conductivity_at(high) <= 0:
+            high -= 1
+
+        while low + 1 < high:
+            mid = (low + high) // 2
+            if self._reverse_solve_heat_loss_coeff(conductivity_at(mid)) < target_result + TOLERANCE_B:
+                high = mid
+            else:
+                low = mid
+
+        conductivity = conductivity_at(high)
+        if conductivity > 0 and abs(self._reverse_solve_heat_loss_coeff(conductivity) - target_result) < TOLERANCE_B:
+            return conductivity
+
+        raise ValueError(
+            f"Error: No insulation conductivity between {starting_conductivity} and 0.0 W/mk gives a "
+            f"pipe heat-loss-coefficient of {target_result} W/mk for the pipe segment '{self.display_name}'."
+        )
 
     @classmethod
     def from_length(
@@ -291,9 +354,10 @@ class PhxPipeElement:
     @property
     def weighted_pipe_heat_loss_coefficient(self) -> float:
         """Return a length-weighted total heat loss coefficient (W/mk)"""
+        segments = self.segments
         weighted_total = 0.0
-        for segment in self.segments:
-            weighted_total += segment.pipe_heat_loss_coefficient * segment.length_m
+        for segment, heat_loss_coeff in zip(segments, solve_pipe_heat_loss_coefficients(segments)):
+            weighted_total += heat_loss_coeff * segment.length_m
         try:
             return weighted_total / self.length_m
         except ZeroDivisionError:
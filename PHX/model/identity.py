@@ -122,6 +122,24 @@ class IdentityAllocator:
         """Return whether a value is already claimed in a namespace."""
         return value < self._next_candidates.get(namespace, 1) or value in self._claims.get(namespace, {})
 
+    def absorb(self, other: IdentityAllocator) -> None:
+        """Take over the namespaces of an allocator used to build a subgraph apart from this one.
+
+        The namespaces must not already be in use here, as the allocations cannot be
+        interleaved after the fact; in practice the other allocator worked only in the
+        namespaces owned by one variant (see 'identity_owner_scope').
+        """
+        shared = (other._claims.keys() | other._next_candidates.keys()) & (
+            self._claims.keys() | self._next_candidates.keys()
+        )
+        if shared:
+            raise IdentityAllocationError(
+                f"Cannot absorb identities in namespaces already in use: {', '.join(sorted(map(repr, shared)))}."
+            )
+        for namespace, claims in other._claims.items():
+            self._claims[namespace] = dict(claims)
+        self._next_candidates.update(other._next_candidates)
+
     def snapshot(self) -> dict[IdentityNamespace, tuple[int, ...]]:
         """Return a deterministic diagnostic view of allocated identities."""
         namespaces = self._claims.keys() | self._next_candidates.keys()
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from enum import Enum
+from operator import attrgetter
 
 from PHX.model.components import PhxComponentAperture, PhxComponentOpaque
 from PHX.model.geometry import PhxPolygon, PhxVertix
@@ -65,89 +69,129 @@ class _VariantGraph:
     components: tuple[PhxComponentOpaque | PhxComponentAperture, ...]
     polygons: tuple[PhxPolygon, ...]
     vertices: tuple[PhxVertix, ...]
+    # -- True when different vertex objects share an id-number (their de-duplication then depends on coordinates).
+    shared_vertex_ids: bool = False
+
+
+_ID_NUM = attrgetter("id_num")
+
+# -- The project-level references of one part of the graph:
+# -- namespace -> (part of the PHPP contract, value -> paths).
+_ProjectReferences = dict[IdentityNamespace, tuple[bool, dict[int, list[str]]]]
 
 
 class _GraphValidator:
-    def __init__(self, target: IdentityValidationTarget):
-        self.target = target
-        self.issues: list[IdentityIssue] = []
+    """Walk the project part, or one variant, of the graph once for every export contract.
+
+    WUFI and METR validate the same members and references. PHPP validates a
+    subset of the namespaces: members and references with 'phpp=False' (always
+    a whole namespace) only belong to the WUFI/METR contract, so each issue is
+    kept with the contracts it belongs to. A variant's references to
+    project-level identities are resolved later, against the project part's members.
+
+    With 'full=False' a variant is only walked for the PHPP contract.
+    """
+
+    def __init__(self, full: bool = True) -> None:
+        self.full = full
+        self.issues: list[tuple[IdentityIssue, bool]] = []
         self.members: dict[IdentityNamespace, dict[int, str]] = {}
+        self.project_references: _ProjectReferences = {}
 
-    def add(self, namespace: IdentityNamespace, value: int, path: str) -> None:
+    def add(self, namespace: IdentityNamespace, value: int, path: str, phpp: bool = True) -> None:
         members = self.members.setdefault(namespace, {})
         if previous := members.get(value):
             self.issues.append(
-                IdentityIssue(path, namespace, value, IdentityIssueKind.DUPLICATE, f"also used by {previous}")
+                (IdentityIssue(path, namespace, value, IdentityIssueKind.DUPLICATE, f"also used by {previous}"), phpp)
             )
         else:
             members[value] = path
 
     def reference(
-        self, namespace: IdentityNamespace, value: int | None, path: str, sentinels: tuple[int, ...] = ()
+        self,
+        namespace: IdentityNamespace,
+        value: int | None,
+        path: str,
+        sentinels: tuple[int, ...] = (),
+        phpp: bool = True,
     ) -> None:
         if value is None or value in sentinels:
             return
         if value not in self.members.get(namespace, {}):
             self.issues.append(
-                IdentityIssue(path, namespace, value, IdentityIssueKind.DANGLING_REFERENCE, "no matching object")
+                (
+                    IdentityIssue(path, namespace, value, IdentityIssueKind.DANGLING_REFERENCE, "no matching object"),
+                    phpp,
+                )
             )
 
-    def validate(self, project: PhxProject) -> None:
-        self._project_members(project)
-        for variant_index, variant in enumerate(project.variants):
-            owner = f"variants[{variant_index}]"
-            self.add(IdentityNamespaces.VARIANTS, variant.id_num, owner)
-            graph = self._variant_graph(variant)
-            self._variant_members(variant, owner, graph)
-            self._variant_references(variant, owner, graph)
+    def project_reference(
+        self,
+        namespace: IdentityNamespace,
+        value: int | None,
+        path: str,
+        sentinels: tuple[int, ...] = (),
+        phpp: bool = True,
+    ) -> None:
+        if value is None or value in sentinels:
+            return
+        self.project_references.setdefault(namespace, (phpp, {}))[1].setdefault(value, []).append(path)
+
+    def contract_issues(self) -> dict[IdentityValidationTarget, tuple[IdentityIssue, ...]]:
+        """Return the issues of the WUFI/METR contract (as WUFI) and of the PHPP contract."""
+        return {
+            IdentityValidationTarget.WUFI: tuple(issue for issue, _ in self.issues),
+            IdentityValidationTarget.PHPP: tuple(issue for issue, phpp in self.issues if phpp),
+        }
 
-    def _project_members(self, project: PhxProject) -> None:
+    def project_members(self, project: PhxProject) -> None:
         collections = [
-            (IdentityNamespaces.ASSEMBLIES, "assembly_types", project.assembly_types.values()),
-            (IdentityNamespaces.WINDOWS, "window_types", project.window_types.values()),
-            (IdentityNamespaces.SHADES, "shade_types", project.shade_types.values()),
+            (IdentityNamespaces.ASSEMBLIES, "assembly_types", project.assembly_types.values(), True),
+            (IdentityNamespaces.WINDOWS, "window_types", project.window_types.values(), True),
+            (IdentityNamespaces.SHADES, "shade_types", project.shade_types.values(), True),
+            (
+                IdentityNamespaces.VENTILATION_PATTERNS,
+                "utilization_patterns_ventilation",
+                project.utilization_patterns_ventilation.values(),
+                False,
+            ),
+            (
+                IdentityNamespaces.OCCUPANCY_PATTERNS,
+                "utilization_patterns_occupancy",
+                project.utilization_patterns_occupancy.values(),
+                False,
+            ),
+            (
+                IdentityNamespaces.LIGHTING_PATTERNS,
+                "utilization_patterns_lighting",
+                project.utilization_patterns_lighting.values(),
+                False,
+            ),
         ]
-        if self.target is not IdentityValidationTarget.PHPP:
-            collections.extend(
-                (
-                    (
-                        IdentityNamespaces.VENTILATION_PATTERNS,
-                        "utilization_patterns_ventilation",
-                        project.utilization_patterns_ventilation.values(),
-                    ),
-                    (
-                        IdentityNamespaces.OCCUPANCY_PATTERNS,
-                        "utilization_patterns_occupancy",
-                        project.utilization_patterns_occupancy.values(),
-                    ),
-                    (
-                        IdentityNamespaces.LIGHTING_PATTERNS,
-                        "utilization_patterns_lighting",
-                        project.utilization_patterns_lighting.values(),
-                    ),
-                )
-            )
-        for namespace, label, values in collections:
+        for namespace, label, values, phpp in collections:
             for index, value in enumerate(values):
-                self.add(namespace, value.id_num, f"project.{label}[{index}]")
-
-        if self.target in (IdentityValidationTarget.WUFI, IdentityValidationTarget.METR):
-            for assembly_index, assembly in enumerate(project.assembly_types.values()):
-                material_namespace = (IdentityNamespaces.MATERIALS, assembly.id_num)
-                materials = [layer.material for layer in assembly.layers]
-                materials.extend(assembly.exchange_materials)
-                seen_objects: set[int] = set()
-                for material_index, material in enumerate(materials):
-                    if id(material) in seen_objects:
-                        continue
-                    seen_objects.add(id(material))
-                    self.add(
-                        material_namespace,
-                        material.id_num,
-                        f"project.assembly_types[{assembly_index}].materials[{material_index}]",
-                    )
+                self.add(namespace, value.id_num, f"project.{label}[{index}]", phpp)
+
+        for assembly_index, assembly in enumerate(project.assembly_types.values()):
+            material_namespace = (IdentityNamespaces.MATERIALS, assembly.id_num)
+            materials = [layer.material for layer in assembly.layers]
+            materials.extend(assembly.exchange_materials)
+            seen_objects: set[int] = set()
+            for material_index, material in enumerate(materials):
+                if id(material) in seen_objects:
+                    continue
+                seen_objects.add(id(material))
+                self.add(
+                    material_namespace,
+                    material.id_num,
+                    f"project.assembly_types[{assembly_index}].materials[{material_index}]",
+                    phpp=False,
+                )
+
+        for variant_index, variant in enumerate(project.variants):
+            self.add(IdentityNamespaces.VARIANTS, variant.id_num, f"variants[{variant_index}]")
 
-    def _variant_graph(self, variant: PhxVariant) -> _VariantGraph:
+    def variant_graph(self, variant: PhxVariant) -> _VariantGraph:
         components = tuple(variant.building.all_components)
         polygons: list[PhxPolygon] = []
         seen: set[int] = set()
@@ -156,18 +200,23 @@ class _GraphValidator:
                 if id(polygon) not in seen:
                     seen.add(id(polygon))
                     polygons.append(polygon)
-        vertices = () if self.target is IdentityValidationTarget.PHPP else tuple(variant.graphics3D.vertices)
-        return _VariantGraph(components, tuple(polygons), vertices)
-
-    def _variant_members(self, variant: PhxVariant, owner: str, graph: _VariantGraph) -> None:
-        if self.target is not IdentityValidationTarget.PHPP:
+        if not self.full:
+            return _VariantGraph(components, tuple(polygons), ())
+        vertex_table = variant.graphics3D.vertex_table()
+        vertex_ids = set(map(_ID_NUM, vertex_table.vertices))
+        shared_vertex_ids = len(vertex_ids) != len(set(map(id, vertex_table.packed_vertices)))
+        return _VariantGraph(components, tuple(polygons), tuple(vertex_table.vertices), shared_vertex_ids)
+
+    def variant_members(self, variant: PhxVariant, owner: str, graph: _VariantGraph) -> None:
+        if self.full:
             for zone_index, zone in enumerate(variant.zones):
-                self.add((owner, IdentityNamespaces.ZONES), zone.id_num, f"{owner}.zones[{zone_index}]")
+                self.add((owner, IdentityNamespaces.ZONES), zone.id_num, f"{owner}.zones[{zone_index}]", phpp=False)
                 for space_index, space in enumerate(zone.spaces):
                     self.add(
                         (owner, IdentityNamespaces.SPACES),
                         space.id_num,
                         f"{owner}.zones[{zone_index}].spaces[{space_index}]",
+                        phpp=False,
                     )
 
         for component_index, component in enumerate(graph.components):
@@ -181,28 +230,33 @@ class _GraphValidator:
             polygon_path = f"{owner}.polygons[{polygon_index}]"
             self.add((owner, IdentityNamespaces.POLYGONS), polygon.id_num, polygon_path)
         for vertex_index, vertex in enumerate(graph.vertices):
-            self.add((owner, IdentityNamespaces.VERTICES), vertex.id_num, f"{owner}.vertices[{vertex_index}]")
+            self.add(
+                (owner, IdentityNamespaces.VERTICES), vertex.id_num, f"{owner}.vertices[{vertex_index}]", phpp=False
+            )
 
         for collection_index, collection in enumerate(variant.mech_collections):
             collection_path = f"{owner}.mechanical_systems[{collection_index}]"
-            if self.target is not IdentityValidationTarget.PHPP:
-                self.add((owner, IdentityNamespaces.MECHANICAL_SYSTEMS), collection.id_num, collection_path)
+            if self.full:
+                self.add((owner, IdentityNamespaces.MECHANICAL_SYSTEMS), collection.id_num, collection_path, phpp=False)
             for device_index, device in enumerate(collection.devices):
-                if self.target is IdentityValidationTarget.PHPP and not isinstance(device, PhxDeviceVentilation):
+                phpp = isinstance(device, PhxDeviceVentilation)
+                if not (phpp or self.full):
                     continue
                 namespace = (owner, IdentityNamespaces.mechanical_devices(device.__class__))
-                self.add(namespace, device.id_num, f"{collection_path}.devices[{device_index}]")
-            if self.target is IdentityValidationTarget.PHPP:
+                self.add(namespace, device.id_num, f"{collection_path}.devices[{device_index}]", phpp)
+            if not self.full:
                 continue
             for duct_index, duct in enumerate(collection.vent_ducting):
-                self.add((owner, IdentityNamespaces.DUCTS), duct.id_num, f"{collection_path}.ducts[{duct_index}]")
+                self.add(
+                    (owner, IdentityNamespaces.DUCTS), duct.id_num, f"{collection_path}.ducts[{duct_index}]", phpp=False
+                )
             for trunk_index, trunk in enumerate(collection.dhw_distribution_trunks):
                 trunk_path = f"{collection_path}.pipe_trunks[{trunk_index}]"
-                self.add((owner, IdentityNamespaces.PIPE_TRUNKS), trunk.id_num, trunk_path)
+                self.add((owner, IdentityNamespaces.PIPE_TRUNKS), trunk.id_num, trunk_path, phpp=False)
                 self._pipe_element(owner, trunk.pipe_element, f"{trunk_path}.pipe_element")
                 for branch_index, branch in enumerate(trunk.branches):
                     branch_path = f"{trunk_path}.branches[{branch_index}]"
-                    self.add((owner, IdentityNamespaces.PIPE_BRANCHES), branch.id_num, branch_path)
+                    self.add((owner, IdentityNamespaces.PIPE_BRANCHES), branch.id_num, branch_path, phpp=False)
                     self._pipe_element(owner, branch.pipe_element, f"{branch_path}.pipe_element")
                     for fixture_index, fixture in enumerate(branch.fixtures):
                         self._pipe_element(owner, fixture, f"{branch_path}.fixtures[{fixture_index}]")
@@ -210,26 +264,26 @@ class _GraphValidator:
                 self._pipe_element(owner, pipe, f"{collection_path}.recirc_piping[{pipe_index}]")
 
     def _pipe_element(self, owner: str, pipe: PhxPipeElement, path: str) -> None:
-        self.add((owner, IdentityNamespaces.PIPE_ELEMENTS), pipe.id_num, path)
+        self.add((owner, IdentityNamespaces.PIPE_ELEMENTS), pipe.id_num, path, phpp=False)
 
-    def _variant_references(self, variant: PhxVariant, owner: str, graph: _VariantGraph) -> None:
+    def variant_references(self, variant: PhxVariant, owner: str, graph: _VariantGraph) -> None:
         for component_index, component in enumerate(graph.components):
             component_path = f"{owner}.components[{component_index}]"
             if isinstance(component, PhxComponentOpaque):
-                self.reference(
+                self.project_reference(
                     IdentityNamespaces.ASSEMBLIES,
                     component.assembly_type_id_num,
                     f"{component_path}.assembly_type_id_num",
                     (-1,),
                 )
             if isinstance(component, PhxComponentAperture):
-                self.reference(
+                self.project_reference(
                     IdentityNamespaces.WINDOWS,
                     component.window_type_id_num,
                     f"{component_path}.window_type_id_num",
                     (-1,),
                 )
-                self.reference(
+                self.project_reference(
                     IdentityNamespaces.SHADES,
                     component.shade_type_id_num,
                     f"{component_path}.shade_type_id_num",
@@ -242,49 +296,290 @@ class _GraphValidator:
             polygon_path = f"{owner}.polygon[{polygon.id_num}]"
             for child_id in polygon.child_polygon_ids:
                 self.reference(polygon_namespace, child_id, f"{polygon_path}.child_polygon_ids")
-            if self.target is not IdentityValidationTarget.PHPP:
+            if self.full:
                 for vertex_id in polygon.vertices_id_numbers:
-                    self.reference(vertex_namespace, vertex_id, f"{polygon_path}.vertices")
+                    self.reference(vertex_namespace, vertex_id, f"{polygon_path}.vertices", phpp=False)
 
-        if self.target is not IdentityValidationTarget.PHPP:
-            zone_namespace = (owner, IdentityNamespaces.ZONES)
-            zone_ids = self.members.get(zone_namespace, {})
-            for zone_index, zone in enumerate(variant.zones):
-                for space_index, space in enumerate(zone.spaces):
-                    space_path = f"{owner}.zones[{zone_index}].spaces[{space_index}]"
-                    if space.has_ventilation_airflow:
-                        self.reference(
-                            IdentityNamespaces.VENTILATION_PATTERNS,
-                            space.ventilation.schedule.id_num,
-                            f"{space_path}.ventilation.schedule.id_num",
-                            (0,),
-                        )
-                    self.reference(
-                        IdentityNamespaces.OCCUPANCY_PATTERNS,
-                        space.occupancy.schedule.id_num,
-                        f"{space_path}.occupancy.schedule.id_num",
+        if not self.full:
+            return
+        zone_namespace = (owner, IdentityNamespaces.ZONES)
+        zone_ids = self.members.get(zone_namespace, {})
+        for zone_index, zone in enumerate(variant.zones):
+            for space_index, space in enumerate(zone.spaces):
+                space_path = f"{owner}.zones[{zone_index}].spaces[{space_index}]"
+                if space.has_ventilation_airflow:
+                    self.project_reference(
+                        IdentityNamespaces.VENTILATION_PATTERNS,
+                        space.ventilation.schedule.id_num,
+                        f"{space_path}.ventilation.schedule.id_num",
                         (0,),
+                        phpp=False,
                     )
+                self.project_reference(
+                    IdentityNamespaces.OCCUPANCY_PATTERNS,
+                    space.occupancy.schedule.id_num,
+                    f"{space_path}.occupancy.schedule.id_num",
+                    (0,),
+                    phpp=False,
+                )
 
-            for collection_index, collection in enumerate(variant.mech_collections):
-                if zone_ids:
-                    self.reference(
-                        zone_namespace,
-                        collection.zone_coverage.zone_num,
-                        f"{owner}.mechanical_systems[{collection_index}].zone_coverage.zone_num",
-                    )
+        for collection_index, collection in enumerate(variant.mech_collections):
+            if zone_ids:
+                self.reference(
+                    zone_namespace,
+                    collection.zone_coverage.zone_num,
+                    f"{owner}.mechanical_systems[{collection_index}].zone_coverage.zone_num",
+                    phpp=False,
+                )
 
 
-def validate_project_identities(project: PhxProject, target: IdentityValidationTarget | str) -> None:
-    """Raise one deterministic aggregate error when an export graph is invalid."""
+# -----------------------------------------------------------------------------
+# -- Cached variant results
+
+
+def _add_polygon_fingerprint(fingerprint: list, polygon: PhxPolygon) -> None:
+    vertices = polygon.vertices
+    fingerprint += (id(polygon), polygon.id_num, len(polygon.child_polygon_ids), len(vertices))
+    fingerprint += polygon.child_polygon_ids
+    fingerprint += map(id, vertices)
+    fingerprint += map(_ID_NUM, vertices)
+
+
+def _add_component_fingerprint(fingerprint: list, component: PhxComponentOpaque | PhxComponentAperture) -> None:
+    polygons = component.polygons
+    if isinstance(component, PhxComponentAperture):
+        fingerprint += (component.window_type_id_num, component.shade_type_id_num)
+    else:
+        fingerprint += (component.is_shade, component.assembly_type_id_num)
+    fingerprint += (component.__class__, id(component), component.id_num, component.display_name, len(polygons))
+    for polygon in polygons:
+        _add_polygon_fingerprint(fingerprint, polygon)
+
+
+def _variant_fingerprint(variant: PhxVariant) -> list:
+    """Return everything about the variant that its identity issues depend on, without walking it.
+
+    A flat list: the components, polygons and vertices are given by object
+    identity (as the walk de-duplicates them by object) along with their
+    id-numbers and references, the rest by id-number, and every nested
+    sequence by its length first. Equal fingerprints give equal issues.
+
+    The object identities only stand for which positions share an object: if
+    an object is dropped and a new one happens to be given its id(), the
+    fingerprint is still only equal when the sharing and every id-number and
+    reference are too, so the recorded objects do not need to be kept alive.
+    """
+    fingerprint: list = [len(variant.building._components)]
+    for component in variant.building._components:
+        _add_component_fingerprint(fingerprint, component)
+        fingerprint.append(len(component.apertures))
+        for aperture in component.apertures:
+            _add_component_fingerprint(fingerprint, aperture)
+
+    fingerprint.append(len(variant.zones))
+    for zone in variant.zones:
+        fingerprint += (zone.id_num, len(zone.spaces))
+        for space in zone.spaces:
+            fingerprint += (
+                space.id_num,
+                space.has_ventilation_airflow,
+                space.ventilation.schedule.id_num,
+                space.occupancy.schedule.id_num,
+            )
+
+    fingerprint.append(len(variant.mech_collections))
+    for collection in variant.mech_collections:
+        devices, ducts, recirc_piping = collection.devices, collection.vent_ducting, collection.dhw_recirc_piping
+        fingerprint += (collection.id_num, collection.zone_coverage.zone_num, len(devices))
+        fingerprint += ((device.__class__, device.id_num) for device in devices)
+        fingerprint.append(len(ducts))
+        fingerprint += map(_ID_NUM, ducts)
+        fingerprint.append(len(recirc_piping))
+        fingerprint += map(_ID_NUM, recirc_piping)
+        fingerprint.append(len(collection.dhw_distribution_trunks))
+        for trunk in collection.dhw_distribution_trunks:
+            fingerprint += (trunk.id_num, trunk.pipe_element.id_num, len(trunk.branches))
+            for branch in trunk.branches:
+                fingerprint += (branch.id_num, branch.pipe_element.id_num, len(branch.fixtures))
+                fingerprint += map(_ID_NUM, branch.fixtures)
+        fingerprint.append(None)
+    return fingerprint
+
+
+@dataclass(frozen=True)
+class _VariantRecord:
+    """One variant's issues and project-level references, for each contract, as of its fingerprint.
+
+    A fingerprint of None is never reused: either the variant was not
+    fingerprinted (on its first validation), or it has different vertex
+    objects with the same id-number, which are then told apart by their
+    (uncaptured) coordinates.
+    """
+
+    fingerprint: list | None
+    full: bool
+    issues: dict[IdentityValidationTarget, tuple[IdentityIssue, ...]]
+    project_references: _ProjectReferences
+
+
+def _walk_variant(variant: PhxVariant, variant_index: int, fingerprint: list | None, full: bool) -> _VariantRecord:
+    owner = f"variants[{variant_index}]"
+    validator = _GraphValidator(full)
+    graph = validator.variant_graph(variant)
+    validator.variant_members(variant, owner, graph)
+    validator.variant_references(variant, owner, graph)
+
+    return _VariantRecord(
+        None if graph.shared_vertex_ids else fingerprint,
+        full,
+        validator.contract_issues(),
+        validator.project_references,
+    )
+
+
+# -- The variant records of each validated project, by id(project) and variant index.
+# -- A project's records are dropped along with the project.
+_VARIANT_RECORDS: dict[int, dict[int, _VariantRecord]] = {}
+
+
+def clear_identity_validation_cache(project: PhxProject | None = None) -> None:
+    """Forget the cached variant results of the project (or of every project), so the next validation re-walks them."""
+    if project is None:
+        for records in _VARIANT_RECORDS.values():
+            records.clear()
+    elif records := _VARIANT_RECORDS.get(id(project)):
+        records.clear()
+
+
+# -- The project being validated, set once in each worker process.
+_WORKER_STATE: PhxProject | None = None
+
+
+def _init_worker(_project: PhxProject) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = _project
+
+
+def _walk_variant_in_worker(variant_index: int, full: bool) -> _VariantRecord:
+    """Walk one variant of the worker's project. The record's fingerprint is only a placeholder (or None)."""
+    if _WORKER_STATE is None:
+        raise RuntimeError("The identity validation worker was not initialised with a project.")
+    return _walk_variant(_WORKER_STATE.variants[variant_index], variant_index, [], full)
+
+
+def _walk_variants(
+    project: PhxProject, fingerprints: dict[int, list | None], full: bool, max_workers: int | None
+) -> dict[int, _VariantRecord]:
+    """Walk the variants (by index, with their fingerprints), in worker processes if there are several.
+
+    Each variant's members and references only depend on the variant itself:
+    its references to the project-level types and patterns are only resolved
+    afterwards, against the project part. So the variants are walked
+    independently, and the results merged in the variant order are the same
+    as when walked one after the other in this process.
+    """
+    num_workers = min(max_workers or os.cpu_count() or 1, len(fingerprints))
+    if num_workers <= 1:
+        return {i: _walk_variant(project.variants[i], i, fingerprint, full) for i, fingerprint in fingerprints.items()}
+
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker, initargs=(project,)) as executor:
+        walked = executor.map(_walk_variant_in_worker, fingerprints, [full] * len(fingerprints))
+        return {
+            i: record if record.fingerprint is None else replace(record, fingerprint=fingerprints[i])
+            for i, record in zip(fingerprints, walked)
+        }
+
+
+def _variant_records(project: PhxProject, full: bool, max_workers: int | None = 1) -> list[_VariantRecord]:
+    """Return the record of each variant, re-walking only the variants whose fingerprint changed.
+
+    A variant is only fingerprinted once it is validated a second time, so a
+    project which is validated once costs no more than the plain walk. Its first
+    record (without a fingerprint) is walked again, and fingerprinted, on the
+    second validation. A record of the PHPP contract alone ('full=False') is
+    walked again for the WUFI/METR contract.
+    """
+    records = _VARIANT_RECORDS.get(id(project))
+    if records is None:
+        records = _VARIANT_RECORDS[id(project)] = {}
+        weakref.finalize(project, _VARIANT_RECORDS.pop, id(project), None)
+
+    stale: dict[int, list | None] = {}
+    for variant_index, variant in enumerate(project.variants):
+        record = records.get(variant_index)
+        if record is None:
+            stale[variant_index] = None
+            continue
+        fingerprint = _variant_fingerprint(variant)
+        if record.fingerprint is None or (full and not record.full) or record.fingerprint != fingerprint:
+            stale[variant_index] = fingerprint
+    records.update(_walk_variants(project, stale, full, max_workers))
+
+    for variant_index in [i for i in records if i >= len(project.variants)]:
+        del records[variant_index]
+    return [records[i] for i in range(len(project.variants))]
+
+
+def _resolve_project_references(
+    references: _ProjectReferences, members: dict[IdentityNamespace, dict[int, str]], contract: IdentityValidationTarget
+) -> list[IdentityIssue]:
+    issues: list[IdentityIssue] = []
+    for namespace, (phpp, paths_by_value) in references.items():
+        if contract is IdentityValidationTarget.PHPP and not phpp:
+            continue
+        namespace_members = members.get(namespace, {})
+        for value, paths in paths_by_value.items():
+            if value not in namespace_members:
+                issues.extend(
+                    IdentityIssue(path, namespace, value, IdentityIssueKind.DANGLING_REFERENCE, "no matching object")
+                    for path in paths
+                )
+    return issues
+
+
+def _project_identity_issues(
+    project: PhxProject, target: IdentityValidationTarget, max_workers: int | None = 1
+) -> list[IdentityIssue]:
+    """Return the target's issues: the project part is always walked, the variants come from their records."""
+    contract = (
+        IdentityValidationTarget.PHPP if target is IdentityValidationTarget.PHPP else IdentityValidationTarget.WUFI
+    )
+    project_part = _GraphValidator()
+    project_part.project_members(project)
+
+    issues = list(project_part.contract_issues()[contract])
+    for record in _variant_records(project, contract is IdentityValidationTarget.WUFI, max_workers):
+        issues.extend(record.issues[contract])
+        issues.extend(_resolve_project_references(record.project_references, project_part.members, contract))
+    return issues
+
+
+def validate_project_identities(
+    project: PhxProject, target: IdentityValidationTarget | str, max_workers: int | None = 1
+) -> None:
+    """Raise one deterministic aggregate error when an export graph is invalid.
+
+    One walk of a variant gives its issues for every target (a PHPP validation
+    only walks the PHPP contract), and they are kept until the variant's
+    identities or references change. The first validation of a project is the
+    plain walk, and the second one walks again to fingerprint each variant. After
+    that, validating an unchanged project again, or for another target, only
+    re-checks each variant's fingerprint and the (small) project-level type and
+    pattern collections.
+
+    The variants which do need a walk are walked in up to 'max_workers' worker
+    processes (None for one per CPU). The default of 1 walks them in this
+    process. The issues are the same for any number of workers.
+    """
     resolved_target = IdentityValidationTarget(target)
-    validator = _GraphValidator(resolved_target)
-    validator.validate(project)
-    if validator.issues:
-        raise IdentityValidationError(resolved_target, validator.issues)
+    issues = _project_identity_issues(project, resolved_target, max_workers)
+    if issues:
+        raise IdentityValidationError(resolved_target, issues)
 
 
-def validate_project_export_readiness(project: PhxProject, target: IdentityValidationTarget | str) -> None:
+def validate_project_export_readiness(
+    project: PhxProject, target: IdentityValidationTarget | str, max_workers: int | None = 1
+) -> None:
     """Run shared export preflight in backwards-compatible diagnostic order."""
     project.assert_ventilation_assignments_ready()
-    validate_project_identities(project, target)
+    validate_project_identities(project, target, max_workers)
@@ -396,6 +396,21 @@ class PhxProjectData:
     image: bool | None = None
 
 
+@dataclass
+class PhxPartialImport:
+    """The parts of a source file which a partial import did not load into the project.
+
+    Attributes:
+        skipped_sections (tuple[str, ...]): The source's top-level sections which were not
+            loaded (e.g. "Assemblies"). Their project collections are left empty.
+        skipped_variants (dict[int, str]): The variants which were not loaded: their
+            position in the source, and their name.
+    """
+
+    skipped_sections: tuple[str, ...] = ()
+    skipped_variants: dict[int, str] = field(default_factory=dict)
+
+
 @dataclass
 class PhxProject:
     """Top-level PHX project container.
@@ -425,6 +440,8 @@ class PhxProject:
         program_version (str): WUFI program version string. Default: "3.2.0.1".
         scope (int): Project scope flag. Default: 3.
         visualized_geometry (int): Geometry visualization mode. Default: 2.
+        partial_import (PhxPartialImport | None): What a partial import of the source
+            left out of the project. None when the whole source was loaded.
     """
 
     name: str = "unnamed_project"
@@ -447,6 +464,7 @@ class PhxProject:
     program_version: str = "3.2.0.1"
     scope: int = 3
     visualized_geometry: int = 2
+    partial_import: PhxPartialImport | None = None
     _identity_allocator: IdentityAllocator | None = field(default=None, init=False, repr=False, compare=False)
 
     def _attach_identity_allocator(self, allocator: IdentityAllocator) -> None:
@@ -465,6 +483,11 @@ class PhxProject:
                 with identity_owner_scope(owner):
                     yield allocator
 
+    @property
+    def is_partial(self) -> bool:
+        """True if the project was only partly loaded from its source (see 'partial_import')."""
+        return self.partial_import is not None
+
     def add_new_variant(self, _variant: PhxVariant) -> None:
         """Adds a new PHX Variant to the Project."""
         self.variants.append(_variant)
@@ -0,0 +1,247 @@
+# -*- Python Version: 3.10 -*-
+
+"""Save and load a built PHX project as a compact, versioned binary snapshot.
+
+Re-converting the same Honeybee model or WUFI-XML file is the slowest part of
+repeated exports. A snapshot stores the finished :class:`PhxProject` so it can
+be loaded again instead. The PHX model itself stays transient (it knows nothing
+of snapshots): this module only writes the object graph as it is, so shared
+constructions, identity numbers, the project's identity allocator and the
+variant ownership of its namespaces are all kept.
+
+The file is self-describing:
+
+    * the 8-byte magic ``b"PHXSNAP\\n"``
+    * the length of the header (4 bytes, big-endian)
+    * the header: UTF-8 JSON with the format version, the PHX and Python
+      versions, the pickle protocol, the payload compression, size and CRC-32,
+      and a few counts of the project (see :class:`SnapshotHeader`)
+    * the payload: the project, pickled and zlib-compressed
+
+A snapshot is only loaded by the same format and PHX version that wrote it:
+it is a cache of a conversion, not an exchange format, so after an upgrade the
+project is simply converted again. Loading only creates PHX model classes (and
+a few standard value types). Even so, only load snapshots from a trusted source.
+"""
+
+from __future__ import annotations
+
+import gc
+import io
+import json
+import pathlib
+import pickle
+import platform
+import struct
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from importlib import metadata
+
+from PHX.model.project import PhxProject
+
+__all__ = [
+    "SNAPSHOT_FORMAT_VERSION",
+    "SnapshotError",
+    "SnapshotHeader",
+    "dump_project_snapshot",
+    "load_project_snapshot",
+    "phx_version",
+    "read_project_snapshot",
+    "read_snapshot_header",
+    "write_project_snapshot",
+]
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+_MAGIC = b"PHXSNAP\n"
+_HEADER_LENGTH = struct.Struct(">I")
+_PICKLE_PROTOCOL = 5
+
+# -- The only non-PHX globals a PHX project pickles.
+_SAFE_GLOBALS = {
+    ("builtins", "bytearray"),
+    ("builtins", "complex"),
+    ("builtins", "dict"),
+    ("builtins", "frozenset"),
+    ("builtins", "list"),
+    ("builtins", "set"),
+    ("builtins", "tuple"),
+    ("collections", "OrderedDict"),
+    ("collections", "defaultdict"),
+    ("datetime", "date"),
+    ("datetime", "datetime"),
+    ("datetime", "time"),
+    ("datetime", "timedelta"),
+    ("datetime", "timezone"),
+    ("uuid", "UUID"),
+}
+
+
+class SnapshotError(ValueError):
+    """Raised when data is not a PHX snapshot, is damaged, or was written by another format or PHX version."""
+
+
+@dataclass(frozen=True)
+class SnapshotHeader:
+    """The self-describing header of a snapshot, readable without loading the project."""
+
+    format_version: int
+    phx_version: str
+    python_version: str
+    pickle_protocol: int
+    compression: str
+    payload_size: int
+    payload_crc32: int
+    project_name: str
+    num_variants: int
+    num_components: int
+
+
+def phx_version() -> str:
+    """Return the installed PHX version, or 'unknown' when PHX is not installed as a package."""
+    try:
+        return metadata.version("PHX")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause the cyclic garbage collector: pickling creates or visits every object of the graph at once."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+class _ProjectUnpickler(pickle.Unpickler):
+    """Only resolve PHX classes and the standard value types in '_SAFE_GLOBALS'."""
+
+    def find_class(self, module: str, name: str):
+        if (module, name) in _SAFE_GLOBALS:
+            return super().find_class(module, name)
+        if module == "PHX" or module.startswith("PHX."):
+            obj = super().find_class(module, name)
+            if isinstance(obj, type):
+                return obj
+        raise SnapshotError(f"SnapshotError: the snapshot refers to '{module}.{name}', which is not a PHX class.")
+
+
+def dump_project_snapshot(project: PhxProject) -> bytes:
+    """Return the project as snapshot bytes.
+
+    Arguments:
+    ----------
+        * project (PhxProject): The built project to save.
+
+    Returns:
+    --------
+        * (bytes): The snapshot: magic, header and compressed payload.
+    """
+    with _gc_paused():
+        payload = zlib.compress(pickle.dumps(project, protocol=_PICKLE_PROTOCOL), 1)
+
+    header = SnapshotHeader(
+        format_version=SNAPSHOT_FORMAT_VERSION,
+        phx_version=phx_version(),
+        python_version=platform.python_version(),
+        pickle_protocol=_PICKLE_PROTOCOL,
+        compression="zlib",
+        payload_size=len(payload),
+        payload_crc32=zlib.crc32(payload),
+        project_name=project.name,
+        num_variants=len(project.variants),
+        num_components=sum(len(variant.building.all_components) for variant in project.variants),
+    )
+    header_bytes = json.dumps(asdict(header), sort_keys=True).encode("utf-8")
+    return b"".join((_MAGIC, _HEADER_LENGTH.pack(len(header_bytes)), header_bytes, payload))
+
+
+def _split_snapshot(data: bytes) -> tuple[SnapshotHeader, memoryview]:
+    if not data.startswith(_MAGIC):
+        raise SnapshotError("SnapshotError: the data is not a PHX snapshot.")
+    start = len(_MAGIC) + _HEADER_LENGTH.size
+    try:
+        (header_length,) = _HEADER_LENGTH.unpack_from(data, len(_MAGIC))
+        header = SnapshotHeader(**json.loads(data[start : start + header_length].decode("utf-8")))
+    except (struct.error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise SnapshotError(f"SnapshotError: the snapshot header cannot be read: {e}") from e
+    return header, memoryview(data)[start + header_length :]
+
+
+def read_snapshot_header(data: bytes) -> SnapshotHeader:
+    """Return the header of the snapshot bytes, without loading the project.
+
+    Raises:
+    -------
+        * SnapshotError: If the data is not a PHX snapshot.
+    """
+    return _split_snapshot(data)[0]
+
+
+def load_project_snapshot(data: bytes) -> PhxProject:
+    """Return the project saved in the snapshot bytes.
+
+    Arguments:
+    ----------
+        * data (bytes): Snapshot bytes, from 'dump_project_snapshot'.
+
+    Returns:
+    --------
+        * (PhxProject): The project, with the same objects, identities and shared references as when saved.
+
+    Raises:
+    -------
+        * SnapshotError: If the data is not a PHX snapshot, is damaged, was written by
+            another snapshot format or PHX version, or refers to a PHX class which no
+            longer exists (ie: renamed in an editable install).
+    """
+    header, payload = _split_snapshot(data)
+    if header.format_version != SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotError(
+            f"SnapshotError: the snapshot format is version {header.format_version}; "
+            f"this PHX reads version {SNAPSHOT_FORMAT_VERSION}."
+        )
+    if header.phx_version != phx_version():
+        raise SnapshotError(
+            f"SnapshotError: the snapshot was written by PHX {header.phx_version}; this is PHX {phx_version()}. "
+            "Convert the model again."
+        )
+    if len(payload) != header.payload_size or zlib.crc32(payload) != header.payload_crc32:
+        raise SnapshotError("SnapshotError: the snapshot payload is incomplete or damaged.")
+
+    try:
+        with _gc_paused():
+            project = _ProjectUnpickler(io.BytesIO(zlib.decompress(payload))).load()
+    except (pickle.UnpicklingError, AttributeError, ImportError, EOFError, zlib.error) as e:
+        # -- ie: a PHX class was renamed or moved since the snapshot was written (same version, edited code)
+        raise SnapshotError(
+            f"SnapshotError: the snapshot cannot be loaded by this PHX: {e!r}. Convert the model again."
+        ) from e
+    if not isinstance(project, PhxProject):
+        raise SnapshotError(f"SnapshotError: the snapshot holds a {type(project).__name__}, not a PhxProject.")
+    return project
+
+
+def write_project_snapshot(project: PhxProject, path: pathlib.Path) -> pathlib.Path:
+    """Save the project to a snapshot file, creating its directory if needed. Returns the path."""
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(dump_project_snapshot(project))
+    return path
+
+
+def read_project_snapshot(path: pathlib.Path) -> PhxProject:
+    """Load the project from a snapshot file.
+
+    Raises:
+    -------
+        * SnapshotError: If the file is not a PHX snapshot, is damaged, or was written by
+            another snapshot format or PHX version.
+    """
+    return load_project_snapshot(pathlib.Path(path).read_bytes())
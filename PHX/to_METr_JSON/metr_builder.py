@@ -3,12 +3,13 @@
 """Main entry point: converts a PhxProject into a METr JSON dict, then to JSON text."""
 
 import json
+from collections.abc import Iterator
 from typing import Any
 
 from PHX.model.identity_validation import IdentityValidationTarget, validate_project_export_readiness
 from PHX.model.project import PhxProject
 from PHX.model.transforms import synthesize_window_type_psi_variants
-from PHX.to_METr_JSON import metr_converter
+from PHX.to_METr_JSON import metr_converter, metr_schemas, metr_stream
 
 
 def generate_metr_json_dict(_phx_object: Any, _schema_name: str | None = None) -> dict:
@@ -23,15 +24,19 @@ def generate_metr_json_dict(_phx_object: Any, _schema_name: str | None = None) -
     --------
         * dict: The METr JSON representation.
     """
+    _prepare_for_export(_phx_object)
+    schema_function = metr_converter.get_schema_function(_phx_object, _schema_name)
+    return schema_function(_phx_object)
+
+
+def _prepare_for_export(_phx_object: Any) -> None:
+    """Validate a PhxProject for METr export, and add any window-type variants it needs."""
     # -- METr JSON (like WUFI XML) has no per-aperture psi-install: apertures whose
     # -- elements resolve to non-default values get a content-keyed window-type variant.
     if isinstance(_phx_object, PhxProject):
         validate_project_export_readiness(_phx_object, IdentityValidationTarget.METR)
         synthesize_window_type_psi_variants(_phx_object)
 
-    schema_function = metr_converter.get_schema_function(_phx_object, _schema_name)
-    return schema_function(_phx_object)
-
 
 def generate_metr_json_text(_phx_object: Any, _schema_name: str | None = None) -> str:
     """Convert a PHX object into METr JSON text.
@@ -47,3 +52,33 @@ def generate_metr_json_text(_phx_object: Any, _schema_name: str | None = None) -
     """
     metr_dict = generate_metr_json_dict(_phx_object, _schema_name)
     return json.dumps(metr_dict, indent=2, ensure_ascii=False)
+
+
+def iter_metr_json_text(_phx_object: Any, _schema_name: str | None = None, _compact: bool = False) -> Iterator[str]:
+    """Convert a PHX object into METr JSON text, returned as an iterator of fragments.
+
+    The project is validated (and its window-type variants added) before this
+    returns, so an export error is raised before anything is written. The
+    variants, and each variant's components, zones, polygons and vertices, are
+    then built one at a time as the fragments are written, so the whole METr
+    dict tree never exists at once. The indented text is identical to
+    'generate_metr_json_text'.
+
+    Arguments:
+    ----------
+        * _phx_object: The PHX object to convert (typically a PhxProject).
+        * _schema_name: Optional explicit schema function name.
+        * _compact: If True, write the JSON with no indentation or whitespace.
+
+    Returns:
+    --------
+        * Iterator[str]: The fragments of the METr JSON text, in order.
+    """
+    _prepare_for_export(_phx_object)
+    schema_function = metr_converter.get_schema_function(_phx_object, _schema_name)
+    if schema_function.__name__ in metr_schemas.STREAMING_SCHEMAS:
+        metr_data = schema_function(_phx_object, _stream=True)  # type: ignore
+    else:
+        metr_data = schema_function(_phx_object)
+
+    return metr_stream.iter_json_chunks(metr_data, _indent=None if _compact else 2)
@@ -2,7 +2,10 @@
 
 """Write METr JSON text to a file."""
 
+import os
 import pathlib
+import tempfile
+from collections.abc import Iterable
 
 
 def write_metr_json_file(
@@ -22,3 +25,51 @@ def write_metr_json_file(
     """
     file_path = pathlib.Path(_file_path)
     file_path.write_text(_json_text, encoding="utf-8")
+
+
+def write_metr_json_chunks(
+    _file_path: str | pathlib.Path,
+    _json_chunks: Iterable[str],
+    _buffer_size: int = 1 << 16,
+) -> None:
+    """Write METr JSON text fragments to a file (UTF-8, no BOM) as they are produced.
+
+    The fragments are gathered up to about '_buffer_size' characters per write,
+    so only one buffer's worth of text is held at a time. They are written to a
+    temporary file beside the target, which only replaces the target once all of
+    them are written: an error while generating them leaves the target as it was.
+
+    Arguments:
+    ----------
+        * _file_path (str | pathlib.Path): The target file path.
+        * _json_chunks (Iterable[str]): The JSON text fragments, in order.
+            ie: from 'metr_builder.iter_metr_json_text'.
+        * _buffer_size (int): The approximate number of characters per write.
+
+    Returns:
+    --------
+        * None
+    """
+    file_path = pathlib.Path(_file_path)
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=file_path.parent, prefix=f".{file_path.name}.", delete=False
+    ) as f:
+        try:
+            buffer: list[str] = []
+            buffered = 0
+            for chunk in _json_chunks:
+                buffer.append(chunk)
+                buffered += len(chunk)
+                if buffered >= _buffer_size:
+                    f.write("".join(buffer))
+                    buffer.clear()
+                    buffered = 0
+            f.write("".join(buffer))
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    # -- The temporary file is private (0600), and a new target keeps that. An existing target keeps its own mode.
+    if file_path.exists():
+        os.chmod(f.name, file_path.stat().st_mode)
+    os.replace(f.name, file_path)
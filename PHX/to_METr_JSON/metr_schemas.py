@@ -4,9 +4,14 @@
 
 Each function is named `_ClassName` matching the PHX class and returns a dict (or list).
 The converter discovers these by class name: PhxProject → _PhxProject(), etc.
+
+The schemas in 'STREAMING_SCHEMAS' also take a '_stream' flag: when set, their
+large lists are returned as (lazy) 'MetrStreamList' for 'metr_stream' to encode
+one item at a time, instead of being built in full.
 """
 
 import operator
+from collections.abc import Callable, Hashable, Iterable, Iterator
 from datetime import datetime
 from functools import reduce
 from typing import Any
@@ -30,6 +35,7 @@ from PHX.model.hvac import collection as hvac_collection
 from PHX.model.hvac import heat_pumps, heating, renewable_devices, water
 from PHX.model.hvac import ventilation as hvac_ventilation
 from PHX.model.schedules import occupancy, ventilation
+from PHX.to_METr_JSON.metr_stream import MetrStreamDict, MetrStreamList
 
 TOL_LEV1 = 2  # Rounding tolerance: 9.843181919194 -> 9.84
 TOL_LEV2 = 10  # Rounding tolerance: 9.843181919194 -> 9.8431819192
@@ -51,10 +57,47 @@ def _date_array(d: project.PhxProjectDate) -> list[int]:
     return [d.year, d.month, d.day, d.hour, d.minutes, 0]
 
 
+# -- The schema functions which accept the '_stream' flag.
+STREAMING_SCHEMAS = frozenset({"_PhxProject", "_PhxVariant", "_PhxGraphics3D", "_PhxBuilding"})
+
+
+def _list(_items: Iterable[Any], _stream: bool) -> list | MetrStreamList:
+    """Return the items as a list, or as a lazy MetrStreamList when streaming."""
+    return MetrStreamList(_items) if _stream else list(_items)
+
+
+def _dict(_d: dict, _stream: bool) -> dict:
+    """Return the dict as-is, or marked for key-by-key encoding when streaming."""
+    return MetrStreamDict(_d) if _stream else _d
+
+
+# -- Default-value templates ---------------------------------------------------
+
+_DEFAULT_TEMPLATES: dict[Hashable, dict] = {}
+
+
+def _from_template(_key: Hashable, _build: Callable[[], dict], _copy_keys: tuple[str, ...] = ()) -> dict:
+    """Return a copy of the defaults dict made by '_build', which is only called once per process.
+
+    The copy is shallow (copy-on-write): its nested lists and dicts are shared
+    with the template, and with every other copy, so they must be replaced,
+    never changed in place. The nested values listed in '_copy_keys' (the ones
+    a schema does change in place) get their own (one-level) copy.
+    """
+    template = _DEFAULT_TEMPLATES.get(_key)
+    if template is None:
+        template = _DEFAULT_TEMPLATES[_key] = _build()
+
+    result = template.copy()
+    for k in _copy_keys:
+        result[k] = template[k].copy()
+    return result
+
+
 # -- PROJECT -------------------------------------------------------------------
 
 
-def _PhxProject(_p: project.PhxProject) -> dict:
+def _PhxProject(_p: project.PhxProject, _stream: bool = False) -> dict:
     # -- Collect all unique materials across all assemblies into a global list.
     # -- METR-JSON stores materials separately from assemblies, referenced by ID.
     # -- Deduplicate by id_num (mixed-material layers can cause duplicates).
@@ -65,23 +108,24 @@ def _PhxProject(_p: project.PhxProject) -> dict:
                 if mat.id_num not in all_materials:
                     all_materials[mat.id_num] = mat
 
-    return {
+    result = {
         "progVers": "3.5.0.1",
         "SIIP": 2,
         "calcScope": 4,
         "dimVisGeom": _p.visualized_geometry,
         "projD": _PhxProjectData(_p.project_data),
-        "lMaterial": [_PhxMaterial(m) for m in all_materials.values()],
-        "lAssembly": [_PhxConstructionOpaque(a) for a in _p.assembly_types.values()],
-        "lWindow": [_PhxConstructionWindow(w) for w in _p.window_types.values()],
-        "lSolProt": [_PhxWindowShade(s) for s in _p.shade_types.values()],
+        "lMaterial": _list((_PhxMaterial(m) for m in all_materials.values()), _stream),
+        "lAssembly": _list((_PhxConstructionOpaque(a) for a in _p.assembly_types.values()), _stream),
+        "lWindow": _list((_PhxConstructionWindow(w) for w in _p.window_types.values()), _stream),
+        "lSolProt": _list((_PhxWindowShade(s) for s in _p.shade_types.values()), _stream),
         "lOverhang": [],  # TODO: Phase 3 — overhangs
         "lUtilNResPH": [_UtilizationPattern(pat) for pat in _p.utilization_patterns_occupancy],
         "lUtilVentPH": [_UtilizationPatternVent(pat) for pat in _p.utilization_patterns_ventilation],
         "lFile": [],
         "timeProf": _build_time_profiles(_p),
-        "lVariant": [_PhxVariant(v) for v in _p.variants],
+        "lVariant": _list((_PhxVariant(v, _stream) for v in _p.variants), _stream),
     }
+    return _dict(result, _stream)
 
 
 # -- PROJECT DATA --------------------------------------------------------------
@@ -368,19 +412,19 @@ def _build_time_profiles(_p: project.PhxProject) -> dict:
 # -- VARIANTS ------------------------------------------------------------------
 
 
-def _PhxVariant(_v: project.PhxVariant) -> dict:
+def _PhxVariant(_v: project.PhxVariant, _stream: bool = False) -> dict:
     foundations = _v.phius_cert.ph_building_data.foundations
-    return {
+    result = {
         "id": _v.id_num,
         "n": _v.name,
         "remarks": _v.remarks or "",
-        "geom": _PhxGraphics3D(_v.graphics3D),
+        "geom": _PhxGraphics3D(_v.graphics3D, _stream),
         "calcScope": -1,
         "HaMT": _build_default_HaMT(),
         "PHIUS": _PhxPhiusCertification(_v.phius_cert),
         "DIN4108": {"selC4108": 1, "reg4108": 2},
         "cliLoc": _PhxSite(_v.site, _v.phius_cert.phius_certification_criteria),
-        "building": _PhxBuilding(_v.building, foundations),
+        "building": _PhxBuilding(_v.building, foundations, _stream),
         "HVAC": _Systems(_v._mech_collections),
         "res": {
             "cCurv": 0,
@@ -389,6 +433,7 @@ def _PhxVariant(_v: project.PhxVariant) -> dict:
             "lResF": 0.0,
         },
     }
+    return _dict(result, _stream)
 
 
 def _build_default_HaMT() -> dict:
@@ -428,16 +473,21 @@ def _build_default_HaMT() -> dict:
 # -- GEOMETRY ------------------------------------------------------------------
 
 
-def _PhxGraphics3D(_g3d: geometry.PhxGraphics3D) -> dict:
-    return {
-        "lIDXYZ": [[v.id_num, v.x, v.y, v.z] for v in _g3d.vertices],
-        "lPoly": [_PhxPolygon(p) for p in _g3d.polygons],
+def _PhxGraphics3D(_g3d: geometry.PhxGraphics3D, _stream: bool = False) -> dict:
+    # -- One pass over the polygons gives both the vertex list and each polygon's vertices.
+    table = _g3d.vertex_table()
+    result = {
+        "lIDXYZ": _list(([v.id_num, v.x, v.y, v.z] for v in table.vertices), _stream),
+        "lPoly": _list((_PhxPolygon(p, vts) for p, vts in zip(_g3d.polygons, table.iter_polygon_vertices())), _stream),
     }
+    return _dict(result, _stream)
 
 
-def _PhxPolygon(_p: geometry.PhxPolygon) -> dict:
+def _PhxPolygon(_p: geometry.PhxPolygon, _vertices: list[geometry.PhxVertix] | None = None) -> dict:
+    vertices = _p.vertices if _vertices is None else _vertices
+
     # -- Derive height above ground from vertex z-coordinates
-    z_coords = [v.z for v in _p.vertices]
+    z_coords = [v.z for v in vertices]
     min_z = min(z_coords) if z_coords else 0.0
     max_z = max(z_coords) if z_coords else 0.0
     h_above_ground = (min_z + max_z) / 2.0
@@ -448,8 +498,8 @@ def _PhxPolygon(_p: geometry.PhxPolygon) -> dict:
         vert_height = _p.height
     else:
         # Estimate from bounding box for non-rectangular polygons
-        x_coords = [v.x for v in _p.vertices]
-        y_coords = [v.y for v in _p.vertices]
+        x_coords = [v.x for v in vertices]
+        y_coords = [v.y for v in vertices]
         dx = max(x_coords) - min(x_coords) if x_coords else 0.0
         dy = max(y_coords) - min(y_coords) if y_coords else 0.0
         dz = max_z - min_z
@@ -470,7 +520,7 @@ def _PhxPolygon(_p: geometry.PhxPolygon) -> dict:
         "hAGr": round(h_above_ground, 6),
         "vertH": round(vert_height, 6),
         "nVec": [_p.normal_vector.x, _p.normal_vector.y, _p.normal_vector.z],
-        "idVert": _p.vertices_id_numbers,
+        "idVert": [v.id_num for v in vertices],
         "idPolyI": _p.child_polygon_ids,
     }
 
@@ -478,16 +528,22 @@ def _PhxPolygon(_p: geometry.PhxPolygon) -> dict:
 # -- BUILDING ------------------------------------------------------------------
 
 
-def _PhxBuilding(_b: building.PhxBuilding, _foundations: list[ground.PhxFoundation] | None = None) -> dict:
-    # -- Collect all components: opaque (incl. shades) first, then apertures.
+def _iter_building_components(_b: building.PhxBuilding) -> Iterator[dict]:
+    """Yield every component: opaque (incl. shades) first, then apertures, indexed in that order."""
     # -- _b._components has all opaque; _b.aperture_components has all apertures.
-    all_components: list[dict] = []
+    index = 0
     for c in _b._components:
-        all_components.append(_PhxComponentOpaque(c, len(all_components)))
+        yield _PhxComponentOpaque(c, index)
+        index += 1
     for c in _b.aperture_components:
-        all_components.append(_PhxComponentAperture(c, len(all_components)))
+        yield _PhxComponentAperture(c, index)
+        index += 1
 
-    return {
+
+def _PhxBuilding(
+    _b: building.PhxBuilding, _foundations: list[ground.PhxFoundation] | None = None, _stream: bool = False
+) -> dict:
+    result = {
         "OrAzim": 1,
         "orient": 1,
         "azimN": 180.0,
@@ -517,18 +573,23 @@ def _PhxBuilding(_b: building.PhxBuilding, _foundations: list[ground.PhxFoundati
         "openInOB": 1,
         "dPresB": 50.0,
         "overwrPB": False,
-        "lComponent": all_components,
-        "lZone": [_PhxZone(z, _foundations or []) for z in _b.zones],
+        "lComponent": _list(_iter_building_components(_b), _stream),
+        "lZone": _list((_PhxZone(z, _foundations or []) for z in _b.zones), _stream),
         "lObj3D": [],
         "generB": _build_default_generB(),
         "countGenB": 0,
         "wasGenB": False,
         "chdSLGB": False,
     }
+    return _dict(result, _stream)
 
 
 def _build_default_generB() -> dict:
     """Default building geometry generator parameters."""
+    return _from_template("generB", _new_default_generB)
+
+
+def _new_default_generB() -> dict:
     return {
         "mainSec": 1,
         "tRoof": 1,
@@ -575,6 +636,13 @@ def _component_surface_defaults(
     is_roof = _face_type_value == ComponentFaceType.ROOF_CEILING.value
     is_ground = _exposure_ext_value == ComponentExposureExterior.GROUND.value
 
+    return _from_template(
+        ("surface", is_floor, is_roof, is_ground),
+        lambda: _new_component_surface_defaults(is_floor, is_roof, is_ground),
+    )
+
+
+def _new_component_surface_defaults(is_floor: bool, is_roof: bool, is_ground: bool) -> dict:
     if is_ground and is_floor:
         rse = 0.0
         rsi = 0.17
@@ -800,6 +868,10 @@ def _PhxComponentAperture(_c: components.PhxComponentAperture, _index: int) -> d
 
 def _zone_design_conditions() -> dict:
     """Default zone design conditions, referencing value profiles by ID."""
+    return _from_template("zone_design_conditions", _new_zone_design_conditions)
+
+
+def _new_zone_design_conditions() -> dict:
     return {
         "minTZ": {"PF": 1, "PTVid": [[-1, 1, 1]], "FCid": [-1, -1]},
         "maxTZ": {"PF": 1, "PTVid": [[-1, 1, 2]], "FCid": [-1, -1]},
@@ -849,6 +921,10 @@ def _zone_loads(_z: building.PhxZone) -> dict:
 
 def _zone_calc_params() -> dict:
     """Default zone calculation parameters."""
+    return _from_template("zone_calc_params", _new_zone_calc_params)
+
+
+def _new_zone_calc_params() -> dict:
     return {
         "iniTz": 20.0,
         "iniRHz": 55.0,
@@ -1456,11 +1532,16 @@ def _PhxMechanicalSystemCollection(_c: hvac_collection.PhxMechanicalSystemCollec
 
 
 def _build_device_defaults() -> dict:
-    """Build the ~131-key base device dict with NaN/default values.
+    """Return the ~131-key base device dict with NaN/default values.
 
     METR uses a flat 'super-device' structure where every device has ALL keys
     regardless of device type. Device-specific overlays set the relevant values.
     """
+    # -- 'cHWCVHD' is the only value changed in place (ventilator coverage split)
+    return _from_template("device", _new_device_defaults, _copy_keys=("cHWCVHD",))
+
+
+def _new_device_defaults() -> dict:
     return {
         # -- Identity
         "info": "",
@@ -0,0 +1,93 @@
+# -*- Python Version: 3.10 -*-
+
+"""Streaming JSON encoder for METr JSON: yields the text in fragments instead of one string.
+
+The schema functions mark the large parts of the tree (the variants, each
+variant's components, zones, polygons and vertices) as 'MetrStreamList', whose
+items are only built as the encoder reaches them, and the objects holding them
+as 'MetrStreamDict'. Everything else is ordinary dicts and lists, which are
+encoded in a single 'json.dumps' call each.
+
+The indented text is identical to 'json.dumps(..., indent=_indent, ensure_ascii=False)'
+of the same (fully built) tree. The compact text has no whitespace at all.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+COMPACT_SEPARATORS = (",", ":")
+
+
+class MetrStreamList:
+    """A METr JSON list whose items are produced one at a time, as the encoder reaches them.
+
+    The items can only be iterated once.
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self, _items: Iterable[Any]) -> None:
+        self.items = _items
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+
+class MetrStreamDict(dict):
+    """A METr JSON object with one or more streamed values: it is encoded key by key."""
+
+
+def _dumps(_value: Any, _indent: int | None) -> str:
+    if _indent is None:
+        return json.dumps(_value, ensure_ascii=False, separators=COMPACT_SEPARATORS)
+    return json.dumps(_value, ensure_ascii=False, indent=_indent)
+
+
+def iter_json_chunks(_value: Any, _indent: int | None = 2, _level: int = 0) -> Iterator[str]:
+    """Yield the JSON text of the value in fragments.
+
+    Arguments:
+    ----------
+        * _value: (Any) The JSON-able value. May contain MetrStreamList / MetrStreamDict.
+        * _indent: (int | None) The number of spaces to indent by. None for compact output.
+        * _level: (int) The nesting level of the value itself (for the indentation).
+
+    Yields:
+    -------
+        * (str): The next fragment of JSON text.
+    """
+    if isinstance(_value, MetrStreamDict):
+        yield from _iter_container(
+            ((json.dumps(str(k), ensure_ascii=False), v) for k, v in _value.items()), "{", "}", _indent, _level
+        )
+    elif isinstance(_value, MetrStreamList):
+        yield from _iter_container(((None, v) for v in _value), "[", "]", _indent, _level)
+    elif _indent and _level and isinstance(_value, (dict, list, tuple)):
+        # -- The nested lines of a leaf container must be indented to its own level.
+        yield _dumps(_value, _indent).replace("\n", "\n" + " " * (_indent * _level))
+    else:
+        yield _dumps(_value, _indent)
+
+
+def _iter_container(
+    _entries: Iterator[tuple[str | None, Any]], _open: str, _close: str, _indent: int | None, _level: int
+) -> Iterator[str]:
+    """Yield a JSON object or array, one entry at a time. Keys are already encoded (None for arrays)."""
+    if _indent is None:
+        item_prefix, first_prefix, close, key_sep = ",", "", _close, ":"
+    else:
+        inner = "\n" + " " * (_indent * (_level + 1))
+        item_prefix, first_prefix, key_sep = "," + inner, inner, ": "
+        close = "\n" + " " * (_indent * _level) + _close
+
+    is_empty = True
+    for key, value in _entries:
+        prefix = first_prefix if is_empty else item_prefix
+        if is_empty:
+            yield _open
+            is_empty = False
+        yield prefix if key is None else f"{prefix}{key}{key_sep}"
+        yield from iter_json_chunks(value, _indent, _level + 1)
+
+    yield f"{_open}{_close}" if is_empty else close
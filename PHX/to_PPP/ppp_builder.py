@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from PHX.model.project import PhxProject
 from PHX.to_PPP.ppp_schemas import (
     ASSEMBLY_ID_OFFSET,
@@ -16,6 +18,7 @@ from PHX.to_PPP.ppp_schemas import (
     ebf_sections,
     meta_sections,
     overbuilt_sections,
+    ppp_timestamp,
     shading_sections,
     surface_sections,
     thermal_bridge_sections,
@@ -24,7 +27,22 @@ from PHX.to_PPP.ppp_schemas import (
     ventilation_sections,
     window_sections,
 )
-from PHX.to_PPP.ppp_sections import PppFile
+from PHX.to_PPP.ppp_sections import PppFile, PppSection
+
+
+@dataclass(frozen=True)
+class PppProjectData:
+    """The project-level maps and sections, built once and shared by every variant's PppFile.
+
+    The sections are shared (not copied) between the files, so must not be modified.
+    Every file also gets the same 'imported from PHX' timestamp.
+    """
+
+    assembly_map: AssemblyMap
+    glazing_map: GlazingMap
+    frame_map: FrameMap
+    project_sections: list[PppSection]
+    timestamp: str
 
 
 def _build_assembly_map(project: PhxProject) -> AssemblyMap:
@@ -71,27 +89,52 @@ def _build_surface_index_map(variant) -> SurfaceIndexMap:
     return result
 
 
-def build_ppp_file(project: PhxProject) -> PppFile:
-    """Build a complete PppFile from a PhxProject."""
-    variant = project.variants[0]
-    variant.assert_ventilation_assignments_ready()
-
-    # Build cross-reference maps
+def build_ppp_project_data(project: PhxProject) -> PppProjectData:
+    """Build the project-level cross-reference maps, and the sections which only depend on the project."""
     assembly_map = _build_assembly_map(project)
     glazing_map = _build_glazing_map(project)
     frame_map = _build_frame_map(project)
+
+    sections = []
+    sections += u_value_sections(project, assembly_map)
+    sections += user_component_sections(project, glazing_map, frame_map, assembly_map)
+    sections += overbuilt_sections()
+
+    return PppProjectData(assembly_map, glazing_map, frame_map, sections, ppp_timestamp())
+
+
+def build_ppp_file(
+    project: PhxProject, _variant_index: int = 0, _project_data: PppProjectData | None = None
+) -> PppFile:
+    """Build a complete PppFile from a PhxProject.
+
+    Arguments:
+    ----------
+        * project (PhxProject): The project to build the PPP file from.
+        * _variant_index (int): The index of the variant to write. Default: 0 (the first).
+        * _project_data (PppProjectData | None): The project-level maps and sections, when
+            already built for another variant. Default: None (build them).
+
+    Returns:
+    --------
+        * (PppFile): The PPP file for the variant.
+    """
+    variant = project.variants[_variant_index]
+    variant.assert_ventilation_assignments_ready()
+
+    # Build cross-reference maps
+    if _project_data is None:
+        _project_data = build_ppp_project_data(project)
     surface_index_map = _build_surface_index_map(variant)
 
     sections = []
-    sections += meta_sections(project, variant)
+    sections += meta_sections(project, variant, _project_data.timestamp)
     sections += ebf_sections(variant)
-    sections += surface_sections(variant, assembly_map)
+    sections += surface_sections(variant, _project_data.assembly_map)
     sections += thermal_bridge_sections(variant)
-    sections += window_sections(variant, surface_index_map, glazing_map, frame_map)
+    sections += window_sections(variant, surface_index_map, _project_data.glazing_map, _project_data.frame_map)
     sections += shading_sections(variant)
     sections += ventilation_sections(variant)
-    sections += u_value_sections(project, assembly_map)
-    sections += user_component_sections(project, glazing_map, frame_map, assembly_map)
-    sections += overbuilt_sections()
+    sections += _project_data.project_sections
 
     return PppFile(sections=sections)
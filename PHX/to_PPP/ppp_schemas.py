@@ -125,10 +125,14 @@ SurfaceIndexMap = dict[int, tuple[int, str]]  # {component id(): (row_num, displ
 # ---------------------------------------------------------------------------
 
 
-def meta_sections(_project: PhxProject, _variant: PhxVariant) -> list[PppSection]:
-    """Build the header / metadata sections."""
-    now = datetime.now()
-    timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+def ppp_timestamp() -> str:
+    """Return the current time, formatted for the 'imported from PHX' note."""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def meta_sections(_project: PhxProject, _variant: PhxVariant, _timestamp: str | None = None) -> list[PppSection]:
+    """Build the header / metadata sections. The timestamp defaults to the current time."""
+    timestamp = _timestamp or ppp_timestamp()
 
     # pppmeta_kopf
     kopf = PppSection(
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 
@@ -16,10 +17,14 @@ class PppSection:
     cols: int
     values: list[str] = field(default_factory=list)
 
+    def iter_lines(self) -> Iterator[str]:
+        """Yield the section's lines (header + values)."""
+        yield f'"{self.name}",{self.rows},{self.cols}'
+        yield from self.values
+
     def to_lines(self) -> list[str]:
         """Return the section as a list of lines (header + values)."""
-        header = f'"{self.name}",{self.rows},{self.cols}'
-        return [header] + list(self.values)
+        return list(self.iter_lines())
 
 
 END_MARKER = "<End of designPH import!>"
@@ -36,13 +41,21 @@ class PppFile:
 
     sections: list[PppSection] = field(default_factory=list)
 
+    def iter_lines(self) -> Iterator[str]:
+        """Yield all lines for the complete PPP file, one section at a time."""
+        for section in self.sections:
+            section_lines = section.iter_lines()
+            if section.name not in END_MARKER_SECTIONS:
+                yield from section_lines
+                continue
+
+            # Replace the last data value with the end marker
+            previous = next(section_lines)
+            for line in section_lines:
+                yield previous
+                previous = line
+            yield END_MARKER
+
     def to_lines(self) -> list[str]:
         """Return all lines for the complete PPP file."""
-        lines: list[str] = []
-        for section in self.sections:
-            section_lines = section.to_lines()
-            if section.name in END_MARKER_SECTIONS:
-                # Replace the last data value with the end marker
-                section_lines[-1] = END_MARKER
-            lines.extend(section_lines)
-        return lines
+        return list(self.iter_lines())
@@ -9,9 +9,23 @@ import pathlib
 from PHX.to_PPP.ppp_sections import PppFile
 
 
-def write_ppp_file(_filepath: pathlib.Path, _ppp_file: PppFile) -> None:
-    """Write a PppFile to disk as a UTF-16LE encoded text file (no BOM)."""
-    lines = _ppp_file.to_lines()
-    text = "\n".join(lines) + "\n"
+def write_ppp_file(_filepath: pathlib.Path, _ppp_file: PppFile, _batch_lines: int = 4096) -> None:
+    """Write a PppFile to disk as a UTF-16LE encoded text file (no BOM).
+
+    The lines are encoded and written in batches of '_batch_lines' as the sections
+    yield them, so neither the full text nor its encoded bytes are ever held in memory.
+    Every line ends with a newline, written in text mode (as the platform's line ending).
+    """
     with open(_filepath, "w", encoding="utf-16-le") as f:
-        f.write(text)
+        batch: list[str] = []
+        is_empty = True
+        for line in _ppp_file.iter_lines():
+            batch.append(line)
+            if len(batch) >= _batch_lines:
+                f.write("\n".join(batch) + "\n")
+                batch.clear()
+                is_empty = False
+
+        # -- The last (partial) batch. An empty file is a single newline.
+        if batch or is_empty:
+            f.write("\n".join(batch) + "\n")
@@ -0,0 +1,75 @@
+# -*- Python Version: 3.10 -*-
+
+"""Build and write one PPP file per variant, in parallel processes."""
+
+from __future__ import annotations
+
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+
+from PHX.model.project import PhxProject
+from PHX.to_PPP import ppp_builder, ppp_txt_to_file
+
+# -- The project and its shared PPP data, set once in each worker process.
+_WORKER_STATE: tuple[PhxProject, ppp_builder.PppProjectData] | None = None
+
+
+def variant_ppp_file_path(_target_dir: pathlib.Path, _file_stem: str, _variant_index: int) -> pathlib.Path:
+    """Return the PPP file path for the variant: '<stem>_<n>.ppp', numbered from 1."""
+    return pathlib.Path(_target_dir, f"{_file_stem}_{_variant_index + 1}.ppp")
+
+
+def _init_worker(_project: PhxProject, _project_data: ppp_builder.PppProjectData) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (_project, _project_data)
+
+
+def _write_variant(_variant_index: int, _filepath: pathlib.Path) -> pathlib.Path:
+    """Build and write one variant's PPP file, using the worker's project and shared data."""
+    if _WORKER_STATE is None:
+        raise RuntimeError("The PPP variant worker was not initialised with a project.")
+    project, project_data = _WORKER_STATE
+    ppp_file = ppp_builder.build_ppp_file(project, _variant_index, project_data)
+    ppp_txt_to_file.write_ppp_file(_filepath, ppp_file)
+    return _filepath
+
+
+def write_variant_ppp_files(
+    _project: PhxProject,
+    _target_dir: pathlib.Path,
+    _file_stem: str,
+    _max_workers: int | None = None,
+) -> list[pathlib.Path]:
+    """Write a PPP file for every variant in the project.
+
+    The project-level assembly, glazing and frame maps (and the sections that only
+    depend on the project) are built once and sent to each worker process along
+    with the project, so each variant only costs its own sections.
+
+    Arguments:
+    ----------
+        * _project (PhxProject): The project to write.
+        * _target_dir (pathlib.Path): The directory to write the files into.
+        * _file_stem (str): The file name (without extension). The variant number is appended.
+        * _max_workers (int | None): The maximum number of worker processes. Default: None (one
+            per CPU). With 1 (or a single variant) the files are written in this process.
+
+    Returns:
+    --------
+        * (list[pathlib.Path]): The PPP file paths, in the variant order.
+    """
+    _project.assert_ventilation_assignments_ready()
+    project_data = ppp_builder.build_ppp_project_data(_project)
+    paths = [variant_ppp_file_path(_target_dir, _file_stem, i) for i in range(len(_project.variants))]
+
+    num_workers = min(_max_workers or os.cpu_count() or 1, len(paths))
+    if num_workers <= 1:
+        for i, path in enumerate(paths):
+            ppp_txt_to_file.write_ppp_file(path, ppp_builder.build_ppp_file(_project, i, project_data))
+        return paths
+
+    with ProcessPoolExecutor(
+        max_workers=num_workers, initializer=_init_worker, initargs=(_project, project_data)
+    ) as executor:
+        return list(executor.map(_write_variant, range(len(paths)), paths))
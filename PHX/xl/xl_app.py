@@ -8,7 +8,7 @@ from collections.abc import Callable
 from contextlib import contextmanager
 from typing import Any
 
-from PHX.xl import xl_data
+from PHX.xl import xl_data, xl_profile
 from PHX.xl.xl_typing import (
     xl_app_Protocol,
     xl_apps_Protocol,
@@ -138,6 +138,10 @@ class XLConnection:
         # -- whole cache (a recalc can change formula-cells on EVERY sheet).
         self._column_data_cache: dict[str, dict[tuple[str, int | None, int | None], Any]] = {}
 
+        # -- Opt-in export-phase profiler. None (the default) means no facade
+        # -- method is wrapped at all. See 'xl_profile.XLProfiler.attach'.
+        self.profiler: xl_profile.XLProfiler | None = None
+
         self._wb: xl_Book_Protocol | None = None
         self.output(f"> connected to excel doc: '{self.wb.fullname}'")
 
@@ -50,6 +50,12 @@ def col_offset(_col: str, _offset: int) -> str:
     return xl_chr(new)
 
 
+def split_cell_address(_address: str) -> tuple[str, int]:
+    """Return the (column, row) of a single-cell address. ie: "AB25" -> ("AB", 25)"""
+    col = "".join(c for c in _address if c.isalpha())
+    return col, int(_address[len(col) :])
+
+
 class XlItem:
     """A single XLItem which can be written out to a specific XL Range."""
 
@@ -434,3 +440,71 @@ def merge_xl_item_row(
                 raise Exception(msg)
 
     return list(d.values())
+
+
+def merge_xl_item_cells(_xl_items: list[XlItem]) -> list[XlItem]:
+    """Merge scattered single-cell XlItems into as few rectangular block XlItems as possible.
+
+    Unlike 'merge_xl_item_rows', the items need not form uniform rows: this is
+    for sparse input cells (ie: the 'Electricity' or 'Climate' entry cells)
+    which sit in between labels and formulas. Only the cells given are ever
+    covered by the blocks, so the cells in between are left untouched.
+
+    Items are applied in order, so a later item for the same cell replaces an
+    earlier one and each cell is written only once. Each row is split into
+    runs of adjacent columns, and identical runs (same start-column and width)
+    on consecutive rows are stacked into one 2D-valued XlItem.
+
+    ie: E16, E17, E18, N16 -> 'E16'=[[..], [..], [..]] and 'N16'
+
+    Items with font/range colors, multi-cell ranges or list values are returned
+    unchanged (after the merged blocks).
+
+    Arguments:
+    ----------
+        * _xl_items: (list[XlItem]) The single-cell items to merge.
+
+    Returns:
+    --------
+        * (list[XlItem]): Items ready for 'write_xl_item()', sorted by sheet, row and column.
+    """
+    passthrough: list[XlItem] = []
+    cells: dict[tuple[str, int, int], xl_writable] = {}
+    for item in _xl_items:
+        if item.has_color or ":" in item.xl_range or item.value_is_iterable:
+            passthrough.append(item)
+            continue
+        cells[(item.sheet_name, item.xl_row_number, item.xl_col_number)] = item.write_value
+
+    # -- Split each row into runs of adjacent columns: {(sheet, row): [(col, [values]), ...]}
+    row_runs: dict[tuple[str, int], list[tuple[int, list]]] = {}
+    for sheet_name, row, col in sorted(cells):
+        runs = row_runs.setdefault((sheet_name, row), [])
+        if runs and runs[-1][0] + len(runs[-1][1]) == col:
+            runs[-1][1].append(cells[(sheet_name, row, col)])
+        else:
+            runs.append((col, [cells[(sheet_name, row, col)]]))
+
+    # -- Stack identical runs on consecutive rows: {(sheet, col, width): (start_row, last_row, [rows])}
+    blocks: list[tuple[str, int, int, list[list]]] = []
+    open_blocks: dict[tuple[str, int, int], tuple[int, int, list[list]]] = {}
+    for (sheet_name, row), runs in row_runs.items():
+        for col, values in runs:
+            key = (sheet_name, col, len(values))
+            if key in open_blocks and open_blocks[key][1] == row - 1:
+                start_row, _, rows = open_blocks[key]
+                rows.append(values)
+                open_blocks[key] = (start_row, row, rows)
+            else:
+                if key in open_blocks:
+                    start_row, _, rows = open_blocks[key]
+                    blocks.append((sheet_name, start_row, col, rows))
+                open_blocks[key] = (row, row, [values])
+    for (sheet_name, col, _), (start_row, _, rows) in open_blocks.items():
+        blocks.append((sheet_name, start_row, col, rows))
+
+    merged: list[XlItem] = []
+    for sheet_name, start_row, col, rows in sorted(blocks, key=lambda b: (b[0], b[1], b[2])):
+        value = rows[0][0] if len(rows) == 1 and len(rows[0]) == 1 else rows
+        merged.append(XlItem(sheet_name, f"{xl_chr(col)}{start_row}", value))
+    return merged + passthrough
@@ -0,0 +1,279 @@
+# -*- Python Version: 3.10 -*-
+
+"""Opt-in export-phase profiler for the Excel interop layer.
+
+When enabled, an 'XLProfiler' is attached to an 'XLConnection' (and, through
+'PHPPConnection', to its 'write_*' phase methods). It records, per phase:
+wall time, read and write round trips, recalculations and column-cache hits.
+
+The profiler works by replacing the facade methods on the *instance* with
+counting wrappers, so when it is off nothing is wrapped and the export runs
+exactly the un-instrumented code: zero overhead.
+
+Round trips are counted at the facade level: each facade call that touches the
+workbook directly counts as one. Delegating helpers (ie: 'get_data_with_column_letters')
+are not counted themselves, only the facade calls they make. A column-read
+served from the column-cache counts as a cache hit, not as a read.
+
+Enable it with the 'PHX_PHPP_PROFILE' environment variable, or by passing
+'profile=True' to 'PHPPConnection':
+
+    * PHX_PHPP_PROFILE=1 (or 'true' / 'yes' / 'on'): profile, report via 'xl.output'
+    * PHX_PHPP_PROFILE=/some/path.json: profile, and write the JSON report there
+"""
+
+import json
+import os
+import pathlib
+import time
+from collections.abc import Callable, Iterable
+from contextlib import contextmanager
+from typing import Any
+
+PROFILE_ENV_VAR = "PHX_PHPP_PROFILE"
+NO_PHASE = "(no phase)"
+
+# -- Facade methods which make one read round trip to the workbook.
+READ_METHODS = (
+    "get_data",
+    "get_single_data_item",
+    "get_multiple_column_data",
+    "get_data_by_columns",
+    "get_single_row_data",
+    "get_row_num_of_value_in_column",
+    "get_last_used_row_num_in_column",
+    "get_last_used_column_in_row",
+    "get_upper_case_worksheet_names",
+)
+
+# -- Facade methods which make one write round trip to the workbook.
+WRITE_METHODS = (
+    "write_xl_item",
+    "clear_range_data",
+    "clear_sheet_contents",
+    "clear_sheet_formats",
+    "clear_sheet_all",
+    "create_new_worksheet",
+    "group_rows",
+    "hide_group_details",
+    "autofit_columns",
+    "autofit_rows",
+    "unprotect_all_sheets",
+)
+
+_TRUTHY = ("1", "true", "yes", "on")
+_FALSY = ("", "0", "false", "no", "off")
+
+
+# -----------------------------------------------------------------------------
+
+
+def profile_setting_from_env() -> str | None:
+    """Return the 'PHX_PHPP_PROFILE' setting, or None if profiling is turned off."""
+    value = os.environ.get(PROFILE_ENV_VAR, "").strip()
+    if value.lower() in _FALSY:
+        return None
+    return value
+
+
+def profile_output_path_from_env() -> pathlib.Path | None:
+    """Return the JSON report path set in 'PHX_PHPP_PROFILE', or None if it is a simple on/off flag."""
+    value = profile_setting_from_env()
+    if value is None or value.lower() in _TRUTHY:
+        return None
+    return pathlib.Path(value).expanduser()
+
+
+# -----------------------------------------------------------------------------
+
+
+class PhaseRecord:
+    """The counts recorded for one export phase."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.wall_time_s = 0.0
+        self.reads = 0
+        self.writes = 0
+        self.recalcs = 0
+        self.column_cache_hits = 0
+        self.column_cache_misses = 0
+
+    @property
+    def round_trips(self) -> int:
+        return self.reads + self.writes + self.recalcs
+
+    @property
+    def column_cache_hit_rate(self) -> float | None:
+        total = self.column_cache_hits + self.column_cache_misses
+        if not total:
+            return None
+        return round(self.column_cache_hits / total, 4)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "phase": self.name,
+            "calls": self.calls,
+            "wall_time_s": round(self.wall_time_s, 4),
+            "reads": self.reads,
+            "writes": self.writes,
+            "recalcs": self.recalcs,
+            "round_trips": self.round_trips,
+            "column_cache_hits": self.column_cache_hits,
+            "column_cache_misses": self.column_cache_misses,
+            "column_cache_hit_rate": self.column_cache_hit_rate,
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r}, reads={self.reads}, writes={self.writes})"
+
+
+class XLProfiler:
+    """Records per-phase wall time, round-trip counts and cache hits for an XLConnection."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseRecord] = {}
+        self._phase_stack: list[str] = []
+
+    @property
+    def current_phase(self) -> PhaseRecord:
+        name = self._phase_stack[-1] if self._phase_stack else NO_PHASE
+        if name not in self.phases:
+            self.phases[name] = PhaseRecord(name)
+        return self.phases[name]
+
+    @contextmanager
+    def phase(self, _name: str):
+        """Attribute all the round trips inside the 'with' block to the named phase."""
+        self._phase_stack.append(_name)
+        record = self.current_phase
+        record.calls += 1
+        t0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.wall_time_s += time.perf_counter() - t0
+            self._phase_stack.pop()
+
+    # -------------------------------------------------------------------------
+    # -- Attaching
+
+    @classmethod
+    def attach(cls, _xl) -> "XLProfiler":
+        """Create a new XLProfiler and install its counting wrappers on an XLConnection instance."""
+        profiler = cls()
+        for name in READ_METHODS:
+            profiler._wrap_counter(_xl, name, "reads")
+        for name in WRITE_METHODS:
+            profiler._wrap_counter(_xl, name, "writes")
+        profiler._wrap_counter(_xl, "calculate", "recalcs")
+        profiler._wrap_column_reads(_xl)
+        _xl.profiler = profiler
+        return profiler
+
+    def _wrap_counter(self, _obj, _method_name: str, _count_name: str) -> None:
+        method = getattr(_obj, _method_name)
+
+        def wrapper(*args, **kwargs):
+            record = self.current_phase
+            setattr(record, _count_name, getattr(record, _count_name) + 1)
+            return method(*args, **kwargs)
+
+        setattr(_obj, _method_name, wrapper)
+
+    def _wrap_column_reads(self, _xl) -> None:
+        method = _xl.get_single_column_data
+
+        def wrapper(_sheet_name, _col, _row_start=None, _row_end=None):
+            sheet_cache = _xl._column_data_cache.get(str(_sheet_name).upper(), {})
+            record = self.current_phase
+            if (_col, _row_start, _row_end) in sheet_cache:
+                record.column_cache_hits += 1
+            else:
+                record.column_cache_misses += 1
+                record.reads += 1
+            return method(_sheet_name, _col, _row_start, _row_end)
+
+        _xl.get_single_column_data = wrapper
+
+    def wrap_phases(self, _obj, _method_names: Iterable[str]) -> None:
+        """Wrap each of the named methods on an object instance so that it runs as its own phase."""
+        for name in _method_names:
+            self._wrap_phase(_obj, name)
+
+    def _wrap_phase(self, _obj, _method_name: str) -> None:
+        method: Callable = getattr(_obj, _method_name)
+
+        def wrapper(*args, **kwargs):
+            with self.phase(_method_name):
+                return method(*args, **kwargs)
+
+        setattr(_obj, _method_name, wrapper)
+
+    # -------------------------------------------------------------------------
+    # -- Reporting
+
+    def totals(self) -> dict[str, Any]:
+        total = PhaseRecord("total")
+        for record in self.phases.values():
+            total.wall_time_s += record.wall_time_s
+            total.reads += record.reads
+            total.writes += record.writes
+            total.recalcs += record.recalcs
+            total.column_cache_hits += record.column_cache_hits
+            total.column_cache_misses += record.column_cache_misses
+        total.calls = sum(r.calls for r in self.phases.values())
+        return total.to_dict()
+
+    def report(self) -> dict[str, Any]:
+        """Return the profile as a JSON-serializable dict, phases in the order they first ran."""
+        return {
+            "phases": [record.to_dict() for record in self.phases.values()],
+            "totals": self.totals(),
+        }
+
+    def write_json(self, _path: pathlib.Path) -> None:
+        """Write the profile report to a JSON file."""
+        _path = pathlib.Path(_path)
+        _path.parent.mkdir(parents=True, exist_ok=True)
+        _path.write_text(json.dumps(self.report(), indent=2))
+
+    def summary_lines(self) -> list[str]:
+        """Return a short human-readable table of the phases."""
+        lines = [f"{'phase':<40} {'time (s)':>9} {'reads':>7} {'writes':>7} {'recalcs':>7} {'cache-hit':>9}"]
+        for record in self.phases.values():
+            hit_rate = record.column_cache_hit_rate
+            lines.append(
+                f"{record.name:<40} {record.wall_time_s:>9.3f} {record.reads:>7} {record.writes:>7} "
+                f"{record.recalcs:>7} {'-' if hit_rate is None else f'{hit_rate:.0%}':>9}"
+            )
+        return lines
+
+
+# -----------------------------------------------------------------------------
+
+
+def check_round_trip_budgets(_report: dict[str, Any], _budgets: dict[str, dict[str, int]]) -> list[str]:
+    """Return a description of every phase whose round-trip counts exceed its budget.
+
+    Arguments:
+    ----------
+        * _report (dict[str, Any]): An 'XLProfiler.report()'.
+        * _budgets (dict[str, dict[str, int]]): The budgets, by phase name.
+            ie: {"write_project_tfa": {"reads": 4, "writes": 2}, ...}
+
+    Returns:
+    --------
+        * (list[str]): One entry per phase/count over budget. Empty if all are within budget.
+    """
+    phases = {phase["phase"]: phase for phase in _report["phases"]}
+    violations = []
+    for phase_name, budget in _budgets.items():
+        phase = phases.get(phase_name)
+        if phase is None:
+            continue
+        for count_name, limit in budget.items():
+            if phase[count_name] > limit:
+                violations.append(f"{phase_name}: {phase[count_name]} {count_name} > budget of {limit}")
+    return violations
@@ -7,7 +7,7 @@ import pathlib
 from rich import print as rich_print
 
 from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
-from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_dict
+from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_plain_dict
 from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
 from PHX.to_WUFI_XML import xml_builder, xml_txt_to_file
 
@@ -22,7 +22,7 @@ for xm_source_file_name in SOURCE_FILE_NAMES:
     # ----------------------------------------------------------------
     # -- 1) Read in the WUFI-XML File as a new Pydantic Model
     rich_print(f"[green bold]> Reading in data from XML-File: {xm_source_file}[/green bold]")
-    wufi_xml_data = get_WUFI_XML_file_as_dict(xm_source_file)
+    wufi_xml_data = get_WUFI_XML_file_as_plain_dict(xm_source_file)
     wufi_xml_model = WUFIplusProject.model_validate(wufi_xml_data)
 
     # ----------------------------------------------------------------
@@ -0,0 +1,146 @@
+# -*- Python Version: 3.10 -*-
+
+"""Microbenchmark: 'phx_schemas.as_phx_obj' dispatch cost, with and without the builder registry.
+
+'as_phx_obj' used to find its class-builder with
+'getattr(sys.modules[__name__], f"_{_schema_name}")' on every call; it now looks
+the name up in the '_BUILDERS' dict built once at import. On a synthetic model's
+WUFI-XML this times:
+
+    * dispatch — '--calls' calls of 'as_phx_obj' with a no-op builder, less calling
+                 the builder directly: the dispatch overhead per call (ns)
+    * convert  — the full 'convert_WUFI_XML_to_PHX_project' (ms), and how many
+                 'as_phx_obj' calls it makes
+
+once with the registry ('after') and once with the per-call getattr ('before').
+
+Usage:
+    python scripts/perf/bench_as_phx_obj.py [--rooms 64] [--calls 200000] [--repeat 5] [--seed 0]
+"""
+
+import argparse
+import contextlib
+import gc
+import math
+import pathlib
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import synthetic_models
+
+from PHX.from_WUFI_XML import phx_schemas
+from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
+from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_plain_dict
+from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
+
+
+def _as_phx_obj_by_getattr(_model, _schema_name, **kwargs) -> Any:
+    """The original dispatch: look the builder up on the module on every call."""
+    builder = getattr(sys.modules[phx_schemas.__name__], f"_{_schema_name}")
+    return builder(_model, **kwargs)
+
+
+@contextlib.contextmanager
+def registry_disabled() -> Iterator[None]:
+    """Dispatch with a per-call getattr, as before the registry."""
+    original = phx_schemas.as_phx_obj
+    phx_schemas.as_phx_obj = _as_phx_obj_by_getattr  # type: ignore
+    try:
+        yield
+    finally:
+        phx_schemas.as_phx_obj = original  # type: ignore
+
+
+def _best_s(_func: Callable[[], Any], _repeat: int) -> float:
+    """The best time of '_repeat' calls, each after a collection and excluding freeing the result."""
+    best = math.inf
+    for _ in range(max(_repeat, 1)):
+        gc.collect()
+        t0 = time.perf_counter()
+        result = _func()
+        best = min(best, time.perf_counter() - t0)
+        del result
+    return best
+
+
+def _noop(_model: Any) -> Any:
+    return _model
+
+
+@contextlib.contextmanager
+def noop_builder() -> Iterator[None]:
+    """Add a '_BenchNoop' builder to the module (and its registry) for the duration."""
+    phx_schemas._BenchNoop = _noop  # type: ignore
+    phx_schemas._BUILDERS["BenchNoop"] = _noop
+    try:
+        yield
+    finally:
+        del phx_schemas._BenchNoop  # type: ignore
+        del phx_schemas._BUILDERS["BenchNoop"]
+
+
+def _dispatch_ns(_calls: int, _repeat: int) -> float:
+    """The best time per call through 'as_phx_obj', less the best time calling the builder directly."""
+    items = range(_calls)
+    with noop_builder():
+        via_dispatch = _best_s(lambda: [phx_schemas.as_phx_obj(i, "BenchNoop") for i in items], _repeat)
+        direct = _best_s(lambda: [_noop(i) for i in items], _repeat)
+    return round((via_dispatch - direct) / max(_calls, 1) * 1e9, 1)
+
+
+def _count_calls(_model: WUFIplusProject) -> int:
+    calls = 0
+    original = phx_schemas.as_phx_obj
+
+    def _counting(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return original(*args, **kwargs)
+
+    phx_schemas.as_phx_obj = _counting  # type: ignore
+    try:
+        convert_WUFI_XML_to_PHX_project(_model)
+    finally:
+        phx_schemas.as_phx_obj = original  # type: ignore
+    return calls
+
+
+def run(_rooms: int, _calls: int, _repeat: int, _seed: int) -> dict[str, dict[str, Any]]:
+    spec = synthetic_models.SyntheticModelSpec(rooms_per_segment=_rooms, seed=_seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp, "model.xml")
+        path.write_text(synthetic_models.build_wufi_xml(spec), encoding="utf-8")
+        model = WUFIplusProject.model_validate(get_WUFI_XML_file_as_plain_dict(path))
+    results: dict[str, dict[str, Any]] = {}
+    with registry_disabled():
+        before = _dispatch_ns(_calls, _repeat)
+    results["dispatch"] = {"count": _calls, "unit": "ns/call", "before": before, "after": _dispatch_ns(_calls, _repeat)}
+
+    with registry_disabled():
+        before = round(_best_s(lambda: convert_WUFI_XML_to_PHX_project(model), _repeat) * 1e3, 1)
+    results["convert"] = {"count": _count_calls(model), "unit": "ms", "before": before}
+    results["convert"]["after"] = round(_best_s(lambda: convert_WUFI_XML_to_PHX_project(model), _repeat) * 1e3, 1)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rooms", type=int, default=64, help="Rooms per segment in the synthetic model.")
+    parser.add_argument("--calls", type=int, default=200_000, help="Calls for the dispatch stage.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.rooms, args.calls, args.repeat, args.seed)
+
+    print(f"{'stage':>9} {'calls':>8} {'unit':>8} {'before':>9} {'after':>9}")
+    for name, row in results.items():
+        print(f"{name:>9} {row['count']:>8} {row['unit']:>8} {row['before']:>9.1f} {row['after']:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# -*- Python Version: 3.10 -*-
+
+"""Benchmark: identity validation of a multi-target export, with and without the cached variant results.
+
+'identity_validation.validate_project_identities' used to walk the whole project
+graph on every call. Each variant's issues (for every export target) are now
+kept with a fingerprint of its identities and references, and only a variant
+whose fingerprint changed is walked again. A variant is only fingerprinted on
+its second validation, so the first one is the plain walk. On a synthetic model
+(one variant per building segment) this times the validation of:
+
+    * wufi / metr / phpp — one export to each target, in turn
+    * repeat             — the WUFI export again, unchanged
+    * edited             — the WUFI export again, after an edit to one variant
+
+with a fresh walk on every call ('before', the cache is cleared first, so each
+call is the baseline walk) and with the cache ('after'), and checks both give the
+same issues. The 'wufi' step is a first validation in both: it shows that the
+cache adds nothing to a project which is only validated once. The 'metr' step
+pays for the fingerprints.
+
+Usage:
+    python scripts/perf/bench_identity_validation.py [--segments 4] [--rooms 64] [--apertures 2] [--repeat 5] [--seed 0]
+"""
+
+import argparse
+import gc
+import math
+import sys
+import time
+from collections.abc import Callable
+
+import synthetic_models
+
+from PHX.from_HBJSON import create_project
+from PHX.model import identity_validation
+from PHX.model.identity_validation import IdentityValidationError, IdentityValidationTarget
+from PHX.model.project import PhxProject
+
+STEPS: dict[str, IdentityValidationTarget] = {
+    "wufi": IdentityValidationTarget.WUFI,
+    "metr": IdentityValidationTarget.METR,
+    "phpp": IdentityValidationTarget.PHPP,
+    "repeat": IdentityValidationTarget.WUFI,
+    "edited": IdentityValidationTarget.WUFI,
+}
+
+
+def _issues(_project: PhxProject, _target: IdentityValidationTarget) -> tuple:
+    try:
+        identity_validation.validate_project_identities(_project, _target)
+    except IdentityValidationError as e:
+        return e.issues
+    return ()
+
+
+def _edit(_project: PhxProject, _edited: bool) -> None:
+    """Flip one space's id-number in the last variant (a duplicate of its neighbour's, or back)."""
+    spaces = _project.variants[-1].zones[0].spaces
+    spaces[1].id_num = spaces[0].id_num if _edited else spaces[1].id_num + 10_000_000
+
+
+def _run_steps(_project: PhxProject, _cached: bool) -> tuple[dict[str, float], dict[str, tuple]]:
+    """Time each step once. Without the cache, every validation starts from a cleared cache."""
+    identity_validation.clear_identity_validation_cache(_project)
+    times, issues = {}, {}
+    for step, target in STEPS.items():
+        if step == "edited":
+            _edit(_project, True)
+        if not _cached:
+            identity_validation.clear_identity_validation_cache(_project)
+        gc.collect()
+        t0 = time.perf_counter()
+        issues[step] = _issues(_project, target)
+        times[step] = time.perf_counter() - t0
+    _edit(_project, False)
+    return times, issues
+
+
+def _best(_run: Callable[[], tuple[dict[str, float], dict[str, tuple]]], _repeat: int) -> tuple[dict, dict]:
+    best: dict[str, float] = dict.fromkeys(STEPS, math.inf)
+    issues: dict[str, tuple] = {}
+    for _ in range(max(_repeat, 1)):
+        times, issues = _run()
+        best = {step: min(best[step], times[step]) for step in STEPS}
+    return {step: round(t * 1e3, 1) for step, t in best.items()}, issues
+
+
+def run(_segments: int, _rooms: int, _apertures: int, _repeat: int, _seed: int) -> dict[str, dict[str, float]]:
+    spec = synthetic_models.SyntheticModelSpec(
+        segments=_segments, rooms_per_segment=_rooms, apertures_per_face=_apertures, seed=_seed
+    )
+    project = create_project.convert_hb_model_to_PhxProject(
+        synthetic_models.build_hb_model(spec), _group_components=False
+    )
+    _edit(project, False)
+
+    before, before_issues = _best(lambda: _run_steps(project, _cached=False), _repeat)
+    after, after_issues = _best(lambda: _run_steps(project, _cached=True), _repeat)
+    if before_issues != after_issues or not after_issues["edited"] or after_issues["repeat"]:
+        raise AssertionError("The cached validation gives different issues from a fresh walk.")
+    return {"before_ms": before, "after_ms": after}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=4, help="Building segments (= variants).")
+    parser.add_argument("--rooms", type=int, default=64, help="Rooms per segment.")
+    parser.add_argument("--apertures", type=int, default=2, help="Apertures per exterior face.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.segments, args.rooms, args.apertures, args.repeat, args.seed)
+
+    print(f"{'step':>8} {'before ms':>10} {'after ms':>9}")
+    for step in STEPS:
+        print(f"{step:>8} {results['before_ms'][step]:>10.1f} {results['after_ms'][step]:>9.1f}")
+    print(f"{'total':>8} {sum(results['before_ms'].values()):>10.1f} {sum(results['after_ms'].values()):>9.1f}")
+    first_before, first_after = results["before_ms"]["wufi"], results["after_ms"]["wufi"]
+    print(f"first validation: {first_after:.1f} ms, {first_after / first_before:.2f}x the baseline walk")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# -*- Python Version: 3.10 -*-
+
+"""Benchmark: a fresh identity validation of a multi-variant project, in this process and in worker processes.
+
+'identity_validation.validate_project_identities(..., max_workers=N)' walks the
+variants which are not cached in N worker processes, and merges their issues
+with the project part's in this process. On a synthetic model (one variant per
+building segment) this times a validation from a cleared cache for each target:
+
+    * serial   — 'max_workers=1', every variant walked in this process
+    * parallel — 'max_workers=N'
+    * largest  — the walk of the largest variant alone (the floor for 'parallel')
+
+and checks that 'serial' and 'parallel' give the same issues. The worker
+processes only help with at least two free CPUs: each is started (and, with a
+'spawn' start method, receives the project) on every call.
+
+Usage:
+    python scripts/perf/bench_identity_validation_workers.py [--segments 8] [--rooms 32] [--workers 4] [--repeat 3] [--seed 0]
+"""
+
+import argparse
+import functools
+import gc
+import math
+import sys
+import time
+from collections.abc import Callable
+
+import synthetic_models
+
+from PHX.from_HBJSON import create_project
+from PHX.model import identity_validation
+from PHX.model.identity_validation import IdentityValidationError, IdentityValidationTarget
+from PHX.model.project import PhxProject
+
+
+def _issues(_project: PhxProject, _target: IdentityValidationTarget, _max_workers: int) -> tuple:
+    identity_validation.clear_identity_validation_cache(_project)
+    try:
+        identity_validation.validate_project_identities(_project, _target, _max_workers)
+    except IdentityValidationError as e:
+        return e.issues
+    return ()
+
+
+def _best_ms(_func: Callable[[], object], _repeat: int) -> float:
+    best = math.inf
+    for _ in range(max(_repeat, 1)):
+        gc.collect()
+        t0 = time.perf_counter()
+        _func()
+        best = min(best, time.perf_counter() - t0)
+    return round(best * 1e3, 1)
+
+
+def run(_segments: int, _rooms: int, _workers: int, _repeat: int, _seed: int) -> dict[str, dict[str, float]]:
+    spec = synthetic_models.SyntheticModelSpec(segments=_segments, rooms_per_segment=_rooms, seed=_seed)
+    project = create_project.convert_hb_model_to_PhxProject(
+        synthetic_models.build_hb_model(spec), _group_components=False
+    )
+    largest_index, largest = max(enumerate(project.variants), key=lambda _: len(_[1].building.all_components))
+
+    results: dict[str, dict[str, float]] = {}
+    for target in (IdentityValidationTarget.WUFI, IdentityValidationTarget.PHPP):
+        full = target is not IdentityValidationTarget.PHPP
+        if _issues(project, target, 1) != _issues(project, target, _workers):
+            raise AssertionError(f"The {target.value} issues differ between the serial and parallel validation.")
+        results[target.value] = {
+            "serial_ms": _best_ms(functools.partial(_issues, project, target, 1), _repeat),
+            "parallel_ms": _best_ms(functools.partial(_issues, project, target, _workers), _repeat),
+            "largest_ms": _best_ms(
+                lambda full=full: identity_validation._walk_variant(largest, largest_index, [], full), _repeat
+            ),
+        }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=8, help="Building segments (= variants).")
+    parser.add_argument("--rooms", type=int, default=32, help="Rooms per segment.")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.segments, args.rooms, args.workers, args.repeat, args.seed)
+
+    print(f"{'target':>7} {'serial ms':>10} {'parallel ms':>12} {'largest ms':>11}")
+    for target, row in results.items():
+        print(f"{target:>7} {row['serial_ms']:>10.1f} {row['parallel_ms']:>12.1f} {row['largest_ms']:>11.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# -*- Python Version: 3.10 -*-
+
+"""Microbenchmark: per-component / per-device METr JSON serialisation cost, with and without the default templates.
+
+The METr schemas build large, constant 'default' dicts for every component
+(surface physics), zone (design conditions, calc params) and mechanical device
+(the ~131-key 'super-device'). These are now built once per process and copied
+('metr_schemas._from_template'). This times, on a synthetic model:
+
+    * component — '_PhxComponentOpaque' / '_PhxComponentAperture' per component
+    * device    — '_PhxMechanicalDevice' per mechanical device
+    * zone      — '_PhxZone' per zone
+
+once with the templates ('after') and once rebuilding every default dict
+literal on each call ('before'), and reports the mean cost per object in µs.
+
+Usage:
+    python scripts/perf/bench_metr_defaults.py [--rooms 64] [--repeat 5] [--seed 0]
+"""
+
+import argparse
+import contextlib
+import math
+import sys
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import synthetic_models
+
+from PHX.from_HBJSON import create_project
+from PHX.to_METr_JSON import metr_schemas
+
+
+@contextlib.contextmanager
+def templates_disabled() -> Iterator[None]:
+    """Rebuild every default dict on each call, as before the templates were added."""
+    original = metr_schemas._from_template
+    metr_schemas._from_template = lambda _key, _build, **_: _build()  # type: ignore
+    try:
+        yield
+    finally:
+        metr_schemas._from_template = original
+
+
+def _best_per_item_us(_func: Callable[[Any], Any], _items: list[Any], _repeat: int) -> float:
+    """Return the fastest mean time (µs) per item over '_repeat' passes."""
+    best = math.inf
+    for _ in range(max(_repeat, 1)):
+        t0 = time.perf_counter()
+        for item in _items:
+            _func(item)
+        best = min(best, time.perf_counter() - t0)
+    return round(best / max(len(_items), 1) * 1e6, 2)
+
+
+def run(_rooms: int, _repeat: int, _seed: int) -> dict[str, dict[str, Any]]:
+    spec = synthetic_models.SyntheticModelSpec(rooms_per_segment=_rooms, seed=_seed)
+    phx_project = create_project.convert_hb_model_to_PhxProject(
+        synthetic_models.build_hb_model(spec), _group_components=False
+    )
+
+    components, devices, zones = [], [], []
+    for variant in phx_project.variants:
+        components.extend(variant.building._components)
+        components.extend(variant.building.aperture_components)
+        zones.extend(variant.building.zones)
+        for mech_collection in variant.mech_collections:
+            devices.extend(mech_collection.devices)
+
+    def _component(_c) -> dict:
+        if isinstance(_c, metr_schemas.components.PhxComponentAperture):
+            return metr_schemas._PhxComponentAperture(_c, 0)
+        return metr_schemas._PhxComponentOpaque(_c, 0)
+
+    stages: dict[str, tuple[Callable[[Any], Any], list[Any]]] = {
+        "component": (_component, components),
+        "device": (metr_schemas._PhxMechanicalDevice, devices),
+        "zone": (metr_schemas._PhxZone, zones),
+    }
+
+    results: dict[str, dict[str, Any]] = {}
+    for name, (func, items) in stages.items():
+        with templates_disabled():
+            before = _best_per_item_us(func, items, _repeat)
+        after = _best_per_item_us(func, items, _repeat)
+        results[name] = {
+            "count": len(items),
+            "before_us": before,
+            "after_us": after,
+            "speedup": round(before / after, 2) if after else None,
+        }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rooms", type=int, default=64, help="Rooms in the synthetic model.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.rooms, args.repeat, args.seed)
+
+    print(f"{'stage':>10} {'count':>7} {'before µs':>10} {'after µs':>10} {'speedup':>8}")
+    for name, row in results.items():
+        speedup = "-" if row["speedup"] is None else f"{row['speedup']:.2f}x"
+        print(f"{name:>10} {row['count']:>7} {row['before_us']:>10.2f} {row['after_us']:>10.2f} {speedup:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
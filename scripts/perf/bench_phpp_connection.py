@@ -0,0 +1,106 @@
+# -*- Python Version: 3.10 -*-
+
+"""Benchmark 'PHPPConnection' construction time (shape-file loading).
+
+Creates PHPPConnections against the in-memory replay fake (no Excel needed) and
+reports the per-connection cost in two modes:
+
+    * cold — the shape memo is cleared before every connection, so the shape
+             is validated from JSON each time (the pre-memo behaviour)
+    * warm — the shape memo is left alone, so only the first connection pays
+             for loading the shape
+
+Offline and CI-safe: the workbook is the 'tests/test_xl_replay' fake, seeded
+from the recorded replay fixture.
+
+Usage:
+    python scripts/perf/bench_phpp_connection.py [--n 50] [--label my-machine] [--save]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from typing import Any
+
+import perf_paths
+
+if str(perf_paths.REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(perf_paths.REPO_ROOT))
+
+from PHX.PHPP import phpp_app  # noqa: E402
+from PHX.PHPP.phpp_localization import load  # noqa: E402
+from PHX.xl.xl_app import XLConnection  # noqa: E402
+from tests.test_xl_replay.fake_xl_framework import FakeXLFramework  # noqa: E402
+
+REPLAY_FIXTURE = perf_paths.REPO_ROOT / "tests" / "test_xl_replay" / "fixtures" / "single_zone_replay.json"
+
+
+def _new_fake_framework(_fixture: dict[str, Any]) -> FakeXLFramework:
+    return FakeXLFramework(
+        sheet_names=_fixture["sheet_names"],
+        seed=_fixture["seed"],
+        epoch_deltas=_fixture["epoch_deltas"],
+    )
+
+
+def _time_connections(_fixture: dict[str, Any], _n: int, _clear_memo: bool) -> list[float]:
+    """Return the per-connection construction times in seconds."""
+    durations = []
+    for _ in range(_n):
+        framework = _new_fake_framework(_fixture)
+        if _clear_memo:
+            load.clear_phpp_shape_cache()
+        t0 = time.perf_counter()
+        phpp_app.PHPPConnection(XLConnection(xl_framework=framework))
+        durations.append(time.perf_counter() - t0)
+    return durations
+
+
+def _stats(durations: list[float]) -> dict[str, float]:
+    ms = sorted(d * 1000 for d in durations)
+    return {
+        "n": len(ms),
+        "total_s": round(sum(ms) / 1000, 4),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "median_ms": round(statistics.median(ms), 3),
+        "max_ms": round(ms[-1], 3),
+    }
+
+
+def run(_n: int) -> dict[str, dict[str, float]]:
+    fixture = json.loads(REPLAY_FIXTURE.read_text())
+    results: dict[str, dict[str, float]] = {}
+
+    results["cold"] = _stats(_time_connections(fixture, _n, _clear_memo=True))
+
+    load.clear_phpp_shape_cache()
+    results["warm"] = _stats(_time_connections(fixture, _n, _clear_memo=False))
+    load.clear_phpp_shape_cache()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=50, help="Connections to create per mode.")
+    parser.add_argument("--label", default="local", help="Label used in the output file name.")
+    parser.add_argument("--save", action="store_true", help="Write the results to 'scripts/perf/baselines/'.")
+    args = parser.parse_args()
+
+    results = run(args.n)
+    for mode, row in results.items():
+        print(f"  {mode:<8} mean={row['mean_ms']:>8.2f} ms   median={row['median_ms']:>8.2f} ms   n={row['n']}")
+
+    if args.save:
+        meta = perf_paths.environment_metadata()
+        perf_paths.BASELINES_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = meta["timestamp"].replace(":", "-")
+        out_path = perf_paths.BASELINES_DIR / f"bench_phpp_connection__{args.label}__{stamp}.json"
+        out_path.write_text(json.dumps({"meta": meta, "results": results}, indent=2))
+        print(f"Wrote -> {out_path.relative_to(perf_paths.REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
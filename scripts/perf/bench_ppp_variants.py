@@ -0,0 +1,96 @@
+# -*- Python Version: 3.10 -*-
+
+"""Benchmark: one PPP file per variant, with and without the shared project data and worker processes.
+
+Times writing a PPP file for every variant of a synthetic model (one variant per
+building segment):
+
+    * rebuilt  — 'build_ppp_file(project, i)' per variant: the assembly / glazing /
+                 frame maps and the project-only sections are rebuilt for each file
+    * shared   — 'write_variant_ppp_files(..., _max_workers=1)': the project data is
+                 built once, files written in this process
+    * parallel — 'write_variant_ppp_files(..., _max_workers=N)': the same, in N worker
+                 processes (each receives the project once)
+
+and checks that all three give the same files (with the 'imported from PHX'
+timestamp fixed, as it is otherwise only shared by the files of one call).
+
+Usage:
+    python scripts/perf/bench_ppp_variants.py [--segments 8] [--rooms 16] [--workers 4] [--repeat 3] [--seed 0]
+"""
+
+import argparse
+import math
+import pathlib
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+
+import synthetic_models
+
+from PHX.from_HBJSON import create_project
+from PHX.model.project import PhxProject
+from PHX.to_PPP import ppp_builder, ppp_txt_to_file, ppp_variants
+
+
+def _write_rebuilt(_project: PhxProject, _target_dir: pathlib.Path) -> list[pathlib.Path]:
+    paths = []
+    for i in range(len(_project.variants)):
+        path = ppp_variants.variant_ppp_file_path(_target_dir, "model", i)
+        ppp_txt_to_file.write_ppp_file(path, ppp_builder.build_ppp_file(_project, i))
+        paths.append(path)
+    return paths
+
+
+def _best_ms(_func: Callable[[pathlib.Path], list[pathlib.Path]], _target_dir: pathlib.Path, _repeat: int) -> float:
+    best = math.inf
+    for _ in range(max(_repeat, 1)):
+        t0 = time.perf_counter()
+        _func(_target_dir)
+        best = min(best, time.perf_counter() - t0)
+    return round(best * 1e3, 2)
+
+
+def run(_segments: int, _rooms: int, _workers: int, _repeat: int, _seed: int) -> dict[str, float]:
+    spec = synthetic_models.SyntheticModelSpec(segments=_segments, rooms_per_segment=_rooms, seed=_seed)
+    project = create_project.convert_hb_model_to_PhxProject(synthetic_models.build_hb_model(spec))
+    ppp_builder.ppp_timestamp = lambda: "2026-01-01 00:00:00"  # type: ignore
+
+    stages: dict[str, Callable[[pathlib.Path], list[pathlib.Path]]] = {
+        "rebuilt": lambda d: _write_rebuilt(project, d),
+        "shared": lambda d: ppp_variants.write_variant_ppp_files(project, d, "model", _max_workers=1),
+        "parallel": lambda d: ppp_variants.write_variant_ppp_files(project, d, "model", _max_workers=_workers),
+    }
+
+    results: dict[str, float] = {"variants": len(project.variants)}
+    outputs: dict[str, list[bytes]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, func in stages.items():
+            target_dir = pathlib.Path(tmp, name)
+            target_dir.mkdir()
+            results[f"{name}_ms"] = _best_ms(func, target_dir, _repeat)
+            outputs[name] = [p.read_bytes() for p in sorted(target_dir.glob("*.ppp"))]
+
+    if not outputs["rebuilt"] == outputs["shared"] == outputs["parallel"]:
+        raise AssertionError("The per-variant PPP files differ between the stages.")
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=8, help="Building segments (= variants).")
+    parser.add_argument("--rooms", type=int, default=16, help="Rooms per segment.")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.segments, args.rooms, args.workers, args.repeat, args.seed)
+    for name, value in results.items():
+        print(f"{name:>12}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
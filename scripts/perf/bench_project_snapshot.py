@@ -0,0 +1,103 @@
+# -*- Python Version: 3.10 -*-
+
+"""Benchmark: loading a PHX project snapshot vs. converting the model again.
+
+'PHX.snapshot' saves a built 'PhxProject' (pickled, zlib-compressed, behind a
+self-describing header) and loads it again. On a synthetic model this times:
+
+    * hb_convert   — 'convert_hb_model_to_PhxProject' from the Honeybee model
+    * xml_convert  — the WUFI-XML import: parse, validate and convert the file
+    * save / load  — 'dump_project_snapshot' / 'load_project_snapshot' of each project
+
+and reports the snapshot size, and checks that each reloaded project writes the
+same WUFI-XML as the original.
+
+Usage:
+    python scripts/perf/bench_project_snapshot.py [--segments 2] [--rooms 32] [--repeat 3] [--seed 0]
+"""
+
+import argparse
+import functools
+import gc
+import logging
+import math
+import pathlib
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+import synthetic_models
+
+from PHX import snapshot
+from PHX.from_HBJSON import create_project
+from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
+from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_plain_dict
+from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
+from PHX.to_WUFI_XML.xml_builder import generate_WUFI_XML_from_object
+
+
+def _best_ms(_func: Callable[[], Any], _repeat: int) -> tuple[float, Any]:
+    best, result = math.inf, None
+    for _ in range(max(_repeat, 1)):
+        gc.collect()
+        t0 = time.perf_counter()
+        result = _func()
+        best = min(best, time.perf_counter() - t0)
+    return round(best * 1e3, 1), result
+
+
+def run(_segments: int, _rooms: int, _repeat: int, _seed: int) -> dict[str, dict[str, float]]:
+    spec = synthetic_models.SyntheticModelSpec(segments=_segments, rooms_per_segment=_rooms, seed=_seed)
+    hb_model = synthetic_models.build_hb_model(spec)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        xml_file = pathlib.Path(tmp, "model.xml")
+        xml_file.write_text(synthetic_models.build_wufi_xml(spec), encoding="utf-8")
+        converters: dict[str, Callable[[], Any]] = {
+            "hb": lambda: create_project.convert_hb_model_to_PhxProject(hb_model),
+            "xml": lambda: convert_WUFI_XML_to_PHX_project(
+                WUFIplusProject.model_validate(get_WUFI_XML_file_as_plain_dict(xml_file))
+            ),
+        }
+
+        results: dict[str, dict[str, float]] = {}
+        for name, convert in converters.items():
+            convert_ms, project = _best_ms(convert, _repeat)
+            save_ms, data = _best_ms(functools.partial(snapshot.dump_project_snapshot, project), _repeat)
+            load_ms, reloaded = _best_ms(functools.partial(snapshot.load_project_snapshot, data), _repeat)
+            if generate_WUFI_XML_from_object(reloaded) != generate_WUFI_XML_from_object(project):
+                raise AssertionError(f"The reloaded '{name}' project writes a different WUFI-XML.")
+            results[name] = {
+                "convert_ms": convert_ms,
+                "save_ms": save_ms,
+                "load_ms": load_ms,
+                "snapshot_mb": round(len(data) / 1e6, 2),
+                "speedup": round(convert_ms / load_ms, 1),
+            }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=2, help="Building segments (= variants).")
+    parser.add_argument("--rooms", type=int, default=32, help="Rooms per segment.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    results = run(args.segments, args.rooms, args.repeat, args.seed)
+
+    print(f"{'source':>7} {'convert ms':>11} {'save ms':>8} {'load ms':>8} {'snapshot MB':>12} {'speedup':>8}")
+    for name, row in results.items():
+        print(
+            f"{name:>7} {row['convert_ms']:>11.1f} {row['save_ms']:>8.1f} {row['load_ms']:>8.1f}"
+            f" {row['snapshot_mb']:>12.2f} {row['speedup']:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
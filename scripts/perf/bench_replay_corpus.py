@@ -0,0 +1,377 @@
+# -*- Python Version: 3.10 -*-
+
+"""Replay-driven PHPP export benchmark over a graded synthetic model corpus.
+
+Runs the production PHPP write sequence ('write_phx_project_to_phpp') against
+the in-memory replay fake (no Excel needed) for a graded set of synthetic
+models - 1, 10, 100 and 1,000 rooms, each room with a window on every wall
+facade - and records, per size:
+
+    * interop events — the low-level framework events counted by
+      'profiling.CountingFrameworkProxy', and the per-phase round trips from
+      the built-in export profiler ('PHX.xl.xl_profile')
+    * modelled latency — the event counts multiplied by the per-op costs
+      (median ms) measured by 'bench_interop.py' on a real machine, for every
+      backend in that baseline. This is what the export *would* cost live.
+    * Python CPU time ('time.process_time') and peak Python memory ('tracemalloc')
+      of the export, plus the CPU time of the HBJSON -> PhxProject conversion
+
+The replay fixture is recorded against a stock PHPP, which only has room for
+100 opaque surfaces and ~150 windows. For the larger sizes the fixture's
+'Areas', 'Windows' and 'Shading' entry blocks are grown (everything below each
+block's end-marker is shifted down) so the export runs to completion. Sizes
+which still cannot be exported are reported as skipped, with the reason.
+
+Note: the 1,000-room size is slow (minutes), mostly in the model conversion.
+
+Offline and CI-safe. Compare two saved runs (ie: before/after a commit) with:
+
+    python scripts/perf/bench_replay_corpus.py compare OLD.json NEW.json
+
+Usage:
+    python scripts/perf/bench_replay_corpus.py [--sizes 1 10 100 1000] [--label my-machine] [--save]
+    python scripts/perf/bench_replay_corpus.py compare OLD.json NEW.json
+"""
+
+import argparse
+import copy
+import json
+import pathlib
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any
+
+import perf_paths
+import profiling
+import synthetic_models
+
+if str(perf_paths.REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(perf_paths.REPO_ROOT))
+
+from PHX.from_HBJSON import create_project  # noqa: E402
+from PHX.hbjson_to_phpp import write_phx_project_to_phpp  # noqa: E402
+from PHX.PHPP import phpp_app  # noqa: E402
+from PHX.xl.xl_app import XLConnection  # noqa: E402
+from tests.test_xl_replay.fake_xl_framework import FakeXLFramework  # noqa: E402
+
+FIXTURES_DIR = perf_paths.REPO_ROOT / "tests" / "test_xl_replay" / "fixtures"
+REPLAY_FIXTURE = FIXTURES_DIR / "single_zone_replay.json"
+
+DEFAULT_SIZES = (1, 10, 100, 1000)
+
+# -- 'bench_interop.py' operation used to model the cost of each counted event.
+# -- Anything not listed is modelled as one single-cell write round trip.
+_OP_COST_KEYS = {
+    "range.value.get": "read_cell",
+    "range.raw_value.get": "read_cell",
+    "range.value.set": "write_cell",
+    "range.raw_value.set": "write_cell",
+    "range.end": "end_call",
+}
+_DEFAULT_COST_KEY = "write_cell"
+
+# -- (sheet, end-marker column, end-marker text, surface-ID column or None).
+# -- Everything from the end-marker row down is shifted to grow the entry block.
+_GROWABLE_BLOCKS = (
+    ("Areas", "K", "Aend", "K"),
+    ("Windows", "L", "Unhide additional rows", None),
+    ("Shading", "T", "Unhide additional rows", None),
+)
+
+_CELL_ADDRESS = re.compile(r"^([A-Z]+)(\d+)$")
+
+
+# -----------------------------------------------------------------------------
+# -- Corpus
+
+
+def corpus_spec(_n_rooms: int) -> synthetic_models.SyntheticModelSpec:
+    """Return the synthetic-model spec of the '_n_rooms' corpus model.
+
+    One building segment of '_n_rooms' rooms (see 'synthetic_models.py'), with a
+    window on every wall: each room adds 6 opaque surfaces and 4 windows. No
+    outdoor shades, DHW system or ERV ducts: the replay fixture's workbook (from
+    a single-zone model) has no DHW-piping or duct sections to write them to.
+    """
+    return synthetic_models.SyntheticModelSpec(
+        segments=1,
+        rooms_per_segment=_n_rooms,
+        apertures_per_face=1,
+        shades=False,
+        hot_water=False,
+        ervs_per_segment=0,
+    )
+
+
+# -----------------------------------------------------------------------------
+# -- Replay fixture capacity
+
+
+def _shift_sheet_rows(_cells: dict[str, Any], _from_row: int, _extra_rows: int) -> dict[str, Any]:
+    """Return the cells with every row at or below '_from_row' moved down by '_extra_rows'."""
+    shifted = {}
+    for address, value in _cells.items():
+        match = _CELL_ADDRESS.match(address)
+        if match and int(match.group(2)) >= _from_row:
+            address = f"{match.group(1)}{int(match.group(2)) + _extra_rows}"
+        shifted[address] = value
+    return shifted
+
+
+def _find_marker_row(_fixture: dict[str, Any], _sheet: str, _col: str, _text: str) -> int | None:
+    layers = [_fixture["seed"]] + list(_fixture["epoch_deltas"])
+    rows = [
+        int(address[len(_col) :])
+        for layer in layers
+        for address, value in layer.get(_sheet, {}).items()
+        if _CELL_ADDRESS.match(address)
+        and address.startswith(_col)
+        and address[len(_col) :].isdigit()
+        and _text in str(value)
+    ]
+    return min(rows) if rows else None
+
+
+def grow_fixture_capacity(_fixture: dict[str, Any], _extra_rows: int) -> dict[str, Any]:
+    """Return a copy of the replay fixture with '_extra_rows' more entry rows in Areas, Windows and Shading.
+
+    The stock PHPP hides its extra entry rows; in the fixture, the end-marker
+    (and everything below it) is shifted down instead. The new 'Areas' rows get
+    sequential surface IDs, as in the PHPP.
+    """
+    fixture = copy.deepcopy(_fixture)
+    if _extra_rows <= 0:
+        return fixture
+
+    for sheet, marker_col, marker_text, id_col in _GROWABLE_BLOCKS:
+        marker_row = _find_marker_row(fixture, sheet, marker_col, marker_text)
+        if marker_row is None:
+            continue
+
+        layers = [fixture["seed"]] + list(fixture["epoch_deltas"])
+        for layer in layers:
+            if sheet in layer:
+                layer[sheet] = _shift_sheet_rows(layer[sheet], marker_row, _extra_rows)
+
+        if id_col:
+            # -- The IDs go in the same layer (seed or epoch) as the template's own last ID
+            last_id_address = f"{id_col}{marker_row - 1}"
+            for layer in layers:
+                if last_id_address in layer.get(sheet, {}):
+                    last_id = int(layer[sheet][last_id_address])
+                    for i in range(_extra_rows):
+                        layer[sheet][f"{id_col}{marker_row + i}"] = last_id + 1 + i
+                    break
+
+    return fixture
+
+
+def _extra_rows_needed(_n_rooms: int) -> int:
+    # -- 6 opaque surfaces and 4 windows per room, plus some headroom. The stock
+    # -- template already holds 100 surfaces.
+    return max(0, _n_rooms * 6 + 10 - 100)
+
+
+# -----------------------------------------------------------------------------
+# -- Latency model
+
+
+def load_op_costs(_baseline_path: pathlib.Path | None = None) -> tuple[str | None, dict[str, dict[str, float]]]:
+    """Return (baseline-file-name, {backend: {op: median_ms}}) from the newest 'bench_interop' baseline."""
+    if _baseline_path is None:
+        candidates = sorted(perf_paths.BASELINES_DIR.glob("bench_interop__*.json"))
+        candidates = [p for p in candidates if len(json.loads(p.read_text())["results"]) > 1] or candidates
+        if not candidates:
+            return None, {}
+        _baseline_path = candidates[-1]
+
+    results = json.loads(pathlib.Path(_baseline_path).read_text())["results"]
+    costs = {
+        backend: {op: row["median_ms"] for op, row in ops.items() if row and row.get("median_ms") is not None}
+        for backend, ops in results.items()
+    }
+    return pathlib.Path(_baseline_path).name, costs
+
+
+def modelled_latency_s(_by_op: dict[str, int], _costs: dict[str, dict[str, float]]) -> dict[str, float]:
+    """Return the modelled live-Excel time (seconds) of the counted events, for each backend."""
+    modelled = {}
+    for backend, op_costs in _costs.items():
+        if _DEFAULT_COST_KEY not in op_costs:
+            continue
+        total_ms = 0.0
+        for op, count in _by_op.items():
+            if op not in profiling.OpCounter.ROUND_TRIP_OPS:
+                continue
+            cost_key = _OP_COST_KEYS.get(op, _DEFAULT_COST_KEY)
+            total_ms += count * op_costs.get(cost_key, op_costs[_DEFAULT_COST_KEY])
+        modelled[backend] = round(total_ms / 1000, 3)
+    return modelled
+
+
+# -----------------------------------------------------------------------------
+# -- Benchmark
+
+
+def run_size(_n_rooms: int, _fixture: dict[str, Any], _costs: dict[str, dict[str, float]]) -> dict[str, Any]:
+    """Export one corpus model to the replay fake and return its measurements."""
+    hb_model = synthetic_models.build_hb_model(corpus_spec(_n_rooms))
+    convert_t0 = time.process_time()
+    phx_project = create_project.convert_hb_model_to_PhxProject(hb_model, _group_components=True)
+    convert_cpu_s = time.process_time() - convert_t0
+    variant = phx_project.variants[0]
+    row: dict[str, Any] = {
+        "rooms": _n_rooms,
+        "opaque_surfaces": sum(len(c.polygons) for c in variant.building.opaque_components),
+        "windows": sum(len(c.elements) for c in variant.building.aperture_components),
+        "convert_cpu_s": round(convert_cpu_s, 3),
+    }
+
+    fixture = grow_fixture_capacity(_fixture, _extra_rows_needed(_n_rooms))
+    counter = profiling.OpCounter()
+    framework = profiling.CountingFrameworkProxy(
+        FakeXLFramework(
+            sheet_names=fixture["sheet_names"],
+            seed=fixture["seed"],
+            epoch_deltas=fixture["epoch_deltas"],
+        ),
+        counter,
+    )
+
+    tracemalloc.start()
+    cpu_t0 = time.process_time()
+    wall_t0 = time.perf_counter()
+    try:
+        connection = XLConnection(xl_framework=framework)
+        phpp_conn = phpp_app.PHPPConnection(connection, profile=True)
+        with connection.in_silent_mode():
+            connection.unprotect_all_sheets()
+            write_phx_project_to_phpp(phpp_conn, phx_project)
+    except Exception as e:
+        row["skipped"] = f"{type(e).__name__}: {str(e).strip()}"
+        return row
+    finally:
+        row["cpu_s"] = round(time.process_time() - cpu_t0, 3)
+        row["wall_s"] = round(time.perf_counter() - wall_t0, 3)
+        row["peak_mem_mb"] = round(tracemalloc.get_traced_memory()[1] / 1_000_000, 2)
+        tracemalloc.stop()
+
+    by_op = Counter({entry["op"]: entry["count"] for entry in counter.by_op()})
+    assert phpp_conn.profiler is not None
+    row["interop_events"] = counter.total_round_trips()
+    row["events_by_op"] = dict(by_op.most_common())
+    row["facade_round_trips"] = phpp_conn.profiler.totals()["round_trips"]
+    row["phase_round_trips"] = {phase["phase"]: phase["round_trips"] for phase in phpp_conn.profiler.report()["phases"]}
+    row["modelled_latency_s"] = modelled_latency_s(by_op, _costs)
+    return row
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=perf_paths.REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run(_sizes: list[int], _baseline_path: pathlib.Path | None = None) -> dict[str, Any]:
+    fixture = json.loads(REPLAY_FIXTURE.read_text())
+    cost_source, costs = load_op_costs(_baseline_path)
+    return {
+        "config": {"sizes": list(_sizes), "op_costs_from": cost_source, "git_commit": _git_commit()},
+        "results": {str(n): run_size(n, fixture, costs) for n in _sizes},
+    }
+
+
+# -----------------------------------------------------------------------------
+# -- Output
+
+
+def summary_lines(_results: dict[str, dict[str, Any]]) -> list[str]:
+    lines = [f"{'rooms':>6} {'events':>8} {'facade':>8} {'convert':>8} {'cpu (s)':>8} {'peak MB':>8}  modelled (s)"]
+    for row in _results.values():
+        if "skipped" in row:
+            lines.append(f"{row['rooms']:>6}  skipped (convert={row['convert_cpu_s']:.1f}s): {row['skipped']}")
+            continue
+        modelled = ", ".join(f"{k}={v:.1f}" for k, v in row["modelled_latency_s"].items())
+        lines.append(
+            f"{row['rooms']:>6} {row['interop_events']:>8} {row['facade_round_trips']:>8} "
+            f"{row['convert_cpu_s']:>8.2f} {row['cpu_s']:>8.2f} {row['peak_mem_mb']:>8.1f}  {modelled}"
+        )
+    return lines
+
+
+def _pct_change(_old: float, _new: float) -> str:
+    if not _old:
+        return "   n/a"
+    return f"{(_new - _old) / _old:+6.1%}"
+
+
+def compare_lines(_old: dict[str, Any], _new: dict[str, Any]) -> list[str]:
+    """Return a per-size comparison of two saved runs."""
+    lines = [f"{'rooms':>6} {'metric':<20} {'old':>10} {'new':>10} {'change':>8}"]
+    for size, new_row in _new["results"].items():
+        old_row = _old["results"].get(size)
+        if old_row is None or "skipped" in old_row or "skipped" in new_row:
+            lines.append(f"{size:>6} (not comparable: missing or skipped in one run)")
+            continue
+        metrics = [
+            ("interop_events", old_row["interop_events"], new_row["interop_events"]),
+            ("facade_round_trips", old_row["facade_round_trips"], new_row["facade_round_trips"]),
+            ("convert_cpu_s", old_row["convert_cpu_s"], new_row["convert_cpu_s"]),
+            ("cpu_s", old_row["cpu_s"], new_row["cpu_s"]),
+            ("peak_mem_mb", old_row["peak_mem_mb"], new_row["peak_mem_mb"]),
+        ]
+        for backend, new_s in new_row["modelled_latency_s"].items():
+            if backend in old_row["modelled_latency_s"]:
+                metrics.append((f"modelled:{backend}", old_row["modelled_latency_s"][backend], new_s))
+        for name, old_value, new_value in metrics:
+            lines.append(f"{size:>6} {name:<20} {old_value:>10} {new_value:>10} {_pct_change(old_value, new_value):>8}")
+    return lines
+
+
+def main() -> int:
+    if len(sys.argv) > 1 and sys.argv[1] == "compare":
+        parser = argparse.ArgumentParser(description="Compare two saved 'bench_replay_corpus' runs.")
+        parser.add_argument("old", type=pathlib.Path)
+        parser.add_argument("new", type=pathlib.Path)
+        args = parser.parse_args(sys.argv[2:])
+        old, new = json.loads(args.old.read_text()), json.loads(args.new.read_text())
+        print(f"old: {old['config'].get('git_commit') or '?'}   new: {new['config'].get('git_commit') or '?'}")
+        for line in compare_lines(old, new):
+            print(line)
+        return 0
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Room counts to run.")
+    parser.add_argument("--op-costs", type=pathlib.Path, default=None, help="A 'bench_interop' baseline JSON.")
+    parser.add_argument("--label", default="local", help="Label used in the output file name.")
+    parser.add_argument("--save", action="store_true", help="Write the results to 'scripts/perf/baselines/'.")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.op_costs)
+    for line in summary_lines(report["results"]):
+        print(line)
+
+    if args.save:
+        meta = perf_paths.environment_metadata()
+        perf_paths.BASELINES_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = meta["timestamp"].replace(":", "-")
+        out_path = perf_paths.BASELINES_DIR / f"bench_replay_corpus__{args.label}__{stamp}.json"
+        out_path.write_text(json.dumps({"meta": meta, **report}, indent=2))
+        print(f"Wrote -> {out_path.relative_to(perf_paths.REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+# -*- Python Version: 3.10 -*-
+
+"""Scaling benchmark: conversion and writer time across synthetic model sizes.
+
+Builds synthetic honeybee-ph models ('synthetic_models.py') of increasing size
+and times, for each size:
+
+    * convert   — 'convert_hb_model_to_PhxProject'
+    * wufi_xml  — 'xml_builder.generate_WUFI_XML_from_object'
+    * metr_json — 'metr_builder.generate_metr_json_text'
+    * ppp       — 'ppp_builder.build_ppp_file'
+
+Each stage is timed '--repeat' times and the fastest run is kept. For each stage
+the complexity exponent 'k' in 'time ~ rooms^k' is fitted (least squares on
+log-log), so a quadratic path shows up as k ≈ 2 long before a real 500-unit
+building arrives. (The PHPP writer needs a workbook - see 'bench_replay_corpus.py'.)
+
+Usage:
+    python scripts/perf/bench_scaling.py [--rooms 8 16 32 64] [--segments 1] [--apertures 2]
+                                         [--repeat 3] [--seed 0] [--label my-machine] [--save]
+"""
+
+import argparse
+import dataclasses
+import functools
+import json
+import math
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import perf_paths
+import synthetic_models
+
+from PHX.from_HBJSON import create_project
+from PHX.to_METr_JSON import metr_builder
+from PHX.to_PPP import ppp_builder
+from PHX.to_WUFI_XML import xml_builder
+
+DEFAULT_ROOMS = (8, 16, 32, 64)
+
+WRITERS: dict[str, Callable[[Any], Any]] = {
+    "wufi_xml": xml_builder.generate_WUFI_XML_from_object,
+    "metr_json": metr_builder.generate_metr_json_text,
+    "ppp": ppp_builder.build_ppp_file,
+}
+
+
+def fit_exponent(_sizes: list[float], _times: list[float]) -> float | None:
+    """Return the least-squares slope of log(time) against log(size), or None if it can't be fitted."""
+    points = [(math.log(n), math.log(t)) for n, t in zip(_sizes, _times) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var_x:
+        return None
+    return round(sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x, 3)
+
+
+def _best_time(_func: Callable[[], Any], _repeat: int) -> tuple[float, Any]:
+    best, result = math.inf, None
+    for _ in range(max(_repeat, 1)):
+        t0 = time.perf_counter()
+        result = _func()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def run_size(_spec: synthetic_models.SyntheticModelSpec, _repeat: int) -> dict[str, Any]:
+    """Return the fastest time (s) of the conversion and of each writer for one model size."""
+    hb_model = synthetic_models.build_hb_model(_spec)
+    row: dict[str, Any] = {"rooms": _spec.total_rooms, "apertures": len(hb_model.apertures)}
+
+    row["convert"], phx_project = _best_time(
+        lambda: create_project.convert_hb_model_to_PhxProject(hb_model, _group_components=True), _repeat
+    )
+    for name, writer in WRITERS.items():
+        row[name], _ = _best_time(functools.partial(writer, phx_project), _repeat)
+
+    for stage in ("convert", *WRITERS):
+        row[stage] = round(row[stage], 4)
+    return row
+
+
+def run(_spec: synthetic_models.SyntheticModelSpec, _rooms: list[int], _repeat: int) -> dict[str, Any]:
+    rows = []
+    for n_rooms in _rooms:
+        per_segment = max(1, n_rooms // _spec.segments)
+        size_spec = dataclasses.replace(_spec, rooms_per_segment=per_segment)
+        rows.append(run_size(size_spec, _repeat))
+
+    sizes = [row["rooms"] for row in rows]
+    exponents = {stage: fit_exponent(sizes, [row[stage] for row in rows]) for stage in ("convert", *WRITERS)}
+    return {
+        "config": {"spec": dataclasses.asdict(_spec), "rooms": list(_rooms), "repeat": _repeat},
+        "results": rows,
+        "exponents": exponents,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rooms", type=int, nargs="+", default=list(DEFAULT_ROOMS), help="Total room counts.")
+    parser.add_argument("--segments", type=int, default=1)
+    parser.add_argument("--apertures", type=int, default=2, help="Apertures per wall face.")
+    parser.add_argument("--ervs", type=int, default=2, help="ERV networks per segment.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", default="local", help="Label used in the output file name.")
+    parser.add_argument("--save", action="store_true", help="Write the results to 'scripts/perf/baselines/'.")
+    args = parser.parse_args()
+
+    spec = synthetic_models.SyntheticModelSpec(
+        segments=args.segments,
+        apertures_per_face=args.apertures,
+        ervs_per_segment=args.ervs,
+        seed=args.seed,
+    )
+    report = run(spec, args.rooms, args.repeat)
+
+    stages = ("convert", *WRITERS)
+    print(f"{'rooms':>6} {'apertures':>9} " + " ".join(f"{s:>10}" for s in stages))
+    for row in report["results"]:
+        print(f"{row['rooms']:>6} {row['apertures']:>9} " + " ".join(f"{row[s]:>10.3f}" for s in stages))
+    exponents = [report["exponents"][s] for s in stages]
+    print(f"{'k':>16} " + " ".join(f"{'-' if k is None else f'{k:.2f}':>10}" for k in exponents))
+
+    if args.save:
+        meta = perf_paths.environment_metadata()
+        perf_paths.BASELINES_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = meta["timestamp"].replace(":", "-")
+        out_path = perf_paths.BASELINES_DIR / f"bench_scaling__{args.label}__{stamp}.json"
+        out_path.write_text(json.dumps({"meta": meta, **report}, indent=2))
+        print(f"Wrote -> {out_path.relative_to(perf_paths.REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+# -*- Python Version: 3.10 -*-
+
+"""Benchmark: pairing a WUFI Zone's ventilation rooms, person-loads and lighting-loads, up to 10,000 rooms.
+
+'_PhxZone' pairs the Zone's three Space-shaped lists by normalized name. It now
+does this in one hash-join ('phx_schemas._join_space_lists'), normalizing each
+name once, instead of per-list name look-ups (each name normalized again for
+every look-up, and the left-over rooms found through a set of object ids). On a
+synthetic Zone (the synthetic model's records, copied and re-named: the
+person-loads shuffled, 5% of each list without a partner, lighting for half the
+rooms) this times, at 1/10 of the rooms and at the full count:
+
+    * join — the pairing alone, with the original look-ups ('before') and the
+             hash-join ('after'), checking both pair the same records
+    * zone — the full '_PhxZone' (Spaces, patterns, ...) with the hash-join
+
+as µs per room, so a linear cost shows as a flat column.
+
+Usage:
+    python scripts/perf/bench_space_list_join.py [--rooms 10000] [--repeat 5] [--seed 0]
+"""
+
+import argparse
+import functools
+import logging
+import math
+import pathlib
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable
+from typing import Any
+
+import synthetic_models
+
+from PHX.from_WUFI_XML import phx_schemas
+from PHX.from_WUFI_XML import wufi_file_schema as wufi_xml
+from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
+from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_plain_dict
+from PHX.model.identity import identity_scope
+from PHX.model.project import PhxProject
+from PHX.model.spaces import PhxSpace
+
+
+def _join_by_name_lookups(_spaces: list[PhxSpace], _persons: list, _lighting: list) -> list[tuple]:
+    """The original pairing (as it ran inside '_PhxZone'), returning the same rows as the hash-join."""
+    key = phx_schemas._space_list_join_key
+    spaces_by_name: defaultdict[str, deque[PhxSpace]] = defaultdict(deque)
+    for space in _spaces:
+        spaces_by_name[key(space.display_name)].append(space)
+    lighting_by_name: defaultdict[str, deque] = defaultdict(deque)
+    for lighting_data in _lighting:
+        lighting_by_name[key(lighting_data.Name)].append(lighting_data)
+
+    def _pop_lighting_data(_name):
+        matching = lighting_by_name[key(_name)]
+        return matching.popleft() if matching else None
+
+    rows, used_space_ids = [], set()
+    for person in _persons:
+        matching_spaces = spaces_by_name[key(person.Name)]
+        space = None
+        if matching_spaces:
+            space = matching_spaces.popleft()
+            used_space_ids.add(id(space))
+        rows.append((space, person, _pop_lighting_data(person.Name)))
+    for space in _spaces:
+        if id(space) not in used_space_ids:
+            rows.append((space, None, _pop_lighting_data(space.display_name)))
+    return rows
+
+
+def _synthetic_zone(_rooms: int, _seed: int) -> tuple[wufi_xml.WufiZone, PhxProject]:
+    """A Zone with '_rooms' ventilation rooms, and the (small) project it was taken from, as the Space host."""
+    spec = synthetic_models.SyntheticModelSpec(segments=1, rooms_per_segment=2, seed=_seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp, "model.xml")
+        path.write_text(synthetic_models.build_wufi_xml(spec), encoding="utf-8")
+        model = wufi_xml.WUFIplusProject.model_validate(get_WUFI_XML_file_as_plain_dict(path))
+    host = convert_WUFI_XML_to_PHX_project(model)
+
+    zone = model.Variants[0].Building.Zones[0]
+    room, person, lighting = zone.RoomsVentilation[0], zone.LoadsPersonsPH[0], zone.LoadsLightingsPH[0]
+    rng = random.Random(_seed)
+    unpaired = _rooms // 20
+    person_names = [f"Room {i}" for i in range(unpaired, _rooms)] + [f"Office {i}" for i in range(unpaired)]
+    rng.shuffle(person_names)
+    return (
+        zone.model_copy(
+            update={
+                "RoomsVentilation": [room.model_copy(update={"Name": f"Room {i}"}) for i in range(_rooms)],
+                "LoadsPersonsPH": [person.model_copy(update={"Name": n}) for n in person_names],
+                "LoadsLightingsPH": [lighting.model_copy(update={"Name": f" Room  {i} "}) for i in range(0, _rooms, 2)],
+            }
+        ),
+        host,
+    )
+
+
+def _best_us_per_room(_func: Callable[[], Any], _rooms: int, _repeat: int) -> float:
+    best = math.inf
+    for _ in range(max(_repeat, 1)):
+        t0 = time.perf_counter()
+        _func()
+        best = min(best, time.perf_counter() - t0)
+    return round(best / _rooms * 1e6, 3)
+
+
+def _zone(_zone_data: wufi_xml.WufiZone, _host: PhxProject) -> None:
+    with identity_scope():
+        phx_schemas._PhxZone(_zone_data, _host)
+
+
+def run(_rooms: int, _repeat: int, _seed: int) -> list[dict[str, Any]]:
+    # -- The synthetic Zones are un-paired on purpose: don't log the reconciliation warning on every run.
+    phx_schemas.logger.setLevel(logging.ERROR)
+    rows = []
+    for rooms in (max(_rooms // 10, 1), _rooms):
+        zone_data, host = _synthetic_zone(rooms, _seed)
+        spaces = [PhxSpace(display_name=r.Name) for r in zone_data.RoomsVentilation]
+        persons, lighting = zone_data.LoadsPersonsPH, zone_data.LoadsLightingsPH
+
+        if (
+            _join_by_name_lookups(spaces, persons, lighting)
+            != phx_schemas._join_space_lists(spaces, persons, lighting).rows
+        ):
+            raise AssertionError("The hash-join pairs different records from the original look-ups.")
+
+        rows.append(
+            {
+                "rooms": rooms,
+                "join_before_us": _best_us_per_room(
+                    functools.partial(_join_by_name_lookups, spaces, persons, lighting), rooms, _repeat
+                ),
+                "join_after_us": _best_us_per_room(
+                    functools.partial(phx_schemas._join_space_lists, spaces, persons, lighting), rooms, _repeat
+                ),
+                "zone_us": _best_us_per_room(functools.partial(_zone, zone_data, host), rooms, _repeat),
+            }
+        )
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rooms", type=int, default=10_000, help="Ventilation rooms in the largest Zone.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'rooms':>7} {'join before µs/room':>20} {'join after µs/room':>19} {'zone µs/room':>13}")
+    for row in run(args.rooms, args.repeat, args.seed):
+        print(f"{row['rooms']:>7} {row['join_before_us']:>20.3f} {row['join_after_us']:>19.3f} {row['zone_us']:>13.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+# -*- Python Version: 3.10 -*-
+
+"""Microbenchmark: METr / WUFI geometry serialisation, with and without the shared vertex table.
+
+Both writers need the unique vertices of each variant's 'PhxGraphics3D' (sorted
+by id_num), and the METr writer also needs each polygon's vertices several
+times (heights, bounding box, vertex ids). 'PhxGraphics3D.vertex_table()' now
+gathers all of this in one pass over the polygons, de-duplicating by vertex
+object / id_num instead of hashing every vertex's formatted coordinates. This
+times, on a synthetic model:
+
+    * metr — 'metr_schemas._PhxGraphics3D' (the full 'lIDXYZ' + 'lPoly' output)
+    * metr_stream — the same, streamed to (discarded) JSON text, as the METr CLI writes it
+    * wufi — 'xml_schemas._PhxGraphics3D' (the 'Vertices' + 'Polygons' writables)
+
+once with the vertex table ('after') and once with the original set-based
+de-duplication and per-polygon vertex look-ups ('before'). It reports the best
+CPU time and the peak (tracemalloc) memory of one pass over every variant, and
+checks that both versions give the same output.
+
+Usage:
+    python scripts/perf/bench_vertex_table.py [--rooms 64] [--apertures 2] [--repeat 5] [--seed 0]
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import synthetic_models
+
+from PHX.from_HBJSON import create_project
+from PHX.model import geometry
+from PHX.to_METr_JSON import metr_schemas, metr_stream
+from PHX.to_WUFI_XML import xml_schemas
+
+
+def _set_based_vertex_table(self: geometry.PhxGraphics3D) -> "_SetBasedVertexTable":
+    """The original path: a set of every polygon vertex, and each polygon looks up its own vertices."""
+    vertices = sorted({vertix for polygon in self.polygons for vertix in polygon.vertices}, key=lambda _: _.id_num)
+    return _SetBasedVertexTable(vertices, len(self.polygons))
+
+
+class _SetBasedVertexTable:
+    def __init__(self, _vertices: list[geometry.PhxVertix], _num_polygons: int) -> None:
+        self.vertices = _vertices
+        self.num_polygons = _num_polygons
+
+    def iter_polygon_vertices(self) -> Iterator[None]:
+        return iter([None] * self.num_polygons)
+
+
+@contextlib.contextmanager
+def vertex_table_disabled() -> Iterator[None]:
+    """De-duplicate with a set, and let each polygon look up its own vertices, as before the vertex table."""
+    original = geometry.PhxGraphics3D.vertex_table
+    geometry.PhxGraphics3D.vertex_table = _set_based_vertex_table  # type: ignore
+    try:
+        yield
+    finally:
+        geometry.PhxGraphics3D.vertex_table = original  # type: ignore
+
+
+def _measure(_func: Callable[[Any], Any], _items: list[Any], _repeat: int) -> tuple[float, float]:
+    """Return the best time (ms) of '_repeat' passes over the items, and the peak memory (MB) of one pass."""
+    best = math.inf
+    for _ in range(max(_repeat, 1)):
+        t0 = time.perf_counter()
+        for item in _items:
+            _func(item)
+        best = min(best, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    for item in _items:
+        _func(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return round(best * 1e3, 2), round(peak / 1e6, 3)
+
+
+def _wufi_output(_g3d: geometry.PhxGraphics3D) -> list:
+    """The WUFI writables, down to each vertex's and polygon's own nodes."""
+    return [
+        (
+            [xml_schemas._PhxVertix(o.node_object) for o in writable.node_items]
+            if writable.node_name == "Vertices"
+            else [xml_schemas._PhxPolygon(o.node_object) for o in writable.node_items]
+        )
+        for writable in xml_schemas._PhxGraphics3D(_g3d)
+    ]
+
+
+def _metr_stream(_g3d: geometry.PhxGraphics3D) -> None:
+    for _ in metr_stream.iter_json_chunks(metr_schemas._PhxGraphics3D(_g3d, _stream=True)):
+        pass
+
+
+def _metr_text(_g3d: geometry.PhxGraphics3D) -> str:
+    return json.dumps(metr_schemas._PhxGraphics3D(_g3d), indent=2)
+
+
+def run(_rooms: int, _apertures: int, _repeat: int, _seed: int) -> dict[str, dict[str, Any]]:
+    spec = synthetic_models.SyntheticModelSpec(rooms_per_segment=_rooms, apertures_per_face=_apertures, seed=_seed)
+    phx_project = create_project.convert_hb_model_to_PhxProject(
+        synthetic_models.build_hb_model(spec), _group_components=False
+    )
+    graphics = [variant.graphics3D for variant in phx_project.variants]
+
+    with vertex_table_disabled():
+        before_text = [_metr_text(g) for g in graphics]
+    if before_text != [_metr_text(g) for g in graphics]:
+        raise AssertionError("The METr geometry output changed with the vertex table.")
+
+    stages: dict[str, Callable[[Any], Any]] = {
+        "metr": metr_schemas._PhxGraphics3D,
+        "metr_stream": _metr_stream,
+        "wufi": _wufi_output,
+    }
+
+    results: dict[str, dict[str, Any]] = {}
+    for name, func in stages.items():
+        with vertex_table_disabled():
+            before_ms, before_mb = _measure(func, graphics, _repeat)
+        after_ms, after_mb = _measure(func, graphics, _repeat)
+        results[name] = {
+            "vertices": sum(len(g.vertices) for g in graphics),
+            "polygons": sum(len(g.polygons) for g in graphics),
+            "before_ms": before_ms,
+            "after_ms": after_ms,
+            "before_peak_mb": before_mb,
+            "after_peak_mb": after_mb,
+        }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rooms", type=int, default=64, help="Rooms in the synthetic model.")
+    parser.add_argument("--apertures", type=int, default=2, help="Apertures per exterior face.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.rooms, args.apertures, args.repeat, args.seed)
+
+    print(
+        f"{'stage':>11} {'vertices':>9} {'polygons':>9} {'before ms':>10} {'after ms':>9}"
+        f" {'before MB':>10} {'after MB':>9}"
+    )
+    for name, row in results.items():
+        print(
+            f"{name:>11} {row['vertices']:>9} {row['polygons']:>9} {row['before_ms']:>10.2f} {row['after_ms']:>9.2f}"
+            f" {row['before_peak_mb']:>10.3f} {row['after_peak_mb']:>9.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
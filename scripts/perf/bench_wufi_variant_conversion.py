@@ -0,0 +1,97 @@
+# -*- Python Version: 3.10 -*-
+
+"""Benchmark: WUFI-XML to PHX conversion of a multi-Variant file, with the Variant geometry in worker processes.
+
+'convert_WUFI_XML_to_PHX_project(..., _max_workers=N)' builds each Variant's
+vertices and polygons (most of a Variant's conversion cost) in N worker
+processes, then converts the rest of each Variant in order in this process.
+This times, on a synthetic model with one Variant per building segment:
+
+    * serial   — '_max_workers=1'
+    * parallel — '_max_workers=N', for each N given
+
+reporting the best conversion time, the share of the serial time spent on the
+geometry (the part that runs in parallel), and checking that every run gives the
+same WUFI-XML output and identity allocations as the serial one.
+
+Usage:
+    python scripts/perf/bench_wufi_variant_conversion.py [--segments 12] [--rooms 16] [--workers 2 4] [--repeat 3]
+"""
+
+import argparse
+import math
+import pathlib
+import sys
+import tempfile
+import time
+
+import synthetic_models
+
+from PHX.from_WUFI_XML import phx_schemas
+from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
+from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_plain_dict
+from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
+from PHX.model.identity import identity_owner_scope, identity_scope
+from PHX.model.project import PhxProject
+from PHX.to_WUFI_XML.xml_builder import generate_WUFI_XML_from_object
+
+
+def _best_ms(_model: WUFIplusProject, _workers: int, _repeat: int) -> tuple[float, PhxProject]:
+    best, project = math.inf, None
+    for _ in range(max(_repeat, 1)):
+        t0 = time.perf_counter()
+        project = convert_WUFI_XML_to_PHX_project(_model, _max_workers=_workers)
+        best = min(best, time.perf_counter() - t0)
+    return round(best * 1e3, 1), project
+
+
+def _geometry_ms(_model: WUFIplusProject) -> float:
+    t0 = time.perf_counter()
+    for variant in _model.Variants:
+        with identity_scope(), identity_owner_scope(variant.IdentNr):
+            phx_schemas.as_phx_obj(variant.Graphics_3D, "PhxVariantGeometry")
+    return round((time.perf_counter() - t0) * 1e3, 1)
+
+
+def _output(_project: PhxProject) -> tuple:
+    return generate_WUFI_XML_from_object(_project), _project._identity_allocator.snapshot()
+
+
+def run(_segments: int, _rooms: int, _workers: list[int], _repeat: int, _seed: int) -> dict[str, float]:
+    spec = synthetic_models.SyntheticModelSpec(segments=_segments, rooms_per_segment=_rooms, seed=_seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp, "model.xml")
+        path.write_text(synthetic_models.build_wufi_xml(spec), encoding="utf-8")
+        model = WUFIplusProject.model_validate(get_WUFI_XML_file_as_plain_dict(path))
+
+    serial_ms, serial_project = _best_ms(model, 1, _repeat)
+    results: dict[str, float] = {
+        "variants": len(model.Variants),
+        "geometry_share": round(_geometry_ms(model) / serial_ms, 2),
+        "serial_ms": serial_ms,
+    }
+    expected = _output(serial_project)
+    for workers in _workers:
+        results[f"parallel_{workers}_ms"], project = _best_ms(model, workers, _repeat)
+        if _output(project) != expected:
+            raise AssertionError(f"The conversion with {workers} workers differs from the serial one.")
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=12, help="Building segments (= Variants).")
+    parser.add_argument("--rooms", type=int, default=16, help="Rooms per segment.")
+    parser.add_argument("--workers", type=int, nargs="*", default=[2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.segments, args.rooms, args.workers, args.repeat, args.seed)
+    for name, value in results.items():
+        print(f"{name:>16}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+# -*- Python Version: 3.10 -*-
+
+"""Benchmark: WUFI-XML import throughput (MB/s) and peak RSS across file sizes.
+
+'read_WUFI_XML_file.get_WUFI_XML_file_as_dict' used to decode the file as UTF-8
+and feed it to an 'XMLPullParser' 1,024 characters at a time. It now feeds the
+raw bytes to an 'XMLParser' in 1 MiB blocks ('parse_WUFI_XML_file'). And
+'get_WUFI_XML_file_as_plain_dict' builds a dict of plain (already unpacked)
+values instead of Tag objects, releasing the parsed tree as it goes. For each
+file this measures, in a fresh child process per run (so the peak RSS is that
+run's own):
+
+    * before — the original text-chunk pull-parse, 'xml_to_dict'
+    * block  — the block parse, 'xml_to_dict'
+    * plain  — the block parse, 'xml_to_plain_dict' (releasing the tree)
+
+as the parse alone ('parse MB/s'), the parse plus the dict conversion ('dict
+MB/s'), the full import through 'WUFIplusProject.model_validate' ('import
+MB/s'), and the peak RSS of the process ('ru_maxrss').
+
+The files are either given with '--xml', or generated from synthetic models
+(2 segments x N rooms, see 'synthetic_models.py'; generation is slow for large N).
+
+Usage:
+    python scripts/perf/bench_wufi_xml_import.py [--rooms 8 32 128] [--xml FILE ...] [--repeat 3]
+"""
+
+import argparse
+import json
+import math
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+from lxml import etree
+
+from PHX.from_WUFI_XML import read_WUFI_XML_file
+from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
+
+
+def _parse_in_text_chunks(_file_address: pathlib.Path) -> etree._Element:
+    """The original parse: the file decoded as UTF-8, fed to a pull-parser 1,024 characters at a time."""
+    parser = etree.XMLPullParser(recover=True, encoding="utf-8")
+    with open(_file_address, encoding="utf-8") as xml_file:
+        while True:
+            chunk = xml_file.read(1024)
+            if not chunk:
+                break
+            parser.feed(chunk)
+    return parser.close()
+
+
+MODES: dict[str, tuple[Callable[[pathlib.Path], etree._Element], Callable[[etree._Element], dict]]] = {
+    "before": (_parse_in_text_chunks, read_WUFI_XML_file.xml_to_dict),
+    "block": (read_WUFI_XML_file.parse_WUFI_XML_file, read_WUFI_XML_file.xml_to_dict),
+    "plain": (
+        read_WUFI_XML_file.parse_WUFI_XML_file,
+        lambda _root: read_WUFI_XML_file.xml_to_plain_dict(_root, _release=True),
+    ),
+}
+
+
+def _peak_rss_mb() -> float:
+    """The peak RSS of this process. 'ru_maxrss' is in bytes on macOS, KiB on Linux."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1e6 if sys.platform == "darwin" else 1e3), 1)
+
+
+def measure(_mode: str, _file_address: pathlib.Path, _repeat: int) -> dict[str, Any]:
+    """Time one import mode on the file (in this process), then report the peak RSS."""
+    parse, to_dict = MODES[_mode]
+    size_mb = _file_address.stat().st_size / 1e6
+
+    best_parse, best_dict, best_import = math.inf, math.inf, math.inf
+    for _ in range(max(_repeat, 1)):
+        t0 = time.perf_counter()
+        root = parse(_file_address)
+        t1 = time.perf_counter()
+        data = to_dict(root)
+        del root
+        t2 = time.perf_counter()
+        WUFIplusProject.model_validate(data)
+        t3 = time.perf_counter()
+        del data
+        best_parse, best_dict, best_import = (
+            min(best_parse, t1 - t0),
+            min(best_dict, t2 - t0),
+            min(best_import, t3 - t0),
+        )
+
+    return {
+        "parse_mb_s": round(size_mb / best_parse, 1),
+        "dict_mb_s": round(size_mb / best_dict, 1),
+        "import_mb_s": round(size_mb / best_import, 1),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _measure_in_child(_mode: str, _file_address: pathlib.Path, _repeat: int) -> dict[str, Any]:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", _mode, str(_file_address), "--repeat", str(_repeat)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run(_files: list[pathlib.Path], _repeat: int) -> list[dict[str, Any]]:
+    rows = []
+    for file_address in _files:
+        row: dict[str, Any] = {"file": file_address.name, "size_mb": round(file_address.stat().st_size / 1e6, 2)}
+        for mode in MODES:
+            row[mode] = _measure_in_child(mode, file_address, _repeat)
+        rows.append(row)
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rooms", type=int, nargs="*", default=[8, 32, 128], help="Rooms per segment.")
+    parser.add_argument("--xml", type=pathlib.Path, nargs="*", default=[], help="Existing WUFI-XML files.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "FILE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child[0], pathlib.Path(args.child[1]), args.repeat)))
+        return 0
+
+    # -- Only imported here: the child processes must not carry the honeybee libraries in their RSS.
+    import synthetic_models
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = list(args.xml)
+        for rooms in [] if args.xml else args.rooms:
+            spec = synthetic_models.SyntheticModelSpec(segments=2, rooms_per_segment=rooms, seed=args.seed)
+            path = pathlib.Path(tmp, f"synthetic_{rooms}_rooms.xml")
+            path.write_text(synthetic_models.build_wufi_xml(spec), encoding="utf-8")
+            files.append(path)
+
+        rows = run(files, args.repeat)
+
+    print(
+        f"{'file':>26} {'MB':>7} {'':>7} {'parse MB/s':>11} {'dict MB/s':>10} {'import MB/s':>12} {'peak RSS MB':>12}"
+    )
+    for row in rows:
+        for mode in MODES:
+            r = row[mode]
+            print(
+                f"{row['file']:>26} {row['size_mb']:>7.2f} {mode:>7} {r['parse_mb_s']:>11.1f}"
+                f" {r['dict_mb_s']:>10.1f} {r['import_mb_s']:>12.1f} {r['peak_rss_mb']:>12.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
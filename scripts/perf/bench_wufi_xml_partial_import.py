@@ -0,0 +1,95 @@
+# -*- Python Version: 3.10 -*-
+
+"""Benchmark: partial WUFI-XML import of one Variant, or of the project data alone, vs. the full import.
+
+'partial_import.convert_WUFI_XML_file_selection_to_PHX_project' drops the
+byte spans of the unselected Variants and top-level sections before the file is
+parsed, so they are never parsed, converted to a dict, validated or built. This
+times, on a synthetic model with one Variant per building segment:
+
+    * full    — 'get_WUFI_XML_file_as_plain_dict' + 'model_validate' + 'convert_WUFI_XML_to_PHX_project'
+    * variant — one Variant (the middle one) selected
+    * data    — no Variants and no sections: the project data only
+
+reporting the best time of each and its share of the full import.
+
+Usage:
+    python scripts/perf/bench_wufi_xml_partial_import.py [--segments 20] [--rooms 8] [--repeat 3]
+"""
+
+import argparse
+import math
+import pathlib
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+
+import synthetic_models
+
+from PHX.from_WUFI_XML.partial_import import WufiXmlSelection, convert_WUFI_XML_file_selection_to_PHX_project
+from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
+from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_plain_dict
+from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
+
+
+def _best_ms(_fn: Callable[[], object], _repeat: int) -> float:
+    best = math.inf
+    for _ in range(max(_repeat, 1)):
+        t0 = time.perf_counter()
+        _fn()
+        best = min(best, time.perf_counter() - t0)
+    return round(best * 1e3, 1)
+
+
+def run(_segments: int, _rooms: int, _repeat: int, _seed: int) -> dict[str, float]:
+    spec = synthetic_models.SyntheticModelSpec(segments=_segments, rooms_per_segment=_rooms, seed=_seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp, "model.xml")
+        path.write_text(synthetic_models.build_wufi_xml(spec), encoding="utf-8")
+
+        one_variant = WufiXmlSelection(variants=[_segments // 2])
+        project = convert_WUFI_XML_file_selection_to_PHX_project(path, one_variant)
+        if len(project.variants) != 1 or len(project.partial_import.skipped_variants) != _segments - 1:
+            raise AssertionError("The partial import did not load exactly the one selected Variant.")
+
+        full_ms = _best_ms(
+            lambda: convert_WUFI_XML_to_PHX_project(
+                WUFIplusProject.model_validate(get_WUFI_XML_file_as_plain_dict(path))
+            ),
+            _repeat,
+        )
+        variant_ms = _best_ms(lambda: convert_WUFI_XML_file_selection_to_PHX_project(path, one_variant), _repeat)
+        data_ms = _best_ms(
+            lambda: convert_WUFI_XML_file_selection_to_PHX_project(path, WufiXmlSelection(variants=[], sections=[])),
+            _repeat,
+        )
+        size_mb = round(path.stat().st_size / 1e6, 2)
+
+    return {
+        "variants": _segments,
+        "size_mb": size_mb,
+        "full_ms": full_ms,
+        "variant_ms": variant_ms,
+        "variant_share": round(variant_ms / full_ms, 3),
+        "data_ms": data_ms,
+        "data_share": round(data_ms / full_ms, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=20, help="Building segments (= Variants).")
+    parser.add_argument("--rooms", type=int, default=8, help="Rooms per segment.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.segments, args.rooms, args.repeat, args.seed)
+    for name, value in results.items():
+        print(f"{name:>14}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+# -*- Python Version: 3.10 -*-
+
+"""Record the per-phase round-trip budgets used by 'tests/test_xl_replay/test_phase_budgets.py'.
+
+Runs the replay export (offline, against the in-memory fake) with the built-in
+export-phase profiler on, and writes each phase's read/write round-trip counts
+as its budget.
+
+Re-record ONLY when a change legitimately reduces the counts (ie: a new
+batched write), so the lower numbers become the new gate. Never re-record to
+make a failing budget test pass.
+
+Usage:
+    python scripts/perf/record_phase_budgets.py
+"""
+
+import json
+import sys
+
+import perf_paths
+
+if str(perf_paths.REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(perf_paths.REPO_ROOT))
+
+from tests.test_xl_replay.test_phase_budgets import BUDGETS_FILE, run_profiled_replay  # noqa: E402
+
+BUDGET_COUNTS = ("reads", "writes")
+
+
+def main() -> int:
+    report, _ = run_profiled_replay()
+    budgets = {
+        phase["phase"]: {count: phase[count] for count in BUDGET_COUNTS}
+        for phase in report["phases"]
+        if phase["calls"]  # -- skip the un-phased bucket (connection setup etc.)
+    }
+    BUDGETS_FILE.write_text(json.dumps({"source": "Single_Zone.hbjson", "phases": budgets}, indent=2) + "\n")
+    print(f"Wrote {len(budgets)} phase budgets -> {BUDGETS_FILE.relative_to(perf_paths.REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+# -*- Python Version: 3.10 -*-
+
+"""Synthetic large-model generator for the scaling benchmarks.
+
+Builds honeybee-ph 'Model' objects of a chosen size, and the matching WUFI XML:
+
+    * N building segments (one PHX variant each)
+    * M rooms per segment, each a box with one PH-Space
+    * K apertures on every wall face
+    * one outdoor shade (an overhang) above each wall with apertures
+    * one DHW system per segment (optional): a tank and a piping tree (trunk -> branches -> twigs)
+    * E ERV networks per segment, each with supply / exhaust ducts, shared by its rooms
+
+Every dimension that varies (room sizes, window ratios, pipe lengths ...) is drawn
+from 'random.Random(spec.seed)', and every honeybee-ph / honeybee-phhvac object is
+given a deterministic identifier, so the same spec always produces the same model
+(and byte-identical WUFI XML). Only the library-default sub-objects which never
+reach the PHX output (ie: the project 'team') keep their random identifiers.
+
+The WUFI XML is generated from the model by the production writer (so it always
+matches the model), for use as input to the WUFI-XML import benchmarks.
+
+Usage:
+    python scripts/perf/synthetic_models.py --segments 2 --rooms 10 --apertures 2 --out /tmp/model.xml
+"""
+
+import argparse
+import json
+import pathlib
+import random
+import sys
+from dataclasses import dataclass
+
+import perf_paths
+
+if str(perf_paths.REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(perf_paths.REPO_ROOT))
+
+from honeybee.aperture import Aperture  # noqa: E402
+from honeybee.model import Model  # noqa: E402
+from honeybee.room import Room  # noqa: E402
+from honeybee.shade import Shade  # noqa: E402
+from honeybee_energy.lib.programtypes import program_type_by_identifier  # noqa: E402
+from honeybee_ph.bldg_segment import BldgSegment  # noqa: E402
+from honeybee_ph.space import Space, SpaceFloor, SpaceFloorSegment, SpaceVolume  # noqa: E402
+from honeybee_phhvac.ducting import PhDuctElement, PhDuctSegment  # noqa: E402
+from honeybee_phhvac.hot_water_devices import PhHvacHotWaterTank  # noqa: E402
+from honeybee_phhvac.hot_water_piping import (  # noqa: E402
+    PhHvacPipeBranch,
+    PhHvacPipeElement,
+    PhHvacPipeSegment,
+    PhHvacPipeTrunk,
+)
+from honeybee_phhvac.hot_water_system import PhHotWaterSystem  # noqa: E402
+from honeybee_phhvac.ventilation import PhVentilationSystem, Ventilator  # noqa: E402
+from ladybug_geometry.geometry3d import Face3D, LineSegment3D, Point3D, Vector3D  # noqa: E402
+
+ROOM_SPACING_M = 2.0
+PROGRAM_TYPE = "Generic Office Program"
+
+
+@dataclass(frozen=True)
+class SyntheticModelSpec:
+    """The size of a synthetic model.
+
+    Arguments:
+    ----------
+        * segments (int): Number of building segments (PHX variants).
+        * rooms_per_segment (int): Number of rooms in each segment.
+        * apertures_per_face (int): Number of apertures on every wall face.
+        * shades (bool): Add one outdoor shade above each wall with apertures.
+        * hot_water (bool): Add each segment's DHW system (tank and piping tree).
+        * dhw_branches (int): Branches on each segment's DHW trunk.
+        * dhw_twigs_per_branch (int): Fixture twigs on each DHW branch.
+        * ervs_per_segment (int): ERV networks in each segment. The segment's rooms
+            are shared out evenly between them.
+        * seed (int): The random seed.
+    """
+
+    segments: int = 1
+    rooms_per_segment: int = 4
+    apertures_per_face: int = 1
+    shades: bool = True
+    hot_water: bool = True
+    dhw_branches: int = 2
+    dhw_twigs_per_branch: int = 2
+    ervs_per_segment: int = 1
+    seed: int = 0
+
+    @property
+    def total_rooms(self) -> int:
+        return self.segments * self.rooms_per_segment
+
+
+# -----------------------------------------------------------------------------
+# -- Geometry
+
+
+def _create_space(_room: Room, _identifier: str, _height: float) -> Space:
+    """Return a PH-Space with a single volume covering the room's floor."""
+    floor_face = [f for f in _room.faces if str(f.type) == "Floor"][0].geometry.flip()
+
+    floor_segment = SpaceFloorSegment()
+    floor_segment.identifier = f"{_identifier}_floor_segment"
+    floor_segment.display_name = floor_segment.identifier
+    floor_segment.geometry = floor_face
+
+    floor = SpaceFloor()
+    floor.identifier = f"{_identifier}_floor"
+    floor.display_name = floor.identifier
+    floor.geometry = floor_face
+    floor.add_floor_segment(floor_segment)
+
+    volume = SpaceVolume()
+    volume.identifier = f"{_identifier}_volume"
+    volume.display_name = volume.identifier
+    volume.avg_ceiling_height = _height
+    volume.floor = floor
+    volume.geometry = [f.geometry for f in _room.faces]
+
+    space = Space(_host=_room)
+    space.identifier = _identifier
+    space.name = _room.display_name
+    space.number = _identifier.split("_")[-1]
+    space.add_new_volumes([volume])
+    return space
+
+
+def _add_apertures_and_shade(_room: Room, _spec: SyntheticModelSpec, _rng: random.Random) -> list[Shade]:
+    """Add K side-by-side apertures to every wall of the room. Return the room's outdoor shades."""
+    shades = []
+    for face in _room.faces:
+        if str(face.type) != "Wall" or _spec.apertures_per_face < 1:
+            continue
+
+        vertices = face.geometry.vertices
+        z_min = min(pt.z for pt in vertices)
+        z_max = max(pt.z for pt in vertices)
+        bottom_left, bottom_right = [pt for pt in vertices if pt.z == z_min][:2]
+        step = (bottom_right - bottom_left) / _spec.apertures_per_face
+        sill = (z_max - z_min) * 0.3
+        head = (z_max - z_min) * _rng.uniform(0.6, 0.9)
+
+        for k in range(_spec.apertures_per_face):
+            start = bottom_left.move(step * (k + 0.1))
+            end = bottom_left.move(step * (k + 0.9))
+            aperture_geo = Face3D(
+                (
+                    start.move(Vector3D(0, 0, sill)),
+                    end.move(Vector3D(0, 0, sill)),
+                    end.move(Vector3D(0, 0, head)),
+                    start.move(Vector3D(0, 0, head)),
+                )
+            )
+            if aperture_geo.normal.dot(face.normal) < 0:
+                aperture_geo = aperture_geo.flip()
+            face.add_aperture(Aperture(f"{face.identifier}_Aperture_{k}", aperture_geo))
+
+        if _spec.shades:
+            shade_geo = Face3D(
+                (
+                    bottom_left.move(Vector3D(0, 0, z_max - z_min)),
+                    bottom_right.move(Vector3D(0, 0, z_max - z_min)),
+                    bottom_right.move(Vector3D(0, 0, z_max - z_min) + face.normal * 0.5),
+                    bottom_left.move(Vector3D(0, 0, z_max - z_min) + face.normal * 0.5),
+                )
+            )
+            shades.append(Shade(f"{face.identifier}_Shade", shade_geo))
+    return shades
+
+
+# -----------------------------------------------------------------------------
+# -- HVAC
+
+
+def _create_pipe_element(_identifier: str, _start: Point3D, _length: float, _diameter_mm: float) -> PhHvacPipeElement:
+    segment = PhHvacPipeSegment(LineSegment3D(_start, Vector3D(_length, 0, 0)), _diameter_mm=_diameter_mm)
+    segment.identifier = f"{_identifier}_segment"
+    segment.display_name = segment.identifier
+    element = PhHvacPipeElement()
+    element.identifier = _identifier
+    element.display_name = _identifier
+    element.add_segment(segment)
+    return element
+
+
+def _create_hot_water_system(
+    _segment_name: str, _origin: Point3D, _spec: SyntheticModelSpec, _rng: random.Random
+) -> PhHotWaterSystem:
+    """Return a DHW system with a tank and a trunk -> branch -> twig piping tree."""
+    hw_system = PhHotWaterSystem()
+    hw_system.identifier = f"{_segment_name}_DHW"
+    hw_system.display_name = f"{_segment_name}_DHW"
+
+    tank = PhHvacHotWaterTank()
+    tank.identifier = f"{_segment_name}_Tank"
+    tank.display_name = tank.identifier
+    hw_system.tank_1 = tank
+
+    trunk = PhHvacPipeTrunk()
+    trunk.identifier = f"{_segment_name}_Trunk"
+    trunk.display_name = trunk.identifier
+    trunk.pipe_element = _create_pipe_element(f"{trunk.identifier}_pipe", _origin, _rng.uniform(5, 20), 25.4)
+
+    for b in range(_spec.dhw_branches):
+        branch = PhHvacPipeBranch()
+        branch.identifier = f"{trunk.identifier}_Branch_{b}"
+        branch.display_name = branch.identifier
+        branch.pipe_element = _create_pipe_element(f"{branch.identifier}_pipe", _origin, _rng.uniform(2, 10), 19.05)
+        for t in range(_spec.dhw_twigs_per_branch):
+            twig = _create_pipe_element(f"{branch.identifier}_Twig_{t}", _origin, _rng.uniform(0.5, 3), 12.7)
+            branch.add_fixture(twig)
+        trunk.add_branch(branch)
+
+    hw_system.add_distribution_piping(trunk)
+    return hw_system
+
+
+def _create_ventilation_system(_identifier: str, _origin: Point3D, _rng: random.Random) -> PhVentilationSystem:
+    """Return an ERV system with its ventilation unit and a supply and an exhaust duct."""
+    ventilator = Ventilator()
+    ventilator.identifier = f"{_identifier}_ERV"
+    ventilator.display_name = ventilator.identifier
+    ventilator.sensible_heat_recovery = round(_rng.uniform(0.75, 0.9), 2)
+    ventilator.latent_heat_recovery = round(_rng.uniform(0.0, 0.6), 2)
+
+    vent_system = PhVentilationSystem()
+    vent_system.identifier = _identifier
+    vent_system.display_name = _identifier
+    vent_system.ventilation_unit = ventilator
+
+    for duct_type, ducts in ((1, vent_system.supply_ducting), (2, vent_system.exhaust_ducting)):
+        duct = PhDuctElement(f"{_identifier}_duct_{duct_type}", _duct_type=duct_type)
+        duct.identifier = duct.display_name
+        duct_segment = PhDuctSegment(LineSegment3D(_origin, Vector3D(_rng.uniform(2, 8), 0, 0)))
+        duct_segment.identifier = f"{duct.identifier}_segment"
+        duct_segment.display_name = duct_segment.identifier
+        duct.add_segment(duct_segment)
+        ducts.append(duct)
+
+    return vent_system
+
+
+# -----------------------------------------------------------------------------
+# -- Model
+
+
+def build_hb_model(_spec: SyntheticModelSpec) -> Model:
+    """Return a new honeybee-ph Model built to the spec."""
+    rng = random.Random(_spec.seed)
+    program = program_type_by_identifier(PROGRAM_TYPE)
+    rooms: list[Room] = []
+    shades: list[Shade] = []
+
+    for s in range(_spec.segments):
+        segment_name = f"Segment_{s}"
+        bldg_segment = BldgSegment()
+        bldg_segment.identifier = segment_name
+        bldg_segment.display_name = segment_name
+        segment_origin = Point3D(0, s * 100.0, 0)
+
+        hw_system = _create_hot_water_system(segment_name, segment_origin, _spec, rng) if _spec.hot_water else None
+        vent_systems = [
+            _create_ventilation_system(f"{segment_name}_Vent_{e}", segment_origin, rng)
+            for e in range(max(_spec.ervs_per_segment, 0))
+        ]
+
+        x = 0.0
+        for r in range(_spec.rooms_per_segment):
+            width, depth, height = rng.uniform(3, 8), rng.uniform(3, 8), rng.uniform(2.5, 3.5)
+            room_name = f"{segment_name}_Room_{r}"
+            room = Room.from_box(room_name, width, depth, height, origin=Point3D(x, segment_origin.y, 0))
+            x += width + ROOM_SPACING_M
+            room.properties.energy.program_type = program
+
+            room.properties.ph.ph_bldg_segment = bldg_segment
+            room.properties.ph.add_new_space(_create_space(room, f"{room_name}_Space", height))
+            if hw_system:
+                room.properties.ph_hvac.set_hot_water_system(hw_system)
+            if vent_systems:
+                room.properties.ph_hvac.set_ventilation_system(vent_systems[r % len(vent_systems)])
+
+            shades.extend(_add_apertures_and_shade(room, _spec, rng))
+            rooms.append(room)
+
+    return Model(f"Synthetic_{_spec.segments}x{_spec.rooms_per_segment}", rooms=rooms, orphaned_shades=shades)
+
+
+def build_wufi_xml(_spec: SyntheticModelSpec) -> str:
+    """Return the WUFI XML text matching the spec's honeybee-ph Model."""
+    from PHX.from_HBJSON import create_project
+    from PHX.to_WUFI_XML import xml_builder
+
+    phx_project = create_project.convert_hb_model_to_PhxProject(build_hb_model(_spec), _group_components=True)
+    return xml_builder.generate_WUFI_XML_from_object(phx_project)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=1)
+    parser.add_argument("--rooms", type=int, default=4, help="Rooms per segment.")
+    parser.add_argument("--apertures", type=int, default=1, help="Apertures per wall face.")
+    parser.add_argument("--no-shades", action="store_true")
+    parser.add_argument("--no-dhw", action="store_true", help="No DHW systems.")
+    parser.add_argument("--dhw-branches", type=int, default=2)
+    parser.add_argument("--dhw-twigs", type=int, default=2, help="Twigs per DHW branch.")
+    parser.add_argument("--ervs", type=int, default=1, help="ERV networks per segment.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=pathlib.Path, required=True, help="Output path (.hbjson or .xml).")
+    args = parser.parse_args()
+
+    spec = SyntheticModelSpec(
+        segments=args.segments,
+        rooms_per_segment=args.rooms,
+        apertures_per_face=args.apertures,
+        shades=not args.no_shades,
+        hot_water=not args.no_dhw,
+        dhw_branches=args.dhw_branches,
+        dhw_twigs_per_branch=args.dhw_twigs,
+        ervs_per_segment=args.ervs,
+        seed=args.seed,
+    )
+    if args.out.suffix.lower() == ".xml":
+        args.out.write_text(build_wufi_xml(spec))
+    else:
+        args.out.write_text(json.dumps(build_hb_model(spec).to_dict()))
+    print(f"Wrote -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,11 +2,22 @@ from pathlib import Path
 
 import pytest
 
-from PHX.PHPP.phpp_localization.load import get_shape_filepath
+from PHX.PHPP.phpp_localization.load import (
+    clear_phpp_shape_cache,
+    get_phpp_shape,
+    get_shape_filepath,
+)
 from PHX.PHPP.phpp_localization.shape_model import PhppShape
 from PHX.PHPP.phpp_model.version import PHPPVersion
 
 
+class _SilentXL:
+    """Stand-in for XLConnection: 'get_phpp_shape' only uses '.output()'."""
+
+    def output(self, _input) -> None:
+        return None
+
+
 @pytest.mark.parametrize(
     "version",
     [
@@ -23,3 +34,27 @@ def test_load_all_shape_files(version) -> None:
     phpp_shape_filepath = get_shape_filepath(version, shape_file_dir)
     phpp_shape = PhppShape.model_validate_json(phpp_shape_filepath.read_bytes())
     assert phpp_shape is not None
+
+
+def test_get_phpp_shape_is_memoized_per_version() -> None:
+    clear_phpp_shape_cache()
+    xl = _SilentXL()
+    version = PHPPVersion("10", "6", "EN")
+
+    shape_1 = get_phpp_shape(xl, version)
+    shape_2 = get_phpp_shape(xl, version)
+    assert shape_1 is shape_2
+
+    other_shape = get_phpp_shape(xl, PHPPVersion("10", "4IP", "EN"))
+    assert other_shape is not shape_1
+
+
+def test_clear_phpp_shape_cache_reloads_the_shape() -> None:
+    xl = _SilentXL()
+    version = PHPPVersion("10", "6", "EN")
+    shape_1 = get_phpp_shape(xl, version)
+
+    clear_phpp_shape_cache()
+    shape_2 = get_phpp_shape(xl, version)
+    assert shape_2 is not shape_1
+    assert shape_2 == shape_1
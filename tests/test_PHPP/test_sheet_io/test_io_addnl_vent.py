@@ -0,0 +1,177 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the PHPP 'Additional Vent' shared section locator, ventilator-id map and block writes."""
+
+import pytest
+
+from PHX.model.schedules.ventilation import PhxScheduleVentilation
+from PHX.model.spaces import PhxSpace
+from PHX.PHPP.phpp_model import vent_space
+from PHX.PHPP.sheet_io.io_addnl_vent import AddnlVent, AddnlVentSectionLocator, Spaces, VentDucts, VentUnits
+from PHX.xl.xl_app import XLConnection
+from PHX.xl.xl_profile import XLProfiler
+from tests.test_PHPP.test_sheet_io.conftest import load_shape
+from tests.test_xl_replay.fake_xl_framework import FakeXLFramework
+
+SHAPE = load_shape("EN_10_6.json").ADDNL_VENT
+
+ROOMS_HEADER_ROW = 5
+ROOMS_FIRST_ENTRY_ROW = 8
+ROOMS_NUM_ROWS = 30
+UNITS_HEADER_ROW = 60
+UNITS_FIRST_ENTRY_ROW = 63
+UNITS_NUM_ROWS = 10
+DUCTS_HEADER_ROW = 86
+DUCTS_END_MARKER_ROW = 115
+
+
+def _seed() -> dict[str, object]:
+    rooms, units, ducts = SHAPE.rooms, SHAPE.units, SHAPE.ducts
+    seed: dict[str, object] = {
+        f"{rooms.locator_col_header}{ROOMS_HEADER_ROW}": rooms.locator_string_header,
+        f"{units.locator_col_header}{UNITS_HEADER_ROW}": units.locator_string_header,
+        f"{ducts.locator_col_header}{DUCTS_HEADER_ROW}": "Round duct diameter",
+        f"{ducts.locator_col_entry}{DUCTS_END_MARKER_ROW}": "Additional lines",
+        f"{units.inputs.unit_selected.column}{UNITS_FIRST_ENTRY_ROW}": "01ud-Unit A",
+        f"{units.inputs.unit_selected.column}{UNITS_FIRST_ENTRY_ROW + 1}": "02ud-Unit B",
+    }
+    for i in range(ROOMS_NUM_ROWS):
+        seed[f"{rooms.locator_col_entry}{ROOMS_FIRST_ENTRY_ROW + i}"] = float(i + 1)
+    for i in range(UNITS_NUM_ROWS):
+        seed[f"{units.locator_col_entry}{UNITS_FIRST_ENTRY_ROW + i}"] = float(i + 1)
+    return seed
+
+
+def _xl() -> XLConnection:
+    xl = XLConnection(xl_framework=FakeXLFramework(sheet_names=[SHAPE.name], seed={SHAPE.name: _seed()}))
+    xl.get_sheet_by_name(SHAPE.name)  # -- the one-off worksheet-name lookup
+    return xl
+
+
+def test_every_section_shape_is_found_in_one_read() -> None:
+    xl = _xl()
+    addnl_vent = AddnlVent(xl, SHAPE)
+    profiler = XLProfiler.attach(xl)
+
+    assert addnl_vent.spaces.section_header_row == ROOMS_HEADER_ROW
+    assert addnl_vent.spaces.section_first_entry_row == ROOMS_FIRST_ENTRY_ROW
+    assert addnl_vent.spaces.section_last_entry_row == ROOMS_FIRST_ENTRY_ROW + ROOMS_NUM_ROWS
+    assert addnl_vent.vent_units.section_header_row == UNITS_HEADER_ROW
+    assert addnl_vent.vent_units.section_first_entry_row == UNITS_FIRST_ENTRY_ROW
+    assert addnl_vent.vent_units.section_last_entry_row == UNITS_FIRST_ENTRY_ROW + UNITS_NUM_ROWS - 1
+    assert addnl_vent.vent_ducts.section_header_row == DUCTS_HEADER_ROW
+    assert addnl_vent.vent_ducts.section_first_entry_row == DUCTS_HEADER_ROW + 9
+    assert addnl_vent.vent_ducts.section_last_entry_row == DUCTS_END_MARKER_ROW - 1
+
+    assert profiler.totals()["reads"] == 1
+
+
+def test_shared_locator_matches_each_controllers_own_search() -> None:
+    xl = _xl()
+    locator = AddnlVentSectionLocator(xl, SHAPE)
+
+    spaces = Spaces(xl, SHAPE)
+    assert locator.rooms.header == spaces.find_section_header_row()
+    assert locator.rooms.first_entry == spaces.find_section_first_entry_row()
+    assert locator.rooms.last_entry == spaces.find_section_last_entry_row()
+
+    units = VentUnits(xl, SHAPE)
+    assert locator.units.header == units.find_section_header_row()
+    assert locator.units.first_entry == units.find_section_first_entry_row()
+    assert locator.units.last_entry == units.find_section_last_entry_row()
+
+    ducts = VentDucts(xl, SHAPE)
+    assert locator.ducts.header == ducts.find_section_header_row()
+    assert locator.ducts.first_entry == ducts.find_section_first_entry_row()
+    assert locator.ducts.last_entry == ducts.find_section_last_entry_row()
+
+
+def test_sections_past_the_first_read_block_are_found_with_one_more_read() -> None:
+    xl = _xl()
+    full_size = AddnlVentSectionLocator(xl, SHAPE)
+    small_block = AddnlVentSectionLocator(xl, SHAPE, _read_rows=70)
+
+    profiler = XLProfiler.attach(xl)
+    assert small_block.rooms == full_size.rooms
+    assert small_block.units == full_size.units
+    assert small_block.ducts == full_size.ducts  # -- The ducts end past row 70
+
+    # -- The 70-row block, the full-size re-read, and the 'full_size' block
+    assert profiler.totals()["reads"] == 3
+
+
+def test_missing_section_raises() -> None:
+    xl = XLConnection(xl_framework=FakeXLFramework(sheet_names=[SHAPE.name], seed={SHAPE.name: {}}))
+    spaces = AddnlVent(xl, SHAPE).spaces
+    with pytest.raises(Exception, match="Rooms"):
+        assert spaces.section_first_entry_row
+
+
+def test_ventilator_ids_are_answered_from_one_read() -> None:
+    xl = _xl()
+    addnl_vent = AddnlVent(xl, SHAPE)
+    # -- Locate the sections first
+    assert addnl_vent.vent_units.section_first_entry_row == UNITS_FIRST_ENTRY_ROW
+
+    profiler = XLProfiler.attach(xl)
+    numbers = [addnl_vent.vent_units.get_vent_unit_num_by_phpp_id(_) for _ in ["02ud-Unit B", "01ud-Unit A"] * 50]
+
+    assert numbers[:2] == [2.0, 1.0]
+    assert profiler.totals()["reads"] == 1
+
+    with pytest.raises(Exception, match="Cannot locate the Ventilation Unit"):
+        addnl_vent.vent_units.get_vent_unit_num_by_phpp_id("03ud-Missing")
+
+
+def test_writing_the_units_drops_the_ventilator_id_map() -> None:
+    xl = _xl()
+    addnl_vent = AddnlVent(xl, SHAPE)
+    assert addnl_vent.vent_units.get_vent_unit_num_by_phpp_id("01ud-Unit A") == 1.0
+
+    addnl_vent.activate_variants("Variants", "D10")
+
+    with pytest.raises(Exception, match="Cannot locate the Ventilation Unit"):
+        addnl_vent.vent_units.get_vent_unit_num_by_phpp_id("01ud-Unit A")
+
+
+def test_activate_variants_is_one_write() -> None:
+    xl = _xl()
+    addnl_vent = AddnlVent(xl, SHAPE)
+    # -- Locate the sections first
+    assert addnl_vent.vent_units.section_last_entry_row == UNITS_FIRST_ENTRY_ROW + UNITS_NUM_ROWS - 1
+
+    profiler = XLProfiler.attach(xl)
+    addnl_vent.activate_variants("Variants", "D10")
+
+    assert profiler.totals()["writes"] == 1
+    col = SHAPE.units.inputs.unit_selected.column
+    for row in range(UNITS_FIRST_ENTRY_ROW, UNITS_FIRST_ENTRY_ROW + UNITS_NUM_ROWS):
+        assert xl.get_data(SHAPE.name, f"{col}{row}") == "=Variants!D10"
+
+
+def test_many_spaces_are_written_in_a_handful_of_blocks() -> None:
+    xl = _xl()
+    addnl_vent = AddnlVent(xl, SHAPE)
+    # -- Locate the sections first
+    assert addnl_vent.spaces.section_first_entry_row == ROOMS_FIRST_ENTRY_ROW
+
+    spaces = []
+    for i in range(500):
+        space = PhxSpace()
+        space.display_name = f"Room {i}"
+        space.floor_area = 10.0 + i
+        spaces.append(vent_space.VentSpaceRow(SHAPE, space, 1.0 + i % 2, PhxScheduleVentilation()))
+
+    profiler = XLProfiler.attach(xl)
+    addnl_vent.write_spaces(spaces)
+
+    # -- One 2D block per run of adjacent input columns (D:H, J:L, N:V): the
+    # -- formula columns in between are left alone.
+    assert profiler.totals()["writes"] == 3
+    assert profiler.totals()["reads"] == 0
+
+    inputs = SHAPE.rooms.inputs
+    last_row = ROOMS_FIRST_ENTRY_ROW + 499
+    assert xl.get_data(SHAPE.name, f"{inputs.display_name.column}{last_row}") == "Room 499"
+    assert xl.get_data(SHAPE.name, f"{inputs.vent_unit_assigned.column}{last_row}") == 2.0
+    assert xl.get_data(SHAPE.name, f"{inputs.weighted_floor_area.column}{last_row}") == 509.0
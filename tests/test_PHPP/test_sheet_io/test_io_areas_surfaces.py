@@ -0,0 +1,38 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the surface look-ups of the PHPP 'Areas' worksheet."""
+
+import pytest
+
+from PHX.PHPP.sheet_io.io_areas import Surfaces
+from PHX.xl.xl_app import XLConnection
+from tests.test_PHPP.test_sheet_io.conftest import load_shape
+from tests.test_xl_replay.fake_xl_framework import FakeXLFramework
+
+SHAPE = load_shape("EN_10_6.json").AREAS
+
+HEADER_ROW = 40
+FIRST_ENTRY_ROW = 42
+NUM_ENTRY_ROWS = 700  # -- A grown entry block: well past the 500 rows of a stock PHPP
+
+
+def _surfaces() -> Surfaces:
+    rows = SHAPE.surface_rows
+    seed: dict[str, object] = {f"{rows.locator_col_header}{HEADER_ROW}": rows.locator_string_header}
+    for i in range(NUM_ENTRY_ROWS):
+        seed[f"{rows.locator_col_entry}{FIRST_ENTRY_ROW + i}"] = float(i + 1)
+        seed[f"{rows.inputs.description.column}{FIRST_ENTRY_ROW + i}"] = f"Surface_{i + 1}"
+    xl = XLConnection(xl_framework=FakeXLFramework(sheet_names=[SHAPE.name], seed={SHAPE.name: seed}))
+    return Surfaces(xl, SHAPE, {})
+
+
+@pytest.mark.parametrize("number", [1, 500, 650, NUM_ENTRY_ROWS])
+def test_surface_id_is_found_anywhere_in_the_entry_block(number) -> None:
+    surfaces = _surfaces()
+    assert surfaces.section_last_entry_row == FIRST_ENTRY_ROW + NUM_ENTRY_ROWS - 1
+    assert surfaces.get_surface_phpp_id_by_name(f"Surface_{number}") == f"{number}-Surface_{number}"
+
+
+def test_missing_surface_raises() -> None:
+    with pytest.raises(Exception, match="Cannot locate the phpp surface named: Surface_0"):
+        _surfaces().get_surface_phpp_id_by_name("Surface_0")
@@ -0,0 +1,118 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the PHPP 'Climate' worksheet block writing and the grouped active-climate read."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from PHX.model import phx_site
+from PHX.PHPP.phpp_model import climate_entry
+from PHX.PHPP.sheet_io.io_climate import Climate
+from PHX.xl.xl_app import XLConnection, silent_print
+from PHX.xl.xl_profile import XLProfiler
+from tests.test_PHPP.test_sheet_io.conftest import load_shape
+from tests.test_xl_replay.fake_xl_framework import FakeXLFramework
+
+SHAPE = load_shape("EN_10_6.json").CLIMATE
+
+
+def _climate(
+    _shape=SHAPE, _seed: dict[str, object] | None = None, _output: Callable[[str], Any] = silent_print
+) -> tuple[Climate, XLConnection, FakeXLFramework]:
+    fake_xl = FakeXLFramework(sheet_names=[_shape.name], seed={_shape.name: _seed or {}})
+    xl = XLConnection(xl_framework=fake_xl, output=_output)
+    return Climate(xl, _shape), xl, fake_xl
+
+
+def _site(_name: str, _temp: float) -> phx_site.PhxSite:
+    site = phx_site.PhxSite()
+    site.display_name = _name
+    site.location.latitude = 40.6
+    site.location.longitude = -73.8
+    for attr in vars(SHAPE.ud_block.input_rows):
+        setattr(site.climate, attr, [0.0] * 12)
+    site.climate.temperature_air = [_temp + i for i in range(12)]
+    return site
+
+
+def test_climate_block_is_written_in_a_few_block_writes() -> None:
+    climate, xl, fake_xl = _climate()
+    data_block = climate_entry.ClimateDataBlock(shape=SHAPE, phx_site=_site("New York", 0.0))
+
+    profiler = XLProfiler.attach(xl)
+    climate.write_climate_block(data_block)
+
+    # -- 6 header cells + the monthly/peak-load block, instead of one write per cell.
+    item_count = len(data_block.create_xl_items(SHAPE.name, SHAPE.ud_block.start_row))
+    assert profiler.totals()["writes"] <= 8 < item_count
+
+    # -- Same cells and values as the cell-by-cell write.
+    single, single_xl, single_fake_xl = _climate()
+    for item in data_block.create_xl_items(SHAPE.name, SHAPE.ud_block.start_row):
+        single_xl.write_xl_item(item)
+    assert fake_xl.written_state() == single_fake_xl.written_state()
+
+
+def test_a_shape_with_one_slot_writes_every_variant_to_it_with_a_warning() -> None:
+    messages: list[str] = []
+    climate, xl, _ = _climate(_output=messages.append)
+    for i, name in enumerate(["A", "B"]):
+        climate.write_climate_block(climate_entry.ClimateDataBlock(shape=SHAPE, phx_site=_site(name, 0.0)), i)
+
+    assert climate.get_start_rows() == [SHAPE.ud_block.start_row]
+    name_address = f"{SHAPE.ud_block.input_columns.display_name}{SHAPE.ud_block.start_row}"
+    assert xl.get_data(SHAPE.name, name_address) == "B"
+    warnings = [m for m in messages if "PHPPClimateWarning" in m]
+    assert len(warnings) == 1 and "1 user-defined climate slot(s)" in warnings[0] and "'B' for slot 2" in warnings[0]
+
+
+@pytest.fixture
+def active_climate_sheet() -> dict[str, object]:
+    seed: dict[str, object] = {
+        # -- The named selections, which differ from the active-dataset input cells.
+        "B2": "US-United States of America",
+        "B3": "New York",
+        "B4": "US0055c-New York",
+        "D9": "Input country",
+        "D10": "Input region",
+        "D12": "Input data set",
+        SHAPE.defined_ranges.weather_station_altitude: 12.0,
+        SHAPE.defined_ranges.site_altitude: 20.0,
+        SHAPE.defined_ranges.latitude: 40.6,
+        SHAPE.defined_ranges.longitude: -73.8,
+    }
+    for row in range(SHAPE.active_block.start_row, SHAPE.active_block.end_row + 1):
+        for col in "DEFGHIJKLMNOPQRSTU":
+            seed[f"{col}{row}"] = float(row * 100 + ord(col))
+    return seed
+
+
+def test_active_climate_snapshot_matches_the_single_reads(active_climate_sheet) -> None:
+    climate, xl, _ = _climate(_seed=active_climate_sheet)
+    # -- The fake workbook has no named ranges, so point them at plain cells.
+    climate.shape = SHAPE.model_copy(deep=True)
+    climate.shape.named_ranges.country = "B2"
+    climate.shape.named_ranges.region = "B3"
+    climate.shape.named_ranges.data_set = "B4"
+
+    xl.get_sheet_by_name(SHAPE.name)  # -- the one-off worksheet-name lookup
+    profiler = XLProfiler.attach(xl)
+    snapshot = climate.read_active_climate_snapshot()
+    # -- The three named selections + one block for the location and monthly data.
+    assert profiler.totals()["reads"] == 4
+    assert (snapshot.country, snapshot.region, snapshot.data_set) == (
+        "US-United States of America",
+        "New York",
+        "US0055c-New York",
+    )
+
+    assert snapshot.country == climate.read_active_country()
+    assert snapshot.region == climate.read_active_region()
+    assert snapshot.data_set == climate.read_active_data_set()
+    assert snapshot.station_elevation == climate.read_station_elevation()
+    assert snapshot.site_elevation == climate.read_site_elevation()
+    assert snapshot.latitude == climate.read_latitude()
+    assert snapshot.longitude == climate.read_longitude()
+    assert snapshot.monthly_data == climate.read_active_monthly_data()
@@ -0,0 +1,128 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the PHPP 'Electricity' worksheet reset/write and the block-read device reader."""
+
+from PHX.model import elec_equip
+from PHX.PHPP.phpp_model import electricity_item
+from PHX.PHPP.sheet_io.io_electricity import Electricity
+from PHX.xl.xl_app import XLConnection
+from PHX.xl.xl_profile import XLProfiler
+from tests.test_PHPP.test_sheet_io.conftest import load_shape
+from tests.test_xl_replay.fake_xl_framework import FakeXLFramework
+
+SHAPE = load_shape("EN_10_6.json").ELECTRICITY
+
+
+def _electricity(_seed: dict[str, object] | None = None) -> tuple[Electricity, XLConnection, FakeXLFramework]:
+    fake_xl = FakeXLFramework(sheet_names=[SHAPE.name], seed={SHAPE.name: _seed or {}})
+    xl = XLConnection(xl_framework=fake_xl)
+    return Electricity(xl, SHAPE), xl, fake_xl
+
+
+def _equipment_inputs() -> list[electricity_item.ElectricityItemXLWriter]:
+    dishwasher = elec_equip.PhxDeviceDishwasher()
+    dishwasher.energy_demand_per_use = 1.1
+    dishwasher.water_connection = 2
+    fridge = elec_equip.PhxDeviceRefrigerator()
+    fridge.energy_demand_per_use = 0.9
+    cooktop = elec_equip.PhxDeviceCooktop()
+    cooktop.energy_demand_per_use = 0.25
+    return [electricity_item.ElectricityItemXLWriter(equip) for equip in (dishwasher, fridge, cooktop)]
+
+
+def _cell_by_cell_state(_equipment_inputs, _seed) -> dict[str, object]:
+    """The sheet state from the original, one-write-per-cell, reset-and-write sequence."""
+    electricity, xl, _ = _electricity(_seed)
+    for xl_item in electricity._reset_xl_items():
+        xl.write_xl_item(xl_item)
+    for equip_input in _equipment_inputs:
+        for xl_item in equip_input.create_xl_items(SHAPE):
+            xl.write_xl_item(xl_item)
+    return _sheet_state(xl)
+
+
+def _sheet_state(_xl: XLConnection) -> dict[str, object]:
+    data = _xl.get_data_with_column_letters(SHAPE.name, "A1:AC70")
+    return {f"{col}{row}": v for col, values in data.items() for row, v in enumerate(values, start=1) if v is not None}
+
+
+def test_write_equipment_matches_cell_by_cell_writes() -> None:
+    # -- Labels and formulas around the input cells must survive.
+    seed = {"E19": "label", "F16": "=formula", "G25": 12.0}
+    electricity, xl, _ = _electricity(seed)
+    electricity.write_equipment(_equipment_inputs())
+
+    assert _sheet_state(xl) == _cell_by_cell_state(_equipment_inputs(), seed)
+
+
+def test_write_equipment_leaves_the_excluded_rows_untouched() -> None:
+    rows = SHAPE.input_rows
+    used = SHAPE.input_columns.used
+    seed = {f"{used}{rows.clothes_drying.data}": 1, f"{used}{rows.small_appliances.data}": 1}
+    electricity, _, fake_xl = _electricity(seed)
+    electricity.write_equipment([])
+
+    written = fake_xl.written_state()[SHAPE.name]
+    assert f"{used}{rows.clothes_drying.data}" not in written
+    assert f"{used}{rows.small_appliances.data}" not in written
+    assert f"{used}{rows.dishwasher.data}" in written
+
+
+def test_write_equipment_merges_the_cells_into_blocks() -> None:
+    electricity, xl, _ = _electricity()
+    profiler = XLProfiler.attach(xl)
+    electricity.write_equipment(_equipment_inputs())
+
+    # -- 7 reset cells + 8 equipment cells, previously one write each. Merged:
+    # -- E16:E18, N16, E20, N21, E24, E25:F25, N25, E29, E38:E39
+    assert profiler.totals()["writes"] == 9
+
+
+def test_get_phx_elec_devices_reads_the_sheet_once() -> None:
+    electricity, xl, _ = _electricity()
+    electricity.write_equipment(_equipment_inputs())
+
+    profiler = XLProfiler.attach(xl)
+    devices = electricity.get_phx_elec_devices()
+
+    assert profiler.totals()["reads"] == 1
+    assert [type(d) for d in devices][:2] == [elec_equip.PhxDeviceDishwasher, elec_equip.PhxDeviceClothesWasher]
+
+    dishwasher = devices[0]
+    assert dishwasher.quantity == 1
+    assert dishwasher.water_connection == SHAPE.input_rows.dishwasher.selection_options["2"]
+
+
+def test_block_read_matches_single_cell_reads() -> None:
+    electricity, xl, _ = _electricity()
+    electricity.write_equipment(_equipment_inputs())
+
+    reader = electricity_item.ElectricityItemXLReader(SHAPE)
+    addresses = [_.phpp_address for _ in reader._dishwasher.data + reader._lighting_exterior.data]
+    assert electricity.read_addresses(addresses) == {
+        address: xl.get_single_data_item(SHAPE.name, address) for address in addresses
+    }
+
+
+def test_single_device_is_built_from_its_own_read() -> None:
+    electricity, _, _ = _electricity()
+    electricity.write_equipment(_equipment_inputs())
+    devices = electricity.get_phx_elec_devices()
+
+    # -- The refrigerator's read spans a single row, which comes back flat, not as 2D columns.
+    reader = electricity_item.ElectricityItemXLReader(SHAPE)
+    for device_reader, device in ((reader._dishwasher, devices[0]), (reader._refrigerator, devices[3])):
+        single = electricity.build_phx_device_from_phpp(device_reader)
+        assert type(single) is type(device)
+        for read_address in device_reader.data:
+            assert getattr(single, read_address.attr_name) == getattr(device, read_address.attr_name)
+
+
+def test_one_row_one_column_and_one_cell_reads_match_single_cell_reads() -> None:
+    electricity, xl, _ = _electricity()
+    electricity.write_equipment(_equipment_inputs())
+
+    for addresses in (["E16", "F16", "AB16"], ["E24", "E25", "E29"], ["E25"]):
+        assert electricity.read_addresses(addresses) == {
+            address: xl.get_single_data_item(SHAPE.name, address) for address in addresses
+        }
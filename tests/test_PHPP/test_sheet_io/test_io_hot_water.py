@@ -0,0 +1,163 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the PHPP 'DHW+Distribution' shared section locator and the block read/write paths."""
+
+import pytest
+
+from PHX.model.geometry import PhxLineSegment, PhxVertix
+from PHX.model.hvac.piping import PhxHotWaterPipingMaterial, PhxPipeSegment
+from PHX.model.hvac.water import PhxHotWaterTank
+from PHX.PHPP.phpp_model import hot_water_piping, hot_water_tank
+from PHX.PHPP.sheet_io.io_hot_water import BranchPiping, DHWPiping, HotWater, RecircPiping, Tanks
+from PHX.xl.xl_app import XLConnection
+from PHX.xl.xl_profile import XLProfiler
+from tests.test_PHPP.test_sheet_io.conftest import load_shape
+from tests.test_xl_replay.fake_xl_framework import FakeXLFramework
+
+SHAPE = load_shape("EN_10_6.json").DHW
+
+DHW_HEADER_ROW = 112
+RECIRC_HEADER_ROW = 118
+BRANCH_HEADER_ROW = 140
+TANKS_HEADER_ROW = 185
+
+
+def _seed(_shape=SHAPE, _tanks_header_row: int | None = TANKS_HEADER_ROW) -> dict[str, object]:
+    seed: dict[str, object] = {
+        f"{_shape.branch_piping.locator_col_header}{DHW_HEADER_ROW}": _shape.branch_piping.locator_string_header,
+        f"{_shape.recirc_piping.locator_col_entry}{RECIRC_HEADER_ROW}": _shape.recirc_piping.locator_string_entry,
+        f"{_shape.branch_piping.locator_col_entry}{BRANCH_HEADER_ROW}": _shape.branch_piping.locator_string_entry,
+    }
+    if _tanks_header_row:
+        seed[f"{_shape.tanks.locator_col_header}{_tanks_header_row}"] = _shape.tanks.locator_string_header
+    return seed
+
+
+def _hot_water(_shape=SHAPE, _seed_data: dict[str, object] | None = None) -> tuple[HotWater, XLConnection]:
+    seed = _seed() if _seed_data is None else _seed_data
+    xl = XLConnection(xl_framework=FakeXLFramework(sheet_names=[_shape.name], seed={_shape.name: seed}))
+    xl.get_sheet_by_name(_shape.name)  # -- the one-off worksheet-name lookup
+    return HotWater(xl, _shape), xl
+
+
+def _pipe(_length: float, _diameter: float) -> PhxPipeSegment:
+    return PhxPipeSegment(
+        identifier="test",
+        display_name="test",
+        geometry=PhxLineSegment(PhxVertix(0, 0, 0), PhxVertix(0, 0, _length)),
+        pipe_material=PhxHotWaterPipingMaterial.COPPER_K,
+        diameter_m=_diameter,
+        insulation_thickness_m=0.0254,
+        insulation_conductivity=0.04,
+        insulation_reflective=True,
+        insulation_quality=None,
+        daily_period=24,
+    )
+
+
+def test_every_section_anchor_is_found_in_one_read() -> None:
+    hot_water, xl = _hot_water()
+    profiler = XLProfiler.attach(xl)
+
+    assert hot_water.dhw_piping.header_row == DHW_HEADER_ROW
+    assert hot_water.dhw_piping.recirc_piping.header_row == RECIRC_HEADER_ROW
+    assert hot_water.dhw_piping.branch_piping.header_row == BRANCH_HEADER_ROW
+    assert hot_water.tanks.header_row == TANKS_HEADER_ROW
+
+    assert profiler.totals()["reads"] == 1
+
+
+@pytest.mark.parametrize(
+    "controller, expected_row",
+    [(RecircPiping, RECIRC_HEADER_ROW), (BranchPiping, BRANCH_HEADER_ROW), (DHWPiping, DHW_HEADER_ROW)],
+)
+def test_shared_locator_matches_each_controllers_own_search(controller, expected_row) -> None:
+    _, xl = _hot_water()
+    section = controller(xl, SHAPE)
+    assert section.header_row == section.find_header_row() == expected_row
+
+
+def test_tanks_shared_locator_matches_its_own_search() -> None:
+    _, xl = _hot_water()
+    tanks = Tanks(xl, SHAPE)
+    assert tanks.header_row == tanks.find_header_row() == TANKS_HEADER_ROW
+
+
+def test_missing_section_raises() -> None:
+    xl = XLConnection(xl_framework=FakeXLFramework(sheet_names=[SHAPE.name], seed={SHAPE.name: {}}))
+    dhw_piping = HotWater(xl, SHAPE).dhw_piping
+    with pytest.raises(Exception, match=SHAPE.branch_piping.locator_string_header):
+        assert dhw_piping.header_row
+
+
+def _write_and_read_piping(_hot_water: HotWater, _shape) -> None:
+    groups = [[_pipe(1.0 + i, 0.0127 * (i + 1))] for i in range(5)]
+    _hot_water.write_branch_piping([hot_water_piping.BranchPipingInput(_shape, g, i, 3) for i, g in enumerate(groups)])
+    _hot_water.write_recirc_piping([hot_water_piping.RecircPipingInput(_shape, g, i) for i, g in enumerate(groups)])
+    # -- The IP shapes read the lengths back in FT
+    lengths = [d.total_length for d in _hot_water.get_branch_piping_data() + _hot_water.get_recirc_piping_data()]
+    assert [round(length.as_a("M").value, 6) for length in lengths] == [1.0, 2.0, 3.0, 4.0, 5.0] * 2
+
+
+def test_piping_does_not_need_the_other_section_anchors() -> None:
+    seed = _seed(_tanks_header_row=None)
+    del seed[f"{SHAPE.branch_piping.locator_col_header}{DHW_HEADER_ROW}"]
+    hot_water, _ = _hot_water(SHAPE, seed)
+
+    _write_and_read_piping(hot_water, SHAPE)
+    with pytest.raises(Exception, match=SHAPE.tanks.locator_string_header):
+        assert hot_water.tanks.header_row
+
+
+@pytest.mark.parametrize("shape_filename", ["EN_9_6A.json", "EN_9_7IP.json"])
+def test_phpp_9_piping_and_tank_header_are_found(shape_filename) -> None:
+    shape = load_shape(shape_filename).DHW
+    # -- The 9.x tank entries start further down than on 10.x, so its header is below row 200
+    tanks_header_row = shape.tanks.entry_row_start - 3
+    assert tanks_header_row > 200
+    hot_water, _ = _hot_water(shape, _seed(shape, tanks_header_row))
+
+    _write_and_read_piping(hot_water, shape)
+    assert hot_water.tanks.header_row == tanks_header_row
+
+
+def test_piping_write_and_read_are_constant_round_trips() -> None:
+    hot_water, xl = _hot_water()
+    groups = [[_pipe(1.0 + i, 0.0127 * (i + 1))] for i in range(5)]
+    branch_inputs = [hot_water_piping.BranchPipingInput(SHAPE, g, i, 3) for i, g in enumerate(groups)]
+    recirc_inputs = [hot_water_piping.RecircPipingInput(SHAPE, g, i) for i, g in enumerate(groups)]
+
+    profiler = XLProfiler.attach(xl)
+    hot_water.write_branch_piping(branch_inputs)
+    hot_water.write_recirc_piping(recirc_inputs)
+    branch_data = hot_water.get_branch_piping_data()
+    recirc_data = hot_water.get_recirc_piping_data()
+
+    # -- 1 locator read + 1 block read per section. Writes: the branch rows (1-4)
+    # -- are one block, the recirc rows (2-6 and 12-13) are two - for any number of groups.
+    totals = profiler.totals()
+    assert totals["reads"] == 3
+    assert totals["writes"] == 3
+
+    assert [round(d.total_length.value, 6) for d in branch_data] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert [d.num_taps for d in branch_data] == [3] * 5
+    assert [round(d.total_length.value, 6) for d in recirc_data] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert all(d.insul_reflective for d in recirc_data)
+
+
+def test_tank_write_and_block_read_round_trip() -> None:
+    hot_water, xl = _hot_water()
+    tank = PhxHotWaterTank()
+    tank.quantity = 1
+    tank.params.storage_capacity = 200.0
+    tank.params.standby_losses = 1.5
+    hot_water.write_tanks([hot_water_tank.TankInput(SHAPE, tank, 1), hot_water_tank.TankInput(SHAPE, tank, 2)])
+
+    profiler = XLProfiler.attach(xl)
+    tank_data = hot_water.get_all_tank_device_data()
+    assert profiler.totals()["reads"] == 1
+
+    # -- Same as the single-tank (column) read
+    assert tank_data[0] == hot_water.tanks.tank_1.get_phpp_data(1)
+    assert tank_data[1].volume.value == 200.0
+    assert tank_data[1].heat_loss_rate.value == 1.5
@@ -0,0 +1,117 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the bulk WWR window scaling on the PHPP 'Windows' worksheet.
+
+'Windows.scale_window_sizes' must give exactly the same sizes as calling
+'scale_window_size' row-by-row, while reading the entry block once and writing
+each run of consecutive scaled rows as a single width/height block.
+"""
+
+import pytest
+
+from PHX.PHPP.sheet_io.io_windows import Windows
+from PHX.xl.xl_app import XLConnection
+from PHX.xl.xl_profile import XLProfiler
+from tests.test_PHPP.test_sheet_io.conftest import load_shape
+from tests.test_xl_replay.fake_xl_framework import FakeXLFramework
+
+SHAPE = load_shape("EN_10_6.json").WINDOWS
+
+# -- The entry block starts 2 rows below the 'Quan-' label, and ends 2 rows
+# -- below the 'Unhide additional rows' marker.
+FIRST_ENTRY_ROW = 12
+LAST_ENTRY_ROW = 22
+
+# -- row: (description, angle, width, height). Row 18 has an empty angle cell.
+WINDOW_ROWS = {
+    12: ("North", 90.0, 1.2, 1.5),
+    13: ("East", 90.0, 0.8, 2.1),
+    14: ("Skylight", 0.0, 1.0, 1.0),
+    15: ("South", 88.0, 2.4, 1.5),
+    16: ("-", 90.0, 3.0, 3.0),
+    17: ("West", 90.0, 1.5, 1.5),
+    18: ("Door", None, 0.9, 2.1),
+}
+
+
+def _seed() -> dict[str, object]:
+    inputs = SHAPE.window_rows.inputs
+    seed: dict[str, object] = {
+        f"{SHAPE.window_rows.locator_col_entry}{FIRST_ENTRY_ROW - 2}": SHAPE.window_rows.locator_string_entry,
+        f"{SHAPE.window_rows_end.locator_col_entry}{LAST_ENTRY_ROW - 2}": SHAPE.window_rows_end.locator_string_entry,
+    }
+    for row, (description, angle, width, height) in WINDOW_ROWS.items():
+        seed[f"{inputs.description.column}{row}"] = description
+        if angle is not None:
+            seed[f"{inputs.vertical_angle.column}{row}"] = angle
+        seed[f"{inputs.width.column}{row}"] = width
+        seed[f"{inputs.height.column}{row}"] = height
+    return seed
+
+
+def _windows() -> tuple[Windows, XLConnection]:
+    xl = XLConnection(xl_framework=FakeXLFramework(sheet_names=[SHAPE.name], seed={SHAPE.name: _seed()}))
+    return Windows(xl, SHAPE), xl
+
+
+def _sizes(_xl: XLConnection) -> dict[int, tuple[object, object]]:
+    inputs = SHAPE.window_rows.inputs
+    return {
+        row: (
+            _xl.get_data(SHAPE.name, f"{inputs.width.column}{row}"),
+            _xl.get_data(SHAPE.name, f"{inputs.height.column}{row}"),
+        )
+        for row in WINDOW_ROWS
+    }
+
+
+@pytest.mark.parametrize("scale_factor", [0.5, 1.37, 2.0])
+def test_bulk_scaling_matches_row_by_row_scaling(scale_factor) -> None:
+    bulk_windows, bulk_xl = _windows()
+    bulk_windows.scale_window_sizes(scale_factor)
+
+    single_windows, single_xl = _windows()
+    for row_num in single_windows.used_window_row_numbers:
+        single_windows.scale_window_size(row_num, scale_factor)
+
+    assert _sizes(bulk_xl) == _sizes(single_xl)
+
+
+def test_bulk_scaling_skips_unused_rows() -> None:
+    windows, xl = _windows()
+    scaled_rows = windows.scale_window_sizes(2.0)
+
+    assert scaled_rows == [12, 13, 14, 15, 17, 18]
+    assert _sizes(xl)[16] == (3.0, 3.0)
+
+
+def test_bulk_scaling_can_exclude_skylights() -> None:
+    windows, xl = _windows()
+    scaled_rows = windows.scale_window_sizes(2.0, _skylights=False)
+
+    assert scaled_rows == [12, 13, 15, 17, 18]
+    assert _sizes(xl)[14] == (1.0, 1.0)
+
+
+def test_bulk_scaling_can_scale_only_skylights() -> None:
+    windows, xl = _windows()
+    scaled_rows = windows.scale_window_sizes(4.0, _windows=False)
+
+    assert scaled_rows == [14]
+    assert _sizes(xl)[14] == (2.0, 2.0)
+    assert _sizes(xl)[12] == (1.2, 1.5)
+    assert _sizes(xl)[18] == (0.9, 2.1)
+
+
+def test_bulk_scaling_uses_one_read_and_one_write_per_run_of_rows() -> None:
+    windows, xl = _windows()
+    # -- Locate the entry block first, so only the scaling itself is counted.
+    assert (windows.first_entry_row, windows.last_entry_row) == (FIRST_ENTRY_ROW, LAST_ENTRY_ROW)
+
+    profiler = XLProfiler.attach(xl)
+    windows.scale_window_sizes(2.0)
+
+    totals = profiler.totals()
+    assert totals["reads"] == 1
+    # -- Rows 12-15 and rows 17-18: the unused row 16 splits the block in two.
+    assert totals["writes"] == 2
@@ -0,0 +1,76 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for xl_data.merge_xl_item_cells (sparse input-cell batching)."""
+
+from PHX.xl.xl_data import XlItem, merge_xl_item_cells, split_cell_address
+
+
+def _written_cells(_items: list[XlItem]) -> dict[str, object]:
+    """Expand the items to {address: value}, the way the sheet would receive them."""
+    cells = {}
+    for item in _items:
+        col, row = split_cell_address(item.xl_range)
+        value = item.write_value
+        rows = value if isinstance(value, list) else [[value]]
+        for row_i, row_values in enumerate(rows):
+            for col_i, v in enumerate(row_values):
+                cells[f"{chr(ord(col) + col_i)}{row + row_i}"] = v
+    return cells
+
+
+def test_split_cell_address():
+    assert split_cell_address("E16") == ("E", 16)
+    assert split_cell_address("AB250") == ("AB", 250)
+
+
+def test_column_run_becomes_one_block():
+    items = [XlItem("Sheet", f"E{row}", row) for row in (16, 17, 18)]
+    result = merge_xl_item_cells(items)
+
+    assert len(result) == 1
+    assert result[0].xl_range == "E16"
+    assert result[0].write_value == [[16], [17], [18]]
+
+
+def test_row_run_becomes_one_block():
+    result = merge_xl_item_cells([XlItem("Sheet", "E67", 1), XlItem("Sheet", "F67", 2)])
+
+    assert [(i.xl_range, i.write_value) for i in result] == [("E67", [[1, 2]])]
+
+
+def test_uniform_rows_become_one_2d_block():
+    items = [XlItem("Sheet", f"{col}{row}", f"{col}{row}") for row in (68, 69, 70) for col in "EFG"]
+    result = merge_xl_item_cells(items)
+
+    assert len(result) == 1
+    assert result[0].write_value == [["E68", "F68", "G68"], ["E69", "F69", "G69"], ["E70", "F70", "G70"]]
+
+
+def test_gaps_are_never_covered():
+    items = [XlItem("Sheet", "E16", 1), XlItem("Sheet", "G16", 2), XlItem("Sheet", "E18", 3)]
+    result = merge_xl_item_cells(items)
+
+    assert len(result) == 3
+    assert _written_cells(result) == {"E16": 1, "G16": 2, "E18": 3}
+
+
+def test_later_items_replace_earlier_ones():
+    items = [XlItem("Sheet", "E16", 0), XlItem("Sheet", "E17", 0), XlItem("Sheet", "E16", 1)]
+    result = merge_xl_item_cells(items)
+
+    assert _written_cells(result) == {"E16": 1, "E17": 0}
+
+
+def test_unit_conversion_is_applied_before_merging():
+    items = [XlItem("Sheet", "E16", 1.0, "M", "FT"), XlItem("Sheet", "E17", 2.0, "M", "FT")]
+    result = merge_xl_item_cells(items)
+
+    assert result[0].write_value == [[items[0].write_value], [items[1].write_value]]
+
+
+def test_colored_and_list_items_pass_through_unchanged():
+    colored = XlItem("Sheet", "E16", 1, range_color=(1, 2, 3), font_color=(4, 5, 6))
+    listed = XlItem("Sheet", "E17", [1, 2, 3])
+    result = merge_xl_item_cells([colored, listed, XlItem("Sheet", "E18", 3)])
+
+    assert result[1:] == [colored, listed]
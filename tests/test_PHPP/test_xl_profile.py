@@ -0,0 +1,108 @@
+import pytest
+
+from PHX.xl import xl_app, xl_data, xl_profile, xl_typing
+
+# -- Mock XL Framework --------------------------------------------------------
+
+
+class Mock_XL_Framework(xl_typing.xl_Framework_Protocol):
+    def __init__(self):
+        self.books = xl_typing.xl_Books_Protocol()
+        self.books.active.sheets.storage = {
+            "Sheet1": xl_typing.xl_Sheet_Protocol(name="Sheet1"),
+        }
+        self.apps = xl_typing.xl_apps_Protocol()
+
+
+# -----------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("value", ["", "0", "false", "Off"])
+def test_profile_setting_from_env_off(monkeypatch, value) -> None:
+    monkeypatch.setenv(xl_profile.PROFILE_ENV_VAR, value)
+    assert xl_profile.profile_setting_from_env() is None
+    assert xl_profile.profile_output_path_from_env() is None
+
+
+@pytest.mark.parametrize("value", ["1", "true", "YES", "on"])
+def test_profile_setting_from_env_flag(monkeypatch, value) -> None:
+    monkeypatch.setenv(xl_profile.PROFILE_ENV_VAR, value)
+    assert xl_profile.profile_setting_from_env() == value
+    assert xl_profile.profile_output_path_from_env() is None
+
+
+def test_profile_setting_from_env_path(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv(xl_profile.PROFILE_ENV_VAR, str(tmp_path / "profile.json"))
+    assert xl_profile.profile_output_path_from_env() == tmp_path / "profile.json"
+
+
+def test_no_profiler_means_no_wrappers() -> None:
+    conn = xl_app.XLConnection(xl_framework=Mock_XL_Framework())
+    assert conn.profiler is None
+    assert "write_xl_item" not in vars(conn)
+    assert "get_data" not in vars(conn)
+
+
+def test_profiler_counts_reads_and_writes_by_phase() -> None:
+    mock_xw = Mock_XL_Framework()
+    mock_xw.books.active.sheets["Sheet1"].range("A1:A2").value = [1, 2]
+    conn = xl_app.XLConnection(xl_framework=mock_xw)
+    profiler = xl_profile.XLProfiler.attach(conn)
+    assert conn.profiler is profiler
+    assert conn.worksheet_names  # -- the (one-time) sheet-name read
+
+    with profiler.phase("write_things"):
+        conn.write_xl_item(xl_data.XlItem("Sheet1", "A1", 1))
+        conn.write_xl_item(xl_data.XlItem("Sheet1", "A2", 2))
+        conn.get_data("Sheet1", "A1")
+        conn.get_single_column_data("Sheet1", "A", 1, 2)
+        conn.get_single_column_data("Sheet1", "A", 1, 2)  # -- cache hit
+    conn.calculate()
+
+    phases = {p["phase"]: p for p in profiler.report()["phases"]}
+    assert phases["write_things"]["calls"] == 1
+    assert phases["write_things"]["writes"] == 2
+    assert phases["write_things"]["reads"] == 2
+    assert phases["write_things"]["column_cache_hits"] == 1
+    assert phases["write_things"]["column_cache_misses"] == 1
+    assert phases["write_things"]["column_cache_hit_rate"] == 0.5
+    assert phases[xl_profile.NO_PHASE]["reads"] == 1
+    assert phases[xl_profile.NO_PHASE]["recalcs"] == 1
+    assert profiler.report()["totals"]["round_trips"] == 6
+
+
+def test_wrap_phases() -> None:
+    class Thing:
+        def write_something(self):
+            return "done"
+
+    profiler = xl_profile.XLProfiler()
+    thing = Thing()
+    profiler.wrap_phases(thing, ["write_something"])
+    assert thing.write_something() == "done"
+    assert thing.write_something() == "done"
+    assert profiler.phases["write_something"].calls == 2
+
+
+def test_write_json(tmp_path) -> None:
+    profiler = xl_profile.XLProfiler()
+    with profiler.phase("a"):
+        pass
+    path = tmp_path / "sub" / "profile.json"
+    profiler.write_json(path)
+    assert '"phase": "a"' in path.read_text()
+
+
+def test_check_round_trip_budgets() -> None:
+    report = {
+        "phases": [
+            {"phase": "a", "reads": 3, "writes": 10},
+            {"phase": "b", "reads": 1, "writes": 1},
+        ]
+    }
+    budgets = {
+        "a": {"reads": 3, "writes": 9},
+        "b": {"reads": 1, "writes": 1},
+        "not_run": {"reads": 0, "writes": 0},
+    }
+    assert xl_profile.check_round_trip_budgets(report, budgets) == ["a: 10 writes > budget of 9"]
@@ -0,0 +1,135 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the opt-in conversion cache of the run scripts (PHX.conversion_cache)."""
+
+import json
+import os
+import pathlib
+
+import pytest
+
+from PHX import conversion_cache, snapshot
+from PHX.from_HBJSON import create_project
+from PHX.to_METr_JSON.metr_builder import generate_metr_json_dict
+
+HBJSON_FILE = pathlib.Path(
+    "tests", "reference_files", "from_grasshopper_tests", "hbjson", "Default_Model_Single_Zone.hbjson"
+)
+OPTIONS = {
+    "group_components": True,
+    "merge_faces": False,
+    "merge_spaces_by_erv": False,
+    "merge_exhaust_vent_devices": False,
+}
+
+
+@pytest.fixture
+def conversions(monkeypatch) -> list:
+    """Count the Honeybee -> PHX conversions."""
+    calls = []
+    convert = create_project.convert_hb_model_to_PhxProject
+
+    def _counting_convert(*args, **kwargs):
+        calls.append(kwargs)
+        return convert(*args, **kwargs)
+
+    monkeypatch.setattr(create_project, "convert_hb_model_to_PhxProject", _counting_convert)
+    return calls
+
+
+def test_key_depends_on_the_model_options_and_versions(tmp_path, monkeypatch) -> None:
+    cache = conversion_cache.ConversionCache(tmp_path / "cache")
+    key = cache.key(HBJSON_FILE, **OPTIONS)
+    assert cache.key(HBJSON_FILE, **OPTIONS) == key
+
+    assert cache.key(HBJSON_FILE, **(OPTIONS | {"group_components": False})) != key
+    edited = tmp_path / "edited.hbjson"
+    edited.write_bytes(HBJSON_FILE.read_bytes() + b"\n")
+    assert cache.key(edited, **OPTIONS) != key
+    monkeypatch.setattr(snapshot, "phx_version", lambda: "0.0.1")
+    assert cache.key(HBJSON_FILE, **OPTIONS) != key
+
+
+def test_unchanged_model_is_converted_once(tmp_path, conversions) -> None:
+    cache = conversion_cache.ConversionCache(tmp_path / "cache")
+    first = conversion_cache.convert_hbjson_file(HBJSON_FILE, cache, **OPTIONS)
+    second = conversion_cache.convert_hbjson_file(HBJSON_FILE, cache, **OPTIONS)
+
+    assert conversions == [{f"_{name}": value for name, value in OPTIONS.items()}]
+    assert (cache.hits["project"], cache.misses["project"]) == (1, 1)
+    assert generate_metr_json_dict(second) == generate_metr_json_dict(first)
+
+    conversion_cache.convert_hbjson_file(HBJSON_FILE, cache, **(OPTIONS | {"merge_spaces_by_erv": True}))
+    conversion_cache.convert_hbjson_file(HBJSON_FILE, None, **OPTIONS)
+    assert len(conversions) == 3
+
+
+def test_damaged_project_entry_is_a_miss(tmp_path, conversions) -> None:
+    cache = conversion_cache.ConversionCache(tmp_path / "cache")
+    key = cache.key(HBJSON_FILE, **OPTIONS)
+    cache._entry(key, "project.phxsnap").write_bytes(b"not a snapshot")
+
+    conversion_cache.convert_hbjson_file(HBJSON_FILE, cache, key, **OPTIONS)
+    assert (len(conversions), cache.misses["project"]) == (1, 1)
+    conversion_cache.convert_hbjson_file(HBJSON_FILE, cache, key, **OPTIONS)
+    assert (len(conversions), cache.hits["project"]) == (1, 1)
+
+
+def test_project_entry_of_a_renamed_class_is_a_miss(tmp_path, conversions, monkeypatch) -> None:
+    cache = conversion_cache.ConversionCache(tmp_path / "cache")
+    conversion_cache.convert_hbjson_file(HBJSON_FILE, cache, **OPTIONS)
+
+    # -- ie: a PHX class renamed in an editable install, with the same PHX version
+    def _renamed_class(self, module: str, name: str):
+        raise AttributeError(f"module '{module}' has no attribute '{name}'")
+
+    monkeypatch.setattr(snapshot._ProjectUnpickler, "find_class", _renamed_class)
+    conversion_cache.convert_hbjson_file(HBJSON_FILE, cache, **OPTIONS)
+    assert (len(conversions), cache.misses["project"]) == (2, 2)
+
+
+def test_written_output_is_restored(tmp_path) -> None:
+    cache = conversion_cache.ConversionCache(tmp_path / "cache")
+    key = cache.key(HBJSON_FILE, **OPTIONS)
+    written, restored = tmp_path / "model.xml", tmp_path / "restored.xml"
+
+    assert not cache.restore_output(key, "wufi.xml", restored)
+    written.write_text("<WUFIplusProject/>")
+    cache.store_output(key, "wufi.xml", written)
+    assert cache.restore_output(key, "wufi.xml", restored)
+    assert restored.read_bytes() == written.read_bytes()
+    assert not cache.restore_output(key, "metr.json", restored)
+    assert (cache.hits["output"], cache.misses["output"]) == (1, 2)
+
+
+def test_report_keeps_running_totals_in_the_cache_directory(tmp_path) -> None:
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        cache = conversion_cache.ConversionCache(cache_dir)
+        cache.restore_output("key", "wufi.xml", tmp_path / "model.xml")
+        report = cache.report()
+    assert report.endswith("Totals: output 0 hits / 2 misses.")
+    assert "this run output 0 hits / 1 misses" in report
+
+    cache.report()
+    assert json.loads((cache_dir / "stats.json").read_text()) == {"output": {"hits": 0, "misses": 2}}
+
+
+def test_least_recently_used_keys_are_pruned(tmp_path) -> None:
+    cache = conversion_cache.ConversionCache(tmp_path / "cache", max_entries=2)
+    written = tmp_path / "model.xml"
+    written.write_text("<WUFIplusProject/>")
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.store_output(key, "wufi.xml", written)
+        os.utime(cache._entry(key, "wufi.xml"), (i, i))
+    cache.store_output("b", "metr.json", written)
+
+    assert sorted(p.name for p in cache.cache_dir.iterdir()) == ["b.metr.json", "b.wufi.xml", "c.wufi.xml"]
+
+
+def test_cache_is_only_used_when_the_environment_variable_is_set(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv(conversion_cache.CACHE_ENV_VAR, raising=False)
+    assert conversion_cache.ConversionCache.from_env() is None
+    monkeypatch.setenv(conversion_cache.CACHE_ENV_VAR, str(tmp_path / "cache"))
+    cache = conversion_cache.ConversionCache.from_env()
+    assert cache is not None and cache.cache_dir == tmp_path / "cache" and cache.cache_dir.is_dir()
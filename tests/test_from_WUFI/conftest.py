@@ -4,7 +4,7 @@ import pytest
 
 from PHX.from_HBJSON import create_project, read_HBJSON_file
 from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
-from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_dict
+from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_plain_dict
 from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
 from PHX.model.project import PhxProject
 from tests.conftest import _reset_phx_class_counters
@@ -33,7 +33,7 @@ def phx_project_from_wufi_xml() -> PhxProject:
 
     _reset_phx_class_counters()
     SOURCE_XML_FILE = Path("tests", "reference_files", "from_grasshopper_tests", "wufi_xml", "Multi_Room_Complete.xml")
-    wufi_xml_data = get_WUFI_XML_file_as_dict(SOURCE_XML_FILE)
+    wufi_xml_data = get_WUFI_XML_file_as_plain_dict(SOURCE_XML_FILE)
     wufi_xml_model = WUFIplusProject.model_validate(wufi_xml_data)
     phx_project = convert_WUFI_XML_to_PHX_project(wufi_xml_model)
 
@@ -46,7 +46,7 @@ def phx_project_from_wufi_xml_LA_MORA() -> PhxProject:
 
     _reset_phx_class_counters()
     SOURCE_XML_FILE = Path("tests", "reference_files", "from_grasshopper_tests", "wufi_xml", "_la_mora.xml")
-    wufi_xml_data = get_WUFI_XML_file_as_dict(SOURCE_XML_FILE)
+    wufi_xml_data = get_WUFI_XML_file_as_plain_dict(SOURCE_XML_FILE)
     wufi_xml_model = WUFIplusProject.model_validate(wufi_xml_data)
     phx_project = convert_WUFI_XML_to_PHX_project(wufi_xml_model)
 
@@ -59,7 +59,7 @@ def phx_project_from_wufi_xml_RIDGEWAY() -> PhxProject:
 
     _reset_phx_class_counters()
     SOURCE_XML_FILE = Path("tests", "reference_files", "from_grasshopper_tests", "wufi_xml", "_ridgeway.xml")
-    wufi_xml_data = get_WUFI_XML_file_as_dict(SOURCE_XML_FILE)
+    wufi_xml_data = get_WUFI_XML_file_as_plain_dict(SOURCE_XML_FILE)
     wufi_xml_model = WUFIplusProject.model_validate(wufi_xml_data)
     phx_project = convert_WUFI_XML_to_PHX_project(wufi_xml_model)
 
@@ -72,7 +72,7 @@ def phx_project_from_wufi_xml_ARVERNE_D_NO_WIN() -> PhxProject:
 
     _reset_phx_class_counters()
     SOURCE_XML_FILE = Path("tests", "reference_files", "from_grasshopper_tests", "wufi_xml", "_arverne_d_no_win.xml")
-    wufi_xml_data = get_WUFI_XML_file_as_dict(SOURCE_XML_FILE)
+    wufi_xml_data = get_WUFI_XML_file_as_plain_dict(SOURCE_XML_FILE)
     wufi_xml_model = WUFIplusProject.model_validate(wufi_xml_data)
     phx_project = convert_WUFI_XML_to_PHX_project(wufi_xml_model)
 
@@ -85,7 +85,7 @@ def phx_project_from_wufi_xml_SCHOOL() -> PhxProject:
 
     _reset_phx_class_counters()
     SOURCE_XML_FILE = Path("tests", "reference_files", "from_grasshopper_tests", "wufi_xml", "School.xml")
-    wufi_xml_data = get_WUFI_XML_file_as_dict(SOURCE_XML_FILE)
+    wufi_xml_data = get_WUFI_XML_file_as_plain_dict(SOURCE_XML_FILE)
     wufi_xml_model = WUFIplusProject.model_validate(wufi_xml_data)
     phx_project = convert_WUFI_XML_to_PHX_project(wufi_xml_model)
 
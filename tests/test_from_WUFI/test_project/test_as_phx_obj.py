@@ -0,0 +1,29 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from PHX.from_WUFI_XML import phx_schemas
+
+
+def test_registry_holds_every_builder_by_schema_name():
+    assert phx_schemas._BUILDERS["PhxVertix"] is phx_schemas._PhxVertix
+    assert phx_schemas._BUILDERS["Trunc"] is phx_schemas._Trunc
+    assert "claim_object_identity" not in phx_schemas._BUILDERS
+    assert "get_compo_data_by_type" not in phx_schemas._BUILDERS
+
+
+def test_every_schema_name_used_in_the_module_is_registered():
+    source = Path(phx_schemas.__file__).read_text(encoding="utf-8")
+    # -- The literal names passed to 'as_phx_obj', and the values of its builder-name lookup dicts.
+    used = set(re.findall(r'as_phx_\w+\(\s*[^,()]+,\s*"(\w+)"', source))
+    used |= set(re.findall(r'_schema_name="(\w+)"', source))
+    used |= set(re.findall(r':\s*"((?:Phx|Wufi)\w+)",', source))
+
+    assert used
+    assert used <= phx_schemas._BUILDERS.keys()
+
+
+def test_unknown_schema_name_raises_a_clear_error():
+    with pytest.raises(phx_schemas.NoPhxBuilderFoundError, match=r'"PhxNotABuilder".*"_PhxNotABuilder"'):
+        phx_schemas.as_phx_obj(None, "PhxNotABuilder")
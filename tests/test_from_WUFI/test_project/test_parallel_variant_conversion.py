@@ -0,0 +1,66 @@
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
+from PHX.from_WUFI_XML.phx_variants import build_variant_geometries
+from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_plain_dict
+from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
+from PHX.model.identity import DuplicateIdentityError
+from PHX.to_WUFI_XML.xml_builder import generate_WUFI_XML_from_object
+
+REFERENCE_DIR = Path("tests", "reference_files", "from_grasshopper_tests", "wufi_xml")
+
+
+def _wufi_model(filename: str) -> WUFIplusProject:
+    return WUFIplusProject.model_validate(get_WUFI_XML_file_as_plain_dict(REFERENCE_DIR / filename))
+
+
+def _three_variant_model() -> WUFIplusProject:
+    """The single-Variant reference model, plus two copies of its Variant."""
+    source = _wufi_model("Multi_Room_Complete.xml")
+    for ident_nr in (2, 3):
+        variant = deepcopy(source.Variants[0])
+        variant.IdentNr = ident_nr
+        variant.Name = f"Variant {ident_nr}"
+        source.Variants.append(variant)
+    return source
+
+
+def test_single_worker_builds_geometry_in_line():
+    assert build_variant_geometries(_three_variant_model(), _max_workers=1) is None
+    assert build_variant_geometries(_wufi_model("Multi_Room_Complete.xml"), _max_workers=4) is None
+
+
+def test_parallel_conversion_matches_serial(reset_class_counters):
+    source = _three_variant_model()
+
+    serial = convert_WUFI_XML_to_PHX_project(source)
+    parallel = convert_WUFI_XML_to_PHX_project(source, _max_workers=2)
+
+    assert parallel._identity_allocator.snapshot() == serial._identity_allocator.snapshot()
+    assert generate_WUFI_XML_from_object(parallel) == generate_WUFI_XML_from_object(serial)
+
+
+def test_parallel_conversion_keeps_variant_order_and_identities(reset_class_counters):
+    source = _wufi_model("Non_Residential_Office.xml")
+
+    serial = convert_WUFI_XML_to_PHX_project(source)
+    parallel = convert_WUFI_XML_to_PHX_project(source, _max_workers=2)
+
+    assert [v.id_num for v in parallel.variants] == [v.id_num for v in serial.variants]
+    assert parallel._identity_allocator.snapshot() == serial._identity_allocator.snapshot()
+    for parallel_variant, serial_variant in zip(parallel.variants, serial.variants):
+        assert parallel_variant.graphics3D.vertices == serial_variant.graphics3D.vertices
+        assert [p.id_num for p in parallel_variant.graphics3D.polygons] == [
+            p.id_num for p in serial_variant.graphics3D.polygons
+        ]
+
+
+def test_parallel_conversion_reports_duplicate_variant_identity(reset_class_counters):
+    source = _three_variant_model()
+    source.Variants[2].IdentNr = 2
+
+    with pytest.raises(DuplicateIdentityError, match="project.variants"):
+        convert_WUFI_XML_to_PHX_project(source, _max_workers=2)
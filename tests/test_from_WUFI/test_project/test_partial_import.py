@@ -0,0 +1,86 @@
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from PHX.from_WUFI_XML.partial_import import (
+    SELECTABLE_SECTIONS,
+    WufiXmlSelection,
+    convert_WUFI_XML_file_selection_to_PHX_project,
+)
+from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
+from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_plain_dict
+from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
+from PHX.model.project import PhxPartialImport
+from PHX.to_WUFI_XML.xml_builder import generate_WUFI_XML_from_object
+
+SOURCE_XML_FILE = Path("tests", "reference_files", "from_grasshopper_tests", "wufi_xml", "Multi_Room_Complete.xml")
+
+
+def _write_variants_file(_path: Path, _ident_nrs: list[int]) -> Path:
+    """Write the single-Variant reference file, with a copy of its Variant for each IdentNr."""
+    root = etree.parse(str(SOURCE_XML_FILE)).getroot()
+    variants = root.find("Variants")
+    source_variant = variants[0]
+    variants.remove(source_variant)
+    for ident_nr in _ident_nrs:
+        variant = deepcopy(source_variant)
+        variant.find("IdentNr").text = str(ident_nr)
+        variant.find("Name").text = f"Variant {ident_nr}"
+        variants.append(variant)
+    variants.set("count", str(len(_ident_nrs)))
+    etree.ElementTree(root).write(str(_path), encoding="utf-8", xml_declaration=True)
+    return _path
+
+
+def _full_import(_path: Path):
+    return convert_WUFI_XML_to_PHX_project(WUFIplusProject.model_validate(get_WUFI_XML_file_as_plain_dict(_path)))
+
+
+@pytest.fixture
+def three_variants_file(tmp_path) -> Path:
+    return _write_variants_file(tmp_path / "three_variants.xml", [1, 2, 3])
+
+
+def test_selecting_everything_is_the_full_import(three_variants_file, reset_class_counters):
+    project = convert_WUFI_XML_file_selection_to_PHX_project(three_variants_file, WufiXmlSelection())
+
+    assert project.partial_import is None and not project.is_partial
+    assert generate_WUFI_XML_from_object(project) == generate_WUFI_XML_from_object(_full_import(three_variants_file))
+
+
+def test_one_variant_is_imported_as_if_it_were_alone_in_the_file(three_variants_file, tmp_path, reset_class_counters):
+    project = convert_WUFI_XML_file_selection_to_PHX_project(three_variants_file, WufiXmlSelection(variants=[1]))
+
+    assert [v.name for v in project.variants] == ["Variant 2"]
+    assert project.partial_import == PhxPartialImport(skipped_variants={0: "Variant 1", 2: "Variant 3"})
+    alone = _full_import(_write_variants_file(tmp_path / "one_variant.xml", [2]))
+    assert generate_WUFI_XML_from_object(project) == generate_WUFI_XML_from_object(alone)
+
+
+def test_sections_are_imported_without_the_variants(three_variants_file, reset_class_counters):
+    project = convert_WUFI_XML_file_selection_to_PHX_project(
+        three_variants_file, WufiXmlSelection(variants=[], sections=["Assemblies"])
+    )
+    full = _full_import(three_variants_file)
+
+    assert project.is_partial
+    assert project.partial_import.skipped_sections == tuple(s for s in SELECTABLE_SECTIONS if s != "Assemblies")
+    assert project.partial_import.skipped_variants == {0: "Variant 1", 1: "Variant 2", 2: "Variant 3"}
+    assert project.variants == [] and project.window_types == {} and project.shade_types == {}
+    assert sorted(project.assembly_types) == sorted(full.assembly_types)
+    assert project.project_data.project_date == full.project_data.project_date
+
+
+def test_loaded_variants_keep_the_sections_they_refer_to():
+    assert WufiXmlSelection(variants=[0], sections=[]).skipped_sections == ()
+    assert WufiXmlSelection(sections=[]).skipped_sections == ()
+    assert WufiXmlSelection(variants=[], sections=[]).skipped_sections == SELECTABLE_SECTIONS
+
+
+def test_unknown_section_or_variant_is_an_error(three_variants_file):
+    with pytest.raises(ValueError, match="Unknown WUFI-XML section"):
+        WufiXmlSelection(sections=["Climate"])
+    with pytest.raises(ValueError, match="the file has 3 Variant"):
+        convert_WUFI_XML_file_selection_to_PHX_project(three_variants_file, WufiXmlSelection(variants=[3]))
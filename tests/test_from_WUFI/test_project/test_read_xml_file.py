@@ -1,8 +1,18 @@
 import pathlib
 
+import pytest
+from lxml import etree
+
 from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
-from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_dict
-from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
+from PHX.from_WUFI_XML.read_WUFI_XML_file import (
+    Tag,
+    get_WUFI_XML_file_as_dict,
+    get_WUFI_XML_file_as_plain_dict,
+    parse_WUFI_XML_file,
+    xml_to_dict,
+    xml_to_plain_dict,
+)
+from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject, unpack_xml_tag
 from PHX.model.project import PhxProject
 
 
@@ -42,3 +52,83 @@ def test_read_xml_and_convert_to_phx_project(reset_class_counters) -> None:
     phx_project = convert_WUFI_XML_to_PHX_project(wufi_xml_model)
 
     assert isinstance(phx_project, PhxProject)
+
+
+def _parse_in_text_chunks(_file_address: pathlib.Path) -> etree._Element:
+    """The original parse: the file decoded as UTF-8, fed to a pull-parser 1,024 characters at a time."""
+    parser = etree.XMLPullParser(recover=True, encoding="utf-8")
+    with open(_file_address, encoding="utf-8") as xml_file:
+        while True:
+            chunk = xml_file.read(1024)
+            if not chunk:
+                break
+            parser.feed(chunk)
+    return parser.close()
+
+
+REFERENCE_FILES = sorted(pathlib.Path("tests", "reference_files", "from_grasshopper_tests", "wufi_xml").glob("*.xml"))
+
+
+@pytest.mark.parametrize("source_file", REFERENCE_FILES, ids=lambda _: _.name)
+def test_block_parse_matches_the_text_chunk_parse(source_file) -> None:
+    expected = _parse_in_text_chunks(source_file)
+    root = parse_WUFI_XML_file(source_file, _block_size=4096)
+
+    assert etree.tostring(root) == etree.tostring(expected)
+    assert repr(xml_to_dict(root)) == repr(xml_to_dict(expected))
+
+
+@pytest.mark.parametrize(
+    "xml_bytes",
+    [
+        b'<?xml version="1.0" encoding="UTF-8"?>\r\n<A>\r\n<B x="1\r\n2">t\r\nu</B>\r</A>\r\n',
+        b'\xef\xbb\xbf<?xml version="1.0"?><A><B>\xc3\xbc</B></A>',
+        b"<A><B>1</B><C><D>2</D>",
+        b"<A><B>a & b</B><C>&nbsp;x</C></A>",
+        b"<A><B>1<C>2</B></A>",
+    ],
+    ids=["crlf", "bom", "truncated", "bad-entities", "unclosed"],
+)
+def test_block_parse_recovers_as_before(tmp_path, xml_bytes) -> None:
+    source_file = tmp_path / "model.xml"
+    source_file.write_bytes(xml_bytes)
+
+    expected = etree.tostring(_parse_in_text_chunks(source_file))
+    assert etree.tostring(parse_WUFI_XML_file(source_file, _block_size=3)) == expected
+
+
+def _unpacked(_value):
+    """The Tag-dict value, with every Tag unpacked as the WufiBaseModel validator would."""
+    if isinstance(_value, dict):
+        return {k: _unpacked(v) for k, v in _value.items()}
+    if isinstance(_value, list):
+        return [_unpacked(v) for v in _value]
+    return unpack_xml_tag(_value) if isinstance(_value, Tag) else _value
+
+
+@pytest.mark.parametrize("source_file", REFERENCE_FILES, ids=lambda _: _.name)
+def test_plain_dict_gives_the_same_models(source_file) -> None:
+    plain = get_WUFI_XML_file_as_plain_dict(source_file)
+    tag_dict = get_WUFI_XML_file_as_dict(source_file)
+
+    assert plain == _unpacked(tag_dict)
+    assert WUFIplusProject.model_validate(plain) == WUFIplusProject.model_validate(tag_dict)
+
+
+def test_plain_dict_leaves_and_parent_units() -> None:
+    root = etree.fromstring(
+        b"<Root><Name>A</Name><Empty count='0'/><Missing>None</Missing><Area unit='ft2'>10</Area>"
+        b"<Temps count='2' unit='F'><Item>50</Item><Item unit='C'>10</Item></Temps>"
+        b"<Rooms count='1'><Room><Name>R1</Name></Room></Rooms></Root>"
+    )
+    expected = {
+        "Name": "A",
+        "Empty": [],
+        "Missing": None,
+        "Area": {"value": "10", "unit_type": "ft2"},
+        "Temps": [{"Item": {"value": "50", "unit_type": "F"}}, {"Item": {"value": "10", "unit_type": "F"}}],
+        "Rooms": [{"Name": "R1"}],
+    }
+    assert xml_to_plain_dict(root) == expected
+    assert xml_to_plain_dict(root, _release=True) == expected
+    assert all(len(child) == 0 for child in root)
@@ -15,7 +15,9 @@ from pathlib import Path
 
 import pytest
 
+from PHX.from_WUFI_XML import wufi_file_schema as wufi_xml
 from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
+from PHX.from_WUFI_XML.phx_schemas import _join_space_lists
 from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_dict
 from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
 from PHX.model.project import PhxProject
@@ -108,3 +110,27 @@ def test_unreconciled_lists_are_reported(reset_class_counters, caplog) -> None:
     assert "do not pair 1:1 by name" in message
     for unpaired_name in ("'a'", "'b'", "'Office'", "'Workshop'"):
         assert unpaired_name in message
+
+
+def test_join_pairs_in_list_order_and_keeps_the_left_overs(reset_class_counters) -> None:
+    rooms = [PhxSpace(display_name=n) for n in ("a", " b ", "a", "c")]
+    persons = [wufi_xml.WufiLoadPerson.model_construct(Name=n) for n in ("b", "a", "d", "a", "a")]
+    lighting = [wufi_xml.WufiLoadsLighting.model_construct(Name=n) for n in ("c", "a", "x", "a")]
+
+    join = _join_space_lists(rooms, persons, lighting)
+
+    # -- Compare by identity: same-named records are equal, but must pair in list order.
+    assert [tuple(map(id, row)) for row in join.rows] == [
+        tuple(map(id, row))
+        for row in [
+            (rooms[1], persons[0], None),
+            (rooms[0], persons[1], lighting[1]),
+            (None, persons[2], None),
+            (rooms[2], persons[3], lighting[3]),
+            (None, persons[4], None),
+            (rooms[3], None, lighting[0]),
+        ]
+    ]
+    assert join.unpaired_rooms == ["c"]
+    assert join.unpaired_persons == ["d", "a"]
+    assert [d.Name for queue in join.unused_lighting.values() for d in queue] == ["x"]
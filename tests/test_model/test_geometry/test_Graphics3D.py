@@ -1,3 +1,5 @@
+import copy
+
 from PHX.model import geometry
 
 
@@ -31,3 +33,38 @@ def test_add_two_polygon(reset_class_counters, polygon_1x1x0, polygon_2x2x0):
         assert v in g3d.vertices
     for v in polygon_2x2x0.vertices:
         assert v in g3d.vertices
+
+
+def _set_based_vertices(_g3d: geometry.PhxGraphics3D) -> list[geometry.PhxVertix]:
+    """The original de-duplication: a set of every polygon vertex, sorted by id_num."""
+    return sorted({v for p in _g3d.polygons for v in p.vertices}, key=lambda _: _.id_num)
+
+
+def test_vertex_table_shares_vertices_between_polygons(reset_class_counters, polygon_1x1x0, polygon_2x2x0):
+    polygon_2x2x0._vertices[0] = polygon_1x1x0.vertices[2]
+    g3d = geometry.PhxGraphics3D([polygon_2x2x0, polygon_1x1x0])
+
+    table = g3d.vertex_table()
+    assert table.vertices == _set_based_vertices(g3d)
+    assert [v.id_num for v in table.vertices] == sorted({v.id_num for p in g3d.polygons for v in p.vertices})
+    assert list(table.iter_polygon_vertices()) == [polygon_2x2x0.vertices, polygon_1x1x0.vertices]
+    assert table.polygon_vertices(1) == polygon_1x1x0.vertices
+
+
+def test_vertex_table_copies_with_the_same_id_are_merged_as_in_a_set(reset_class_counters, polygon_1x1x0):
+    copied = copy.copy(polygon_1x1x0.vertices[0])
+    polygon_1x1x0._vertices.append(copied)
+    g3d = geometry.PhxGraphics3D([polygon_1x1x0])
+
+    assert [id(v) for v in g3d.vertices] == [id(v) for v in _set_based_vertices(g3d)]
+    assert all(v is not copied for v in g3d.vertices)
+
+
+def test_vertex_table_different_vertices_with_the_same_id_are_all_kept(reset_class_counters, polygon_1x1x0):
+    moved = copy.copy(polygon_1x1x0.vertices[0])
+    moved.x += 10.0
+    polygon_1x1x0._vertices.append(moved)
+    g3d = geometry.PhxGraphics3D([polygon_1x1x0])
+
+    assert [id(v) for v in g3d.vertices] == [id(v) for v in _set_based_vertices(g3d)]
+    assert len(g3d.vertices) == 5
@@ -3,7 +3,12 @@ from ph_units.converter import convert
 
 from PHX.model.enums.hvac import PhxHotWaterPipingInchDiameterType
 from PHX.model.geometry import PhxLineSegment, PhxVertix
-from PHX.model.hvac.piping import PhxHotWaterPipingMaterial, PhxPipeSegment
+from PHX.model.hvac.piping import (
+    PhxHotWaterPipingMaterial,
+    PhxPipeSegment,
+    clear_pipe_heat_loss_cache,
+    solve_pipe_heat_loss_coefficients,
+)
 
 
 def test_PhxPipeSegment_to_wufi_diameter_type():
@@ -64,3 +69,79 @@ def test_PhxPipeSegment_heat_loss_coefficient_2():
 
     k2 = seg._solve_for_pipe_heat_loss_coeff()
     assert k2 == pytest.approx(0.21003911131648087)
+
+
+def _make_segment(**kwargs) -> PhxPipeSegment:
+    attrs = {
+        "identifier": "test",
+        "display_name": "test",
+        "geometry": PhxLineSegment(PhxVertix(0, 0, 0), PhxVertix(0, 0, 1)),
+        "pipe_material": PhxHotWaterPipingMaterial.COPPER_K,
+        "diameter_m": 0.0254,
+        "insulation_thickness_m": 0.0254,
+        "insulation_conductivity": 0.04,
+        "insulation_reflective": True,
+        "insulation_quality": None,
+        "daily_period": 24,
+    }
+    attrs.update(kwargs)
+    return PhxPipeSegment(**attrs)
+
+
+def test_PhxPipeSegment_heat_loss_coefficient_is_memoized(monkeypatch):
+    clear_pipe_heat_loss_cache()
+    seg_a = _make_segment(identifier="a")
+    seg_b = _make_segment(identifier="b", geometry=PhxLineSegment(PhxVertix(0, 0, 0), PhxVertix(0, 0, 5)))
+    assert seg_a.pipe_heat_loss_coefficient == pytest.approx(0.18920200481210636)
+
+    # -- Same pipe type: served from the memo, not re-solved
+    monkeypatch.setattr(PhxPipeSegment, "_solve_for_pipe_heat_loss_coeff", lambda self: pytest.fail("re-solved"))
+    assert seg_b.pipe_heat_loss_coefficient == seg_a.pipe_heat_loss_coefficient
+
+
+def test_PhxPipeSegment_heat_loss_coefficient_follows_changed_insulation():
+    clear_pipe_heat_loss_cache()
+    seg = _make_segment()
+    assert seg.pipe_heat_loss_coefficient == pytest.approx(0.18920200481210636)
+
+    seg.insulation_reflective = False
+    assert seg.pipe_heat_loss_coefficient == pytest.approx(0.21003911131648087)
+
+
+def test_solve_pipe_heat_loss_coefficients_matches_each_segment():
+    segments = [
+        _make_segment(diameter_m=d, insulation_thickness_m=t, insulation_reflective=r)
+        for d in (0.0127, 0.0254)
+        for t in (0.0127, 0.0254)
+        for r in (True, False)
+    ] * 3
+    clear_pipe_heat_loss_cache()
+    batch = solve_pipe_heat_loss_coefficients(segments)
+    assert batch == [s._solve_for_pipe_heat_loss_coeff() for s in segments]
+
+
+def _linear_reverse_solve(seg: PhxPipeSegment, target: float, start: float) -> float:
+    """The original step-by-step search, as a reference."""
+    conductivity = start
+    while abs(seg._reverse_solve_heat_loss_coeff(conductivity) - target) >= 0.01:
+        conductivity -= 0.001
+    return conductivity
+
+
+@pytest.mark.parametrize("target", [0.0, 0.05, 0.123, 0.2, 0.3, 0.39])
+def test_reverse_solve_for_insulation_conductivity_matches_linear_search(target):
+    seg = PhxPipeSegment.from_length("Recirculation Pipe", 3.0, PhxHotWaterPipingMaterial.COPPER_K, 0.0254)
+    seg.insulation_thickness_m = 0.0254
+    seg.insulation_conductivity = 0.04
+
+    conductivity = seg.reverse_solve_for_insulation_conductivity(target, 0.1)
+    assert conductivity == _linear_reverse_solve(seg, target, 0.1)
+
+
+def test_reverse_solve_for_insulation_conductivity_unreachable_target():
+    seg = PhxPipeSegment.from_length("Recirculation Pipe", 3.0, PhxHotWaterPipingMaterial.COPPER_K, 0.0254)
+    seg.insulation_thickness_m = 0.0254
+    seg.insulation_conductivity = 0.04
+
+    with pytest.raises(ValueError, match="heat-loss-coefficient of 0.6"):
+        seg.reverse_solve_for_insulation_conductivity(0.6, 0.1)
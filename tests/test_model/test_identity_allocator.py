@@ -2,6 +2,7 @@ import pytest
 
 from PHX.model.identity import (
     DuplicateIdentityError,
+    IdentityAllocationError,
     IdentityAllocator,
     allocate_identity,
     current_identity_allocator,
@@ -81,3 +82,28 @@ def test_allocator_snapshot_is_sorted_and_diagnostic_only():
     allocator.next_id("a")
 
     assert allocator.snapshot() == {"a": (1,), "z": (4,)}
+
+
+def test_absorb_takes_over_disjoint_namespaces():
+    allocator = IdentityAllocator()
+    allocator.next_id("materials")
+    other = IdentityAllocator()
+    other.claim_id(("variant-1", "vertices"), 3, source="vertex[3]")
+    other.next_id(("variant-1", "vertices"))
+
+    allocator.absorb(other)
+
+    assert allocator.snapshot() == {"materials": (1,), ("variant-1", "vertices"): (1, 3)}
+    assert allocator.next_id(("variant-1", "vertices")) == 2
+    with pytest.raises(DuplicateIdentityError, match=r"vertex\[3\]"):
+        allocator.claim_id(("variant-1", "vertices"), 3, source="vertex[3] again")
+
+
+def test_absorb_rejects_namespaces_already_in_use():
+    allocator = IdentityAllocator()
+    allocator.next_id("materials")
+    other = IdentityAllocator()
+    other.next_id("materials")
+
+    with pytest.raises(IdentityAllocationError, match="materials"):
+        allocator.absorb(other)
@@ -1,6 +1,7 @@
 import pytest
 
 from PHX.hbjson_to_phpp import write_phx_project_to_phpp
+from PHX.model import identity_validation
 from PHX.model.building import PhxZone
 from PHX.model.components import PhxComponentOpaque
 from PHX.model.constructions import PhxConstructionOpaque
@@ -12,6 +13,7 @@ from PHX.model.identity import IdentityNamespaces
 from PHX.model.identity_validation import (
     IdentityValidationError,
     IdentityValidationTarget,
+    clear_identity_validation_cache,
     validate_project_identities,
 )
 from PHX.model.project import PhxProject, PhxVariant
@@ -143,6 +145,154 @@ def test_geometry_and_schedule_references_report_the_consumed_namespace():
     }
 
 
+def _issues(project: PhxProject, target: IdentityValidationTarget, max_workers: int | None = 1) -> tuple:
+    try:
+        validate_project_identities(project, target, max_workers)
+    except IdentityValidationError as e:
+        return e.issues
+    return ()
+
+
+@pytest.mark.parametrize(
+    "targets",
+    [
+        list(IdentityValidationTarget),
+        [IdentityValidationTarget.PHPP, IdentityValidationTarget.WUFI, IdentityValidationTarget.PHPP],
+    ],
+)
+def test_cached_issues_match_a_fresh_validation_for_every_target(targets):
+    project = _invalid_project()
+    first_zone, second_zone = PhxZone(), PhxZone()
+    second_zone.id_num = first_zone.id_num
+    project.variants[0].building.add_zones((first_zone, second_zone))
+    fresh = {}
+    for target in targets:
+        clear_identity_validation_cache(project)
+        fresh[target] = _issues(project, target)
+    clear_identity_validation_cache(project)
+
+    for target in targets + targets:
+        assert _issues(project, target) == fresh[target]
+    assert fresh[IdentityValidationTarget.PHPP] != fresh[IdentityValidationTarget.WUFI]
+
+
+def test_unchanged_variants_are_walked_once_for_all_targets(monkeypatch):
+    walks = []
+
+    def _counting_walk(variant, variant_index, fingerprint, full):
+        walks.append(variant_index)
+        return walk_variant(variant, variant_index, fingerprint, full)
+
+    walk_variant = identity_validation._walk_variant
+    monkeypatch.setattr(identity_validation, "_walk_variant", _counting_walk)
+    project = PhxProject()
+    for _ in range(3):
+        variant = PhxVariant()
+        variant.building.add_component(PhxComponentOpaque())
+        project.add_new_variant(variant)
+
+    # -- The first validation is the plain walk, the second one walks again to fingerprint the variants.
+    for target in (IdentityValidationTarget.WUFI, IdentityValidationTarget.METR, IdentityValidationTarget.PHPP):
+        validate_project_identities(project, target)
+        validate_project_identities(project, target)
+    assert walks == [0, 1, 2, 0, 1, 2]
+
+    project.variants[1].building.add_component(PhxComponentOpaque())
+    validate_project_identities(project, IdentityValidationTarget.WUFI)
+    assert walks == [0, 1, 2, 0, 1, 2, 1]
+
+
+def test_a_first_validation_does_not_fingerprint_the_variants(monkeypatch):
+    def _fingerprint(variant):
+        raise AssertionError("A first validation should not fingerprint the variants.")
+
+    monkeypatch.setattr(identity_validation, "_variant_fingerprint", _fingerprint)
+    project = PhxProject()
+    project.add_new_variant(PhxVariant())
+    validate_project_identities(project, IdentityValidationTarget.PHPP)
+
+
+def test_cached_validation_picks_up_edits_to_identities_and_references():
+    project = PhxProject()
+    assembly = PhxConstructionOpaque()
+    project.assembly_types["assembly"] = assembly
+    variant = PhxVariant()
+    first_component, second_component = PhxComponentOpaque(), PhxComponentOpaque()
+    first_component.set_assembly_type(assembly)
+    variant.building.add_components((first_component, second_component))
+    project.add_new_variant(variant)
+    # -- Validate twice, so the edits are found by the variant's fingerprint.
+    validate_project_identities(project, IdentityValidationTarget.WUFI)
+    validate_project_identities(project, IdentityValidationTarget.WUFI)
+
+    first_component.assembly_type_id_num = assembly.id_num + 1
+    assert {i.kind for i in _issues(project, IdentityValidationTarget.WUFI)} == {"dangling-reference"}
+    first_component.assembly_type_id_num = assembly.id_num
+    validate_project_identities(project, IdentityValidationTarget.WUFI)
+
+    collection = variant.default_mech_collection
+    first_trunk, second_trunk = PhxPipeTrunk(identifier="first"), PhxPipeTrunk(identifier="second")
+    collection.add_distribution_piping(first_trunk)
+    validate_project_identities(project, IdentityValidationTarget.WUFI)
+    second_trunk.id_num = first_trunk.id_num
+    collection.add_distribution_piping(second_trunk)
+    assert {i.kind for i in _issues(project, IdentityValidationTarget.WUFI)} == {"duplicate"}
+    second_trunk.id_num = first_trunk.id_num + 1
+    validate_project_identities(project, IdentityValidationTarget.WUFI)
+    second_trunk.pipe_element.id_num = first_trunk.pipe_element.id_num
+    assert {i.kind for i in _issues(project, IdentityValidationTarget.WUFI)} == {"duplicate"}
+    collection._distribution_piping_trunks.pop(second_trunk.identifier)
+    validate_project_identities(project, IdentityValidationTarget.WUFI)
+
+    second_component._id_num = first_component.id_num
+    assert {i.kind for i in _issues(project, IdentityValidationTarget.PHPP)} == {"duplicate"}
+    project.variants.pop()
+    validate_project_identities(project, IdentityValidationTarget.PHPP)
+
+
+def test_vertices_sharing_an_id_are_re_checked_when_they_move():
+    project = PhxProject()
+    variant = PhxVariant()
+    component = PhxComponentOpaque()
+    plane = PhxPlane(PhxVector(0, 0, 1), PhxVertix(), PhxVector(1, 0, 0), PhxVector(0, 1, 0))
+    first_vertex, second_vertex = PhxVertix(1, 1, 0), PhxVertix(1, 1, 0)
+    second_vertex.id_num = first_vertex.id_num
+    for vertex in (first_vertex, second_vertex):
+        polygon = PhxPolygon("polygon", 1.0, PhxVertix(), PhxVector(0, 0, 1), plane)
+        polygon.add_vertix(vertex)
+        component.add_polygons(polygon)
+    variant.building.add_component(component)
+    project.add_new_variant(variant)
+    validate_project_identities(project, IdentityValidationTarget.WUFI)
+    validate_project_identities(project, IdentityValidationTarget.WUFI)
+
+    second_vertex.x = 2.0
+    issues = _issues(project, IdentityValidationTarget.WUFI)
+    assert [(i.namespace, i.kind) for i in issues] == [(("variants[0]", IdentityNamespaces.VERTICES), "duplicate")]
+
+
+def test_variants_walked_in_worker_processes_give_the_serial_issues():
+    project = _invalid_project()
+    for variant_index in range(3):
+        variant = PhxVariant()
+        first_component, second_component = PhxComponentOpaque(), PhxComponentOpaque()
+        second_component._id_num = first_component.id_num
+        first_component.assembly_type_id_num = 1_000 + variant_index
+        variant.building.add_components((first_component, second_component))
+        first_zone, second_zone = PhxZone(), PhxZone()
+        second_zone.id_num = first_zone.id_num
+        variant.building.add_zones((first_zone, second_zone))
+        project.add_new_variant(variant)
+
+    for target in IdentityValidationTarget:
+        clear_identity_validation_cache(project)
+        serial = _issues(project, target)
+        clear_identity_validation_cache(project)
+        assert _issues(project, target, max_workers=2) == serial
+        assert _issues(project, target, max_workers=2) == serial
+    assert {issue.path.split(".")[0] for issue in serial} >= {f"variants[{i}]" for i in range(4)}
+
+
 @pytest.mark.parametrize("exporter", [generate_WUFI_XML_from_object, generate_metr_json_dict])
 def test_serializing_exporters_validate_before_conversion(exporter):
     with pytest.raises(IdentityValidationError):
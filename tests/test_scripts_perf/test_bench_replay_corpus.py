@@ -0,0 +1,43 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the replay-corpus benchmark helpers (offline, against the replay fake)."""
+
+import json
+
+import bench_replay_corpus
+
+
+def _fixture() -> dict:
+    return json.loads(bench_replay_corpus.REPLAY_FIXTURE.read_text())
+
+
+def test_grow_fixture_capacity_shifts_end_markers_and_adds_surface_ids():
+    fixture = _fixture()
+    grown = bench_replay_corpus.grow_fixture_capacity(fixture, 50)
+
+    areas = grown["epoch_deltas"][0]["Areas"]
+    assert areas["K140"] == 100.0
+    assert areas["K141"] == 101
+    assert areas["K190"] == 150
+    assert areas["K191"] == "Aend"
+    assert "Unhide additional rows" in grown["epoch_deltas"][0]["Windows"]["L227"]
+
+    # -- The source fixture is left alone
+    assert fixture["epoch_deltas"][0]["Areas"]["K141"] == "Aend"
+
+
+def test_modelled_latency_uses_per_op_costs():
+    costs = {"fast": {"read_cell": 1.0, "write_cell": 2.0, "end_call": 10.0}}
+    by_op = {"range.value.get": 100, "range.raw_value.set": 100, "range.end": 10, "sheet.name.get": 5}
+    assert bench_replay_corpus.modelled_latency_s(by_op, costs) == {"fast": round((100 + 200 + 100 + 10) / 1000, 3)}
+
+
+def test_run_size_records_events_and_resources(reset_class_counters):
+    _, costs = bench_replay_corpus.load_op_costs()
+    row = bench_replay_corpus.run_size(1, _fixture(), costs)
+
+    assert "skipped" not in row
+    assert row["windows"] == 4
+    assert row["interop_events"] >= row["facade_round_trips"] > 0
+    assert row["peak_mem_mb"] > 0
+    assert set(row["modelled_latency_s"]) >= {"xlwings", "xlwings-raw"}
@@ -0,0 +1,53 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the synthetic large-model generator and the scaling-benchmark fit."""
+
+import bench_scaling
+import synthetic_models
+
+from PHX.from_HBJSON import create_project
+
+
+def test_model_has_the_requested_size():
+    spec = synthetic_models.SyntheticModelSpec(
+        segments=2,
+        rooms_per_segment=3,
+        apertures_per_face=2,
+        dhw_branches=3,
+        dhw_twigs_per_branch=2,
+        ervs_per_segment=2,
+    )
+    hb_model = synthetic_models.build_hb_model(spec)
+
+    assert len(hb_model.rooms) == 6
+    assert len(hb_model.apertures) == 6 * 4 * 2
+    assert len(hb_model.orphaned_shades) == 6 * 4
+
+    phx_project = create_project.convert_hb_model_to_PhxProject(hb_model, _group_components=True)
+    assert len(phx_project.variants) == 2
+    for variant in phx_project.variants:
+        mech = variant.default_mech_collection
+        assert len(variant.building.zones[0].spaces) == 3
+        assert len(mech.ventilation_devices) == 2
+        assert len(mech.dhw_distribution_trunks) == 1
+        trunk = mech.dhw_distribution_trunks[0]
+        assert len(trunk.branches) == 3
+        assert all(len(branch.fixtures) == 2 for branch in trunk.branches)
+
+
+def test_same_seed_gives_the_same_wufi_xml():
+    spec = synthetic_models.SyntheticModelSpec(rooms_per_segment=2, seed=7)
+    assert synthetic_models.build_wufi_xml(spec) == synthetic_models.build_wufi_xml(spec)
+
+
+def test_different_seed_gives_a_different_model():
+    model_a = synthetic_models.build_hb_model(synthetic_models.SyntheticModelSpec(seed=1))
+    model_b = synthetic_models.build_hb_model(synthetic_models.SyntheticModelSpec(seed=2))
+    assert model_a.rooms[0].volume != model_b.rooms[0].volume
+
+
+def test_fit_exponent():
+    sizes = [10, 20, 40, 80]
+    assert bench_scaling.fit_exponent(sizes, [0.001 * n for n in sizes]) == 1.0
+    assert bench_scaling.fit_exponent(sizes, [0.001 * n**2 for n in sizes]) == 2.0
+    assert bench_scaling.fit_exponent([10], [1.0]) is None
@@ -0,0 +1,158 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for saving and loading PHX project snapshots (PHX.snapshot)."""
+
+import json
+import pathlib
+import pickle
+import zlib
+
+import pytest
+
+from PHX import snapshot
+from PHX.from_HBJSON import create_project, read_HBJSON_file
+from PHX.from_WUFI_XML.phx_converter import convert_WUFI_XML_to_PHX_project
+from PHX.from_WUFI_XML.read_WUFI_XML_file import get_WUFI_XML_file_as_plain_dict
+from PHX.from_WUFI_XML.wufi_file_schema import WUFIplusProject
+from PHX.hbjson_to_phpp import write_phx_project_to_phpp
+from PHX.model.components import PhxComponentOpaque
+from PHX.model.identity import IdentityNamespaces, allocate_identity
+from PHX.model.project import PhxProject, PhxVariant
+from PHX.PHPP import phpp_app
+from PHX.to_METr_JSON.metr_builder import generate_metr_json_dict
+from PHX.to_PPP import ppp_builder
+from PHX.to_WUFI_XML.xml_builder import generate_WUFI_XML_from_object
+from PHX.xl.xl_app import XLConnection
+from tests.test_xl_replay.fake_xl_framework import FakeXLFramework
+
+REFERENCE_DIR = pathlib.Path("tests", "reference_files", "from_grasshopper_tests")
+REPLAY_FIXTURES_DIR = pathlib.Path("tests", "test_xl_replay", "fixtures")
+
+
+def _hbjson_project(_file_address: pathlib.Path) -> PhxProject:
+    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(read_HBJSON_file.read_hb_json_from_file(_file_address))
+    return create_project.convert_hb_model_to_PhxProject(hb_model, _group_components=True)
+
+
+def _wufi_xml_project(_file_address: pathlib.Path) -> PhxProject:
+    return convert_WUFI_XML_to_PHX_project(
+        WUFIplusProject.model_validate(get_WUFI_XML_file_as_plain_dict(_file_address))
+    )
+
+
+def _reloaded(_project: PhxProject) -> PhxProject:
+    return snapshot.load_project_snapshot(snapshot.dump_project_snapshot(_project))
+
+
+@pytest.fixture(autouse=True)
+def fixed_timestamp(monkeypatch):
+    monkeypatch.setattr(ppp_builder, "ppp_timestamp", lambda: "2026-01-01 00:00:00")
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda: _hbjson_project(REFERENCE_DIR / "hbjson" / "Multi_Room_Complete.hbjson"),
+        lambda: _hbjson_project(REFERENCE_DIR / "hbjson" / "Non_Residential_Office.hbjson"),
+        lambda: _wufi_xml_project(REFERENCE_DIR / "wufi_xml" / "Multi_Room_Complete.xml"),
+        lambda: _wufi_xml_project(REFERENCE_DIR / "wufi_xml" / "School.xml"),
+    ],
+    ids=["hbjson-multi-room", "hbjson-office", "wufi-xml-multi-room", "wufi-xml-school"],
+)
+def test_file_writers_give_the_same_output_from_a_reloaded_snapshot(build) -> None:
+    project = build()
+    reloaded = _reloaded(project)
+
+    assert generate_WUFI_XML_from_object(reloaded) == generate_WUFI_XML_from_object(project)
+    assert generate_metr_json_dict(reloaded) == generate_metr_json_dict(project)
+    for i in range(len(project.variants)):
+        assert str(ppp_builder.build_ppp_file(reloaded, i)) == str(ppp_builder.build_ppp_file(project, i))
+
+
+def test_phpp_writer_gives_the_same_cells_from_a_reloaded_snapshot() -> None:
+    fixture = json.loads((REPLAY_FIXTURES_DIR / "single_zone_replay.json").read_text())
+    project = _hbjson_project(REPLAY_FIXTURES_DIR / "Single_Zone.hbjson")
+    reloaded = _reloaded(project)
+
+    written = []
+    for phx_project in (project, reloaded):
+        fake_xl = FakeXLFramework(
+            sheet_names=fixture["sheet_names"], seed=fixture["seed"], epoch_deltas=fixture["epoch_deltas"]
+        )
+        connection = XLConnection(xl_framework=fake_xl)
+        with connection.in_silent_mode():
+            connection.unprotect_all_sheets()
+            write_phx_project_to_phpp(phpp_app.PHPPConnection(connection), phx_project)
+        written.append(fake_xl.written_state())
+
+    assert written[0] and written[1] == written[0]
+
+
+def test_reloaded_project_keeps_shared_references_and_identities() -> None:
+    project = _hbjson_project(REFERENCE_DIR / "hbjson" / "Multi_Room_Complete.hbjson")
+    reloaded = _reloaded(project)
+
+    def _shared_assemblies(_project: PhxProject) -> list[bool]:
+        assemblies = {id(assembly) for assembly in _project.assembly_types.values()}
+        components = _project.variants[0].building.all_components
+        return [id(c.assembly) in assemblies for c in components if isinstance(c, PhxComponentOpaque)]
+
+    assert any(_shared_assemblies(reloaded))
+    assert _shared_assemblies(reloaded) == _shared_assemblies(project)
+    assert [c.id_num for c in reloaded.variants[0].building.all_components] == [
+        c.id_num for c in project.variants[0].building.all_components
+    ]
+    assert reloaded._identity_allocator.snapshot() == project._identity_allocator.snapshot()
+
+    # -- New objects in the reloaded project continue its identities, in the variant's own namespaces.
+    new_ids = []
+    for phx_project in (project, reloaded):
+        with phx_project.identity_scope(phx_project.variants[0].id_num):
+            new_ids.append(allocate_identity(IdentityNamespaces.COMPONENTS, PhxComponentOpaque))
+        with phx_project.identity_scope():
+            new_ids.append(PhxVariant().id_num)
+    assert new_ids[:2] == new_ids[2:]
+
+
+def test_snapshot_header_describes_the_project(tmp_path) -> None:
+    project = _hbjson_project(REFERENCE_DIR / "hbjson" / "Multi_Room_Complete.hbjson")
+    path = snapshot.write_project_snapshot(project, tmp_path / "cache" / "model.phxsnap")
+    header = snapshot.read_snapshot_header(path.read_bytes())
+
+    assert header.format_version == snapshot.SNAPSHOT_FORMAT_VERSION
+    assert header.phx_version == snapshot.phx_version()
+    assert header.num_variants == len(project.variants)
+    assert header.num_components == len(project.variants[0].building.all_components)
+    assert generate_metr_json_dict(snapshot.read_project_snapshot(path)) == generate_metr_json_dict(project)
+
+
+def _with_payload(_data: bytes, _payload: bytes) -> bytes:
+    """Return the snapshot with its payload replaced (and the header updated to match)."""
+    header = snapshot.read_snapshot_header(_data).__dict__ | {
+        "payload_size": len(_payload),
+        "payload_crc32": zlib.crc32(_payload),
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    return snapshot._MAGIC + snapshot._HEADER_LENGTH.pack(len(header_bytes)) + header_bytes + _payload
+
+
+def test_loading_rejects_other_data_and_versions(monkeypatch) -> None:
+    data = snapshot.dump_project_snapshot(PhxProject())
+
+    with pytest.raises(snapshot.SnapshotError, match="not a PHX snapshot"):
+        snapshot.load_project_snapshot(b"<WUFIplusProject/>")
+    with pytest.raises(snapshot.SnapshotError, match="damaged"):
+        snapshot.load_project_snapshot(data[:-1])
+    with pytest.raises(snapshot.SnapshotError, match="not a PHX class"):
+        snapshot.load_project_snapshot(_with_payload(data, zlib.compress(pickle.dumps(print))))
+    with pytest.raises(snapshot.SnapshotError, match="not a PhxProject"):
+        snapshot.load_project_snapshot(_with_payload(data, zlib.compress(pickle.dumps(PhxVariant()))))
+    # -- A renamed PHX class, and a moved PHX module (the GLOBAL opcode, then STOP)
+    with pytest.raises(snapshot.SnapshotError, match="AttributeError"):
+        snapshot.load_project_snapshot(_with_payload(data, zlib.compress(b"cPHX.model.project\nPhxRenamed\n.")))
+    with pytest.raises(snapshot.SnapshotError, match="ModuleNotFoundError"):
+        snapshot.load_project_snapshot(_with_payload(data, zlib.compress(b"cPHX.model.moved\nPhxProject\n.")))
+
+    monkeypatch.setattr(snapshot, "phx_version", lambda: "0.0.1")
+    with pytest.raises(snapshot.SnapshotError, match="Convert the model again"):
+        snapshot.load_project_snapshot(data)
@@ -2,8 +2,31 @@
 
 """Focused tests for PHX.to_METr_JSON.metr_schemas."""
 
+import json
+
+import pytest
+
+from PHX.from_HBJSON import create_project, read_HBJSON_file
 from PHX.model.constructions import PhxConstructionWindow, PhxWindowFrameElement
-from PHX.to_METr_JSON.metr_schemas import _PhxConstructionWindow
+from PHX.model.enums.building import ComponentExposureExterior, ComponentFaceType
+from PHX.model.hvac.ventilation import PhxDeviceVentilator
+from PHX.to_METr_JSON.metr_schemas import (
+    _build_default_generB,
+    _build_device_defaults,
+    _component_surface_defaults,
+    _new_component_surface_defaults,
+    _new_default_generB,
+    _new_device_defaults,
+    _new_zone_calc_params,
+    _new_zone_design_conditions,
+    _PhxConstructionWindow,
+    _PhxGraphics3D,
+    _PhxMechanicalDevice,
+    _PhxPolygon,
+    _zone_calc_params,
+    _zone_design_conditions,
+)
+from tests.conftest import _reset_phx_class_counters
 
 
 def test_window_frame_arrays_follow_metr_left_right_top_bottom_order(reset_class_counters):
@@ -39,3 +62,65 @@ def test_window_frame_arrays_follow_metr_left_right_top_bottom_order(reset_class
     assert result["lrtbFrU"] == [1.1, 1.2, 1.3, 1.4]
     assert result["lrtbGlPsi"] == [0.01, 0.02, 0.03, 0.04]
     assert result["lrtbFrPsi"] == [0.001, 0.002, 0.003, 0.004]
+
+
+@pytest.mark.parametrize(
+    "face_type, exposure",
+    [
+        (ComponentFaceType.WALL.value, ComponentExposureExterior.EXTERIOR.value),
+        (ComponentFaceType.ROOF_CEILING.value, ComponentExposureExterior.EXTERIOR.value),
+        (ComponentFaceType.FLOOR.value, ComponentExposureExterior.GROUND.value),
+        (ComponentFaceType.WALL.value, ComponentExposureExterior.GROUND.value),
+    ],
+)
+def test_surface_defaults_template_matches_a_fresh_build(face_type, exposure):
+    is_floor = face_type == ComponentFaceType.FLOOR.value
+    is_roof = face_type == ComponentFaceType.ROOF_CEILING.value
+    is_ground = exposure == ComponentExposureExterior.GROUND.value
+
+    for _ in range(2):
+        assert _component_surface_defaults(face_type, exposure) == _new_component_surface_defaults(
+            is_floor, is_roof, is_ground
+        )
+
+
+@pytest.mark.parametrize(
+    "from_template, fresh",
+    [
+        (_build_device_defaults, _new_device_defaults),
+        (_build_default_generB, _new_default_generB),
+        (_zone_design_conditions, _new_zone_design_conditions),
+        (_zone_calc_params, _new_zone_calc_params),
+    ],
+)
+def test_default_templates_match_a_fresh_build_and_are_independent_copies(from_template, fresh):
+    first = from_template()
+    assert first == fresh()
+
+    first.clear()
+    assert from_template() == fresh()
+
+
+def test_ventilator_coverage_split_does_not_change_the_device_template(reset_class_counters):
+    ventilator = PhxDeviceVentilator()
+    ventilator.usage_profile = None  # -- keep the default coverage list, which is then split in place
+
+    assert _PhxMechanicalDevice(ventilator, _num_ventilators=4)["cHWCVHD"][3] == 0.25
+    assert _build_device_defaults()["cHWCVHD"] == _new_device_defaults()["cHWCVHD"]
+
+
+def test_graphics_from_the_vertex_table_match_the_per_polygon_output() -> None:
+    _reset_phx_class_counters()
+    hbjson_file = "tests/reference_files/from_grasshopper_tests/hbjson/Default_Model_Single_Zone.hbjson"
+    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(read_HBJSON_file.read_hb_json_from_file(hbjson_file))
+    g3d = create_project.convert_hb_model_to_PhxProject(hb_model, _group_components=True).variants[0].graphics3D
+
+    # -- Each polygon's own vertices, and the set-based unique vertex list
+    expected = {
+        "lIDXYZ": [
+            [v.id_num, v.x, v.y, v.z]
+            for v in sorted({v for p in g3d.polygons for v in p.vertices}, key=lambda _: _.id_num)
+        ],
+        "lPoly": [_PhxPolygon(p) for p in g3d.polygons],
+    }
+    assert json.dumps(_PhxGraphics3D(g3d), indent=2) == json.dumps(expected, indent=2)
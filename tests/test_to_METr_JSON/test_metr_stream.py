@@ -0,0 +1,127 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the streaming METr JSON writer (PHX.to_METr_JSON.metr_stream)."""
+
+import copy
+import json
+
+import pytest
+
+from PHX.from_HBJSON import create_project, read_HBJSON_file
+from PHX.model.identity_validation import IdentityValidationError
+from PHX.to_METr_JSON import metr_builder, metr_json_to_file
+from PHX.to_METr_JSON.metr_stream import COMPACT_SEPARATORS, MetrStreamDict, MetrStreamList, iter_json_chunks
+from tests.conftest import _reset_phx_class_counters
+
+NESTED = {
+    "a": 1,
+    "empty_list": [],
+    "empty_dict": {},
+    "text": 'Überbau ☃ "quoted"\nline',
+    "nested": {"b": [1, 2.5, None, True, "NaN"], "c": {"d": []}},
+}
+
+
+def _streamed(_value: dict) -> MetrStreamDict:
+    """The same value, with every list streamed and every dict marked for key-by-key encoding."""
+    d = MetrStreamDict()
+    for k, v in _value.items():
+        if isinstance(v, dict):
+            d[k] = _streamed(v)
+        elif isinstance(v, list):
+            d[k] = MetrStreamList(iter(v))
+        else:
+            d[k] = v
+    return d
+
+
+@pytest.mark.parametrize("indent", [2, 4])
+def test_indented_chunks_match_json_dumps(indent) -> None:
+    value = {**NESTED, "lItems": [NESTED, NESTED]}
+    streamed = _streamed(value)
+    streamed["lItems"] = MetrStreamList(iter([_streamed(NESTED), NESTED]))
+
+    assert "".join(iter_json_chunks(streamed, indent)) == json.dumps(value, indent=indent, ensure_ascii=False)
+
+
+def test_compact_chunks_match_json_dumps() -> None:
+    assert "".join(iter_json_chunks(_streamed(NESTED), None)) == json.dumps(
+        NESTED, ensure_ascii=False, separators=COMPACT_SEPARATORS
+    )
+
+
+def test_streamed_items_are_built_as_they_are_written() -> None:
+    built = []
+
+    def _items():
+        for i in range(3):
+            built.append(i)
+            yield {"i": i}
+
+    chunks = iter_json_chunks(MetrStreamDict({"lItems": MetrStreamList(_items())}))
+    text = ""
+    while '"i": 0' not in text:
+        text += next(chunks)
+    assert built == [0]
+
+    assert json.loads(text + "".join(chunks)) == {"lItems": [{"i": 0}, {"i": 1}, {"i": 2}]}
+
+
+@pytest.fixture
+def phx_project():
+    _reset_phx_class_counters()
+    hbjson_file = "tests/reference_files/from_grasshopper_tests/hbjson/Default_Model_Single_Zone.hbjson"
+    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(read_HBJSON_file.read_hb_json_from_file(hbjson_file))
+    return create_project.convert_hb_model_to_PhxProject(hb_model, _group_components=True)
+
+
+def test_streamed_project_text_matches_the_in_memory_text(phx_project) -> None:
+    expected = metr_builder.generate_metr_json_text(phx_project)
+    assert "".join(metr_builder.iter_metr_json_text(phx_project)) == expected
+
+
+def test_compact_project_text_has_the_same_content(phx_project) -> None:
+    expected = metr_builder.generate_metr_json_dict(phx_project)
+    compact = "".join(metr_builder.iter_metr_json_text(phx_project, _compact=True))
+
+    assert "\n" not in compact
+    assert json.loads(compact) == json.loads(json.dumps(expected))
+
+
+def test_write_metr_json_chunks_matches_write_metr_json_file(phx_project, tmp_path) -> None:
+    in_memory = tmp_path / "in_memory.json"
+    streamed = tmp_path / "streamed.json"
+    metr_json_to_file.write_metr_json_file(in_memory, metr_builder.generate_metr_json_text(phx_project))
+    metr_json_to_file.write_metr_json_chunks(streamed, metr_builder.iter_metr_json_text(phx_project), _buffer_size=1024)
+
+    assert streamed.read_bytes() == in_memory.read_bytes()
+
+
+def test_failed_export_leaves_the_existing_file_unchanged(phx_project, tmp_path) -> None:
+    target = tmp_path / "out.json"
+    target.write_text('{"previous": "export"}', encoding="utf-8")
+    phx_project.variants.append(copy.deepcopy(phx_project.variants[0]))
+
+    with pytest.raises(IdentityValidationError):
+        metr_json_to_file.write_metr_json_chunks(target, metr_builder.iter_metr_json_text(phx_project))
+    assert target.read_text(encoding="utf-8") == '{"previous": "export"}'
+
+    def _failing_chunks():
+        yield '{"lItems": ['
+        raise RuntimeError("Failed while streaming.")
+
+    with pytest.raises(RuntimeError):
+        metr_json_to_file.write_metr_json_chunks(target, _failing_chunks())
+    assert target.read_text(encoding="utf-8") == '{"previous": "export"}'
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+
+def test_rewritten_file_keeps_its_mode(tmp_path) -> None:
+    target = tmp_path / "out.json"
+    target.write_text("{}", encoding="utf-8")
+    target.chmod(0o640)
+
+    metr_json_to_file.write_metr_json_chunks(target, ['{"lItems": ', "[]}"])
+
+    assert target.read_text(encoding="utf-8") == '{"lItems": []}'
+    assert target.stat().st_mode & 0o777 == 0o640
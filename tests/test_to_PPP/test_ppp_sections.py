@@ -56,3 +56,20 @@ def test_ppp_file_no_extra_markers():
     lines = f.to_lines()
     markers = [l for l in lines if "End of designPH" in l]
     assert len(markers) == 0
+
+
+def test_ppp_file_iter_lines_matches_to_lines_with_empty_marker_sections():
+    sections = [
+        PppSection("Flaechen_Flaecheneingabe_Bauteil_Bezeichnung", 0, 1, []),
+        PppSection("other_section", 1, 1, ["x"]),
+        PppSection("Fenster_Bezeichnung_Pos", 1, 1, ["001"]),
+    ]
+    f = PppFile(sections=sections)
+    assert list(f.iter_lines()) == f.to_lines()
+    assert f.to_lines() == [
+        "<End of designPH import!>",
+        '"other_section",1,1',
+        "x",
+        '"Fenster_Bezeichnung_Pos",1,1',
+        "<End of designPH import!>",
+    ]
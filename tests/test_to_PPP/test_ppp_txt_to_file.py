@@ -0,0 +1,57 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for the streaming UTF-16LE PPP file writer."""
+
+import tracemalloc
+
+import pytest
+
+from PHX.to_PPP.ppp_sections import PppFile, PppSection
+from PHX.to_PPP.ppp_txt_to_file import write_ppp_file
+
+
+def _ppp_file(_num_sections: int, _rows: int) -> PppFile:
+    sections = [
+        PppSection(f"section_{i}", _rows, 1, [f"Wand {i}-{r} – Überbau ☃" for r in range(_rows)])
+        for i in range(_num_sections)
+    ]
+    sections.append(PppSection("Fenster_Bezeichnung_Pos", 2, 1, ["001", "-"]))
+    return PppFile(sections=sections)
+
+
+def _write_in_one_step(_filepath, _ppp_file: PppFile) -> None:
+    """The original writer: the whole text joined, then written at once."""
+    with open(_filepath, "w", encoding="utf-16-le") as f:
+        f.write("\n".join(_ppp_file.to_lines()) + "\n")
+
+
+@pytest.mark.parametrize("batch_lines", [1, 7, 4096])
+def test_streamed_file_is_byte_identical(tmp_path, batch_lines) -> None:
+    ppp_file = _ppp_file(10, 25)
+    _write_in_one_step(tmp_path / "expected.ppp", ppp_file)
+    write_ppp_file(tmp_path / "streamed.ppp", ppp_file, _batch_lines=batch_lines)
+
+    raw = (tmp_path / "streamed.ppp").read_bytes()
+    assert raw == (tmp_path / "expected.ppp").read_bytes()
+    assert not raw.startswith(b"\xff\xfe")  # -- no BOM
+
+
+def test_empty_file_is_a_single_newline(tmp_path) -> None:
+    _write_in_one_step(tmp_path / "expected.ppp", PppFile())
+    write_ppp_file(tmp_path / "streamed.ppp", PppFile())
+    assert (tmp_path / "streamed.ppp").read_bytes() == (tmp_path / "expected.ppp").read_bytes()
+
+
+def test_peak_memory_does_not_grow_with_the_file(tmp_path) -> None:
+    def _peak_write_bytes(_ppp_file: PppFile) -> int:
+        tracemalloc.start()
+        write_ppp_file(tmp_path / "out.ppp", _ppp_file)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    small = _peak_write_bytes(_ppp_file(20, 1_000))
+    large = _peak_write_bytes(_ppp_file(200, 1_000))  # -- ~10 MB of UTF-16 text
+
+    assert large < 2 * small
+    assert large < (tmp_path / "out.ppp").stat().st_size / 10
@@ -0,0 +1,80 @@
+# -*- Python Version: 3.10 -*-
+
+"""Tests for writing one PPP file per variant (PHX.to_PPP.ppp_variants)."""
+
+import copy
+
+import pytest
+
+from PHX.from_HBJSON import create_project, read_HBJSON_file
+from PHX.to_PPP import ppp_builder, ppp_txt_to_file, ppp_variants
+from tests.conftest import _reset_phx_class_counters
+
+
+@pytest.fixture(autouse=True)
+def fixed_timestamp(monkeypatch):
+    """The same 'imported from PHX' timestamp for every file, however long the test runs."""
+    monkeypatch.setattr(ppp_builder, "ppp_timestamp", lambda: "2026-01-01 00:00:00")
+
+
+@pytest.fixture
+def phx_project():
+    """A project with three variants: the single-zone model's variant, and two copies with fewer components."""
+    _reset_phx_class_counters()
+    hbjson_file = "tests/reference_files/from_grasshopper_tests/hbjson/Default_Model_Single_Zone.hbjson"
+    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(read_HBJSON_file.read_hb_json_from_file(hbjson_file))
+    project = create_project.convert_hb_model_to_PhxProject(hb_model, _group_components=False)
+
+    for i in (1, 2):
+        variant = copy.deepcopy(project.variants[0])
+        variant.name = f"Variant {i}"
+        del variant.building._components[-i:]
+        project.variants.append(variant)
+    return project
+
+
+def test_variant_files_match_each_variant_built_on_its_own(phx_project, tmp_path) -> None:
+    paths = ppp_variants.write_variant_ppp_files(phx_project, tmp_path, "model", _max_workers=1)
+    assert [p.name for p in paths] == ["model_1.ppp", "model_2.ppp", "model_3.ppp"]
+
+    for i, path in enumerate(paths):
+        expected = tmp_path / f"expected_{i}.ppp"
+        ppp_txt_to_file.write_ppp_file(expected, ppp_builder.build_ppp_file(phx_project, i))
+        assert path.read_bytes() == expected.read_bytes()
+
+    assert paths[0].read_bytes() != paths[1].read_bytes()
+
+
+def test_parallel_files_match_the_serial_files(phx_project, tmp_path) -> None:
+    (tmp_path / "serial").mkdir()
+    (tmp_path / "parallel").mkdir()
+    serial = ppp_variants.write_variant_ppp_files(phx_project, tmp_path / "serial", "model", _max_workers=1)
+    parallel = ppp_variants.write_variant_ppp_files(phx_project, tmp_path / "parallel", "model", _max_workers=2)
+
+    assert [p.name for p in parallel] == [p.name for p in serial]
+    assert [p.read_bytes() for p in parallel] == [p.read_bytes() for p in serial]
+
+
+def test_project_maps_are_built_once_for_all_variants(phx_project, tmp_path, monkeypatch) -> None:
+    calls = []
+    build_assembly_map = ppp_builder._build_assembly_map
+    monkeypatch.setattr(ppp_builder, "_build_assembly_map", lambda _p: calls.append(_p) or build_assembly_map(_p))
+
+    ppp_variants.write_variant_ppp_files(phx_project, tmp_path, "model", _max_workers=1)
+    assert len(calls) == 1
+
+
+def test_build_ppp_file_default_is_the_first_variant(phx_project) -> None:
+    project_data = ppp_builder.build_ppp_project_data(phx_project)
+    assert ppp_builder.build_ppp_file(phx_project).to_lines() == (
+        ppp_builder.build_ppp_file(phx_project, 0, project_data).to_lines()
+    )
+
+
+def test_every_variant_file_has_the_same_timestamp(phx_project, tmp_path, monkeypatch) -> None:
+    times = iter(["2026-01-01 00:00:00", "2026-01-01 00:00:01"])
+    monkeypatch.setattr(ppp_builder, "ppp_timestamp", lambda: next(times))
+
+    paths = ppp_variants.write_variant_ppp_files(phx_project, tmp_path, "model", _max_workers=1)
+    for path in paths:
+        assert "Project data imported from PHX 2026-01-01 00:00:00" in path.read_text(encoding="utf-16-le")
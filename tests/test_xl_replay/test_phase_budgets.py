@@ -0,0 +1,75 @@
+# -*- Python Version: 3.10 -*-
+
+"""Per-phase round-trip budgets for the PHPP export.
+
+Replays the production write sequence against the in-memory fake workbook with
+the built-in export-phase profiler turned on ('PHX.xl.xl_profile'), and fails
+if any 'write_*' phase makes more read or write round trips than its recorded
+budget. On macOS every round trip is an AppleEvent, so a batching regression
+shows up here long before anyone notices the slowdown in a real export.
+
+The budgets are versioned in 'fixtures/phase_round_trip_budgets.json'. Lower
+them (re-record with 'python scripts/perf/record_phase_budgets.py') whenever a
+batching change legitimately reduces the counts - never raise them to make
+this test pass.
+"""
+
+import json
+import pathlib
+from typing import Any
+
+from PHX.from_HBJSON import create_project, read_HBJSON_file
+from PHX.hbjson_to_phpp import write_phx_project_to_phpp
+from PHX.PHPP import phpp_app
+from PHX.xl import xl_profile
+from PHX.xl.xl_app import XLConnection
+from tests.test_xl_replay.fake_xl_framework import FakeXLFramework
+
+FIXTURES_DIR = pathlib.Path(__file__).parent / "fixtures"
+FIXTURE_FILE = FIXTURES_DIR / "single_zone_replay.json"
+HBJSON_FILE = FIXTURES_DIR / "Single_Zone.hbjson"
+BUDGETS_FILE = FIXTURES_DIR / "phase_round_trip_budgets.json"
+
+
+def run_profiled_replay() -> tuple[dict[str, Any], FakeXLFramework]:
+    """Run the full export against the replay fake with profiling on. Returns (profile-report, fake)."""
+    fixture = json.loads(FIXTURE_FILE.read_text())
+
+    hb_json_dict = read_HBJSON_file.read_hb_json_from_file(HBJSON_FILE)
+    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(hb_json_dict)
+    phx_project = create_project.convert_hb_model_to_PhxProject(hb_model, _group_components=True)
+
+    fake_xl = FakeXLFramework(
+        sheet_names=fixture["sheet_names"],
+        seed=fixture["seed"],
+        epoch_deltas=fixture["epoch_deltas"],
+    )
+    connection = XLConnection(xl_framework=fake_xl)
+    phpp_conn = phpp_app.PHPPConnection(connection, profile=True)
+    assert phpp_conn.profiler is not None
+
+    with connection.in_silent_mode():
+        connection.unprotect_all_sheets()
+        write_phx_project_to_phpp(phpp_conn, phx_project)
+
+    return phpp_conn.profiler.report(), fake_xl
+
+
+def test_export_phases_stay_within_round_trip_budgets(reset_class_counters) -> None:
+    assert BUDGETS_FILE.exists(), f"Round-trip budgets not found: {BUDGETS_FILE}."
+    budgets = json.loads(BUDGETS_FILE.read_text())["phases"]
+
+    report, _ = run_profiled_replay()
+
+    # -- Every budgeted phase must actually have run, or the gate silently turns off.
+    profiled_phases = {phase["phase"] for phase in report["phases"]}
+    assert not set(budgets) - profiled_phases, f"Phases not profiled: {sorted(set(budgets) - profiled_phases)}"
+
+    violations = xl_profile.check_round_trip_budgets(report, budgets)
+    assert not violations, "Round-trip budget exceeded:\n" + "\n".join(f"  {v}" for v in violations)
+
+
+def test_profiling_does_not_change_the_written_cell_state(reset_class_counters) -> None:
+    fixture = json.loads(FIXTURE_FILE.read_text())
+    _, fake_xl = run_profiled_replay()
+    assert fake_xl.written_state() == fixture["golden_writes"]